@@ -32,8 +32,12 @@ Trade Allowed ONLY if:
 - ORB range ≥ 0.25% of SYMBOL price
 - OR 5-min ATR ≥ intraday minimum threshold
 
+Rev 00249: filter_signals scores a batch in one pass (evaluate_signals) - volatility
+percentiles are computed once per batch and the score components as arrays, instead
+of per signal against all_signals (O(n²))
+
 Author: Easy ORB Strategy Development Team
-Last Updated: January 6, 2026 (Rev 00231)
+Last Updated: October 16, 2026 (Rev 00249)
 Version: 2.31.0
 """
 
@@ -45,6 +49,9 @@ import numpy as np
 
 log = logging.getLogger(__name__)
 
+# Leveraged QQQ/SPY ETFs get a lower volatility percentile threshold
+LEVERAGED_ETFS = ('TQQQ', 'SPXL', 'UPRO', 'SSO', 'QLD', 'SQQQ', 'SPXU', 'SPXS', 'SDS', 'QID')
+
 @dataclass
 class ConvexEligibilityResult:
     """Result of convex eligibility filtering"""
@@ -104,119 +111,162 @@ class ConvexEligibilityFilter:
         log.info(f"  - Momentum confirmation required: {momentum_confirmation_required}")
         log.info(f"  - Trend day required: {trend_day_required}")
     
-    def calculate_eligibility_score(
+    @staticmethod
+    def _volatility_value(signal: Dict[str, Any]) -> float:
+        """ORB volatility score (orb_volume_ratio as proxy if not available)"""
+        volatility_score = signal.get('orb_volatility_score', None)
+        if volatility_score is None:
+            volatility_score = signal.get('orb_volume_ratio', 0.0)
+        return volatility_score
+    
+    def _leveraged_threshold(self, symbol: str) -> Tuple[bool, float]:
+        """(is_leveraged, volatility percentile threshold) for a symbol"""
+        is_leveraged = any(x in symbol for x in LEVERAGED_ETFS)
+        volatility_threshold = self.volatility_percentile_threshold
+        if is_leveraged:
+            # Lower threshold for leveraged ETFs (they're inherently more volatile)
+            volatility_threshold = max(0.60, volatility_threshold - 0.10)  # Top 30-40% instead of 20%
+        return is_leveraged, volatility_threshold
+    
+    def volatility_percentiles(self, all_signals: Optional[List[Dict[str, Any]]]) -> Optional[Dict[float, float]]:
+        """
+        Volatility score percentiles across a batch (Rev 00249)
+        
+        Computed once per batch for the standard and leveraged-ETF thresholds.
+        
+        Returns:
+            {threshold: percentile value}, or None without cross-signal data
+        """
+        if not all_signals:
+            return None
+        volatility_scores = np.array([self._volatility_value(s) for s in all_signals], dtype=np.float64)
+        _, leveraged_threshold = self._leveraged_threshold(LEVERAGED_ETFS[0])
+        thresholds = sorted({self.volatility_percentile_threshold, leveraged_threshold})
+        values = np.percentile(volatility_scores, [t * 100 for t in thresholds])
+        return dict(zip(thresholds, values.tolist()))
+    
+    def score_signals(
         self,
-        signal: Dict[str, Any],
-        all_signals: Optional[List[Dict[str, Any]]] = None
-    ) -> float:
+        signals: List[Dict[str, Any]],
+        all_signals: Optional[List[Dict[str, Any]]] = None,
+        percentiles: Optional[Dict[float, float]] = None
+    ) -> np.ndarray:
         """
-        Calculate eligibility score for a signal (0.0-1.0)
+        Eligibility scores for a batch of signals (0.0-1.0), vectorized (Rev 00249)
         
         Args:
-            signal: ORB signal dictionary
+            signals: ORB signal dictionaries to score
             all_signals: All signals for percentile calculation (optional)
+            percentiles: Precomputed volatility_percentiles(all_signals) (optional)
             
         Returns:
-            Eligibility score (0.0 = not eligible, 1.0 = highly eligible)
+            Array of eligibility scores (same order as signals)
         """
-        score = 0.0
+        n = len(signals)
+        score = np.zeros(n)
         max_score = 0.0
+        if not n:
+            return score
         
         # 1. Volatility Score (40% weight)
         # Use orb_volume_ratio if orb_volatility_score not available
-        volatility_score = signal.get('orb_volatility_score', None)
-        if volatility_score is None:
-            # Fallback to orb_volume_ratio as proxy for volatility
-            volatility_score = signal.get('orb_volume_ratio', 0.0)
-        
-        if all_signals:
-            # Calculate percentile from available volatility scores
-            volatility_scores = []
-            for s in all_signals:
-                vs = s.get('orb_volatility_score', None)
-                if vs is None:
-                    vs = s.get('orb_volume_ratio', 0.0)
-                volatility_scores.append(vs)
-            
-            if volatility_scores:
-                percentile = np.percentile(volatility_scores, self.volatility_percentile_threshold * 100)
-                if volatility_score >= percentile:
-                    score += 0.40
+        volatility_score = np.array([self._volatility_value(s) for s in signals], dtype=np.float64)
+        if percentiles is None:
+            percentiles = self.volatility_percentiles(all_signals)
+        if percentiles is not None:
+            # Percentile of all volatility scores (computed once per batch)
+            score += np.where(volatility_score >= percentiles[self.volatility_percentile_threshold], 0.40, 0.0)
         else:
             # Fallback: use raw score if above threshold
-            if volatility_score >= self.volatility_percentile_threshold:
-                score += 0.40
+            score += np.where(volatility_score >= self.volatility_percentile_threshold, 0.40, 0.0)
         max_score += 0.40
         
         # 2. ORB Range OR 5-min ATR (25% weight)
         # Trade allowed ONLY if: ORB range ≥ 0.25% OR 5-min ATR ≥ intraday minimum threshold
-        orb_range_pct = signal.get('orb_range_pct', 0.0)
-        current_price = signal.get('current_price', 0.0)
-        atr_5min = signal.get('atr_5min', None)
-        atr_threshold_pct = signal.get('atr_threshold_pct', 0.25)
+        orb_range_pct = np.array([s.get('orb_range_pct', 0.0) for s in signals], dtype=np.float64)
+        current_price = np.array([s.get('current_price', 0.0) for s in signals], dtype=np.float64)
+        atr_5min = np.array([s.get('atr_5min', None) for s in signals], dtype=np.float64)  # None -> nan
+        atr_threshold_pct = np.array([s.get('atr_threshold_pct', 0.25) for s in signals], dtype=np.float64)
         
         orb_range_pass = orb_range_pct >= self.orb_range_min_pct
         
-        # Check 5-min ATR as alternative
-        atr_pass = False
-        if not orb_range_pass and atr_5min is not None and current_price > 0:
-            atr_threshold = current_price * (atr_threshold_pct / 100.0)
-            atr_pass = atr_5min >= atr_threshold
+        # Check 5-min ATR as alternative (nan comparisons are False)
+        atr_pass = ~orb_range_pass & (current_price > 0) & (atr_5min >= current_price * (atr_threshold_pct / 100.0))
         
-        if orb_range_pass:
-            # Scale score based on how much above threshold
-            range_score = min(1.0, (orb_range_pct / self.orb_range_min_pct) * 0.5)
-            score += 0.25 * range_score
-        elif atr_pass:
-            # ATR alternative passes - give partial score
-            score += 0.20  # Slightly lower score for ATR alternative
+        # Scale score based on how much above threshold; ATR alternative gets a slightly lower partial score
+        with np.errstate(divide='ignore', invalid='ignore'):
+            range_score = np.minimum(1.0, (orb_range_pct / self.orb_range_min_pct) * 0.5)
+        score += np.where(orb_range_pass, 0.25 * range_score, np.where(atr_pass, 0.20, 0.0))
         max_score += 0.25
         
         # 3. Red Day Status (15% weight) - must NOT be red day
-        is_red_day = signal.get('is_red_day', False)
-        if not is_red_day:
-            score += 0.15
+        not_red_day = np.array([not s.get('is_red_day', False) for s in signals])
+        score += np.where(not_red_day, 0.15, 0.0)
         max_score += 0.15
         
         # 4. Momentum Confirmation (10% weight)
-        # Calculate momentum from available data if field not present
+        # Calculate momentum from MACD histogram or RS vs SPY if field not present
+        if self.momentum_confirmation_required:
+            has_momentum = np.array([bool(self._score_momentum(s)) for s in signals])
+            score += np.where(has_momentum, 0.10, 0.0)
+        else:
+            score += 0.10
+        max_score += 0.10
+        
+        # 5. Market Regime (10% weight)
+        # Infer from VWAP distance and RS vs SPY if field not present
+        if self.trend_day_required:
+            is_trend_day = np.array([self._market_regime(s) in ['trend', 'impulse', 'BULL', 'BEAR'] for s in signals])
+            score += np.where(is_trend_day, 0.10, 0.0)
+        else:
+            score += 0.10
+        max_score += 0.10
+        
+        # Normalize score
+        return score / max_score
+    
+    @staticmethod
+    def _score_momentum(signal: Dict[str, Any]) -> Any:
+        """Momentum for scoring: momentum_confirmed, else positive MACD histogram or RS vs SPY"""
         has_momentum = signal.get('momentum_confirmed', None)
         if has_momentum is None:
-            # Calculate momentum from MACD histogram or price action
             macd_histogram = signal.get('macd_histogram', 0)
             rs_vs_spy = signal.get('rs_vs_spy', 0)
-            # Positive MACD histogram or positive RS indicates momentum
             has_momentum = macd_histogram > 0 or rs_vs_spy > 0
-        
-        if has_momentum or not self.momentum_confirmation_required:
-            score += 0.10
-        max_score += 0.10
-        
-        # 5. Market Regime (10% weight)
-        # Calculate market regime from available data if field not present
+        return has_momentum
+    
+    @staticmethod
+    def _market_regime(signal: Dict[str, Any]) -> str:
+        """market_regime, else inferred: strong VWAP distance or RS indicates trend/impulse"""
         market_regime = signal.get('market_regime', None)
         if market_regime is None:
-            # Infer from VWAP distance and RS vs SPY
             vwap_distance = signal.get('vwap_distance_pct', 0)
             rs_vs_spy = signal.get('rs_vs_spy', 0)
-            # Strong VWAP distance or RS indicates trend/impulse
             if abs(vwap_distance) > 1.0 or abs(rs_vs_spy) > 2.0:
                 market_regime = 'trend'
             else:
                 market_regime = 'rotation'
+        return market_regime
+    
+    def calculate_eligibility_score(
+        self,
+        signal: Dict[str, Any],
+        all_signals: Optional[List[Dict[str, Any]]] = None
+    ) -> float:
+        """
+        Calculate eligibility score for a signal (0.0-1.0)
         
-        is_trend_day = market_regime in ['trend', 'impulse', 'BULL', 'BEAR']
-        if is_trend_day or not self.trend_day_required:
-            score += 0.10
-        max_score += 0.10
-        
-        # Normalize score
-        if max_score > 0:
-            normalized_score = score / max_score
-        else:
-            normalized_score = 0.0
+        For many signals use score_signals() / evaluate_signals(), which compute
+        the cross-signal percentiles once per batch.
         
-        return normalized_score
+        Args:
+            signal: ORB signal dictionary
+            all_signals: All signals for percentile calculation (optional)
+            
+        Returns:
+            Eligibility score (0.0 = not eligible, 1.0 = highly eligible)
+        """
+        return float(self.score_signals([signal], all_signals)[0])
     
     def is_eligible(
         self,
@@ -235,12 +285,21 @@ class ConvexEligibilityFilter:
         Returns:
             Tuple of (is_eligible, eligibility_reasons, rejection_reasons)
         """
+        percentiles = self.volatility_percentiles(all_signals)
+        score = float(self.score_signals([signal], percentiles=percentiles)[0])
+        return self._check_signal(signal, score, percentiles, min_score)
+    
+    def _check_signal(
+        self,
+        signal: Dict[str, Any],
+        score: float,
+        percentiles: Optional[Dict[float, float]],
+        min_score: float
+    ) -> Tuple[bool, List[str], List[str]]:
+        """Run the individual eligibility checks for one signal (percentiles precomputed)"""
         eligibility_reasons = []
         rejection_reasons = []
         
-        # Calculate eligibility score
-        score = self.calculate_eligibility_score(signal, all_signals)
-        
         # Check individual criteria
         checks = {
             'volatility': False,
@@ -255,33 +314,19 @@ class ConvexEligibilityFilter:
         
         # 1. Volatility Score Check
         # Use orb_volume_ratio if orb_volatility_score not available
-        volatility_score = signal.get('orb_volatility_score', None)
-        if volatility_score is None:
-            volatility_score = signal.get('orb_volume_ratio', 0.0)
+        volatility_score = self._volatility_value(signal)
         
         # Adjust threshold for leveraged ETFs (TQQQ, SPXL, etc.)
         symbol = signal.get('symbol', '')
-        is_leveraged = any(x in symbol for x in ['TQQQ', 'SPXL', 'UPRO', 'SSO', 'QLD', 'SQQQ', 'SPXU', 'SPXS', 'SDS', 'QID'])
-        volatility_threshold = self.volatility_percentile_threshold
-        if is_leveraged:
-            # Lower threshold for leveraged ETFs (they're inherently more volatile)
-            volatility_threshold = max(0.60, volatility_threshold - 0.10)  # Top 30-40% instead of 20%
+        is_leveraged, volatility_threshold = self._leveraged_threshold(symbol)
         
-        if all_signals:
-            volatility_scores = []
-            for s in all_signals:
-                vs = s.get('orb_volatility_score', None)
-                if vs is None:
-                    vs = s.get('orb_volume_ratio', 0.0)
-                volatility_scores.append(vs)
-            
-            if volatility_scores:
-                percentile = np.percentile(volatility_scores, volatility_threshold * 100)
-                if volatility_score >= percentile:
-                    checks['volatility'] = True
-                    eligibility_reasons.append(f"Volatility score {volatility_score:.2f} ≥ {percentile:.2f} percentile ({'leveraged ETF' if is_leveraged else 'standard'})")
-                else:
-                    rejection_reasons.append(f"Volatility score {volatility_score:.2f} < {percentile:.2f} percentile ({'leveraged ETF' if is_leveraged else 'standard'})")
+        if percentiles is not None:
+            percentile = percentiles[volatility_threshold]
+            if volatility_score >= percentile:
+                checks['volatility'] = True
+                eligibility_reasons.append(f"Volatility score {volatility_score:.2f} ≥ {percentile:.2f} percentile ({'leveraged ETF' if is_leveraged else 'standard'})")
+            else:
+                rejection_reasons.append(f"Volatility score {volatility_score:.2f} < {percentile:.2f} percentile ({'leveraged ETF' if is_leveraged else 'standard'})")
         else:
             if volatility_score >= volatility_threshold:
                 checks['volatility'] = True
@@ -296,8 +341,6 @@ class ConvexEligibilityFilter:
         atr_5min = signal.get('atr_5min', None)  # 5-minute ATR
         atr_threshold_pct = signal.get('atr_threshold_pct', 0.25)  # Default 0.25% of price
         
-        symbol = signal.get('symbol', '')
-        is_leveraged = any(x in symbol for x in ['TQQQ', 'SPXL', 'UPRO', 'SSO', 'QLD', 'SQQQ', 'SPXU', 'SPXS', 'SDS', 'QID'])
         range_threshold = self.orb_range_min_pct  # Defaults to 0.25%
         
         # Check ORB range first
@@ -450,6 +493,41 @@ class ConvexEligibilityFilter:
         
         return is_eligible, eligibility_reasons, rejection_reasons
     
+    def evaluate_signals(
+        self,
+        signals: List[Dict[str, Any]],
+        min_score: float = 0.75
+    ) -> List[ConvexEligibilityResult]:
+        """
+        Score and check a batch of signals against each other (Rev 00249)
+        
+        Cross-signal statistics (volatility percentiles) are computed once and all
+        scores in one vectorized pass, so a batch is O(n) instead of O(n²).
+        
+        Args:
+            signals: List of ORB signals (also the percentile population)
+            min_score: Minimum eligibility score threshold
+            
+        Returns:
+            ConvexEligibilityResult per signal (input order, eligible or not)
+        """
+        percentiles = self.volatility_percentiles(signals)
+        scores = self.score_signals(signals, percentiles=percentiles).tolist()
+        
+        results = []
+        for signal, score in zip(signals, scores):
+            is_eligible, eligibility_reasons, rejection_reasons = self._check_signal(
+                signal, score, percentiles, min_score
+            )
+            results.append(ConvexEligibilityResult(
+                signal=signal,
+                eligibility_score=score,
+                is_eligible=is_eligible,
+                eligibility_reasons=eligibility_reasons,
+                rejection_reasons=rejection_reasons
+            ))
+        return results
+    
     def filter_signals(
         self,
         signals: List[Dict[str, Any]],
@@ -473,24 +551,8 @@ class ConvexEligibilityFilter:
         
         log.info(f"Filtering {len(signals)} signals through Convex Eligibility Filter")
         
-        # Calculate eligibility for all signals
-        results = []
-        for signal in signals:
-            is_eligible, eligibility_reasons, rejection_reasons = self.is_eligible(
-                signal, signals, min_score
-            )
-            
-            score = self.calculate_eligibility_score(signal, signals)
-            
-            result = ConvexEligibilityResult(
-                signal=signal,
-                eligibility_score=score,
-                is_eligible=is_eligible,
-                eligibility_reasons=eligibility_reasons,
-                rejection_reasons=rejection_reasons
-            )
-            
-            results.append(result)
+        # Calculate eligibility for all signals (Rev 00249: one batch pass)
+        results = self.evaluate_signals(signals, min_score)
         
         # Sort by eligibility score (descending)
         results.sort(key=lambda x: x.eligibility_score, reverse=True)
@@ -13,6 +13,7 @@ Last Updated: January 6, 2026 (Rev 00231)
 Version: 2.31.0
 """
 
+import asyncio
 import logging
 import os
 import time
@@ -29,11 +30,11 @@ try:
     orb_strategy_path = os.path.join(os.path.dirname(__file__), '../../1. The Easy ORB Strategy')
     if os.path.exists(orb_strategy_path):
         sys.path.insert(0, orb_strategy_path)
-        from modules.prime_etrade_trading import PrimeETradeTrading
+        from modules.prime_etrade_trading import PrimeETradeTrading, get_etrade_client_hub
         ETRADE_AVAILABLE = True
     else:
         # Try direct import (when integrated)
-        from modules.prime_etrade_trading import PrimeETradeTrading
+        from modules.prime_etrade_trading import PrimeETradeTrading, get_etrade_client_hub
         ETRADE_AVAILABLE = True
 except ImportError:
     # Define a dummy class for type hints when ETrade is not available
@@ -119,6 +120,10 @@ class ETradeOptionsAPI:
         
         if etrade_trading:
             self.etrade = etrade_trading
+            # Rev 00251: Own handle on the shared client, so selecting the 0DTE account
+            # does not switch the account of the ORB Strategy's instance
+            if account_id and hasattr(self.etrade, 'derive_handle'):
+                self.etrade = self.etrade.derive_handle()
             # Rev 00218: Select specific account if provided
             if account_id and hasattr(self.etrade, 'select_account'):
                 if self.etrade.select_account(account_id):
@@ -130,7 +135,8 @@ class ETradeOptionsAPI:
                 # Rev 00218: Support separate OAuth tokens for 0DTE Strategy
                 # If secret_name is provided, we need to create a custom PrimeETradeTrading instance
                 # For now, create standard instance - account selection happens after initialization
-                self.etrade = PrimeETradeTrading(environment=environment)
+                # Rev 00251: Handle on the shared E*TRADE client hub
+                self.etrade = get_etrade_client_hub().handle(environment)
                 if not self.etrade.initialize():
                     log.error("Failed to initialize ETrade trading system")
                     self.etrade = None
@@ -186,11 +192,14 @@ class ETradeOptionsAPI:
             # ETrade API endpoint: /v1/market/optionchains
             # Uses same OAuth authentication as ETF endpoints via _make_etrade_api_call()
             
+            # Rev 00246: The E*TRADE call is synchronous - run it in a worker thread so chain
+            # fetches (and the prefetcher's concurrent refreshes) never block the event loop
             # Option 1: Use PrimeETradeTrading's built-in method (if available)
             if hasattr(self.etrade, 'get_option_chains'):
                 # Convert expiry format: YYYYMMDD -> YYYY-MM-DD
                 expiry_formatted = f"{expiry[:4]}-{expiry[4:6]}-{expiry[6:8]}"
-                response = self.etrade.get_option_chains(
+                response = await asyncio.to_thread(
+                    self.etrade.get_option_chains,
                     symbol=symbol,
                     expiry_date=expiry_formatted,
                     option_type='CALL'  # Will fetch both calls and puts
@@ -206,7 +215,8 @@ class ETradeOptionsAPI:
                 }
                 
                 # Make API call (uses same OAuth authentication)
-                response = self.etrade._make_etrade_api_call(
+                response = await asyncio.to_thread(
+                    self.etrade._make_etrade_api_call,
                     method='GET',
                     url=url,
                     params=params
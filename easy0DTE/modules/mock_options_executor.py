@@ -672,13 +672,20 @@ class MockOptionsExecutor:
         position = self.active_positions[position_id]
         
         # Calculate final P&L
-        final_pnl = (exit_price - position.entry_price) * position.quantity * 100
+        # Rev 00248: Credit spreads are closed by buying them back (exit_price = cost to close)
+        if position.position_type == 'credit_spread':
+            final_pnl = (position.entry_price - exit_price) * position.quantity * 100
+        else:
+            final_pnl = (exit_price - position.entry_price) * position.quantity * 100
         position.realized_pnl = final_pnl
         position.unrealized_pnl = 0.0
         position.status = 'closed'
         
-        # Update account balance
-        self.account_balance += (exit_price * position.quantity * 100)
+        # Update account balance (credit was added at entry, so a credit spread pays to close)
+        if position.position_type == 'credit_spread':
+            self.account_balance -= (exit_price * position.quantity * 100)
+        else:
+            self.account_balance += (exit_price * position.quantity * 100)
         
         # Update stats
         self.daily_stats['positions_closed'] += 1
@@ -7,18 +7,24 @@ Manages SPX, QQQ & SPY options chains for 0DTE trading.
 Handles chain fetching, liquidity analysis, and strike selection.
 Priority Order: SPX (professional/institutional) → QQQ (momentum 0DTE) → SPY (most liquid)
 
+Rev 00247: Chains are held column-wise (OptionChainSide): one contiguous NumPy block
+per side, sorted by strike, with a binary-search strike index and vectorized
+candidate scoring for every strike selector.
+
 Author: Easy ORB Strategy Development Team
-Last Updated: January 6, 2026 (Rev 00231)
+Last Updated: October 16, 2026 (Rev 00247)
 Version: 2.31.0
 """
 
 import logging
 import os
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Sequence
 from datetime import datetime, date
 from dataclasses import dataclass
 import asyncio
 
+import numpy as np
+
 # Import ETrade Options API
 try:
     from .etrade_options_api import ETradeOptionsAPI, ETradeOptionContract
@@ -29,6 +35,10 @@ except ImportError:
 
 log = logging.getLogger(__name__)
 
+# Rev 00246: Failed/empty chain refreshes are retried with exponential backoff (per chain)
+CHAIN_RETRY_SECONDS = float(os.getenv('0DTE_CHAIN_RETRY_SECONDS', '10'))
+CHAIN_RETRY_MAX_SECONDS = float(os.getenv('0DTE_CHAIN_RETRY_MAX_SECONDS', '60'))
+
 
 @dataclass
 class OptionContract:
@@ -88,6 +98,192 @@ class OptionContract:
         }
 
 
+class OptionChainSide:
+    """
+    Array-backed side of an options chain (Rev 00247)
+    
+    All contracts of one side (calls or puts) live in a single contiguous
+    (columns x contracts) float64 block sorted by strike, so:
+    - strike lookups are binary searches on the sorted strike row
+    - "strikes OTM" counts come from the unique-strike index (no rescans)
+    - contract scoring is vectorized over all candidates at once
+    
+    Behaves as a read-only sequence of OptionContract (built on access and
+    memoized), so code that iterates chain['calls'] keeps working.
+    """
+    
+    COLUMNS = ('strike', 'bid', 'ask', 'last', 'volume', 'open_interest',
+               'delta', 'gamma', 'theta', 'vega', 'implied_volatility')
+    
+    def __init__(self, symbol: str, expiry: str, option_type: str, data: np.ndarray):
+        """
+        Args:
+            symbol: Underlying symbol
+            expiry: Expiry date (YYYY-MM-DD)
+            option_type: 'call' or 'put'
+            data: (len(COLUMNS), n) array in COLUMNS row order (any strike order)
+        """
+        self.symbol = symbol
+        self.expiry = expiry
+        self.option_type = option_type
+        
+        data = np.asarray(data, dtype=np.float64).reshape(len(self.COLUMNS), -1)
+        order = np.argsort(data[0], kind='stable')  # Stable: equal strikes keep broker order
+        self.data = np.ascontiguousarray(data[:, order])
+        
+        # Row views into the block (no copies)
+        (self.strike, self.bid, self.ask, self.last, self.volume, self.open_interest,
+         self.delta, self.gamma, self.theta, self.vega, self.implied_volatility) = self.data
+        
+        self.abs_delta = np.abs(self.delta)
+        self.mid = (self.bid + self.ask) / 2.0
+        spread = self.ask - self.bid
+        self.spread_pct = np.divide(spread, self.mid, out=np.zeros_like(spread), where=self.mid > 0) * 100.0
+        self.unique_strikes = np.unique(self.strike)
+        
+        self._contracts: Dict[int, OptionContract] = {}
+    
+    @classmethod
+    def from_contracts(
+        cls,
+        contracts: Iterable[Any],
+        option_type: str,
+        symbol: Optional[str] = None,
+        expiry: Optional[str] = None
+    ) -> 'OptionChainSide':
+        """
+        Build from OptionContract / ETradeOptionContract objects (missing greeks -> 0.0)
+        """
+        contracts = list(contracts)
+        if symbol is None:
+            symbol = contracts[0].symbol if contracts else ''
+        if expiry is None:
+            expiry = contracts[0].expiry if contracts else ''
+        data = np.array([[getattr(c, name) or 0.0 for name in cls.COLUMNS] for c in contracts],
+                        dtype=np.float64).reshape(len(contracts), len(cls.COLUMNS)).T
+        return cls(symbol, expiry, option_type, data)
+    
+    def __len__(self) -> int:
+        return self.data.shape[1]
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.contract(i)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.contract(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('OptionChainSide index out of range')
+        return self.contract(index)
+    
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+    
+    def contract(self, i: int) -> OptionContract:
+        """OptionContract for row i (created once, then reused)"""
+        contract = self._contracts.get(i)
+        if contract is None:
+            row = self.data[:, i].tolist()
+            contract = OptionContract(
+                symbol=self.symbol,
+                strike=row[0],
+                expiry=self.expiry,
+                option_type=self.option_type,
+                bid=row[1],
+                ask=row[2],
+                last=row[3],
+                volume=int(row[4]),
+                open_interest=int(row[5]),
+                delta=row[6],
+                gamma=row[7],
+                theta=row[8],
+                vega=row[9],
+                implied_volatility=row[10]
+            )
+            self._contracts[i] = contract
+        return contract
+    
+    def find_strike(self, strike: float) -> int:
+        """Index of the first contract at exactly this strike (-1 if none)"""
+        i = int(np.searchsorted(self.strike, strike, side='left'))
+        if i < len(self) and self.strike[i] == strike:
+            return i
+        return -1
+    
+    def nearest_strike(self, target: float, max_distance: float) -> int:
+        """Index of the contract closest to target within max_distance (exclusive; -1 if none)"""
+        strikes = self.unique_strikes
+        i = int(np.searchsorted(strikes, target))
+        best = None
+        for k in (i - 1, i):  # Lower strike first: ties resolve to it
+            if 0 <= k < len(strikes):
+                distance = abs(strikes[k] - target)
+                if distance < max_distance and (best is None or distance < best[0]):
+                    best = (distance, strikes[k])
+        return self.find_strike(best[1]) if best else -1
+    
+    def strikes_otm(self, current_price: float) -> np.ndarray:
+        """
+        Number of distinct strikes between current_price and each contract's strike
+        
+        Calls: strikes in (current_price, strike]; puts: strikes in [strike, current_price).
+        Only meaningful for OTM contracts.
+        """
+        if self.option_type == 'call':
+            return (np.searchsorted(self.unique_strikes, self.strike, side='right')
+                    - np.searchsorted(self.unique_strikes, current_price, side='right'))
+        return (np.searchsorted(self.unique_strikes, current_price, side='left')
+                - np.searchsorted(self.unique_strikes, self.strike, side='left'))
+    
+    def otm_mask(self, current_price: float) -> np.ndarray:
+        if self.option_type == 'call':
+            return self.strike > current_price
+        return self.strike < current_price
+    
+    def liquidity_mask(self, min_open_interest: int, max_bid_ask_spread_pct: float, min_volume: int) -> np.ndarray:
+        """Vectorized OptionsChainManager.validate_liquidity (True = passes all rules)"""
+        return ((self.open_interest >= min_open_interest)
+                & (self.spread_pct <= max_bid_ask_spread_pct)
+                & (self.volume >= min_volume)
+                & (self.bid > 0) & (self.ask > 0))
+
+
+def _long_option_scores(side: OptionChainSide, idx: np.ndarray, target_delta: float, delta_window: float) -> np.ndarray:
+    """
+    Multi-factor score for buying options (vectorized, Rev 00247)
+    
+    Gamma 40% (cheap gamma), Theta 30% (low decay), Delta proximity 20%, Vega 10% (low IV risk)
+    """
+    score = np.minimum(np.abs(side.gamma[idx]) / 0.10, 1.0) * 0.40
+    score += np.maximum(0.0, (0.30 - np.abs(side.theta[idx])) / 0.30) * 0.30
+    score += np.maximum(0.0, 1.0 - (np.abs(side.abs_delta[idx] - target_delta) / delta_window)) * 0.20
+    score += np.maximum(0.0, (0.15 - np.abs(side.vega[idx])) / 0.15) * 0.10
+    return score
+
+
+def _credit_short_scores(side: OptionChainSide, idx: np.ndarray, target_delta: float) -> np.ndarray:
+    """
+    Score for the short leg of a credit spread (vectorized, Rev 00247)
+    
+    Delta proximity 40%, Vega 30% (low IV risk), Gamma 20% (liquidity), Theta benefit 10%
+    """
+    score = np.maximum(0.0, 1.0 - (np.abs(side.abs_delta[idx] - target_delta) / 0.10)) * 0.40
+    score += np.maximum(0.0, (0.15 - np.abs(side.vega[idx])) / 0.15) * 0.30
+    score += np.minimum(np.abs(side.gamma[idx]) / 0.10, 1.0) * 0.20
+    score += np.minimum(np.abs(side.theta[idx]) / 0.30, 1.0) * 0.10
+    return score
+
+
+def _rank(side: OptionChainSide, idx: np.ndarray, scores: np.ndarray, target_delta: float) -> Tuple[List[int], List[float]]:
+    """Order candidates by score (descending), then delta proximity to target"""
+    order = np.lexsort((np.abs(side.abs_delta[idx] - target_delta), -scores))
+    return idx[order].tolist(), scores[order].tolist()
+
+
 @dataclass
 class DebitSpread:
     """Debit spread structure"""
@@ -219,6 +415,21 @@ class OptionsChainManager:
         self.chain_cache: Dict[str, Dict[str, Any]] = {}
         self.cache_ttl = 300  # 5 minutes
         
+        # Rev 00246: One in-flight fetch per chain (prefetcher and execution share it)
+        self._inflight_fetches: Dict[str, asyncio.Future] = {}
+        # cache_key -> (last failed attempt timestamp, consecutive failures)
+        self._failed_fetches: Dict[str, Tuple[float, int]] = {}
+        self.prefetcher = None
+        
+        # Rev 00248: Black-Scholes synthetic chains for Demo mode (Live chains seed its IV surfaces)
+        self.synthetic_chains = None
+        try:
+            from .synthetic_options_chain import SyntheticChainGenerator, SYNTHETIC_CHAIN_ENABLED
+            if SYNTHETIC_CHAIN_ENABLED:
+                self.synthetic_chains = SyntheticChainGenerator(increment_fallback=self._get_strike_increment)
+        except Exception as e:
+            log.warning(f"Synthetic options chains not available: {e}")
+        
         mode_label = "💰 LIVE API" if use_live_api and self.etrade_api else "🎮 DEMO/MOCK"
         log.info(f"Options Chain Manager initialized ({mode_label}):")
         log.info(f"  - Min open interest: {min_open_interest} (reject if <minimum)")
@@ -232,7 +443,8 @@ class OptionsChainManager:
         self,
         symbol: str,
         expiry: Optional[str] = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        underlying_price: Optional[float] = None
     ) -> Dict[str, List[OptionContract]]:
         """
         Fetch options chain for symbol
@@ -241,6 +453,7 @@ class OptionsChainManager:
             symbol: Underlying symbol (SPX, QQQ, or SPY)
             expiry: Expiry date (YYYY-MM-DD format, None = 0DTE)
             use_cache: Use cached chain if available
+            underlying_price: Current underlying quote (Demo mode: prices a synthetic chain)
             
         Returns:
             Dictionary with 'calls' and 'puts' lists
@@ -249,6 +462,13 @@ class OptionsChainManager:
         if expiry is None:
             expiry = datetime.now().strftime('%Y-%m-%d')
         
+        # Rev 00248: Demo mode prices a synthetic chain around the quote (not cached - it tracks the quote)
+        if underlying_price and underlying_price > 0 and self.synthetic_chains and not (self.use_live_api and self.etrade_api):
+            chain = self.synthetic_chains.generate(symbol, underlying_price, expiry)
+            log.info(f"🧪 Synthetic options chain for {symbol} {expiry} @ ${underlying_price:.2f}: "
+                     f"{len(chain['calls'])} calls, {len(chain['puts'])} puts")
+            return chain
+        
         cache_key = f"{symbol}_{expiry}"
         
         # Check cache
@@ -265,7 +485,101 @@ class OptionsChainManager:
             elif cache_age_seconds < self.cache_ttl:
                 log.debug(f"Using cached options chain for {symbol} {expiry} (age: {cache_age_seconds:.0f}s)")
                 return cached_data['chain']
+            
+            # A refresh just failed - serve the last good chain until the retry backoff expires
+            last_good = self._last_good_chain(cache_key)
+            if last_good is not None and self._retry_in_seconds(cache_key) > 0:
+                return last_good
+        
+        # Rev 00246: Concurrent callers for the same chain share one fetch
+        inflight = self._inflight_fetches.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_chain_uncached(symbol, expiry, cache_key))
+            self._inflight_fetches[cache_key] = inflight
+            inflight.add_done_callback(lambda _task, key=cache_key: self._inflight_fetches.pop(key, None))
+        return await asyncio.shield(inflight)
+    
+    def chain_age_seconds(self, symbol: str, expiry: Optional[str] = None) -> Optional[float]:
+        """Age of the cached chain in seconds (None if not cached)"""
+        if expiry is None:
+            expiry = datetime.now().strftime('%Y-%m-%d')
+        cached_data = self.chain_cache.get(f"{symbol}_{expiry}")
+        if not cached_data:
+            return None
+        return datetime.now().timestamp() - cached_data.get('timestamp', 0)
+    
+    def chain_retry_in_seconds(self, symbol: str, expiry: Optional[str] = None) -> float:
+        """Seconds until a failed/empty chain refresh may be retried (0.0 if not backing off)"""
+        if expiry is None:
+            expiry = datetime.now().strftime('%Y-%m-%d')
+        return self._retry_in_seconds(f"{symbol}_{expiry}")
+    
+    def _retry_in_seconds(self, cache_key: str) -> float:
+        failed = self._failed_fetches.get(cache_key)
+        if failed is None:
+            return 0.0
+        attempted_at, failures = failed
+        backoff = min(CHAIN_RETRY_SECONDS * 2 ** (failures - 1), CHAIN_RETRY_MAX_SECONDS)
+        return max(0.0, attempted_at + backoff - datetime.now().timestamp())
+    
+    def _record_failed_fetch(self, cache_key: str) -> None:
+        _, failures = self._failed_fetches.get(cache_key, (0.0, 0))
+        self._failed_fetches[cache_key] = (datetime.now().timestamp(), failures + 1)
+    
+    async def prefetch_chains(self, symbols: List[str], expiry: Optional[str] = None) -> Dict[str, Dict[str, List[OptionContract]]]:
+        """
+        Warm chains for several symbols concurrently (Rev 00246)
+        
+        Fresh cached chains are served as-is; the rest are fetched in parallel.
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        chains = await asyncio.gather(*(self.fetch_options_chain(symbol, expiry=expiry) for symbol in unique_symbols),
+                                      return_exceptions=True)
+        return {symbol: chain for symbol, chain in zip(unique_symbols, chains) if isinstance(chain, dict)}
+    
+    def start_prefetch(self, symbols: Optional[List[str]] = None) -> Optional[Any]:
+        """
+        Start background chain prefetch for the 0DTE watchlist (Rev 00246, Live API only)
         
+        Args:
+            symbols: Underlyings to keep warm (None = data/watchlist/0dte_list.csv)
+            
+        Returns:
+            The running OptionsChainPrefetcher, or None if prefetch is disabled/unavailable
+        """
+        from .options_chain_prefetcher import OptionsChainPrefetcher, CHAIN_PREFETCH_ENABLED
+        
+        if not CHAIN_PREFETCH_ENABLED or not (self.use_live_api and self.etrade_api):
+            return None
+        if symbols is None:
+            from .prime_0dte_strategy_manager import load_0dte_symbols
+            symbols = load_0dte_symbols()
+        
+        prefetcher = self.prefetcher
+        if prefetcher is None or prefetcher.symbols != list(dict.fromkeys(symbols)):
+            if prefetcher is not None:
+                prefetcher.cancel()
+            prefetcher = OptionsChainPrefetcher(self, symbols)
+            self.prefetcher = prefetcher
+        prefetcher.start()
+        return prefetcher
+    
+    async def stop_prefetch(self):
+        """Stop background chain prefetch (cached chains stay usable)"""
+        if self.prefetcher is not None:
+            await self.prefetcher.stop()
+    
+    def _last_good_chain(self, cache_key: str) -> Optional[Dict[str, List[OptionContract]]]:
+        """Previously cached non-empty chain that is still within the stale threshold"""
+        cached_data = self.chain_cache.get(cache_key)
+        if not cached_data or not (cached_data['chain'].get('calls') or cached_data['chain'].get('puts')):
+            return None
+        if datetime.now().timestamp() - cached_data.get('timestamp', 0) > self.chain_stale_threshold_seconds:
+            return None
+        return cached_data['chain']
+    
+    async def _fetch_chain_uncached(self, symbol: str, expiry: str, cache_key: str) -> Dict[str, List[OptionContract]]:
+        """Fetch a chain from the broker (or the Demo placeholder) and cache it"""
         # Live API: Fetch from ETrade
         if self.use_live_api and self.etrade_api and self.etrade_api.is_available():
             try:
@@ -280,61 +594,44 @@ class OptionsChainManager:
                     include_greeks=True
                 )
                 
-                # Convert ETradeOptionContract to OptionContract
-                calls = []
-                puts = []
+                # Rev 00247: Store each side column-wise (OptionContract objects are built on demand)
+                calls = OptionChainSide.from_contracts(etrade_chain.get('calls', []), 'call', symbol=symbol, expiry=expiry)
+                puts = OptionChainSide.from_contracts(etrade_chain.get('puts', []), 'put', symbol=symbol, expiry=expiry)
                 
-                for etrade_call in etrade_chain.get('calls', []):
-                    call = OptionContract(
-                        symbol=etrade_call.symbol,
-                        strike=etrade_call.strike,
-                        expiry=expiry,
-                        option_type='call',
-                        bid=etrade_call.bid,
-                        ask=etrade_call.ask,
-                        last=etrade_call.last,
-                        volume=etrade_call.volume,
-                        open_interest=etrade_call.open_interest,
-                        delta=etrade_call.delta or 0.0,
-                        gamma=etrade_call.gamma or 0.0,
-                        theta=etrade_call.theta or 0.0,
-                        vega=etrade_call.vega or 0.0,
-                        implied_volatility=etrade_call.implied_volatility or 0.0
-                    )
-                    calls.append(call)
+                chain = {'calls': calls, 'puts': puts}
                 
-                for etrade_put in etrade_chain.get('puts', []):
-                    put = OptionContract(
-                        symbol=etrade_put.symbol,
-                        strike=etrade_put.strike,
-                        expiry=expiry,
-                        option_type='put',
-                        bid=etrade_put.bid,
-                        ask=etrade_put.ask,
-                        last=etrade_put.last,
-                        volume=etrade_put.volume,
-                        open_interest=etrade_put.open_interest,
-                        delta=etrade_put.delta or 0.0,
-                        gamma=etrade_put.gamma or 0.0,
-                        theta=etrade_put.theta or 0.0,
-                        vega=etrade_put.vega or 0.0,
-                        implied_volatility=etrade_put.implied_volatility or 0.0
-                    )
-                    puts.append(put)
+                # Rev 00248: Keep the synthetic IV surface in line with the real chain
+                if self.synthetic_chains and (calls or puts):
+                    try:
+                        self.synthetic_chains.seed_from_chain(symbol, chain)
+                    except Exception as e:
+                        log.debug(f"IV surface fit failed for {symbol}: {e}")
                 
-                chain = {'calls': calls, 'puts': puts}
+                # Rev 00246: An empty refresh must not replace a good chain that is still fresh
+                if not calls and not puts:
+                    last_good = self._last_good_chain(cache_key)
+                    if last_good is not None:
+                        self._record_failed_fetch(cache_key)
+                        log.warning(f"⚠️ Empty options chain refresh for {symbol} {expiry} - keeping previous chain "
+                                    f"(retry in {self._retry_in_seconds(cache_key):.0f}s)")
+                        return last_good
                 
                 # Cache result
                 self.chain_cache[cache_key] = {
                     'chain': chain,
                     'timestamp': datetime.now().timestamp()
                 }
+                self._failed_fetches.pop(cache_key, None)
                 
                 log.info(f"✅ Fetched options chain from ETrade: {len(calls)} calls, {len(puts)} puts")
                 return chain
                 
             except Exception as e:
                 log.error(f"Failed to fetch options chain from ETrade: {e}")
+                last_good = self._last_good_chain(cache_key)
+                if last_good is not None:
+                    self._record_failed_fetch(cache_key)
+                    return last_good
                 # Fall through to return empty chain
         
         # Demo/Mock mode: Return empty structure
@@ -396,6 +693,18 @@ class OptionsChainManager:
         
         return is_valid, reasons
     
+    def _liquidity_mask(self, side: OptionChainSide) -> np.ndarray:
+        """validate_liquidity for every contract of a side at once (Rev 00247)"""
+        return side.liquidity_mask(self.min_open_interest, self.max_bid_ask_spread_pct, self.min_volume)
+    
+    @staticmethod
+    def _chain_side(chain: Dict[str, Sequence[OptionContract]], option_type: str) -> OptionChainSide:
+        """Columnar side of a chain (chains from fetch_options_chain already are)"""
+        contracts = chain.get(option_type + 's', [])
+        if isinstance(contracts, OptionChainSide):
+            return contracts
+        return OptionChainSide.from_contracts(contracts, option_type)
+    
     def select_debit_spread_strikes(
         self,
         chain: Dict[str, List[OptionContract]],
@@ -423,9 +732,9 @@ class OptionsChainManager:
         Returns:
             DebitSpread object or None if no valid spread found
         """
-        contracts = chain.get(option_type + 's', [])
+        side = self._chain_side(chain, option_type)
         
-        if not contracts:
+        if not side:
             log.warning(f"No {option_type} contracts available")
             return None
         
@@ -441,104 +750,27 @@ class OptionsChainManager:
         # Rev 00212: Filter by strike position (1-3 strikes OTM)
         # For calls: strike > current_price (OTM)
         # For puts: strike < current_price (OTM)
-        candidate_long_legs = []
-        
-        # Get all strikes sorted for OTM calculation
-        all_strikes = sorted(set(c.strike for c in contracts))
-        
-        for c in contracts:
-                # Check delta range
-                if not (delta_min <= abs(c.delta) <= delta_max):
-                    continue
-                
-                # Check premium range (use mid price)
-                premium = c.mid_price
-                if not (premium_min <= premium <= premium_max):
-                    log.debug(f"Rejecting {c.strike} {option_type}: premium ${premium:.2f} not in range [${premium_min:.2f}, ${premium_max:.2f}]")
-                    continue
-                
-                # Check strike position (1-3 strikes OTM)
-                if option_type == 'call':
-                    # Call: strike should be above current price (OTM)
-                    if c.strike <= current_price:
-                        continue  # Not OTM
-                    
-                    # Count how many strikes are OTM between current_price and this strike
-                    otm_strikes = [s for s in all_strikes if current_price < s <= c.strike]
-                    strikes_otm = len(otm_strikes)
-                    
-                    if not (1 <= strikes_otm <= 3):
-                        log.debug(f"Rejecting {c.strike} call: {strikes_otm} strikes OTM (need 1-3)")
-                        continue
-                else:  # put
-                    # Put: strike should be below current price (OTM)
-                    if c.strike >= current_price:
-                        continue  # Not OTM
-                    
-                    # Count how many strikes are OTM between this strike and current_price
-                    otm_strikes = [s for s in all_strikes if current_price > s >= c.strike]
-                    strikes_otm = len(otm_strikes)
-                    
-                    if not (1 <= strikes_otm <= 3):
-                        log.debug(f"Rejecting {c.strike} put: {strikes_otm} strikes OTM (need 1-3)")
-                        continue
-                
-                candidate_long_legs.append(c)
+        # Rev 00247: One vectorized pass; OTM strike counts come from the sorted strike index
+        strikes_otm = side.strikes_otm(current_price)
+        candidates = np.flatnonzero(
+            (delta_min <= side.abs_delta) & (side.abs_delta <= delta_max)
+            & (premium_min <= side.mid) & (side.mid <= premium_max)
+            & side.otm_mask(current_price)
+            & (strikes_otm >= 1) & (strikes_otm <= 3)
+        )
         
-        if not candidate_long_legs:
+        if not candidates.size:
             log.warning(f"No contracts found with delta in range [{delta_min:.2f}, {delta_max:.2f}]")
             return None
         
         # Multi-factor optimization: Cheap gamma + Low decay + Peak gamma potential + Vega risk
-        # Score = (gamma_score * gamma_weight) - (theta_score * theta_weight) - (vega_risk * vega_weight)
-        # Higher score = better option
-        
-        def calculate_option_score(contract, target_delta):
-            """Calculate multi-factor optimization score for option selection"""
-            score = 0.0
-            
-            # 1. Gamma Score (40% weight) - Buy cheap gamma, maximize peak gamma potential
-            # Higher gamma = better, but we want cheap gamma (OTM options)
-            gamma_score = abs(contract.gamma) if contract.gamma else 0.0
-            # Normalize gamma (assume max gamma around 0.05-0.10 for OTM options)
-            gamma_normalized = min(gamma_score / 0.10, 1.0) if gamma_score > 0 else 0.0
-            score += gamma_normalized * 0.40
-            
-            # 2. Theta Score (30% weight) - Minimize decay (lower absolute theta = better)
-            # Lower theta (less negative) = less decay = better
-            theta_score = abs(contract.theta) if contract.theta else 0.0
-            # Normalize theta (assume max theta around 0.20-0.30 for 0DTE OTM options)
-            # Lower theta is better, so invert: (max_theta - theta) / max_theta
-            theta_normalized = max(0.0, (0.30 - theta_score) / 0.30) if theta_score > 0 else 1.0
-            score += theta_normalized * 0.30
-            
-            # 3. Delta Proximity (20% weight) - Closest to target delta
-            delta_diff = abs(abs(contract.delta) - target_delta)
-            delta_score = max(0.0, 1.0 - (delta_diff / 0.10))  # Within ±0.10 range
-            score += delta_score * 0.20
-            
-            # 4. Vega Risk (10% weight) - Minimize vega risk (lower vega = less IV sensitivity)
-            # Lower vega = less sensitive to IV changes = better (for buying options)
-            vega_score = abs(contract.vega) if contract.vega else 0.0
-            # Normalize vega (assume max vega around 0.10-0.15 for OTM options)
-            # Lower vega is better, so invert: (max_vega - vega) / max_vega
-            vega_normalized = max(0.0, (0.15 - vega_score) / 0.15) if vega_score > 0 else 1.0
-            score += vega_normalized * 0.10
-            
-            return score
-        
-        # Sort by multi-factor optimization score (descending)
-        # This optimizes for: cheap gamma + low decay + peak gamma potential + low vega risk
-        candidate_long_legs.sort(
-            key=lambda x: (
-                -calculate_option_score(x, target_delta),  # Higher score first (negative for descending)
-                abs(abs(x.delta) - target_delta)  # Then closest delta to target (tiebreaker)
-            )
-        )
+        # Sort by score (descending), then closest delta to target (tiebreaker)
+        ranked, ranked_scores = _rank(side, candidates, _long_option_scores(side, candidates, target_delta, 0.10), target_delta)
+        liquid = self._liquidity_mask(side)
         
         # Try to find valid debit spread
-        for long_contract in candidate_long_legs:
-            long_strike = long_contract.strike
+        for i, opt_score in zip(ranked, ranked_scores):
+            long_strike = float(side.strike[i])
             
             # Find short leg (spread_width away)
             if option_type == 'call':
@@ -546,23 +778,20 @@ class OptionsChainManager:
             else:  # put
                 short_strike = long_strike - spread_width
             
-            # Find short leg contract
-            short_contract = next(
-                (c for c in contracts if c.strike == short_strike),
-                None
-            )
+            # Find short leg contract (binary search)
+            j = side.find_strike(short_strike)
             
-            if not short_contract:
+            if j < 0:
                 continue
             
             # Validate both legs
-            long_valid, long_reasons = self.validate_liquidity(long_contract)
-            short_valid, short_reasons = self.validate_liquidity(short_contract)
-            
-            if not long_valid or not short_valid:
-                log.debug(f"Invalid spread: long={long_valid}, short={short_valid}")
+            if not liquid[i] or not liquid[j]:
+                log.debug(f"Invalid spread: long={bool(liquid[i])}, short={bool(liquid[j])}")
                 continue
             
+            long_contract = side.contract(i)
+            short_contract = side.contract(j)
+            
             # Calculate spread metrics
             debit_cost = long_contract.ask - short_contract.bid
             max_profit = spread_width - debit_cost
@@ -598,9 +827,6 @@ class OptionsChainManager:
                 break_even=break_even
             )
             
-            # Calculate optimization score for logging
-            opt_score = calculate_option_score(long_contract, target_delta)
-            
             log.info(f"✅ Selected debit spread: {spread.symbol} {option_type} {spread.long_strike}/{spread.short_strike}")
             log.info(f"  Debit: ${debit_cost:.2f}, Max Profit: ${max_profit:.2f}, Max Loss: ${max_loss:.2f}")
             log.info(f"  Risk:Reward Ratio: {risk_reward_ratio:.2f}x (within {self.min_risk_reward_ratio:.1f}x-{self.max_risk_reward_ratio:.1f}x range ✅)")
@@ -608,7 +834,7 @@ class OptionsChainManager:
             log.info(f"  Short Leg: R:R {risk_reward_ratio:.2f}x ✅")
             log.info(f"  Long Leg Greeks: Gamma={long_contract.gamma:.4f}, Theta={long_contract.theta:.4f}, Vega={long_contract.vega:.4f}, IV={long_contract.implied_volatility:.2%}")
             log.info(f"  Optimization Score: {opt_score:.3f} (Gamma:40%, Theta:30%, Delta:20%, Vega:10%)")
-            log.info(f"  Rev 00212: Premium ${premium:.2f} in range [${premium_min:.2f}, ${premium_max:.2f}] ✅")
+            log.info(f"  Rev 00212: Premium ${long_contract.mid_price:.2f} in range [${premium_min:.2f}, ${premium_max:.2f}] ✅")
             
             return spread
         
@@ -634,62 +860,28 @@ class OptionsChainManager:
         Returns:
             OptionContract or None if no valid contract found
         """
-        contracts = chain.get(option_type + 's', [])
+        side = self._chain_side(chain, option_type)
         
-        if not contracts:
+        if not side:
             return None
         
         # Filter by delta range (target ± 0.05)
         delta_min = target_delta - 0.05
         delta_max = target_delta + 0.05
         
-        candidates = [
-            c for c in contracts
-            if delta_min <= abs(c.delta) <= delta_max
-        ]
+        candidates = np.flatnonzero((delta_min <= side.abs_delta) & (side.abs_delta <= delta_max))
         
-        if not candidates:
+        if not candidates.size:
             return None
         
         # Multi-factor optimization: Cheap gamma + Low decay + Peak gamma potential + Vega risk
-        def calculate_lotto_score(contract, target_delta):
-            """Calculate multi-factor optimization score for lotto selection"""
-            score = 0.0
-            
-            # 1. Gamma Score (40% weight) - Buy cheap gamma, maximize peak gamma potential
-            gamma_score = abs(contract.gamma) if contract.gamma else 0.0
-            gamma_normalized = min(gamma_score / 0.10, 1.0) if gamma_score > 0 else 0.0
-            score += gamma_normalized * 0.40
-            
-            # 2. Theta Score (30% weight) - Minimize decay (lower absolute theta = better)
-            theta_score = abs(contract.theta) if contract.theta else 0.0
-            theta_normalized = max(0.0, (0.30 - theta_score) / 0.30) if theta_score > 0 else 1.0
-            score += theta_normalized * 0.30
-            
-            # 3. Delta Proximity (20% weight) - Closest to target delta
-            delta_diff = abs(abs(contract.delta) - target_delta)
-            delta_score = max(0.0, 1.0 - (delta_diff / 0.05))  # Within ±0.05 range for lottos
-            score += delta_score * 0.20
-            
-            # 4. Vega Risk (10% weight) - Minimize vega risk (lower vega = less IV sensitivity)
-            vega_score = abs(contract.vega) if contract.vega else 0.0
-            vega_normalized = max(0.0, (0.15 - vega_score) / 0.15) if vega_score > 0 else 1.0
-            score += vega_normalized * 0.10
-            
-            return score
+        # (delta proximity within ±0.05 for lottos)
+        ranked, ranked_scores = _rank(side, candidates, _long_option_scores(side, candidates, target_delta, 0.05), target_delta)
+        liquid = self._liquidity_mask(side)
         
-        # Sort by multi-factor optimization score (descending)
-        candidates.sort(
-            key=lambda x: (
-                -calculate_lotto_score(x, target_delta),  # Higher score first
-                abs(abs(x.delta) - target_delta)  # Then closest delta to target
-            )
-        )
-        
-        for contract in candidates:
-            is_valid, reasons = self.validate_liquidity(contract)
-            if is_valid:
-                opt_score = calculate_lotto_score(contract, target_delta)
+        for i, opt_score in zip(ranked, ranked_scores):
+            if liquid[i]:
+                contract = side.contract(i)
                 log.info(f"Selected lotto strike: {contract.symbol} {option_type} {contract.strike} @ ${contract.mid_price:.2f}")
                 log.info(f"  Greeks: Gamma={contract.gamma:.4f}, Theta={contract.theta:.4f}, Vega={contract.vega:.4f}, IV={contract.implied_volatility:.2%}")
                 log.info(f"  Optimization Score: {opt_score:.3f} (Gamma:40%, Theta:30%, Delta:20%, Vega:10%)")
@@ -720,82 +912,27 @@ class OptionsChainManager:
         Returns:
             DebitSpread or None if no valid spread found
         """
-        contracts = chain.get(option_type + 's', [])
+        side = self._chain_side(chain, option_type)
         
-        if not contracts:
+        if not side:
             return None
         
         # Find ATM or slightly ITM option for long leg
         # For calls: ATM or slightly ITM (strike <= current_price)
         # For puts: ATM or slightly ITM (strike >= current_price)
         if option_type == 'call':
-            long_candidates = [
-                c for c in contracts
-                if c.strike <= current_price * 1.01  # ATM or slightly ITM (within 1%)
-                and 0.30 <= abs(c.delta) <= 0.50  # 30-50 delta for ATM
-            ]
+            near_money = side.strike <= current_price * 1.01  # ATM or slightly ITM (within 1%)
         else:  # put
-            long_candidates = [
-                c for c in contracts
-                if c.strike >= current_price * 0.99  # ATM or slightly ITM (within 1%)
-                and 0.30 <= abs(c.delta) <= 0.50  # 30-50 delta for ATM
-            ]
+            near_money = side.strike >= current_price * 0.99  # ATM or slightly ITM (within 1%)
+        long_candidates = np.flatnonzero(near_money & (0.30 <= side.abs_delta) & (side.abs_delta <= 0.50))  # 30-50 delta for ATM
         
-        if not long_candidates:
-            return None
-        
-        # Sort by delta proximity to 0.40 (ideal ATM delta)
-        long_candidates.sort(key=lambda x: abs(abs(x.delta) - 0.40))
-        
-        for long_contract in long_candidates[:5]:  # Try top 5 candidates
-            # Find short leg: strikes_otm strikes away
-            if option_type == 'call':
-                target_short_strike = long_contract.strike + (strikes_otm * self._get_strike_increment(long_contract.strike))
-            else:  # put
-                target_short_strike = long_contract.strike - (strikes_otm * self._get_strike_increment(long_contract.strike))
-            
-            # Find closest short leg contract
-            short_candidates = [
-                c for c in contracts
-                if abs(c.strike - target_short_strike) < (self._get_strike_increment(long_contract.strike) * 0.5)
-            ]
-            
-            if not short_candidates:
-                continue
-            
-            short_contract = min(short_candidates, key=lambda x: abs(x.strike - target_short_strike))
-            
-            # Validate liquidity
-            long_valid, _ = self.validate_liquidity(long_contract)
-            short_valid, _ = self.validate_liquidity(short_contract)
-            
-            if long_valid and short_valid:
-                # Calculate spread details
-                spread_width = abs(long_contract.strike - short_contract.strike)
-                debit_cost = long_contract.mid_price - short_contract.mid_price
-                max_profit = spread_width - debit_cost
-                max_loss = debit_cost
-                break_even = long_contract.strike + debit_cost if option_type == 'call' else long_contract.strike - debit_cost
-                
-                spread = DebitSpread(
-                    symbol=long_contract.symbol,
-                    expiry=long_contract.expiry,
-                    option_type=option_type,
-                    long_strike=long_contract.strike,
-                    short_strike=short_contract.strike,
-                    long_contract=long_contract,
-                    short_contract=short_contract,
-                    debit_cost=debit_cost,
-                    max_profit=max_profit,
-                    max_loss=max_loss,
-                    break_even=break_even
-                )
-                
-                log.info(f"✅ Selected ATM Momentum Scalper: {spread.symbol} {option_type} {spread.long_strike}/{spread.short_strike}")
-                log.info(f"   - Debit: ${debit_cost:.2f}, Max Profit: ${max_profit:.2f}, Max Loss: ${max_loss:.2f}")
-                return spread
+        # Sort by delta proximity to 0.40 (ideal ATM delta); short leg strikes_otm strikes away
+        spread = self._offset_debit_spread(side, option_type, long_candidates, 0.40, strikes_otm)
         
-        return None
+        if spread:
+            log.info(f"✅ Selected ATM Momentum Scalper: {spread.symbol} {option_type} {spread.long_strike}/{spread.short_strike}")
+            log.info(f"   - Debit: ${spread.debit_cost:.2f}, Max Profit: ${spread.max_profit:.2f}, Max Loss: ${spread.max_loss:.2f}")
+        return spread
     
     def select_itm_probability_spread(
         self,
@@ -820,54 +957,63 @@ class OptionsChainManager:
         Returns:
             DebitSpread or None if no valid spread found
         """
-        contracts = chain.get(option_type + 's', [])
+        side = self._chain_side(chain, option_type)
         
-        if not contracts:
+        if not side:
             return None
         
         # Find deeper ITM option for long leg (delta 0.60-0.70)
         if option_type == 'call':
-            long_candidates = [
-                c for c in contracts
-                if c.strike <= current_price  # ITM for calls
-                and 0.60 <= abs(c.delta) <= 0.70  # Deeper ITM delta
-            ]
+            in_the_money = side.strike <= current_price  # ITM for calls
         else:  # put
-            long_candidates = [
-                c for c in contracts
-                if c.strike >= current_price  # ITM for puts
-                and 0.60 <= abs(c.delta) <= 0.70  # Deeper ITM delta
-            ]
+            in_the_money = side.strike >= current_price  # ITM for puts
+        long_candidates = np.flatnonzero(in_the_money & (0.60 <= side.abs_delta) & (side.abs_delta <= 0.70))  # Deeper ITM delta
+        
+        # Sort by delta proximity to target (0.65); short leg 3 strikes OTM (wider spread for probability)
+        spread = self._offset_debit_spread(side, option_type, long_candidates, target_delta, 3)
         
-        if not long_candidates:
+        if spread:
+            log.info(f"✅ Selected ITM Probability Spread: {spread.symbol} {option_type} {spread.long_strike}/{spread.short_strike}")
+            log.info(f"   - Debit: ${spread.debit_cost:.2f}, Max Profit: ${spread.max_profit:.2f}, Max Loss: ${spread.max_loss:.2f}")
+            log.info(f"   - Long Leg Delta: {spread.long_contract.delta:.2f} (ITM), Higher Probability")
+        return spread
+    
+    def _offset_debit_spread(
+        self,
+        side: OptionChainSide,
+        option_type: str,
+        long_candidates: np.ndarray,
+        target_delta: float,
+        strikes_away: int
+    ) -> Optional[DebitSpread]:
+        """
+        First liquid debit spread among the 5 long candidates closest to target_delta,
+        with the short leg nearest to strikes_away strike increments OTM (Rev 00247)
+        """
+        if not long_candidates.size:
             return None
         
-        # Sort by delta proximity to target (0.65)
-        long_candidates.sort(key=lambda x: abs(abs(x.delta) - target_delta))
+        order = np.argsort(np.abs(side.abs_delta[long_candidates] - target_delta), kind='stable')
+        liquid = self._liquidity_mask(side)
         
-        for long_contract in long_candidates[:5]:  # Try top 5 candidates
-            # Find short leg: 2-5 strikes OTM (wider spread for probability)
+        for i in long_candidates[order][:5].tolist():  # Try top 5 candidates
+            long_strike = float(side.strike[i])
+            increment = self._get_strike_increment(long_strike)
             if option_type == 'call':
-                target_short_strike = long_contract.strike + (3 * self._get_strike_increment(long_contract.strike))  # 3 strikes OTM
+                target_short_strike = long_strike + (strikes_away * increment)
             else:  # put
-                target_short_strike = long_contract.strike - (3 * self._get_strike_increment(long_contract.strike))  # 3 strikes OTM
+                target_short_strike = long_strike - (strikes_away * increment)
             
-            # Find closest short leg contract
-            short_candidates = [
-                c for c in contracts
-                if abs(c.strike - target_short_strike) < (self._get_strike_increment(long_contract.strike) * 0.5)
-            ]
+            # Find closest short leg contract (within half an increment)
+            j = side.nearest_strike(target_short_strike, increment * 0.5)
             
-            if not short_candidates:
+            if j < 0:
                 continue
             
-            short_contract = min(short_candidates, key=lambda x: abs(x.strike - target_short_strike))
-            
-            # Validate liquidity
-            long_valid, _ = self.validate_liquidity(long_contract)
-            short_valid, _ = self.validate_liquidity(short_contract)
-            
-            if long_valid and short_valid:
+            if liquid[i] and liquid[j]:
+                long_contract = side.contract(i)
+                short_contract = side.contract(j)
+                
                 # Calculate spread details
                 spread_width = abs(long_contract.strike - short_contract.strike)
                 debit_cost = long_contract.mid_price - short_contract.mid_price
@@ -875,7 +1021,7 @@ class OptionsChainManager:
                 max_loss = debit_cost
                 break_even = long_contract.strike + debit_cost if option_type == 'call' else long_contract.strike - debit_cost
                 
-                spread = DebitSpread(
+                return DebitSpread(
                     symbol=long_contract.symbol,
                     expiry=long_contract.expiry,
                     option_type=option_type,
@@ -888,11 +1034,6 @@ class OptionsChainManager:
                     max_loss=max_loss,
                     break_even=break_even
                 )
-                
-                log.info(f"✅ Selected ITM Probability Spread: {spread.symbol} {option_type} {spread.long_strike}/{spread.short_strike}")
-                log.info(f"   - Debit: ${debit_cost:.2f}, Max Profit: ${max_profit:.2f}, Max Loss: ${max_loss:.2f}")
-                log.info(f"   - Long Leg Delta: {long_contract.delta:.2f} (ITM), Higher Probability")
-                return spread
         
         return None
     
@@ -938,9 +1079,9 @@ class OptionsChainManager:
         Returns:
             CreditSpread object or None if no valid spread found
         """
-        contracts = chain.get(option_type + 's', [])
+        side = self._chain_side(chain, option_type)
         
-        if not contracts:
+        if not side:
             log.warning(f"No {option_type} contracts available")
             return None
         
@@ -952,85 +1093,28 @@ class OptionsChainManager:
         premium_min = 0.20
         premium_max = 0.60
         
-        # Get all strikes sorted for OTM calculation
-        all_strikes = sorted(set(c.strike for c in contracts))
-        
-        # Rev 00212: Filter by strike position (1-3 strikes OTM) and premium
-        candidate_short_legs = []
-        for c in contracts:
-            # Check delta range
-            if not (delta_min <= abs(c.delta) <= delta_max):
-                continue
-            
-            # Check premium range (use mid price)
-            premium = c.mid_price
-            if not (premium_min <= premium <= premium_max):
-                continue
-            
-            # Check strike position (1-3 strikes OTM) - for credit spreads, short leg should be OTM
-            if option_type == 'call':
-                # CALL credit: Short call should be OTM (strike > current_price)
-                if c.strike <= current_price:
-                    continue  # Not OTM
-                strikes_otm = sum(1 for s in all_strikes if current_price < s <= c.strike)
-                if not (1 <= strikes_otm <= 3):
-                    continue
-            else:  # put
-                # PUT credit: Short put should be OTM (strike < current_price)
-                if c.strike >= current_price:
-                    continue  # Not OTM
-                strikes_otm = sum(1 for s in all_strikes if current_price > s >= c.strike)
-                if not (1 <= strikes_otm <= 3):
-                    continue
-            
-            candidate_short_legs.append(c)
+        # Rev 00212: Filter by strike position (1-3 strikes OTM) and premium - for credit spreads, short leg should be OTM
+        # Rev 00247: One vectorized pass; OTM strike counts come from the sorted strike index
+        strikes_otm = side.strikes_otm(current_price)
+        candidates = np.flatnonzero(
+            (delta_min <= side.abs_delta) & (side.abs_delta <= delta_max)
+            & (premium_min <= side.mid) & (side.mid <= premium_max)
+            & side.otm_mask(current_price)
+            & (strikes_otm >= 1) & (strikes_otm <= 3)
+        )
         
-        if not candidate_short_legs:
+        if not candidates.size:
             log.warning(f"No contracts found with delta in range [{delta_min:.2f}, {delta_max:.2f}]")
             return None
         
         # For credit spreads: Consider gamma (for liquidity), but prioritize low vega risk
-        # Credit spreads have negative gamma, so we accept that but minimize vega risk
-        def calculate_credit_score(contract, target_delta):
-            """Calculate optimization score for credit spread short leg"""
-            score = 0.0
-            
-            # 1. Delta Proximity (40% weight) - Closest to target delta
-            delta_diff = abs(abs(contract.delta) - target_delta)
-            delta_score = max(0.0, 1.0 - (delta_diff / 0.10))
-            score += delta_score * 0.40
-            
-            # 2. Vega Risk (30% weight) - Minimize vega risk (lower vega = less IV sensitivity)
-            # For credit spreads, lower vega is better (less sensitive to IV changes)
-            vega_score = abs(contract.vega) if contract.vega else 0.0
-            vega_normalized = max(0.0, (0.15 - vega_score) / 0.15) if vega_score > 0 else 1.0
-            score += vega_normalized * 0.30
-            
-            # 3. Gamma (20% weight) - Higher gamma for liquidity/spread quality
-            # Accept negative gamma exposure, but use for liquidity selection
-            gamma_score = abs(contract.gamma) if contract.gamma else 0.0
-            gamma_normalized = min(gamma_score / 0.10, 1.0) if gamma_score > 0 else 0.0
-            score += gamma_normalized * 0.20
-            
-            # 4. Theta Benefit (10% weight) - Higher theta benefits credit spreads (time decay helps)
-            # For credit spreads, higher theta (more negative) is actually beneficial
-            theta_score = abs(contract.theta) if contract.theta else 0.0
-            theta_normalized = min(theta_score / 0.30, 1.0) if theta_score > 0 else 0.0
-            score += theta_normalized * 0.10
-            
-            return score
-        
-        # Sort by credit spread optimization score (descending)
-        candidate_short_legs.sort(
-            key=lambda x: (
-                -calculate_credit_score(x, target_delta),  # Higher score first
-                abs(abs(x.delta) - target_delta)  # Then closest delta to target
-            )
-        )
+        # Sort by credit spread optimization score (descending), then closest delta to target
+        ranked, ranked_scores = _rank(side, candidates, _credit_short_scores(side, candidates, target_delta), target_delta)
+        liquid = self._liquidity_mask(side)
         
         # Try to find valid credit spread
-        for short_contract in candidate_short_legs:
-            short_strike = short_contract.strike
+        for i, credit_score in zip(ranked, ranked_scores):
+            short_strike = float(side.strike[i])
             
             # Find long leg (spread_width away)
             if option_type == 'call':
@@ -1040,23 +1124,20 @@ class OptionsChainManager:
                 # PUT credit spread: Short at higher strike, long at lower strike
                 long_strike = short_strike - spread_width
             
-            # Find long leg contract
-            long_contract = next(
-                (c for c in contracts if c.strike == long_strike),
-                None
-            )
+            # Find long leg contract (binary search)
+            j = side.find_strike(long_strike)
             
-            if not long_contract:
+            if j < 0:
                 continue
             
             # Validate both legs
-            short_valid, short_reasons = self.validate_liquidity(short_contract)
-            long_valid, long_reasons = self.validate_liquidity(long_contract)
-            
-            if not short_valid or not long_valid:
-                log.debug(f"Invalid credit spread: short={short_valid}, long={long_valid}")
+            if not liquid[i] or not liquid[j]:
+                log.debug(f"Invalid credit spread: short={bool(liquid[i])}, long={bool(liquid[j])}")
                 continue
             
+            short_contract = side.contract(i)
+            long_contract = side.contract(j)
+            
             # Calculate spread metrics
             # Credit spread: Receive premium from short leg, pay premium for long leg
             credit_received = short_contract.bid - long_contract.ask
@@ -1101,7 +1182,6 @@ class OptionsChainManager:
                 break_even=break_even
             )
             
-            credit_score = calculate_credit_score(short_contract, target_delta)
             log.info(f"Selected credit spread: {spread.symbol} {option_type} {spread.short_strike}/{spread.long_strike}")
             log.info(f"  Credit: ${credit_received:.2f}, Max Profit: ${max_profit:.2f}, Max Loss: ${max_loss:.2f}")
             log.info(f"  Short Leg Greeks: Gamma={short_contract.gamma:.4f}, Theta={short_contract.theta:.4f}, Vega={short_contract.vega:.4f}, IV={short_contract.implied_volatility:.2%}")
@@ -1111,4 +1191,3 @@ class OptionsChainManager:
         
         log.warning(f"No valid credit spread found for {option_type} with delta {target_delta:.2f}")
         return None
-
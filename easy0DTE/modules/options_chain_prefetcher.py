@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Options Chain Prefetcher
+========================
+
+Keeps the 0DTE options chains for the whole 0DTE watchlist warm in the
+OptionsChainManager cache, so strike selection at execution time is served
+from memory instead of serializing one E*TRADE chain call per signal.
+
+Rev 00246:
+- Started when the SO window opens; stopped once 0DTE execution is done
+  (or at the daily reset)
+- Each pass refreshes, concurrently and off the event loop, only the chains
+  whose cache age reached the refresh cadence (incremental refresh)
+- The cadence is clamped below chain_stale_threshold_seconds and the chain
+  cache TTL, so a warm chain is never rejected as stale
+- A failed or empty refresh keeps the previous chain (and its age); the
+  symbol is retried after the chain manager's per-chain backoff, not on
+  every wake-up
+
+Author: Easy ORB Strategy Development Team
+Last Updated: October 16, 2026 (Rev 00246)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+CHAIN_PREFETCH_ENABLED = os.getenv('0DTE_CHAIN_PREFETCH_ENABLED', 'true').lower() == 'true'
+CHAIN_PREFETCH_REFRESH_SECONDS = float(os.getenv('0DTE_CHAIN_PREFETCH_REFRESH_SECONDS', '120'))
+CHAIN_PREFETCH_CONCURRENCY = int(os.getenv('0DTE_CHAIN_PREFETCH_CONCURRENCY', '6'))
+
+
+class OptionsChainPrefetcher:
+    """
+    Background refresher for 0DTE options chains
+
+    Usage:
+        prefetcher = OptionsChainPrefetcher(chain_manager, load_0dte_symbols())
+        prefetcher.start()
+        ...
+        chain = await chain_manager.fetch_options_chain('SPY')  # served warm
+        ...
+        await prefetcher.stop()
+    """
+
+    def __init__(
+        self,
+        chain_manager: Any,
+        symbols: List[str],
+        refresh_seconds: float = CHAIN_PREFETCH_REFRESH_SECONDS,
+        max_concurrency: int = CHAIN_PREFETCH_CONCURRENCY
+    ):
+        """
+        Args:
+            chain_manager: OptionsChainManager whose cache is kept warm
+            symbols: Underlyings to prefetch (0dte_list.csv order)
+            refresh_seconds: Target chain age before it is refreshed
+            max_concurrency: Maximum chain fetches in flight
+        """
+        self.chain_manager = chain_manager
+        self.symbols = list(dict.fromkeys(symbols))
+        self.max_concurrency = max(1, int(max_concurrency))
+
+        # Refresh well inside both the stale threshold and the cache TTL
+        limit = 0.8 * min(chain_manager.chain_stale_threshold_seconds, chain_manager.cache_ttl)
+        if refresh_seconds > limit:
+            log.warning(f"⚠️ Chain prefetch cadence {refresh_seconds:.0f}s exceeds stale window - using {limit:.0f}s")
+            refresh_seconds = limit
+        self.refresh_seconds = refresh_seconds
+
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {'passes': 0, 'fetches': 0, 'failures': 0, 'last_pass_ms': 0.0}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _seconds_until_due(self, symbol: str) -> float:
+        """Time until the symbol's chain reaches the refresh cadence and any retry backoff has passed"""
+        age = self.chain_manager.chain_age_seconds(symbol)
+        until_stale = 0.0 if age is None else self.refresh_seconds - age
+        return max(until_stale, self.chain_manager.chain_retry_in_seconds(symbol), 0.0)
+
+    def _due_symbols(self) -> List[str]:
+        """Symbols whose cached chain is missing or reached the refresh cadence (and is not backing off)"""
+        return [symbol for symbol in self.symbols if self._seconds_until_due(symbol) <= 0]
+
+    async def refresh(self, force: bool = False) -> int:
+        """
+        Run one refresh pass
+
+        Args:
+            force: Refresh every symbol regardless of age
+
+        Returns:
+            Number of chains fetched
+        """
+        due = list(self.symbols) if force else self._due_symbols()
+        if not due:
+            return 0
+
+        start = time.perf_counter()
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(symbol: str) -> bool:
+            async with slots:
+                try:
+                    chain = await self.chain_manager.fetch_options_chain(symbol, expiry=None, use_cache=False)
+                    return bool(chain.get('calls') or chain.get('puts'))
+                except Exception as e:
+                    log.debug(f"Chain prefetch failed for {symbol}: {e}")
+                    return False
+
+        results = await asyncio.gather(*(fetch(symbol) for symbol in due))
+
+        self.stats['passes'] += 1
+        self.stats['fetches'] += len(due)
+        self.stats['failures'] += results.count(False)
+        self.stats['last_pass_ms'] = (time.perf_counter() - start) * 1000
+        log.info(f"🔗 Chain prefetch: {results.count(True)}/{len(due)} chains refreshed in {self.stats['last_pass_ms']:.0f}ms "
+                 f"({len(self.symbols) - len(due)} still warm)")
+        return len(due)
+
+    async def _run(self):
+        await self.refresh(force=True)
+        while True:
+            # Wake up when the next chain is due (or at most every refresh interval)
+            delay = min((self._seconds_until_due(symbol) for symbol in self.symbols), default=self.refresh_seconds)
+            await asyncio.sleep(min(max(delay, 1.0), self.refresh_seconds))
+            try:
+                await self.refresh()
+            except Exception as e:
+                log.warning(f"⚠️ Chain prefetch pass failed: {e}")
+
+    def start(self) -> asyncio.Task:
+        """Start the background refresh loop (no-op if already running)"""
+        if not self.running:
+            log.info(f"🔗 Starting 0DTE chain prefetch for {len(self.symbols)} symbols "
+                     f"(refresh every {self.refresh_seconds:.0f}s, {self.max_concurrency} concurrent)")
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    def cancel(self):
+        """Cancel the refresh loop without waiting for it"""
+        if self.running:
+            self._task.cancel()
+        self._task = None
+
+    async def stop(self):
+        """Stop the background refresh loop"""
+        if self.running:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            log.info(f"🔗 Chain prefetch stopped ({self.stats['passes']} passes, {self.stats['fetches']} fetches)")
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'symbols': len(self.symbols), 'running': self.running}
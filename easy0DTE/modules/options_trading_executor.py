@@ -159,7 +159,9 @@ class OptionsTradingExecutor:
         
         # Demo Mode: Use mock executor
         if self.demo_mode and self.mock_executor:
-            return await self.mock_executor.execute_debit_spread(spread, quantity)
+            mock_position = await self.mock_executor.execute_debit_spread(spread, quantity)
+            self._track_demo_position(mock_position, debit_spread=spread)
+            return mock_position
         
         # Live Mode: Use ETrade API
         if not self.demo_mode and self.etrade_options_api:
@@ -283,7 +285,9 @@ class OptionsTradingExecutor:
         
         # Demo Mode: Use mock executor
         if self.demo_mode and self.mock_executor:
-            return await self.mock_executor.execute_lotto_sleeve(contract, quantity)
+            mock_position = await self.mock_executor.execute_lotto_sleeve(contract, quantity)
+            self._track_demo_position(mock_position, lotto_contract=contract)
+            return mock_position
         
         # Live Mode: Use ETrade API
         if not self.demo_mode and self.etrade_options_api:
@@ -414,7 +418,9 @@ class OptionsTradingExecutor:
         
         # Demo Mode: Use mock executor
         if self.demo_mode and self.mock_executor:
-            return await self.mock_executor.execute_credit_spread(spread, quantity)
+            mock_position = await self.mock_executor.execute_credit_spread(spread, quantity)
+            self._track_demo_position(mock_position, credit_spread=spread)
+            return mock_position
         
         # Live Mode: Use ETrade API
         if not self.demo_mode and self.etrade_options_api:
@@ -513,6 +519,73 @@ class OptionsTradingExecutor:
         
         return position
     
+    def _track_demo_position(self, mock_position, **legs) -> None:
+        """
+        Track a Demo (mock) position like a Live one (Rev 00248)
+        
+        Registers it under the same position ID so revaluation, exit monitoring,
+        partial profits and EOD close cover Demo positions too.
+        """
+        if mock_position is None:
+            return
+        self.positions[mock_position.position_id] = OptionsPosition(
+            position_id=mock_position.position_id,
+            symbol=mock_position.symbol,
+            position_type=mock_position.position_type,
+            entry_price=mock_position.entry_price,
+            entry_time=mock_position.entry_time,
+            quantity=mock_position.quantity,
+            current_value=mock_position.current_value,
+            **legs
+        )
+    
+    async def revalue_positions(self, underlying_prices: Dict[str, float], pricer: Any) -> int:
+        """
+        Mark all open positions to model in one batch pricing pass (Rev 00248, Demo mode)
+        
+        Args:
+            underlying_prices: Current underlying quote per symbol
+            pricer: SyntheticChainGenerator (or anything with price_legs)
+            
+        Returns:
+            Number of positions revalued
+        """
+        legs = []
+        owners = []  # (position_id, sign) per leg
+        for position in self.get_open_positions():
+            underlying_price = underlying_prices.get(position.symbol)
+            if not underlying_price or underlying_price <= 0:
+                continue
+            if position.position_type == 'debit_spread' and position.debit_spread:
+                # Value = long leg - short leg
+                signed_legs = [(position.debit_spread.long_contract, 1.0), (position.debit_spread.short_contract, -1.0)]
+            elif position.position_type == 'credit_spread' and position.credit_spread:
+                # Value = cost to close = short leg - long leg
+                signed_legs = [(position.credit_spread.short_contract, 1.0), (position.credit_spread.long_contract, -1.0)]
+            elif position.lotto_contract:
+                signed_legs = [(position.lotto_contract, 1.0)]
+            else:
+                continue
+            for contract, sign in signed_legs:
+                legs.append((position.symbol, underlying_price, contract.strike, contract.option_type, contract.expiry))
+                owners.append((position.position_id, sign))
+        
+        if not legs:
+            return 0
+        
+        values: Dict[str, float] = {}
+        for (position_id, sign), leg_value in zip(owners, pricer.price_legs(legs).tolist()):
+            values[position_id] = values.get(position_id, 0.0) + sign * leg_value
+        
+        for position_id, value in values.items():
+            value = max(value, 0.0)
+            await self.update_position_value(position_id, value)
+            if self.mock_executor:
+                await self.mock_executor.update_position_value(position_id, value)
+        
+        log.debug(f"Revalued {len(values)} options positions ({len(legs)} legs) in one pricing pass")
+        return len(values)
+    
     async def update_position_value(
         self,
         position_id: str,
@@ -178,6 +178,9 @@ class Prime0DTEStrategyManager:
         # Callbacks
         self.on_signal_callback: Optional[Callable] = None
         
+        # Rev 00235: Per-scan benchmark snapshot (SPY/QQQ/SPX) shared by the trading system
+        self.benchmark_context = None
+        
         log.info(f"Prime 0DTE Strategy Manager initialized:")
         log.info(f"  - Target symbols: {self.target_symbols}")
         log.info(f"  - Max positions: {self.max_positions}")
@@ -188,6 +191,30 @@ class Prime0DTEStrategyManager:
         """Set callback for when 0DTE signals are generated"""
         self.on_signal_callback = callback
     
+    def set_benchmark_context(self, benchmark_context):
+        """Set the per-scan benchmark snapshot used for SPY/QQQ market alignment (Rev 00235)"""
+        self.benchmark_context = benchmark_context
+    
+    def _get_market_alignment_data(self) -> Dict[str, Any]:
+        """
+        Get SPY/QQQ direction for the momentum score market alignment factor (Rev 00235)
+        
+        Reads the shared benchmark snapshot; returns 'NONE' directions when the snapshot
+        is missing or older than its staleness bound.
+        """
+        context = self.benchmark_context
+        if context is None:
+            return {'spy_direction': 'NONE', 'qqq_direction': 'NONE'}
+        
+        age = context.record_use()
+        if context.is_stale():
+            log.warning(f"⚠️ Benchmark snapshot stale ({age:.0f}s > {context.max_age_seconds:.0f}s) - skipping market alignment")
+            return {'spy_direction': 'NONE', 'qqq_direction': 'NONE', 'benchmark_age_seconds': round(age, 3)}
+        
+        alignment = context.alignment_data()
+        log.debug(f"Market alignment: SPY {alignment['spy_direction']}, QQQ {alignment['qqq_direction']} (benchmark age {age:.1f}s)")
+        return alignment
+    
     async def listen_to_orb_signals(
         self,
         orb_signals: List[Dict[str, Any]],
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Synthetic Options Chain Generator
+=================================
+
+Black-Scholes priced 0DTE chains for Demo mode, so strike selection and the
+mock executor run against full chains (prices + Greeks) instead of the empty
+Demo placeholder.
+
+Rev 00248:
+- One vectorized NumPy pass prices a whole chain (both sides, all Greeks)
+- Time to expiry runs to the 4:00 PM ET close of the expiry date
+- Implied volatility comes from a per-symbol surface (ATM level, skew and
+  curvature in log-moneyness), seeded from config or fitted from the last real
+  E*TRADE chain (persisted, so Demo instances can reuse it)
+- The same batch pricer revalues open Demo positions every monitoring tick
+
+Author: Easy ORB Strategy Development Team
+Last Updated: October 16, 2026 (Rev 00248)
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+
+from .options_chain_manager import OptionChainSide
+
+log = logging.getLogger(__name__)
+
+ET_TZ = pytz.timezone('America/New_York')
+
+SYNTHETIC_CHAIN_ENABLED = os.getenv('0DTE_SYNTHETIC_CHAIN_ENABLED', 'true').lower() == 'true'
+SYNTHETIC_ATM_IV = float(os.getenv('0DTE_SYNTHETIC_ATM_IV', '0.20'))
+SYNTHETIC_IV_SKEW = float(os.getenv('0DTE_SYNTHETIC_IV_SKEW', '-1.0'))
+SYNTHETIC_IV_CURVATURE = float(os.getenv('0DTE_SYNTHETIC_IV_CURVATURE', '25.0'))
+SYNTHETIC_RISK_FREE_RATE = float(os.getenv('0DTE_SYNTHETIC_RISK_FREE_RATE', '0.045'))
+SYNTHETIC_STRIKE_COUNT = int(os.getenv('0DTE_SYNTHETIC_STRIKE_COUNT', '20'))
+SYNTHETIC_SPREAD_PCT = float(os.getenv('0DTE_SYNTHETIC_SPREAD_PCT', '3.0'))
+SYNTHETIC_STRIKE_INCREMENTS = os.getenv('0DTE_SYNTHETIC_STRIKE_INCREMENTS', 'SPX:5,SPY:1,QQQ:1')
+SYNTHETIC_IV_SURFACE_FILE = os.getenv('0DTE_SYNTHETIC_IV_SURFACE_FILE', 'data/0dte_iv_surfaces.json')
+SYNTHETIC_IV_SURFACE_MAX_AGE_DAYS = float(os.getenv('0DTE_SYNTHETIC_IV_SURFACE_MAX_AGE_DAYS', '5'))
+
+SECONDS_PER_YEAR = 365.0 * 24 * 3600
+MIN_TIME_TO_EXPIRY_SECONDS = 60.0  # Floor so prices stay finite into the close
+IV_FLOOR = 0.05
+IV_CAP = 3.0
+
+# Synthetic liquidity profile: peaks at the money, decays with |log-moneyness|
+OPEN_INTEREST_ATM = 5000
+VOLUME_ATM = 2000
+OPEN_INTEREST_DECAY = 0.02
+VOLUME_DECAY = 0.015
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF (Abramowitz & Stegun 7.1.26 erf, |error| < 1.5e-7)"""
+    z = np.abs(x) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-z * z)
+    return 0.5 * (1.0 + np.sign(x) * erf)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / np.sqrt(2.0 * np.pi)
+
+
+def black_scholes(
+    underlying: np.ndarray,
+    strike: np.ndarray,
+    time_to_expiry: np.ndarray,
+    volatility: np.ndarray,
+    is_call: np.ndarray,
+    risk_free_rate: float = SYNTHETIC_RISK_FREE_RATE
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized Black-Scholes prices and Greeks (all inputs broadcast)
+
+    Greeks use E*TRADE conventions: theta per calendar day, vega per 1 vol point.
+
+    Returns:
+        {'price', 'delta', 'gamma', 'theta', 'vega'}
+    """
+    S, K, T, sigma, is_call = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64)
+                                                    for a in (underlying, strike, time_to_expiry, volatility)),
+                                                  np.asarray(is_call, dtype=bool))
+
+    sqrt_t = np.sqrt(T)
+    vol_sqrt_t = sigma * sqrt_t
+    d1 = (np.log(S / K) + (risk_free_rate + 0.5 * sigma * sigma) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    discount = K * np.exp(-risk_free_rate * T)
+    pdf_d1 = _norm_pdf(d1)
+
+    call_price = S * _norm_cdf(d1) - discount * _norm_cdf(d2)
+    put_price = discount * _norm_cdf(-d2) - S * _norm_cdf(-d1)
+    decay = -S * pdf_d1 * sigma / (2.0 * sqrt_t)
+
+    return {
+        'price': np.maximum(np.where(is_call, call_price, put_price), 0.0),
+        'delta': np.where(is_call, _norm_cdf(d1), _norm_cdf(d1) - 1.0),
+        'gamma': pdf_d1 / (S * vol_sqrt_t),
+        'theta': np.where(is_call,
+                          decay - risk_free_rate * discount * _norm_cdf(d2),
+                          decay + risk_free_rate * discount * _norm_cdf(-d2)) / 365.0,
+        'vega': S * pdf_d1 * sqrt_t / 100.0
+    }
+
+
+def time_to_expiry_years(expiry: str, now: Optional[datetime] = None) -> float:
+    """
+    Years from now to the 4:00 PM ET close on expiry (YYYY-MM-DD), floored at one minute
+    """
+    close = ET_TZ.localize(datetime.strptime(expiry, '%Y-%m-%d').replace(hour=16, minute=0))
+    if now is None:
+        now = datetime.now(ET_TZ)
+    elif now.tzinfo is None:
+        now = ET_TZ.localize(now)
+    seconds = (close - now).total_seconds()
+    return max(seconds, MIN_TIME_TO_EXPIRY_SECONDS) / SECONDS_PER_YEAR
+
+
+@dataclass
+class IVSurface:
+    """Implied volatility smile: iv(x) = atm_iv + skew*x + curvature*x², x = ln(K/S)"""
+    atm_iv: float
+    skew: float
+    curvature: float
+    source: str = 'config'  # 'config' or 'chain'
+    fitted_at: float = 0.0  # Epoch seconds (chain fits only)
+
+    def iv(self, log_moneyness: np.ndarray) -> np.ndarray:
+        x = np.asarray(log_moneyness, dtype=np.float64)
+        return np.clip(self.atm_iv + self.skew * x + self.curvature * x * x, IV_FLOOR, IV_CAP)
+
+    @classmethod
+    def fit(cls, strikes: np.ndarray, ivs: np.ndarray, underlying_price: float) -> Optional['IVSurface']:
+        """Least-squares smile through observed (strike, iv) points (None if too few)"""
+        valid = (ivs > 0) & (strikes > 0)
+        if not valid.any():
+            return None
+        x = np.log(strikes[valid] / underlying_price)
+        y = ivs[valid]
+        if np.median(y) > IV_CAP:  # Reported in percent
+            y = y / 100.0
+        near = np.abs(x) <= 0.10
+        x, y = x[near], y[near]
+        if len(np.unique(x)) >= 3:
+            curvature, skew, atm_iv = np.polyfit(x, y, 2)
+        elif len(y):
+            curvature, skew, atm_iv = 0.0, 0.0, float(np.median(y))
+        else:
+            return None
+        if not IV_FLOOR <= atm_iv <= IV_CAP:
+            return None
+        return cls(float(atm_iv), float(skew), float(curvature), source='chain', fitted_at=time.time())
+
+
+def implied_underlying_price(calls: OptionChainSide, puts: OptionChainSide) -> Optional[float]:
+    """
+    Underlying price implied by put-call parity (C - P ≈ S - K for 0DTE)
+
+    Uses the strikes where call and put mids are closest (the money).
+    """
+    common, call_idx, put_idx = np.intersect1d(calls.strike, puts.strike, return_indices=True)
+    if not len(common):
+        return None
+    call_mid = calls.mid[call_idx]
+    put_mid = puts.mid[put_idx]
+    priced = (call_mid > 0) & (put_mid > 0)
+    if not priced.any():
+        return None
+    parity = common[priced] + call_mid[priced] - put_mid[priced]
+    nearest = np.argsort(np.abs(call_mid[priced] - put_mid[priced]))[:3]
+    return float(np.median(parity[nearest]))
+
+
+def _parse_increments(spec: str) -> Dict[str, float]:
+    increments = {}
+    for item in spec.split(','):
+        if ':' in item:
+            symbol, value = item.split(':', 1)
+            try:
+                increments[symbol.strip().upper()] = float(value)
+            except ValueError:
+                log.warning(f"⚠️ Invalid synthetic strike increment '{item}' - ignored")
+    return increments
+
+
+class SyntheticChainGenerator:
+    """
+    Batch Black-Scholes pricer for synthetic 0DTE chains and Demo position revaluation
+
+    Usage:
+        generator = SyntheticChainGenerator()
+        chain = generator.generate('SPY', 585.20)              # {'calls': OptionChainSide, 'puts': ...}
+        values = generator.price_legs(legs)                    # one pass for every open leg
+    """
+
+    def __init__(
+        self,
+        atm_iv: float = SYNTHETIC_ATM_IV,
+        skew: float = SYNTHETIC_IV_SKEW,
+        curvature: float = SYNTHETIC_IV_CURVATURE,
+        risk_free_rate: float = SYNTHETIC_RISK_FREE_RATE,
+        strike_count: int = SYNTHETIC_STRIKE_COUNT,
+        spread_pct: float = SYNTHETIC_SPREAD_PCT,
+        surface_file: Optional[str] = SYNTHETIC_IV_SURFACE_FILE,
+        increment_fallback: Optional[Callable[[float], float]] = None
+    ):
+        """
+        Args:
+            atm_iv, skew, curvature: Default IV surface (used until a real chain is fitted)
+            risk_free_rate: Annualized risk-free rate
+            strike_count: Strikes generated on each side of the money
+            spread_pct: Synthetic bid/ask spread as % of theoretical value
+            surface_file: JSON file persisting fitted surfaces (None = memory only)
+            increment_fallback: Strike increment by price for symbols not in config
+        """
+        self.default_surface = IVSurface(atm_iv, skew, curvature)
+        self.risk_free_rate = risk_free_rate
+        self.strike_count = strike_count
+        self.spread_pct = spread_pct
+        self.surface_file = surface_file
+        self.increments = _parse_increments(SYNTHETIC_STRIKE_INCREMENTS)
+        self.increment_fallback = increment_fallback
+        self.surfaces: Dict[str, IVSurface] = self._load_surfaces()
+        self.stats = {'chains': 0, 'revaluations': 0, 'legs_priced': 0, 'fits': 0}
+
+        log.info(f"🧪 Synthetic options chains: ATM IV {atm_iv:.0%}, skew {skew:+.2f}, "
+                 f"{strike_count} strikes each side ({len(self.surfaces)} fitted surfaces loaded)")
+
+    def _load_surfaces(self) -> Dict[str, IVSurface]:
+        if not self.surface_file or not os.path.exists(self.surface_file):
+            return {}
+        try:
+            with open(self.surface_file, 'r') as f:
+                data = json.load(f)
+            max_age = SYNTHETIC_IV_SURFACE_MAX_AGE_DAYS * 86400
+            return {symbol: IVSurface(**values) for symbol, values in data.items()
+                    if time.time() - values.get('fitted_at', 0) <= max_age}
+        except Exception as e:
+            log.warning(f"⚠️ Could not load IV surfaces from {self.surface_file}: {e}")
+            return {}
+
+    def _save_surfaces(self):
+        if not self.surface_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.surface_file) or '.', exist_ok=True)
+            fitted = {symbol: asdict(surface) for symbol, surface in self.surfaces.items() if surface.source == 'chain'}
+            with open(self.surface_file, 'w') as f:
+                json.dump(fitted, f, indent=2)
+        except Exception as e:
+            log.debug(f"Could not save IV surfaces: {e}")
+
+    def surface(self, symbol: str) -> IVSurface:
+        return self.surfaces.get(symbol, self.default_surface)
+
+    def seed_from_chain(self, symbol: str, chain: Dict[str, Any]) -> Optional[IVSurface]:
+        """
+        Fit the symbol's IV surface from a real chain (OTM contracts of both sides)
+
+        Returns:
+            The fitted surface, or None if the chain could not be fitted
+        """
+        calls, puts = chain.get('calls'), chain.get('puts')
+        if not isinstance(calls, OptionChainSide) or not isinstance(puts, OptionChainSide):
+            return None
+        underlying_price = implied_underlying_price(calls, puts)
+        if not underlying_price or underlying_price <= 0:
+            return None
+        otm_calls = calls.strike >= underlying_price
+        otm_puts = puts.strike < underlying_price
+        surface = IVSurface.fit(
+            np.concatenate([calls.strike[otm_calls], puts.strike[otm_puts]]),
+            np.concatenate([calls.implied_volatility[otm_calls], puts.implied_volatility[otm_puts]]),
+            underlying_price
+        )
+        if surface is None:
+            return None
+        self.surfaces[symbol] = surface
+        self.stats['fits'] += 1
+        self._save_surfaces()
+        log.debug(f"IV surface fitted for {symbol} @ ${underlying_price:.2f}: ATM {surface.atm_iv:.1%}, "
+                  f"skew {surface.skew:+.2f}, curvature {surface.curvature:.1f}")
+        return surface
+
+    def strike_increment(self, symbol: str, underlying_price: float) -> float:
+        increment = self.increments.get(symbol.upper())
+        if increment:
+            return increment
+        if self.increment_fallback:
+            return self.increment_fallback(underlying_price)
+        return 1.0
+
+    def generate(
+        self,
+        symbol: str,
+        underlying_price: float,
+        expiry: Optional[str] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, OptionChainSide]:
+        """
+        Price a full chain (strike_count strikes each side of the money) in one pass
+
+        Args:
+            symbol: Underlying symbol
+            underlying_price: Current underlying quote
+            expiry: Expiry date (YYYY-MM-DD, None = today in ET)
+            now: Pricing time (None = current time)
+
+        Returns:
+            {'calls': OptionChainSide, 'puts': OptionChainSide}
+        """
+        if expiry is None:
+            expiry = (now or datetime.now(ET_TZ)).strftime('%Y-%m-%d')
+        increment = self.strike_increment(symbol, underlying_price)
+        atm_strike = round(underlying_price / increment) * increment
+        strikes = atm_strike + increment * np.arange(-self.strike_count, self.strike_count + 1, dtype=np.float64)
+        strikes = strikes[strikes > 0]
+
+        # Both sides in one pass: [calls | puts]
+        n = len(strikes)
+        all_strikes = np.concatenate([strikes, strikes])
+        is_call = np.arange(2 * n) < n
+        log_moneyness = np.log(all_strikes / underlying_price)
+        iv = self.surface(symbol).iv(log_moneyness)
+        greeks = black_scholes(underlying_price, all_strikes, time_to_expiry_years(expiry, now), iv, is_call,
+                               self.risk_free_rate)
+
+        theoretical = greeks['price']
+        # Quotes on the $0.01 tick, at least one tick wide
+        half_spread = theoretical * self.spread_pct / 200.0
+        bid = np.maximum(np.round(theoretical - half_spread, 2), 0.0)
+        ask = np.round(np.maximum(theoretical + half_spread, bid + 0.01), 2)
+        distance = np.abs(log_moneyness)
+        open_interest = np.round(OPEN_INTEREST_ATM * np.exp(-distance / OPEN_INTEREST_DECAY))
+        volume = np.round(VOLUME_ATM * np.exp(-distance / VOLUME_DECAY))
+
+        # Row order must match OptionChainSide.COLUMNS
+        data = np.vstack([all_strikes, bid, ask, np.round(theoretical, 2), volume, open_interest,
+                          greeks['delta'], greeks['gamma'], greeks['theta'], greeks['vega'], iv])
+        self.stats['chains'] += 1
+        return {
+            'calls': OptionChainSide(symbol, expiry, 'call', data[:, :n]),
+            'puts': OptionChainSide(symbol, expiry, 'put', data[:, n:])
+        }
+
+    def price_legs(
+        self,
+        legs: Sequence[Tuple[str, float, float, str, str]],
+        now: Optional[datetime] = None
+    ) -> np.ndarray:
+        """
+        Theoretical values for many option legs in one pass
+
+        Args:
+            legs: (symbol, underlying_price, strike, option_type, expiry) per leg
+            now: Pricing time (None = current time)
+
+        Returns:
+            Array of per-leg theoretical values (same order as legs)
+        """
+        if not legs:
+            return np.zeros(0)
+        symbols, underlying, strikes, option_types, expiries = zip(*legs)
+        underlying = np.asarray(underlying, dtype=np.float64)
+        strikes = np.asarray(strikes, dtype=np.float64)
+        log_moneyness = np.log(strikes / underlying)
+
+        # Per-leg surface coefficients, then one vectorized IV + pricing pass
+        surfaces = [self.surface(symbol) for symbol in symbols]
+        atm_iv = np.array([s.atm_iv for s in surfaces])
+        skew = np.array([s.skew for s in surfaces])
+        curvature = np.array([s.curvature for s in surfaces])
+        iv = np.clip(atm_iv + skew * log_moneyness + curvature * log_moneyness ** 2, IV_FLOOR, IV_CAP)
+
+        expiry_years = {expiry: time_to_expiry_years(expiry, now) for expiry in set(expiries)}
+        time_to_expiry = np.array([expiry_years[expiry] for expiry in expiries])
+        is_call = np.array([option_type == 'call' for option_type in option_types])
+
+        self.stats['revaluations'] += 1
+        self.stats['legs_priced'] += len(legs)
+        return black_scholes(underlying, strikes, time_to_expiry, iv, is_call, self.risk_free_rate)['price']
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'fitted_surfaces': sorted(s for s, v in self.surfaces.items() if v.source == 'chain')}
@@ -15,20 +15,17 @@ import signal
 from typing import Optional
 from datetime import datetime
 
+# --- Startup timeline (Rev 00250): imported first so the imports below are profiled ---
+from modules.startup_timeline import get_startup_timeline, STARTUP_TOP_IMPORTS
+startup_timeline = get_startup_timeline()
+
 # --- Prime System Imports ---
-from modules.prime_trading_system import (
-    get_prime_trading_system, PrimeTradingSystem, TradingConfig, SystemMode
-)
-from modules.prime_market_manager import (
-    get_prime_market_manager, PrimeMarketManager, MarketSession
-)
+# Rev 00250: Trading subsystems (prime_trading_system, E*TRADE, data/market/alert managers)
+# are imported by import_trading_modules() after the HTTP server is up
 # ARCHIVED (Rev 00173): Production signal generator no longer used - ORB manager generates signals directly
 # DELETED (Oct 20, 2025): Removed production_signal_generator import - ORB strategy handles signals directly
-from modules.etrade_oauth_integration import get_etrade_oauth_integration
-from modules.prime_etrade_trading import PrimeETradeTrading
 from modules.prime_models import StrategyMode
 from modules.config_loader import load_configuration, get_config_value
-from modules.prime_alert_manager import AlertLevel
 
 # OAuth keep-alive handled by Cloud Scheduler (no local keep-alive needed)
 
@@ -161,10 +158,26 @@ def _to_strategy_mode(mode_str: str) -> StrategyMode:
     }
     return mapping.get(str(mode_str).lower(), StrategyMode.STANDARD)
 
+def import_trading_modules():
+    """
+    Import the trading subsystems (Rev 00250)
+    
+    Run in a worker thread by main() so pandas, yfinance, aiohttp and the google-cloud
+    clients load while the HTTP server is already answering /health.
+    """
+    import modules.prime_trading_system
+    import modules.prime_data_manager
+    import modules.prime_etrade_trading
+    import modules.etrade_oauth_integration
+    import modules.prime_orb_strategy_manager
+    import modules.prime_unified_trade_manager
+
 def get_integrated_system():
     """Get or create the integrated system instance"""
     global _system_instance
     if _system_instance is None:
+        from modules.prime_trading_system import get_prime_trading_system, TradingConfig, SystemMode
+        
         # Determine trading mode strictly from ETRADE_MODE to avoid enum mismatch
         resolved_mode = SystemMode.DEMO_MODE if ARGS.etrade_mode == 'demo' else SystemMode.LIVE_MODE
 
@@ -186,6 +199,20 @@ def get_integrated_system():
 # --- Health Check Endpoint ---
 async def health_check():
     """Comprehensive health check endpoint using integrated system"""
+    # Rev 00250: Answer while the trading components are still warming up
+    if _system_instance is None:
+        return {
+            "status": "starting",
+            "timestamp": datetime.utcnow().isoformat(),
+            "environment": ARGS.environment,
+            "strategy_mode": ARGS.strategy_mode,
+            "system_mode": ARGS.system_mode,
+            "startup": {
+                "uptime_ms": startup_timeline.snapshot(top=0)["uptime_ms"],
+                "milestones": startup_timeline.milestones
+            }
+        }
+    
     try:
         # Get integrated system instance
         system = get_integrated_system()
@@ -254,13 +281,31 @@ async def start_http_server():
         
         async def handle_health(request):
             health_data = await health_check()
-            status_code = 200 if health_data["status"] in ["healthy", "degraded"] else 503
+            status_code = 200 if health_data["status"] in ["healthy", "degraded", "starting"] else 503
             return web.json_response(health_data, status=status_code)
         
+        async def handle_startup_timeline(request):
+            """Rev 00250: Cold-start profile (?top=N slowest imports, 0 = all)"""
+            try:
+                top = int(request.query.get('top', STARTUP_TOP_IMPORTS))
+            except ValueError:
+                top = STARTUP_TOP_IMPORTS
+            return web.json_response(startup_timeline.snapshot(top=top))
+        
         async def handle_metrics(request):
-            system = get_integrated_system()
-            metrics = system.get_metrics()
-            return web.json_response(metrics)
+            """Rev 00256: Prometheus text (pipeline span histograms + system gauges); ?format=json = previous JSON"""
+            from modules.prime_pipeline_trace import get_pipeline_tracer, metrics_to_gauges, PROMETHEUS_CONTENT_TYPE
+            # Scrapes during startup must not build the trading system
+            metrics = get_integrated_system().get_metrics() if _system_instance is not None else {}
+            if request.query.get('format') == 'json':
+                return web.json_response(metrics)
+            text = get_pipeline_tracer().render_prometheus(metrics_to_gauges(metrics))
+            return web.Response(body=text.encode('utf-8'), headers={'Content-Type': PROMETHEUS_CONTENT_TYPE})
+        
+        async def handle_pipeline_trace(request):
+            """Rev 00256: Last finished trace per pipeline root (scan, process_signals)"""
+            from modules.prime_pipeline_trace import get_pipeline_tracer
+            return web.json_response(dict(get_pipeline_tracer().last_trace))
         
         async def handle_status(request):
             health_data = await health_check()
@@ -326,6 +371,10 @@ async def start_http_server():
                 
                 logger.info(f"🔄 Received OAuth token renewal webhook for {environment}")
                 
+                # Rev 00251: One token re-read in the shared client hub - every component's handle picks it up
+                from modules.prime_etrade_trading import get_etrade_client_hub
+                await asyncio.to_thread(get_etrade_client_hub().reload_tokens, environment)
+                
                 # Send OAuth token renewal confirmation alert
                 system = get_integrated_system()
                 if system.alert_manager:
@@ -887,6 +936,8 @@ async def start_http_server():
         app.router.add_get('/api/positions', handle_positions)  # Position tracking endpoint (Rev 00068 - Oct 30, 2025) - Real-time position monitoring
         app.router.add_post('/api/alerts/market-holiday-check', handle_market_holiday_check)  # Market holiday check endpoint (5:30 AM PT)
         app.router.add_post('/api/manual-orb-capture', handle_manual_orb_capture)  # Manual ORB capture endpoint (Rev 00173)
+        app.router.add_get('/debug/startup', handle_startup_timeline)  # Startup timeline (Rev 00250)
+        app.router.add_get('/debug/pipeline', handle_pipeline_trace)  # Last signal pipeline traces (Rev 00256)
         app.router.add_get('/', handle_health)  # Root endpoint
         
         # Start server
@@ -1006,15 +1057,34 @@ async def main():
     logger.info(f"Signal Optimization: {ARGS.enable_signal_optimization}")
     logger.info(f"OAuth Keep-Alive: Managed by Cloud Scheduler")
     
+    http_runner = None
+    # Ensure trading_task is defined for finally/shutdown even if init fails early
+    trading_task = None
+    
+    # Rev 00250: Bring the HTTP server (/health, /debug/startup) up before the trading
+    # components warm up; /health reports "starting" until the system exists
+    if ARGS.cloud_mode:
+        with startup_timeline.phase('http_server'):
+            http_runner = await start_http_server()
+        startup_timeline.mark('http_server_ready')
+    
+    # Import the trading subsystems off the event loop so /health keeps answering
+    with startup_timeline.phase('import_trading_modules'):
+        await asyncio.to_thread(import_trading_modules)
+    from modules.prime_trading_system import TradingConfig, SystemMode
+    from modules.etrade_oauth_integration import get_etrade_oauth_integration
+    from modules.prime_etrade_trading import get_etrade_client_hub
+    
     # Initialize ETrade OAuth and Trader
     logger.info("Initializing ETrade integration...")
+    startup_timeline.begin('etrade_init')
     try:
         # Map etrade_mode to correct environment for Secret Manager
         # 'demo' → 'sandbox', 'live' → 'prod'
         secret_manager_env = 'sandbox' if ARGS.etrade_mode == 'demo' else 'prod'
         logger.info(f"ETrade Mode: {ARGS.etrade_mode} → Secret Manager: {secret_manager_env}")
         
-        etrade_oauth = get_etrade_oauth_integration(secret_manager_env)
+        etrade_oauth = await asyncio.to_thread(get_etrade_oauth_integration, secret_manager_env)
         
         # Check OAuth status
         oauth_status = etrade_oauth.get_auth_status()
@@ -1034,9 +1104,10 @@ async def main():
         logger.info("✅ OAuth authentication ready")
         
         # Use mapped environment for ETrade trader
-        etrade_trader = PrimeETradeTrading(environment=secret_manager_env)
+        # Rev 00251: Shared client hub - later components reuse these tokens, accounts and pool
+        etrade_trader = await asyncio.to_thread(get_etrade_client_hub().handle, secret_manager_env)
         
-        if etrade_trader.initialize():
+        if await asyncio.to_thread(etrade_trader.initialize):
             logger.info(f"✅ ETrade {ARGS.etrade_mode} trader initialized successfully")
         else:
             logger.error(f"❌ Failed to initialize ETrade {ARGS.etrade_mode} trader")
@@ -1058,10 +1129,7 @@ async def main():
         if ARGS.cloud_mode:
             logger.warning("☁️  Cloud mode: Continuing despite ETrade initialization error")
             logger.warning("   HTTP server will start, system will retry OAuth later")
-    
-    http_runner = None
-    # Ensure trading_task is defined for finally/shutdown even if init fails early
-    trading_task = None
+    startup_timeline.end('etrade_init')
     
     try:
         # Determine trading mode strictly from ETRADE_MODE to avoid enum mismatches
@@ -1084,10 +1152,7 @@ async def main():
         # This ensures the trading loop and health endpoint use the SAME system instance
         system = get_integrated_system()
         
-        # Start HTTP server if in cloud mode
-        if ARGS.cloud_mode:
-            http_runner = await start_http_server()
-        
+        # HTTP server already started above in cloud mode (Rev 00250)
         # trading_task already defined above for safe shutdown
         
         # Initialize integrated trading system (without UnifiedServicesManager)
@@ -1107,7 +1172,8 @@ async def main():
         }
         
         try:
-            await system.initialize(minimal_components)
+            with startup_timeline.phase('trading_system_initialize'):
+                await system.initialize(minimal_components)
             logger.info("✅ Trading system initialized successfully")
         except Exception as e:
             logger.error(f"❌ Failed to initialize trading system: {e}")
@@ -1123,6 +1189,7 @@ async def main():
 
         if ENABLE_0DTE_STRATEGY:
             logger.info("🎯 Initializing 0DTE Strategy...")
+            startup_timeline.begin('0dte_initialize')
             try:
                 # Add 0DTE Strategy modules to Python path
                 import sys
@@ -1294,6 +1361,7 @@ async def main():
                 logger.error(f"❌ Failed to initialize 0DTE Strategy: {e}")
                 logger.warning("⚠️ 0DTE Strategy disabled - continuing with ORB Strategy only")
                 dte0_manager = None
+            startup_timeline.end('0dte_initialize', ok=dte0_manager is not None)
         else:
             logger.info("ℹ️  0DTE Strategy disabled (ENABLE_0DTE_STRATEGY=false)")
         
@@ -1313,6 +1381,8 @@ async def main():
         setup_signal_handlers(http_runner, trading_task)
         
         logger.info("✅ Trading system started in background thread")
+        startup_timeline.mark('trading_started')
+        startup_timeline.log_summary()
         
         # Keep main thread alive to handle HTTP requests
         if ARGS.cloud_mode:
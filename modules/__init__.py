@@ -2,31 +2,52 @@
 """
 Easy ORB Strategy Modules Package
 Provides all core modules for the Easy ORB Strategy trading system
-Last Updated: January 6, 2026 (Rev 00231)
+Last Updated: October 16, 2026 (Rev 00250)
 """
 
 # Core modules that actually exist
 from .config_loader import ConfigLoader, load_configuration, get_config_value
 
-# Prime system modules
-from .prime_data_manager import get_prime_data_manager, PrimeDataManager
-from .prime_market_manager import get_prime_market_manager, PrimeMarketManager
-from .prime_news_manager import get_prime_news_manager, PrimeNewsManager
-from .prime_unified_trade_manager import get_prime_unified_trade_manager, PrimeUnifiedTradeManager
+# Prime models (lightweight, no third-party imports)
 from .prime_models import (
     PrimeSignal, PrimePosition, PrimeTrade, PrimeStopOrder,
     StrategyMode, SignalQuality, SignalType, SignalSide, TradeStatus,
     StopType, TrailingMode, MarketRegime, ConfidenceTier
 )
 
-# ORB Strategy Manager - PRIMARY STRATEGY (Rev 00151)
-from .prime_orb_strategy_manager import (
-    get_prime_orb_strategy_manager,
-    PrimeORBStrategyManager,
-    SignalType as ORBSignalType,
-    ORBData,
-    ORBStrategyResult
-)
+# Rev 00250: Prime system managers are imported on first access (PEP 562), so importing
+# any one module (e.g. modules.config_loader from main.py) no longer pulls in pandas,
+# yfinance, aiohttp, redis, google-cloud and vaderSentiment before the HTTP server is up
+_LAZY_EXPORTS = {
+    # Prime system modules
+    'get_prime_data_manager': ('.prime_data_manager', 'get_prime_data_manager'),
+    'PrimeDataManager': ('.prime_data_manager', 'PrimeDataManager'),
+    'get_prime_market_manager': ('.prime_market_manager', 'get_prime_market_manager'),
+    'PrimeMarketManager': ('.prime_market_manager', 'PrimeMarketManager'),
+    'get_prime_news_manager': ('.prime_news_manager', 'get_prime_news_manager'),
+    'PrimeNewsManager': ('.prime_news_manager', 'PrimeNewsManager'),
+    'get_prime_unified_trade_manager': ('.prime_unified_trade_manager', 'get_prime_unified_trade_manager'),
+    'PrimeUnifiedTradeManager': ('.prime_unified_trade_manager', 'PrimeUnifiedTradeManager'),
+    
+    # ORB Strategy Manager - PRIMARY STRATEGY (Rev 00151)
+    'get_prime_orb_strategy_manager': ('.prime_orb_strategy_manager', 'get_prime_orb_strategy_manager'),
+    'PrimeORBStrategyManager': ('.prime_orb_strategy_manager', 'PrimeORBStrategyManager'),
+    'ORBSignalType': ('.prime_orb_strategy_manager', 'SignalType'),
+    'ORBData': ('.prime_orb_strategy_manager', 'ORBData'),
+    'ORBStrategyResult': ('.prime_orb_strategy_manager', 'ORBStrategyResult'),
+}
+
+def __getattr__(name):
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(target[0], __name__), target[1])
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 # ARCHIVED (Not currently used, kept for reference):
 # - prime_multi_strategy_manager.py
@@ -60,4 +81,4 @@ __all__ = [
 __version__ = "2.31.0"
 __author__ = "Easy ORB Strategy Development Team"
 __description__ = "Easy ORB Strategy Trading System Modules"
-__last_updated__ = "2026-01-06"
\ No newline at end of file
+__last_updated__ = "2026-10-16"
\ No newline at end of file
@@ -17,6 +17,14 @@ Key Features:
 Author: Easy Trading Software Team
 Date: October 17, 2025
 Revision: 00046 - Slip Guard Initial Implementation
+
+Rev 00254: Batched, incremental refresh
+- Daily history comes from the shared OHLCV store: one batched download per start
+  date, fetching only the sessions added since each symbol's last stored session
+- Rolling 90-session volume sums are advanced by the new sessions (add the new
+  volume, subtract the one leaving the window) instead of recomputed
+- Cache persisted as a compact binary file (data/adv_cache.npz); the legacy JSON
+  cache is still read once for migration
 """
 
 import yfinance as yf
@@ -24,11 +32,32 @@ from datetime import datetime, timedelta
 import logging
 import os
 import json
-from typing import Dict, Optional, List
+import time
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
 
+import numpy as np
+
 log = logging.getLogger("adv_data_manager")
 
+# Rev 00254: Batched incremental refresh via the shared OHLCV store (per-symbol yfinance loop otherwise)
+try:
+    from .prime_ohlcv_store import get_ohlcv_store, final_boundary, OHLCV_STORE_ENABLED
+except ImportError:
+    OHLCV_STORE_ENABLED = False
+
+SLIP_GUARD_BATCH_REFRESH = os.getenv('SLIP_GUARD_BATCH_REFRESH', 'true').lower() == 'true'
+SLIP_GUARD_MIN_SESSIONS = 30
+
+# Rolling window per symbol: last session (day number), close on that session, volume sum and session count
+ROLLING_DTYPE = np.dtype([
+    ('symbol', 'U16'),
+    ('last_date', '<i8'),
+    ('close', '<f8'),
+    ('volume_sum', '<f8'),
+    ('count', '<i4'),
+])
+
 class ADVDataManager:
     """
     Simple ADV data manager for Slip Guard position capping.
@@ -41,6 +70,8 @@ class ADVDataManager:
     def __init__(self):
         self.adv_cache: Dict[str, float] = {}  # symbol -> adv_dollars
         self.last_refresh: Optional[datetime] = None
+        # Rev 00254: symbol -> (last_date, close, volume_sum, count) over the lookback window
+        self.rolling: Dict[str, Tuple[int, float, float, int]] = {}
         
         # Configuration
         self.enabled = os.getenv('SLIP_GUARD_ENABLED', 'true').lower() == 'true'
@@ -48,7 +79,8 @@ class ADVDataManager:
         self.lookback_days = int(os.getenv('SLIP_GUARD_LOOKBACK_DAYS', '90'))
         
         # Cache file for persistence (optional)
-        self.cache_file = Path('data/adv_cache.json')
+        self.cache_file = Path('data/adv_cache.npz')
+        self.legacy_cache_file = Path('data/adv_cache.json')
         
         if self.enabled:
             log.info(f"✅ ADV Data Manager initialized")
@@ -119,6 +151,86 @@ class ADVDataManager:
         log.info(f"🔄 Refreshing ADV data for {len(symbols)} symbols...")
         log.info(f"   Lookback period: {self.lookback_days} days")
         
+        if SLIP_GUARD_BATCH_REFRESH and OHLCV_STORE_ENABLED:
+            try:
+                return self._refresh_batched(symbols)
+            except Exception as e:
+                log.warning(f"⚠️ Batched ADV refresh failed ({e}) - falling back to per-symbol refresh")
+        return self._refresh_per_symbol(symbols)
+    
+    def _refresh_batched(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Rev 00254: Batched incremental refresh from the OHLCV store
+        
+        The store downloads only missing sessions (batched by start date); each symbol's
+        rolling window is then advanced by its new sessions in O(new sessions).
+        """
+        started = time.perf_counter()
+        symbols = list(dict.fromkeys(s.upper() for s in symbols if s))
+        store = get_ohlcv_store()
+        store.refresh(symbols, self.lookback_days)
+        
+        updated = recomputed = unchanged = 0
+        failed_symbols = []
+        for symbol in symbols:
+            records = store.read(symbol).records
+            if len(records) < SLIP_GUARD_MIN_SESSIONS:
+                log.warning(f"  {symbol}: Insufficient data (only {len(records)} days)")
+                failed_symbols.append(symbol)
+                continue
+            
+            state, mode = self._advance_window(self.rolling.get(symbol), records)
+            self.rolling[symbol] = state
+            last_date, close, volume_sum, count = state
+            self.adv_cache[symbol] = float(volume_sum / count * close)
+            if mode == 'unchanged':
+                unchanged += 1
+            elif mode == 'advanced':
+                updated += 1
+            else:
+                recomputed += 1
+            log.debug(f"  {symbol}: ADV ${self.adv_cache[symbol]:,.0f} (${close:.2f}/share, {int(volume_sum / count):,} shares/day)")
+        
+        self.last_refresh = datetime.now()
+        elapsed = time.perf_counter() - started
+        log.info(f"✅ ADV refresh complete: {len(symbols) - len(failed_symbols)}/{len(symbols)} symbols in {elapsed:.1f}s "
+                 f"({updated} advanced, {recomputed} recomputed, {unchanged} unchanged)")
+        if failed_symbols:
+            log.warning(f"   Failed symbols ({len(failed_symbols)}): {', '.join(failed_symbols[:10])}")
+        
+        self._save_cache_to_file()
+        return self.adv_cache
+    
+    def _advance_window(self, state: Optional[Tuple[int, float, float, int]],
+                        records: np.ndarray) -> Tuple[Tuple[int, float, float, int], str]:
+        """
+        Move a rolling window to the last stored session
+        
+        Returns the new (last_date, close, volume_sum, count) and 'unchanged', 'advanced' or
+        'recomputed'. The window is recomputed when there is no usable state: unknown last
+        session, or history rewritten for a split/dividend adjustment.
+        """
+        dates, volumes, closes = records['date'], records['volume'], records['close']
+        end = len(records)
+        if state is not None:
+            last_date, close, volume_sum, count = state
+            i = int(np.searchsorted(dates, last_date))
+            if i < end and dates[i] == last_date and closes[i] == close and count == min(self.lookback_days, i + 1):
+                if i == end - 1:
+                    return state, 'unchanged'
+                for j in range(i + 1, end):
+                    volume_sum += volumes[j]
+                    if count == self.lookback_days:
+                        volume_sum -= volumes[j - count]
+                    else:
+                        count += 1
+                return (int(dates[-1]), float(closes[-1]), float(volume_sum), count), 'advanced'
+        
+        window = volumes[-self.lookback_days:]
+        return (int(dates[-1]), float(closes[-1]), float(window.sum()), len(window)), 'recomputed'
+    
+    def _refresh_per_symbol(self, symbols: List[str]) -> Dict[str, float]:
+        """One yfinance request per symbol (used when the OHLCV store is unavailable)"""
         success_count = 0
         failed_symbols = []
         
@@ -176,6 +288,10 @@ class ADVDataManager:
         if not self.last_refresh:
             return True
         
+        # Rev 00254: Also stale once a newer session has completed (refreshes are incremental and cheap)
+        if OHLCV_STORE_ENABLED and self.last_refresh.timestamp() < final_boundary():
+            return True
+        
         age = (datetime.now() - self.last_refresh).total_seconds() / 3600
         return age > max_age_hours
     
@@ -191,21 +307,27 @@ class ADVDataManager:
         }
     
     def _save_cache_to_file(self):
-        """Save ADV cache to file for persistence"""
+        """Save ADV cache to file for persistence (Rev 00254: compact binary, rolling windows included)"""
         try:
-            cache_data = {
-                'adv_data': self.adv_cache,
-                'last_refresh': self.last_refresh.isoformat() if self.last_refresh else None,
-                'lookback_days': self.lookback_days
-            }
+            rolling = np.array(
+                [(symbol, *state) for symbol, state in self.rolling.items()],
+                dtype=ROLLING_DTYPE
+            )
+            symbols = np.array(list(self.adv_cache.keys()), dtype='U16')
+            adv = np.array(list(self.adv_cache.values()), dtype=np.float64)
+            meta = np.array([
+                self.last_refresh.timestamp() if self.last_refresh else 0.0,
+                float(self.lookback_days)
+            ])
             
             # Ensure data directory exists
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            tmp_file = self.cache_file.with_name(self.cache_file.stem + '.tmp.npz')
+            np.savez(tmp_file, symbols=symbols, adv=adv, rolling=rolling, meta=meta)
+            os.replace(tmp_file, self.cache_file)
             
-            log.debug(f"💾 ADV cache saved to {self.cache_file}")
+            log.debug(f"💾 ADV cache saved to {self.cache_file} ({self.cache_file.stat().st_size:,} bytes)")
             
         except Exception as e:
             log.error(f"Failed to save ADV cache: {e}")
@@ -213,19 +335,31 @@ class ADVDataManager:
     def _load_cache_from_file(self):
         """Load ADV cache from file (fallback on startup)"""
         try:
-            if not self.cache_file.exists():
+            if self.cache_file.exists():
+                with np.load(self.cache_file, allow_pickle=False) as data:
+                    self.adv_cache = dict(zip(data['symbols'].tolist(), data['adv'].tolist()))
+                    refreshed_at, lookback_days = data['meta'].tolist()
+                    # Windows built for another lookback are recomputed on the next refresh
+                    if int(lookback_days) == self.lookback_days:
+                        self.rolling = {
+                            r['symbol']: (int(r['last_date']), float(r['close']), float(r['volume_sum']), int(r['count']))
+                            for r in data['rolling']
+                        }
+                self.last_refresh = datetime.fromtimestamp(refreshed_at) if refreshed_at else None
+            elif self.legacy_cache_file.exists():
+                # Rev 00254: One-time migration from the JSON cache (no rolling windows - recomputed on refresh)
+                with open(self.legacy_cache_file, 'r') as f:
+                    cache_data = json.load(f)
+                
+                self.adv_cache = cache_data.get('adv_data', {})
+                
+                refresh_str = cache_data.get('last_refresh')
+                if refresh_str:
+                    self.last_refresh = datetime.fromisoformat(refresh_str)
+            else:
                 log.debug("No ADV cache file found")
                 return
             
-            with open(self.cache_file, 'r') as f:
-                cache_data = json.load(f)
-            
-            self.adv_cache = cache_data.get('adv_data', {})
-            
-            refresh_str = cache_data.get('last_refresh')
-            if refresh_str:
-                self.last_refresh = datetime.fromisoformat(refresh_str)
-            
             age_hours = (datetime.now() - self.last_refresh).total_seconds() / 3600 if self.last_refresh else None
             
             log.info(f"📂 Loaded cached ADV data: {len(self.adv_cache)} symbols")
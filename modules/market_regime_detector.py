@@ -20,6 +20,12 @@ import yfinance as yf
 
 log = logging.getLogger("market_regime_detector")
 
+# Rev 00253: SPY history from the shared OHLCV store (falls back to a direct yfinance download)
+try:
+    from .prime_ohlcv_store import get_ohlcv_store, OHLCV_STORE_ENABLED
+except ImportError:
+    OHLCV_STORE_ENABLED = False
+
 class MarketRegimeDetector:
     """Detects market regime (bull/bear) and adjusts trading strategy"""
     
@@ -58,20 +64,28 @@ class MarketRegimeDetector:
         Returns: "BULL", "BEAR", or "NEUTRAL"
         """
         try:
-            # Fetch SPY data
-            spy = yf.Ticker("SPY")
-            hist = spy.history(period="3mo", interval="1d")
+            # Fetch SPY data (Rev 00253: completed sessions from the OHLCV store)
+            closes = None
+            if OHLCV_STORE_ENABLED:
+                try:
+                    closes = get_ohlcv_store().history(["SPY"], 65)["SPY"].closes
+                except Exception as store_error:
+                    log.debug(f"OHLCV store unavailable for SPY: {store_error}")
+            if closes is None or len(closes) < 50:
+                spy = yf.Ticker("SPY")
+                hist = spy.history(period="3mo", interval="1d")
+                closes = hist['Close'].values if not hist.empty else []
             
-            if hist.empty or len(hist) < 50:
+            if len(closes) < 50:
                 log.warning("⚠️ Insufficient SPY data for regime detection")
                 return "NEUTRAL"
             
             # Get current price
-            self.spy_price = hist['Close'].iloc[-1]
+            self.spy_price = float(closes[-1])
             
             # Calculate moving averages
-            self.spy_ma20 = hist['Close'].tail(20).mean()
-            self.spy_ma50 = hist['Close'].tail(50).mean()
+            self.spy_ma20 = float(closes[-20:].mean())
+            self.spy_ma50 = float(closes[-50:].mean())
             
             # Calculate regime strength
             # Factor 1: Price vs MA20 (40% weight)
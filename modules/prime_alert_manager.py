@@ -31,7 +31,6 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
-import requests
 import aiohttp
 from collections import defaultdict, deque
 import threading
@@ -112,6 +111,57 @@ class Alert:
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+@dataclass
+class TelegramBatch:
+    """Queued Telegram delivery (Rev 00241) - one or more coalesced messages for one chat"""
+    chat_id: str
+    messages: List[str]
+    futures: List[asyncio.Future]
+    coalesce_key: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+class TelegramRateLimiter:
+    """
+    Per-chat Telegram rate limiter (Rev 00241)
+    
+    Telegram allows about one message per second per chat and 20 per minute per group;
+    429 responses carry retry_after, which blocks the chat until it elapses.
+    """
+    
+    def __init__(self, min_interval_seconds: float = 1.0, max_per_minute: int = 20):
+        self.min_interval_seconds = min_interval_seconds
+        self.max_per_minute = max_per_minute
+        self._sent: Dict[str, deque] = defaultdict(deque)
+        self._blocked_until: Dict[str, float] = defaultdict(float)
+        self.waits = 0
+        self.total_wait_seconds = 0.0
+    
+    def _delay(self, chat_id: str, now: float) -> float:
+        sent = self._sent[chat_id]
+        while sent and now - sent[0] >= 60.0:
+            sent.popleft()
+        delay = self._blocked_until[chat_id] - now
+        if sent:
+            delay = max(delay, sent[-1] + self.min_interval_seconds - now)
+        if len(sent) >= self.max_per_minute:
+            delay = max(delay, sent[0] + 60.0 - now)
+        return delay
+    
+    async def acquire(self, chat_id: str) -> None:
+        """Wait until a message may be sent to chat_id, then record the send"""
+        delay = self._delay(chat_id, time.monotonic())
+        if delay > 0:
+            self.waits += 1
+            self.total_wait_seconds += delay
+            await asyncio.sleep(delay)
+        self._sent[chat_id].append(time.monotonic())
+    
+    def penalize(self, chat_id: str, retry_after_seconds: float) -> None:
+        """Block chat_id for retry_after; the rejected send no longer counts (the retry's acquire records it)"""
+        self._blocked_until[chat_id] = max(self._blocked_until[chat_id], time.monotonic() + retry_after_seconds)
+        if self._sent[chat_id]:
+            self._sent[chat_id].pop()
+
 @dataclass
 class TradeAlert:
     """Trade-specific alert data structure"""
@@ -196,6 +246,24 @@ class PrimeAlertManager:
         self.max_alerts_per_minute = int(get_config_value('TELEGRAM_MAX_MESSAGES_PER_MINUTE', '20'))
         self.alert_cooldown_seconds = int(get_config_value('ALERT_COOLDOWN_SECONDS', '30'))
         
+        # Rev 00241: Non-blocking Telegram delivery (background aiohttp worker + bounded queue)
+        self.telegram_queue_max_size = int(get_config_value('TELEGRAM_QUEUE_MAX_SIZE', '200'))
+        self.telegram_coalesce_window_seconds = float(get_config_value('TELEGRAM_COALESCE_WINDOW_SECONDS', '2.0'))
+        self.telegram_send_timeout_seconds = float(get_config_value('TELEGRAM_SEND_TIMEOUT_SECONDS', '10'))
+        self.telegram_rate_limiter = TelegramRateLimiter(
+            min_interval_seconds=float(get_config_value('TELEGRAM_PER_CHAT_MIN_INTERVAL_SECONDS', '1.0')),
+            max_per_minute=self.max_alerts_per_minute
+        )
+        self._telegram_queue: Optional[asyncio.Queue] = None
+        self._telegram_worker_task: Optional[asyncio.Task] = None
+        self._telegram_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._telegram_session: Optional[aiohttp.ClientSession] = None
+        self._telegram_open_batches: Dict[str, TelegramBatch] = {}
+        self.telegram_metrics = {
+            'enqueued': 0, 'sent': 0, 'failed': 0, 'dropped': 0, 'coalesced': 0,
+            'latency_ms_total': 0.0, 'latency_ms_max': 0.0, 'latency_ms_last': 0.0,
+        }
+        
         # Alert tracking
         self.alert_history = deque(maxlen=1000)
         self.alert_counts = defaultdict(int)
@@ -273,13 +341,14 @@ class PrimeAlertManager:
                 return False
             
             url = f"https://api.telegram.org/bot{self.telegram_bot_token}/getMe"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                bot_info = response.json()
-                if bot_info.get('ok'):
-                    log.info(f"Telegram bot connected: @{bot_info['result']['username']}")
-                    return True
+            # Rev 00241: aiohttp (was blocking requests.get on the event loop)
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        bot_info = await response.json()
+                        if bot_info.get('ok'):
+                            log.info(f"Telegram bot connected: @{bot_info['result']['username']}")
+                            return True
             
             return False
             
@@ -472,10 +541,10 @@ class PrimeAlertManager:
 📊 Position closed by Stealth Trailing System
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS, alert_type=AlertType.TRADE_EXIT.value)
             
             if success:
-                log.info(f"Trade exit alert sent for {symbol} - {reason_desc} - P&L: {pnl_sign}{pnl_percent:.2f}%")
+                log.info(f"Trade exit alert queued for {symbol} - {reason_desc} - P&L: {pnl_sign}{pnl_percent:.2f}%")
             
             return success
             
@@ -557,10 +626,10 @@ class PrimeAlertManager:
             
             message += f"📊 Positions closed by Stealth Trailing System"
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
-                log.info(f"Aggregated exit alert sent for {len(closed_positions)} positions - {exit_reason}")
+                log.info(f"Aggregated exit alert queued for {len(closed_positions)} positions - {exit_reason}")
             
             return success
             
@@ -762,10 +831,10 @@ class PrimeAlertManager:
 """
             
             # Send via Telegram
-            success = await self._send_telegram_message(message, AlertLevel.INFO)
+            success = await self._queue_telegram_message(message, AlertLevel.INFO)
             
             if success:
-                log.info(f"{mode} Mode EOD Report sent - Daily: {daily_pnl_sign}${daily_pnl:.2f} ({daily_pnl_sign}{daily_pnl_pct:.2f}%), Weekly: {weekly_pnl_sign}${weekly_pnl:.2f} ({weekly_pnl_sign}{weekly_pnl_pct:.2f}%)")
+                log.info(f"{mode} Mode EOD Report queued - Daily: {daily_pnl_sign}${daily_pnl:.2f} ({daily_pnl_sign}{daily_pnl_pct:.2f}%), Weekly: {weekly_pnl_sign}${weekly_pnl:.2f} ({weekly_pnl_sign}{weekly_pnl_pct:.2f}%)")
             
             return success
             
@@ -892,7 +961,7 @@ class PrimeAlertManager:
             return False
     
     async def _send_telegram_alert(self, alert: Alert) -> bool:
-        """Send alert via Telegram"""
+        """Send alert via Telegram (Rev 00241: queued, non-blocking)"""
         try:
             if not self.telegram_bot_token or not self.telegram_chat_id:
                 return False
@@ -900,107 +969,232 @@ class PrimeAlertManager:
             # Format message
             message = self._format_telegram_message(alert)
             
-            # Send to Telegram
-            url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
-            data = {
-                'chat_id': self.telegram_chat_id,
-                'text': message,
-                'parse_mode': 'HTML',
-                'disable_web_page_preview': True
-            }
-            
-            response = requests.post(url, json=data, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('ok'):
-                    log.debug(f"Telegram alert sent: {alert.alert_id}")
-                    return True
-                else:
-                    log.error(f"Telegram API error: {result.get('description', 'Unknown error')}")
-            else:
-                log.error(f"Telegram HTTP error: {response.status_code}")
-            
-            return False
+            queued = await self._queue_telegram_message(message, alert.level, alert_type=alert.alert_type.value)
+            if queued:
+                log.debug(f"Telegram alert queued: {alert.alert_id}")
+            return queued
             
         except Exception as e:
             log.error(f"Failed to send Telegram alert: {e}")
             return False
     
-    async def _send_telegram_message(self, message: str, level: AlertLevel = AlertLevel.INFO) -> bool:
-        """Send raw message via Telegram (Rev 00184: Auto-fallback to plain text on HTML errors)"""
+    async def _queue_telegram_message(self, message: str, level: AlertLevel = AlertLevel.INFO,
+                                      alert_type: Optional[str] = None, wait_for_delivery: bool = False) -> bool:
+        """
+        Queue raw message for Telegram delivery (Rev 00184: Auto-fallback to plain text on HTML errors)
+        
+        Rev 00241: Hands the message to the background delivery worker. Returns True once the
+        message is accepted for delivery (queued or coalesced), False if it was dropped (queue full,
+        no credentials) - NOT whether Telegram delivered it; the event loop never waits on Telegram.
+        Messages with the same alert_type inside TELEGRAM_COALESCE_WINDOW_SECONDS are merged into
+        one send. Pass wait_for_delivery=True to await the delivery result instead, or use
+        enqueue_telegram_message() for the delivery future itself. Calls from a different event
+        loop (e.g. asyncio.run in the scheduler thread) are delivered directly in that loop and
+        always return the delivery result.
+        """
         try:
             # CRITICAL DEBUG: Log every telegram message attempt
-            log.info(f"🔍🔍🔍 _send_telegram_message CALLED - Message preview: {message[:100]}...")
+            log.info(f"🔍🔍🔍 _queue_telegram_message CALLED - Message preview: {message[:100]}...")
             
             if not self.telegram_bot_token or not self.telegram_chat_id:
                 log.info("🔍🔍🔍 No Telegram credentials, returning False")
                 return False
             
-            # Send to Telegram
-            url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
+            telegram_loop = self._telegram_loop
+            if telegram_loop is not None and not telegram_loop.is_closed() and telegram_loop is not asyncio.get_running_loop():
+                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.telegram_send_timeout_seconds)) as session:
+                    return await self._deliver_telegram(session, str(self.telegram_chat_id), message)
             
-            # Rev 00184: Try HTML first, then fallback to plain text if HTML fails
-            data = {
-                'chat_id': self.telegram_chat_id,
-                'text': message,
-                'parse_mode': 'HTML',
-                'disable_web_page_preview': True
-            }
+            delivery = self.enqueue_telegram_message(message, level, alert_type=alert_type)
+            if wait_for_delivery:
+                return await delivery
+            return not (delivery.done() and delivery.result() is False)
             
-            response = requests.post(url, json=data, timeout=10)
+        except Exception as e:
+            log.error(f"Failed to send Telegram message: {e}")
+            return False
+    
+    def enqueue_telegram_message(self, message: str, level: AlertLevel = AlertLevel.INFO,
+                                 alert_type: Optional[str] = None, chat_id: Optional[str] = None) -> asyncio.Future:
+        """
+        Queue a Telegram message for background delivery (Rev 00241)
+        
+        Returns an awaitable resolving to the delivery result; callers may ignore it.
+        Must be called from the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        delivery = loop.create_future()
+        chat_id = str(chat_id or self.telegram_chat_id)
+        if not self.telegram_bot_token or not chat_id:
+            delivery.set_result(False)
+            return delivery
+        
+        self._ensure_telegram_worker(loop)
+        
+        # Coalesce into an open batch of the same alert type (Telegram hard limit 4096 chars)
+        key = f"{chat_id}:{alert_type}" if alert_type and self.telegram_coalesce_window_seconds > 0 else None
+        open_batch = self._telegram_open_batches.get(key) if key else None
+        if open_batch and sum(len(m) + 2 for m in open_batch.messages) + len(message) <= 4000:
+            open_batch.messages.append(message)
+            open_batch.futures.append(delivery)
+            self.telegram_metrics['enqueued'] += 1
+            self.telegram_metrics['coalesced'] += 1
+            return delivery
+        
+        if self.telegram_queue_depth() >= self.telegram_queue_max_size:
+            self.telegram_metrics['dropped'] += 1
+            log.warning(f"⚠️ Telegram queue full ({self.telegram_queue_max_size}) - dropping {level.value} message: {message[:80]}...")
+            delivery.set_result(False)
+            return delivery
+        
+        batch = TelegramBatch(chat_id=chat_id, messages=[message], futures=[delivery], coalesce_key=key)
+        self.telegram_metrics['enqueued'] += 1
+        if key:
+            if open_batch:
+                # Full batch - send it now and open a new one
+                self._close_telegram_batch(open_batch)
+            self._telegram_open_batches[key] = batch
+            loop.call_later(self.telegram_coalesce_window_seconds, self._close_telegram_batch, batch)
+        else:
+            self._telegram_queue.put_nowait(batch)
+        return delivery
+    
+    def _close_telegram_batch(self, batch: TelegramBatch) -> None:
+        """End a batch's coalescing window and hand it to the worker"""
+        if batch.coalesce_key and self._telegram_open_batches.get(batch.coalesce_key) is batch:
+            del self._telegram_open_batches[batch.coalesce_key]
+            self._telegram_queue.put_nowait(batch)
+    
+    def _ensure_telegram_worker(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._telegram_loop is not loop:
+            # First use, or the previous loop was closed - queue/session are bound to their loop
+            self._telegram_loop = loop
+            self._telegram_queue = asyncio.Queue()
+            self._telegram_open_batches = {}
+            self._telegram_session = None
+            self._telegram_worker_task = None
+        if self._telegram_worker_task is None or self._telegram_worker_task.done():
+            self._telegram_worker_task = loop.create_task(self._telegram_delivery_worker())
+    
+    def telegram_queue_depth(self) -> int:
+        queued = self._telegram_queue.qsize() if self._telegram_queue else 0
+        return queued + len(self._telegram_open_batches)
+    
+    async def _telegram_delivery_worker(self) -> None:
+        """Background Telegram delivery loop (Rev 00241)"""
+        log.info("📨 Telegram delivery worker started")
+        while True:
+            batch = await self._telegram_queue.get()
+            try:
+                if self._telegram_session is None or self._telegram_session.closed:
+                    self._telegram_session = aiohttp.ClientSession(
+                        timeout=aiohttp.ClientTimeout(total=self.telegram_send_timeout_seconds)
+                    )
+                await self.telegram_rate_limiter.acquire(batch.chat_id)
+                success = await self._deliver_telegram(self._telegram_session, batch.chat_id, "\n\n".join(batch.messages))
+                
+                latency_ms = (time.monotonic() - batch.enqueued_at) * 1000
+                self.telegram_metrics['sent' if success else 'failed'] += 1
+                self.telegram_metrics['latency_ms_total'] += latency_ms
+                self.telegram_metrics['latency_ms_last'] = latency_ms
+                self.telegram_metrics['latency_ms_max'] = max(self.telegram_metrics['latency_ms_max'], latency_ms)
+                for delivery in batch.futures:
+                    if not delivery.done():
+                        delivery.set_result(success)
+            except asyncio.CancelledError:
+                for delivery in batch.futures:
+                    if not delivery.done():
+                        delivery.set_result(False)
+                raise
+            except Exception as e:
+                log.error(f"❌ Telegram delivery worker error: {e}")
+                for delivery in batch.futures:
+                    if not delivery.done():
+                        delivery.set_result(False)
+            finally:
+                self._telegram_queue.task_done()
+    
+    async def _deliver_telegram(self, session: aiohttp.ClientSession, chat_id: str, message: str) -> bool:
+        """POST one message (HTML, plain-text fallback on parse errors, honours 429 retry_after)"""
+        url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
+        
+        # Rev 00184: Try HTML first, then fallback to plain text if HTML fails
+        data = {
+            'chat_id': chat_id,
+            'text': message,
+            'parse_mode': 'HTML',
+            'disable_web_page_preview': True
+        }
+        
+        for attempt in range(3):
+            try:
+                async with session.post(url, json=data) as response:
+                    status = response.status
+                    try:
+                        result = await response.json(content_type=None)
+                    except Exception:
+                        result = {}
+            except Exception as e:
+                log.error(f"Failed to send Telegram message: {e}")
+                return False
             
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('ok'):
-                    log.debug(f"Telegram message sent successfully")
-                    return True
+            if status == 200 and result.get('ok'):
+                if 'parse_mode' not in data:
+                    log.info("✅ Telegram message sent successfully (plain text fallback)")
                 else:
-                    error_desc = result.get('description', 'Unknown error')
-                    log.error(f"Telegram API error: {error_desc}")
-                    
-                    # Rev 00184: If HTML parse error, retry with plain text
-                    if 'parse' in error_desc.lower() or 'html' in error_desc.lower() or response.status_code == 400:
-                        log.warning(f"⚠️ HTML parse error detected, retrying with plain text mode")
-                        data_plain = {
-                            'chat_id': self.telegram_chat_id,
-                            'text': message,
-                            'disable_web_page_preview': True
-                            # No parse_mode = plain text
-                        }
-                        response_plain = requests.post(url, json=data_plain, timeout=10)
-                        if response_plain.status_code == 200:
-                            result_plain = response_plain.json()
-                            if result_plain.get('ok'):
-                                log.info("✅ Telegram message sent successfully (plain text fallback)")
-                                return True
-                            else:
-                                log.error(f"Telegram API error (plain text): {result_plain.get('description', 'Unknown error')}")
-                        else:
-                            log.error(f"Telegram HTTP error (plain text): {response_plain.status_code}")
-            else:
-                log.error(f"Telegram HTTP error: {response.status_code}")
-                # Rev 00184: Try plain text on HTTP errors too
-                if response.status_code == 400:
-                    log.warning(f"⚠️ HTTP 400 error, retrying with plain text mode")
-                    data_plain = {
-                        'chat_id': self.telegram_chat_id,
-                        'text': message,
-                        'disable_web_page_preview': True
-                    }
-                    response_plain = requests.post(url, json=data_plain, timeout=10)
-                    if response_plain.status_code == 200:
-                        result_plain = response_plain.json()
-                        if result_plain.get('ok'):
-                            log.info("✅ Telegram message sent successfully (plain text fallback)")
-                            return True
+                    log.debug(f"Telegram message sent successfully")
+                return True
             
+            error_desc = result.get('description', 'Unknown error')
+            if status == 429:
+                retry_after = float((result.get('parameters') or {}).get('retry_after', 1))
+                log.warning(f"⚠️ Telegram rate limited (429) - retrying after {retry_after:.0f}s")
+                self.telegram_rate_limiter.penalize(chat_id, retry_after)
+                await self.telegram_rate_limiter.acquire(chat_id)
+                continue
+            
+            log.error(f"Telegram API error ({status}): {error_desc}")
+            # Rev 00184: If HTML parse error, retry with plain text
+            if 'parse_mode' in data and (status == 400 or 'parse' in error_desc.lower() or 'html' in error_desc.lower()):
+                log.warning(f"⚠️ HTML parse error detected, retrying with plain text mode")
+                data = {k: v for k, v in data.items() if k != 'parse_mode'}
+                continue
             return False
-            
-        except Exception as e:
-            log.error(f"Failed to send Telegram message: {e}")
+        
+        return False
+    
+    async def flush_telegram_queue(self, timeout: float = 15.0) -> bool:
+        """Send everything queued (closing open coalescing windows); True if drained within timeout"""
+        if not self._telegram_queue or self._telegram_loop is not asyncio.get_running_loop():
+            return True
+        for batch in list(self._telegram_open_batches.values()):
+            self._close_telegram_batch(batch)
+        try:
+            await asyncio.wait_for(self._telegram_queue.join(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            log.warning(f"⚠️ Telegram queue not drained within {timeout:.0f}s ({self.telegram_queue_depth()} pending)")
             return False
     
+    def get_telegram_queue_metrics(self) -> Dict[str, Any]:
+        """Queue depth and send-latency metrics (Rev 00241)"""
+        m = self.telegram_metrics
+        delivered = m['sent'] + m['failed']
+        return {
+            'queue_depth': self.telegram_queue_depth(),
+            'queue_max_size': self.telegram_queue_max_size,
+            'enqueued': m['enqueued'],
+            'sent': m['sent'],
+            'failed': m['failed'],
+            'dropped': m['dropped'],
+            'coalesced': m['coalesced'],
+            'avg_send_latency_ms': round(m['latency_ms_total'] / delivered, 1) if delivered else 0.0,
+            'max_send_latency_ms': round(m['latency_ms_max'], 1),
+            'last_send_latency_ms': round(m['latency_ms_last'], 1),
+            'rate_limit_waits': self.telegram_rate_limiter.waits,
+            'rate_limit_wait_seconds': round(self.telegram_rate_limiter.total_wait_seconds, 1),
+        }
+    
     # ============================================================================================================================================
     # MESSAGE FORMATTING
     # ============================================================================================================================================
@@ -1921,9 +2115,10 @@ class PrimeAlertManager:
     def get_alert_statistics(self) -> Dict[str, Any]:
         """Get alert statistics"""
         if not self.alert_history:
-            return {}
+            return {'telegram_queue': self.get_telegram_queue_metrics()}
         
         stats = {
+            'telegram_queue': self.get_telegram_queue_metrics(),
             'total_alerts': len(self.alert_history),
             'alerts_by_type': defaultdict(int),
             'alerts_by_level': defaultdict(int),
@@ -2007,13 +2202,13 @@ class PrimeAlertManager:
 🌐 Public Dashboard: 
           https://easy-trading-oauth-v2.web.app"""
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
                 # Update OAuth status
                 self.oauth_status[environment]['last_renewed'] = datetime.now()
                 self.oauth_status[environment]['is_valid'] = True
-                log.info(f"OAuth renewal success alert sent for {environment}")
+                log.info(f"OAuth renewal success alert queued for {environment}")
             
             return success
             
@@ -2033,12 +2228,12 @@ class PrimeAlertManager:
 🔧 Please check the OAuth web app and try again
 🔗 URL: {self.oauth_renewal_url}/oauth/start?env={environment}"""
             
-            success = await self._send_telegram_message(message, AlertLevel.ERROR)
+            success = await self._queue_telegram_message(message, AlertLevel.ERROR)
             
             if success:
                 # Update OAuth status
                 self.oauth_status[environment]['is_valid'] = False
-                log.info(f"OAuth renewal error alert sent for {environment}")
+                log.info(f"OAuth renewal error alert queued for {environment}")
             
             return success
             
@@ -2099,6 +2294,13 @@ class PrimeAlertManager:
             "Easy ORB Strategy system is shutting down gracefully.",
             AlertLevel.INFO
         )
+        
+        # Rev 00241: Drain queued Telegram messages, then stop the delivery worker
+        await self.flush_telegram_queue()
+        if self._telegram_worker_task and not self._telegram_worker_task.done():
+            self._telegram_worker_task.cancel()
+        if self._telegram_session and not self._telegram_session.closed:
+            await self._telegram_session.close()
     
     async def send_oauth_alert(self, title: str, message: str, level: AlertLevel = AlertLevel.INFO) -> bool:
         """
@@ -2117,10 +2319,10 @@ class PrimeAlertManager:
             formatted_message = f"🔐 **OAuth Alert**\n\n**{title}**\n\n{message}"
             
             # Send alert
-            success = await self._send_telegram_message(formatted_message, level)
+            success = await self._queue_telegram_message(formatted_message, level)
             
             if success:
-                log.info(f"OAuth alert sent: {title}")
+                log.info(f"OAuth alert queued: {title}")
             else:
                 log.warning(f"Failed to send OAuth alert: {title}")
             
@@ -2380,10 +2582,10 @@ class PrimeAlertManager:
                 alert_level = AlertLevel.CRITICAL
                 log.error("Sending Good Morning alert - BOTH tokens INVALID (NO TRADING POSSIBLE)")
             
-            success = await self._send_telegram_message(message, alert_level)
+            success = await self._queue_telegram_message(message, alert_level)
             
             if success:
-                log.info(f"Good Morning alert sent successfully (tokens {'valid' if tokens_valid else 'INVALID'})")
+                log.info(f"Good Morning alert queued (tokens {'valid' if tokens_valid else 'INVALID'})")
             else:
                 log.warning("Failed to send Good Morning alert")
             
@@ -2442,10 +2644,10 @@ class PrimeAlertManager:
 🌐 Public Dashboard: 
           https://easy-trading-oauth-v2.web.app"""
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
-                log.info(f"OAuth {environment} token renewal confirmation sent")
+                log.info(f"OAuth {environment} token renewal confirmation queued")
             
             return success
             
@@ -2474,10 +2676,10 @@ class PrimeAlertManager:
 **Time**: {datetime.now().strftime('%I:%M %p ET')}
 **Status**: Active and ready for trading"""
 
-            success = await self._send_telegram_message(formatted_message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(formatted_message, AlertLevel.SUCCESS)
             
             if success:
-                log.info(f"OAuth success alert sent for {environment}")
+                log.info(f"OAuth success alert queued for {environment}")
             else:
                 log.warning(f"Failed to send OAuth success alert for {environment}")
             
@@ -2527,7 +2729,7 @@ Take Profit: ${take_profit:.2f} ({((take_profit - entry_price) / entry_price * 1
             if note:
                 message += f"\n\n{note}"
             
-            return await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            return await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
         except Exception as e:
             log.error(f"Failed to send buy signal alert: {e}")
@@ -2560,15 +2762,15 @@ Duration: {duration_minutes:.0f} minutes
             if note:
                 message += f"\n\n{note}"
             
-            return await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            return await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
         except Exception as e:
             log.error(f"Failed to send sell signal alert: {e}")
             return False
     
     async def send_telegram_alert(self, message: str, level: AlertLevel = AlertLevel.INFO) -> bool:
-        """Public method to send raw Telegram message"""
-        return await self._send_telegram_message(message, level)
+        """Public method to send raw Telegram message (True once queued - see _queue_telegram_message)"""
+        return await self._queue_telegram_message(message, level)
     
     async def send_oauth_market_open_alert(self) -> bool:
         """
@@ -2678,10 +2880,10 @@ Duration: {duration_minutes:.0f} minutes
 ❌ All Operations: Suspended (no valid tokens)
 ⚠️ Risk Level: HIGH - No trading capability"""
 
-            success = await self._send_telegram_message(message, AlertLevel.ERROR)
+            success = await self._queue_telegram_message(message, AlertLevel.ERROR)
             
             if success:
-                log.info("OAuth market open alert sent successfully")
+                log.info("OAuth market open alert queued")
             else:
                 log.warning("Failed to send OAuth market open alert")
             
@@ -2831,11 +3033,11 @@ Duration: {duration_minutes:.0f} minutes
 {next_section}
 """
 
-            success = await self._send_telegram_message(message, AlertLevel.INFO)
+            success = await self._queue_telegram_message(message, AlertLevel.INFO)
             
             if success:
                 dte_count = dte0_signals_qualified if dte0_signals_qualified is not None else 0
-                log.info(f"✅ SO Signal Collection alert sent: {signal_count} ORB + {dte_count} 0DTE signals from {total_scanned} symbols")
+                log.info(f"✅ SO Signal Collection alert queued: {signal_count} ORB + {dte_count} 0DTE signals from {total_scanned} symbols")
             
             return success
             
@@ -3024,10 +3226,10 @@ All {total_rejected} signals were REJECTED due to insufficient capital.
 
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
-                log.info(f"SO execution aggregated alert sent - {so_count} trades from {total_scanned} symbols")
+                log.info(f"SO execution aggregated alert queued - {so_count} trades from {total_scanned} symbols")
             
             return success
             
@@ -3144,11 +3346,11 @@ All {total_rejected} signals were REJECTED due to insufficient capital.
 {mode_emoji} <b>Mode:</b> {mode_text} - Position monitored by stealth trailing
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
                 signal_desc = "Inverse ORR" if is_inverse else "Bullish ORR"
-                log.info(f"ORR execution alert sent for {symbol} - {signal_desc}")
+                log.info(f"ORR execution alert queued for {symbol} - {signal_desc}")
             
             return success
             
@@ -3220,10 +3422,10 @@ All {total_rejected} signals were REJECTED due to insufficient capital.
 {mode_emoji} <b>Mode:</b> {mode} - System operational, waiting for qualified signals
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.INFO)
+            success = await self._queue_telegram_message(message, AlertLevel.INFO)
             
             if success:
-                log.info(f"{signal_type} no signals alert sent - {total_scanned} scanned, 0 signals")
+                log.info(f"{signal_type} no signals alert queued - {total_scanned} scanned, 0 signals")
             
             return success
             
@@ -3288,10 +3490,10 @@ All {total_rejected} signals were REJECTED due to insufficient capital.
 
 🚨 Trading will be PAUSED until ORB data is available"""
             
-            success = await self._send_telegram_message(message, AlertLevel.ERROR)
+            success = await self._queue_telegram_message(message, AlertLevel.ERROR)
             
             if success:
-                log.warning(f"ORB capture FAILED alert sent - 0/{total_symbols} symbols")
+                log.warning(f"ORB capture FAILED alert queued - 0/{total_symbols} symbols")
             
             return success
             
@@ -3480,10 +3682,10 @@ All {total_rejected} signals were REJECTED due to insufficient capital.
           7:15-7:30 AM PT (10:15-10:30 AM ET){dte_section}
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
-                log.info(f"ORB capture complete alert sent - {symbols_captured} symbols, {active_symbols} active")
+                log.info(f"ORB capture complete alert queued - {symbols_captured} symbols, {active_symbols} active")
             
             return success
             
@@ -3568,9 +3770,9 @@ All {total_rejected} signals were REJECTED due to insufficient capital.
    Early exit to prevent further loss"""
             
             # Send alert
-            await self._send_telegram_message(message)
+            await self._queue_telegram_message(message, alert_type="rapid_exit")
             
-            log.info(f"✅ Sent rapid exit alert for {symbol} ({exit_reason})")
+            log.info(f"✅ Queued rapid exit alert for {symbol} ({exit_reason})")
             return True
             
         except Exception as e:
@@ -3655,9 +3857,9 @@ All {total_rejected} signals were REJECTED due to insufficient capital.
    Will use normal 1.5% trailing stop"""
             
             # Send alert
-            await self._send_telegram_message(message)
+            await self._queue_telegram_message(message)
             
-            log.info(f"✅ Sent aggregated 'Letting Winners Run' alert for {len(positions_held)} positions")
+            log.info(f"✅ Queued aggregated 'Letting Winners Run' alert for {len(positions_held)} positions")
             return True
             
         except Exception as e:
@@ -3724,10 +3926,10 @@ All {total_rejected} signals were REJECTED due to insufficient capital.
 
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.INFO)
+            success = await self._queue_telegram_message(message, AlertLevel.INFO)
             
             if success:
-                log.info(f"Holiday alert sent - {holiday_name} ({skip_reason})")
+                log.info(f"Holiday alert queued - {holiday_name} ({skip_reason})")
             
             return success
             
@@ -3813,10 +4015,10 @@ All {total_rejected} signals were REJECTED due to insufficient capital.
           7:15-7:30 AM PT (10:15-10:30 AM ET)
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
-                log.info(f"0DTE ORB Capture alert sent - SPX Range: {spx_range_pct:.2f}%, QQQ Range: {qqq_range_pct:.2f}%, SPY Range: {spy_range_pct:.2f}%")
+                log.info(f"0DTE ORB Capture alert queued - SPX Range: {spx_range_pct:.2f}%, QQQ Range: {qqq_range_pct:.2f}%, SPY Range: {spy_range_pct:.2f}%")
             
             return success
             
@@ -3910,10 +4112,10 @@ All {total_rejected} signals were REJECTED due to insufficient capital.
           7:30 AM PT (10:30 AM ET)
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
-                log.info(f"Options Signal Collection alert sent - {options_signals_qualified} qualified from {orb_signals_received} ORB signals")
+                log.info(f"Options Signal Collection alert queued - {options_signals_qualified} qualified from {orb_signals_received} ORB signals")
             
             return success
             
@@ -4234,13 +4436,13 @@ All {total_rejected} signals were REJECTED or FAILED.
 {execution_section}
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
                 if len(executed_positions) > 0:
-                    log.info(f"0DTE Strategy Options Execution alert sent - {len(executed_positions)} trades, ${total_capital_deployed:.2f} deployed")
+                    log.info(f"0DTE Strategy Options Execution alert queued - {len(executed_positions)} trades, ${total_capital_deployed:.2f} deployed")
                 else:
-                    log.warning(f"0DTE Strategy Options Execution alert sent - 0 trades executed")
+                    log.warning(f"0DTE Strategy Options Execution alert queued - 0 trades executed")
             
             return success
             
@@ -4344,10 +4546,10 @@ All {total_rejected} signals were REJECTED or FAILED.
 📊 Position closed by Options Exit Manager
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS, alert_type=AlertType.OPTIONS_POSITION_EXIT.value)
             
             if success:
-                log.info(f"Options Position Exit alert sent for {symbol} - {reason_desc} - P&L: {pnl_sign}{pnl_pct:.2f}%")
+                log.info(f"Options Position Exit alert queued for {symbol} - {reason_desc} - P&L: {pnl_sign}{pnl_pct:.2f}%")
             
             return success
             
@@ -4488,10 +4690,10 @@ All {total_rejected} signals were REJECTED or FAILED.
             
             message += f"📊 Positions closed by Options Exit Manager"
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
-                log.info(f"Options Aggregated Exit alert sent for {len(closed_positions)} positions - {exit_reason}")
+                log.info(f"Options Aggregated Exit alert queued for {len(closed_positions)} positions - {exit_reason}")
             
             return success
             
@@ -4564,10 +4766,10 @@ All {total_rejected} signals were REJECTED or FAILED.
 📊 Automated exit system profit capture
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
-                log.info(f"Options Partial Profit alert sent for {symbol} - {target_label} - Profit: ${partial_profit:.2f}")
+                log.info(f"Options Partial Profit alert queued for {symbol} - {target_label} - Profit: ${partial_profit:.2f}")
             
             return success
             
@@ -4645,10 +4847,10 @@ All {total_rejected} signals were REJECTED or FAILED.
 📊 Automated exit system profit capture
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.SUCCESS)
+            success = await self._queue_telegram_message(message, AlertLevel.SUCCESS)
             
             if success:
-                log.info(f"Options Runner Exit alert sent for {symbol} - P&L: {pnl_sign}{pnl_pct:.2f}%")
+                log.info(f"Options Runner Exit alert queued for {symbol} - P&L: {pnl_sign}{pnl_pct:.2f}%")
             
             return success
             
@@ -4720,10 +4922,10 @@ All {total_rejected} signals were REJECTED or FAILED.
 🛡️ Health check system protecting capital
 """
             
-            success = await self._send_telegram_message(message, AlertLevel.WARNING if health_status in ['EMERGENCY', 'WARNING'] else AlertLevel.INFO)
+            success = await self._queue_telegram_message(message, AlertLevel.WARNING if health_status in ['EMERGENCY', 'WARNING'] else AlertLevel.INFO)
             
             if success:
-                log.info(f"Options Health Check alert sent - Status: {health_status}, Flags: {len(red_flags)}")
+                log.info(f"Options Health Check alert queued - Status: {health_status}, Flags: {len(red_flags)}")
             
             return success
             
@@ -4924,10 +5126,10 @@ All {total_rejected} signals were REJECTED or FAILED.
 """
             
             # Send via Telegram
-            success = await self._send_telegram_message(message, AlertLevel.INFO)
+            success = await self._queue_telegram_message(message, AlertLevel.INFO)
             
             if success:
-                log.info(f"Options EOD Report sent ({mode} Mode) - Daily: {daily_pnl_sign}${daily_pnl:.2f} ({daily_pnl_sign}{daily_pnl_pct:.2f}%), Weekly: {weekly_pnl_sign}${weekly_pnl:.2f} ({weekly_pnl_sign}{weekly_pnl_pct:.2f}%)")
+                log.info(f"Options EOD Report queued ({mode} Mode) - Daily: {daily_pnl_sign}${daily_pnl:.2f} ({daily_pnl_sign}{daily_pnl_pct:.2f}%), Weekly: {weekly_pnl_sign}${weekly_pnl:.2f} ({weekly_pnl_sign}{weekly_pnl_pct:.2f}%)")
             
             return success
             
@@ -0,0 +1,170 @@
+"""
+Prime Benchmark Context
+
+Per-scan market benchmark snapshot (SPY/QQQ/SPX) shared by the SO scan,
+RS vs SPY enrichment, Red Day filter and 0DTE manager.
+
+Rev 00235: Replaces the per-signal blocking `get_quotes(['SPY'])` calls in the
+SO scan. The benchmark is captured once, alongside the batch quotes, and every
+consumer reads the same snapshot. Each read records the snapshot age so stale
+benchmarks are visible in logs and performance metrics.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .config_loader import get_config_value
+
+log = logging.getLogger(__name__)
+
+BENCHMARK_SYMBOLS = ['SPY', 'QQQ', 'SPX']
+
+@dataclass
+class BenchmarkQuote:
+    """Benchmark quote snapshot"""
+    symbol: str
+    price: float = 0.0
+    open: float = 0.0
+    change_pct: float = 0.0
+
+    def direction(self, threshold_pct: float = 0.0) -> str:
+        """Intraday direction label used by the 0DTE momentum score"""
+        if self.change_pct > threshold_pct:
+            return 'UP'
+        if self.change_pct < -threshold_pct:
+            return 'DOWN'
+        return 'NONE'
+
+@dataclass
+class BenchmarkContext:
+    """Benchmark snapshot shared by every signal in one SO scan"""
+    quotes: Dict[str, BenchmarkQuote] = field(default_factory=dict)
+    fetched_at: float = field(default_factory=time.monotonic)
+    fetched_at_utc: datetime = field(default_factory=datetime.utcnow)
+    max_age_seconds: float = 120.0
+    source: str = "batch_quotes"
+    # Age-at-use statistics (seconds)
+    uses: int = 0
+    stale_uses: int = 0
+    total_age: float = 0.0
+    max_age_seen: float = 0.0
+
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+    def is_stale(self) -> bool:
+        return self.age_seconds() > self.max_age_seconds
+
+    def get(self, symbol: str) -> Optional[BenchmarkQuote]:
+        return self.quotes.get(symbol)
+
+    def price(self, symbol: str = 'SPY') -> Optional[float]:
+        quote = self.quotes.get(symbol)
+        return quote.price if quote and quote.price > 0 else None
+
+    def change_pct(self, symbol: str = 'SPY') -> float:
+        quote = self.quotes.get(symbol)
+        return quote.change_pct if quote else 0.0
+
+    def record_use(self) -> float:
+        """Record one consumer read and return the benchmark age in seconds"""
+        age = self.age_seconds()
+        self.uses += 1
+        self.total_age += age
+        self.max_age_seen = max(self.max_age_seen, age)
+        if age > self.max_age_seconds:
+            self.stale_uses += 1
+        return age
+
+    def relative_strength(self, symbol_change_pct: float, benchmark: str = 'SPY') -> float:
+        return symbol_change_pct - self.change_pct(benchmark)
+
+    def alignment_data(self, threshold_pct: float = 0.0) -> Dict[str, Any]:
+        """SPY/QQQ direction for the 0DTE momentum score ('NONE' when unavailable)"""
+        spy = self.quotes.get('SPY')
+        qqq = self.quotes.get('QQQ')
+        return {
+            'spy_direction': spy.direction(threshold_pct) if spy else 'NONE',
+            'qqq_direction': qqq.direction(threshold_pct) if qqq else 'NONE',
+            'spy_change_pct': spy.change_pct if spy else 0.0,
+            'qqq_change_pct': qqq.change_pct if qqq else 0.0,
+            'benchmark_age_seconds': round(self.age_seconds(), 3),
+        }
+
+    def current_prices(self) -> Dict[str, float]:
+        return {s: q.price for s, q in self.quotes.items() if q.price > 0}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'symbols': sorted(self.quotes.keys()),
+            'source': self.source,
+            'fetched_at': self.fetched_at_utc.isoformat(),
+            'age_seconds': round(self.age_seconds(), 3),
+            'max_age_seconds': self.max_age_seconds,
+            'uses': self.uses,
+            'stale_uses': self.stale_uses,
+            'avg_age_at_use_seconds': round(self.total_age / self.uses, 3) if self.uses else 0.0,
+            'max_age_at_use_seconds': round(self.max_age_seen, 3),
+        }
+
+def _change_pct_from_quote(quote: Dict[str, Any]) -> float:
+    change_pct = quote.get('change_pct')
+    if change_pct is None:
+        return 0.0
+    try:
+        return float(change_pct)
+    except (TypeError, ValueError):
+        return 0.0
+
+def _spy_change_from_history(spy: BenchmarkQuote) -> float:
+    """Rev 00181 fallback: SPY open (or last) vs previous close via yfinance"""
+    try:
+        import yfinance as yf
+        spy_hist = yf.Ticker("SPY").history(period="2d", interval="1d")
+        if not spy_hist.empty and len(spy_hist) >= 2:
+            spy_prev_close = spy_hist['Close'].iloc[-2]
+            spy_base_price = spy.open if spy.open > 0 else spy.price
+            if spy_prev_close > 0 and spy_base_price:
+                return ((spy_base_price - spy_prev_close) / spy_prev_close) * 100
+    except Exception as spy_hist_error:
+        log.debug(f"⚠️ Could not calculate SPY change % from historical data: {spy_hist_error}")
+    return 0.0
+
+def build_benchmark_context(batch_quotes: Dict[str, Dict[str, Any]],
+                            symbols: Optional[List[str]] = None,
+                            max_age_seconds: Optional[float] = None,
+                            spy_history_fallback: bool = True) -> BenchmarkContext:
+    """
+    Build a benchmark context from the scan's batch quotes.
+
+    Blocking (yfinance fallback) - call via asyncio.to_thread from the event loop.
+    """
+    if max_age_seconds is None:
+        max_age_seconds = float(get_config_value("BENCHMARK_MAX_AGE_SECONDS", 120))
+
+    quotes: Dict[str, BenchmarkQuote] = {}
+    for symbol in (symbols or BENCHMARK_SYMBOLS):
+        quote = (batch_quotes or {}).get(symbol)
+        if not quote:
+            continue
+        quotes[symbol] = BenchmarkQuote(
+            symbol=symbol,
+            price=float(quote.get('last', 0.0) or 0.0),
+            open=float(quote.get('open', 0.0) or 0.0),
+            change_pct=_change_pct_from_quote(quote)
+        )
+
+    spy = quotes.get('SPY')
+    if spy and spy.change_pct == 0.0 and spy_history_fallback:
+        spy.change_pct = _spy_change_from_history(spy)
+
+    context = BenchmarkContext(quotes=quotes, max_age_seconds=max_age_seconds)
+    if spy:
+        log.info(f"📈 Benchmark snapshot: SPY ${spy.price:.2f} ({spy.change_pct:+.2f}%), "
+                 f"QQQ {context.change_pct('QQQ'):+.2f}%, SPX {context.change_pct('SPX'):+.2f}%")
+    else:
+        log.warning("⚠️ Benchmark snapshot missing SPY - RS vs SPY will use 0.0% benchmark change")
+    return context
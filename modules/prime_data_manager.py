@@ -14,6 +14,7 @@ Features:
 - Historical data caching (daily refresh)
 - Connection pooling and rate limiting
 - Cloud Run optimized (in-memory cache when Redis unavailable)
+- Two-tier cache: bounded in-process LRU/TTL tier in front of optional Redis (Rev 00232)
 
 Author: Easy ORB Strategy Development Team
 Last Updated: January 6, 2026 (Rev 00231)
@@ -25,12 +26,13 @@ import asyncio
 import logging
 import time
 import threading
+import weakref
 import json
 import os
 import hashlib
 import tempfile
 import shutil
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -40,21 +42,28 @@ import pandas as pd
 import numpy as np
 import aiohttp
 from concurrent.futures import ThreadPoolExecutor
-from collections import deque
-try:
-    import redis
-    import redis.asyncio as aioredis
-    from contextlib import asynccontextmanager
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
-    logging.warning("Redis not available - falling back to in-memory caching")
+from collections import deque, OrderedDict
+
+# Rev 00250: redis is imported on first use (local development only - disabled on Cloud Run)
+_aioredis = None
+
+def _load_aioredis():
+    """redis.asyncio module, or None if redis is not installed"""
+    global _aioredis
+    if _aioredis is None:
+        try:
+            import redis.asyncio as aioredis
+            _aioredis = aioredis
+        except ImportError:
+            _aioredis = False
+            logging.warning("Redis not available - falling back to in-memory caching")
+    return _aioredis or None
 
 from .config_loader import get_config_value
 
 # Import E*TRADE OAuth integration
 try:
-    from .prime_etrade_trading import PrimeETradeTrading
+    from .prime_etrade_trading import get_etrade_client_hub
     ETRADE_AVAILABLE = True
 except ImportError:
     ETRADE_AVAILABLE = False
@@ -86,7 +95,14 @@ class RedisConfig:
         self.market_data_ttl = get_config_value("REDIS_MARKET_DATA_TTL", 300)  # 5 minutes - Market data (NO CHANGE)
         self.technical_ttl = get_config_value("REDIS_TECHNICAL_TTL", 600)  # 10 minutes (INCREASED from 30m) - Technical indicators
         self.sentiment_ttl = get_config_value("REDIS_SENTIMENT_TTL", 900)  # 15 minutes - Sentiment data (NO CHANGE)
-        
+
+        # In-process memory tier (always on - the only tier on Cloud Run)
+        # Quote TTL is deliberately short: it de-duplicates fetches within one 30s monitoring
+        # tick without letting stealth trailing act on quotes from the previous tick
+        self.memory_max_entries = get_config_value("MEMORY_CACHE_MAX_ENTRIES", 5000)
+        self.memory_quote_ttl = get_config_value("MEMORY_CACHE_QUOTE_TTL", 10)
+        self.memory_default_ttl = get_config_value("MEMORY_CACHE_DEFAULT_TTL", 300)
+
         # API Limit Management
         self.max_daily_calls = get_config_value("MAX_DAILY_API_CALLS", 15000)
         self.max_hourly_calls = get_config_value("MAX_HOURLY_API_CALLS", 1000)
@@ -116,7 +132,8 @@ class ConnectionPoolManager:
             is_cloud_run = os.getenv('K_SERVICE') is not None
             
             # Initialize Redis connection pool
-            if REDIS_AVAILABLE and not is_cloud_run:
+            aioredis = None if is_cloud_run else _load_aioredis()
+            if aioredis:
                 redis_config = RedisConfig()
                 self.redis_pool = aioredis.ConnectionPool.from_url(
                     f"redis://{redis_config.host}:{redis_config.port}/{redis_config.db}",
@@ -149,7 +166,8 @@ class ConnectionPoolManager:
             )
             
             # Initialize E*TRADE connection pool
-            self.etrade_pool = ThreadPoolExecutor(max_workers=10)
+            # Rev 00233: Same size as PrimeETradeTrading's keep-alive HTTP pool (ETRADE_MAX_CONNECTIONS)
+            self.etrade_pool = ThreadPoolExecutor(max_workers=get_config_value("ETRADE_MAX_CONNECTIONS", 10))
             
             self._initialized = True
             log.info("✅ Connection pools initialized successfully")
@@ -169,23 +187,176 @@ class ConnectionPoolManager:
         self._initialized = False
         log.info("Connection pools closed")
 
+# ============================================================================
+# IN-PROCESS MEMORY CACHE TIER
+# ============================================================================
+
+def seconds_until_session_close(now: Optional[datetime] = None) -> int:
+    """Seconds until 4:05 PM ET (tomorrow's if already past), minimum 60 - daily history lifetime"""
+    import pytz
+    et_tz = pytz.timezone('America/New_York')
+    now_et = (now or datetime.utcnow()).replace(tzinfo=pytz.utc).astimezone(et_tz)
+    close_day = now_et.date() if now_et.time() < datetime.strptime("16:05", "%H:%M").time() else now_et.date() + timedelta(days=1)
+    close_et = et_tz.localize(datetime(close_day.year, close_day.month, close_day.day, 16, 5))
+    return max(60, int((close_et - now_et).total_seconds()))
+
+class InMemoryCacheTier:
+    """
+    Bounded in-process LRU cache with per-entry TTL (Rev 00232)
+
+    First tier of the data cache. Redis (when available) sits behind it; on Cloud Run
+    this is the only tier. Each key belongs to a family (the key prefix: quote,
+    historical, daily_historical, market_data, technical) and each family has its own
+    TTL cap so quotes expire in seconds while daily history lives until EOD. A family TTL
+    may be a callable evaluated per set (daily_historical: time to the session close).
+    """
+
+    def __init__(self, max_entries: int, family_ttls: Dict[str, Union[int, Callable[[], int]]], default_ttl: int):
+        self.max_entries = max(1, int(max_entries))
+        self.family_ttls = family_ttls
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'sets': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'families': {}
+        }
+
+    @staticmethod
+    def _family(key: str) -> str:
+        """Key family used for TTL selection and per-family counters"""
+        if key.startswith("daily_historical"):
+            return "daily_historical"
+        return key.split(":", 1)[0]
+
+    def _family_stats(self, family: str) -> Dict[str, int]:
+        stats = self.stats['families'].get(family)
+        if stats is None:
+            stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+            self.stats['families'][family] = stats
+        return stats
+
+    def _ttl_for(self, family: str, ttl: Optional[int]) -> float:
+        """Requested TTL capped by the family TTL"""
+        family_ttl = self.family_ttls.get(family, self.default_ttl)
+        if callable(family_ttl):
+            family_ttl = family_ttl()
+        if ttl is None:
+            return float(family_ttl)
+        return float(min(ttl, family_ttl)) if family_ttl else float(ttl)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live entry (returns a shallow copy so callers cannot mutate the cache)"""
+        family = self._family(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                self.stats['expirations'] += 1
+                entry = None
+            if entry is None:
+                self.stats['misses'] += 1
+                self._family_stats(family)['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            self._family_stats(family)['hits'] += 1
+            value = entry[1]
+        if isinstance(value, (dict, list)):
+            return value.copy()
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Store an entry, evicting least-recently-used entries past max_entries"""
+        family = self._family(key)
+        expires_at = time.monotonic() + self._ttl_for(family, ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            self.stats['sets'] += 1
+            while len(self._entries) > self.max_entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+                self._family_stats(self._family(evicted_key))['evictions'] += 1
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def exists(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def purge_expired(self) -> int:
+        """Drop expired entries (called from EOD cleanup)"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]
+            for k in expired:
+                del self._entries[k]
+            self.stats['expirations'] += len(expired)
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.stats['hits'],
+                'misses': self.stats['misses'],
+                'hit_rate': f"{(self.stats['hits'] / lookups * 100) if lookups else 0.0:.2f}%",
+                'sets': self.stats['sets'],
+                'evictions': self.stats['evictions'],
+                'expirations': self.stats['expirations'],
+                'families': {f: dict(s) for f, s in self.stats['families'].items()}
+            }
+
 # ============================================================================
 # REDIS CACHE MANAGER
 # ============================================================================
 
 class RedisCacheManager:
-    """High-performance Redis cache manager with compression and serialization"""
-    
+    """
+    Two-tier cache manager: in-process memory tier in front of optional Redis
+
+    Rev 00232: get/set always go through the memory tier first, so caching works on
+    Cloud Run where Redis is disabled. Redis hits are promoted into the memory tier.
+    """
+
     def __init__(self, redis_pool):
         self.redis_pool = redis_pool
         self.redis = None
         self.config = RedisConfig()
         self._compression_enabled = get_config_value("REDIS_COMPRESSION", True)
         self._serialization_enabled = get_config_value("REDIS_SERIALIZATION", True)
+        self.memory = InMemoryCacheTier(
+            max_entries=self.config.memory_max_entries,
+            family_ttls={
+                'quote': self.config.memory_quote_ttl,
+                'historical': self.config.historical_ttl,
+                'daily_historical': seconds_until_session_close,
+                'market_data': self.config.market_data_ttl,
+                'technical': self.config.technical_ttl,
+            },
+            default_ttl=self.config.memory_default_ttl
+        )
+        self.redis_stats = {'hits': 0, 'misses': 0, 'errors': 0}
     
     async def initialize(self):
         """Initialize Redis connection"""
-        if not REDIS_AVAILABLE:
+        if self.redis_pool is None:
+            # Cloud Run / no pool: skip importing redis altogether
+            log.info("💾 Using in-memory caching (Redis disabled)")
+            return
+        aioredis = _load_aioredis()
+        if not aioredis:
             log.warning("Redis not available - using in-memory fallback")
             return
         
@@ -239,24 +410,40 @@ class RedisCacheManager:
         return ":".join(key_parts)
     
     async def get(self, key: str) -> Optional[Any]:
-        """Get data from Redis cache"""
+        """Get data from the memory tier, falling back to Redis"""
+        data = self.memory.get(key)
+        if data is not None:
+            return data
+
         if not self.redis:
             return None
-        
+
         try:
             data = await self.redis.get(key)
             if data:
-                return self._deserialize_data(data)
+                self.redis_stats['hits'] += 1
+                value = self._deserialize_data(data)
+                # Promote into memory tier (family TTL applies)
+                self.memory.set(key, value)
+                return value
+            self.redis_stats['misses'] += 1
             return None
         except Exception as e:
+            self.redis_stats['errors'] += 1
             log.error(f"Redis GET error for key {key}: {e}")
             return None
-    
+
     async def set(self, key: str, data: Any, ttl: int = None) -> bool:
-        """Set data in Redis cache with TTL"""
+        """
+        Set data in the memory tier and (if available) Redis with TTL
+
+        Returns False if the Redis write failed (the memory tier still holds the value).
+        """
+        self.memory.set(key, data, ttl)
+
         if not self.redis:
-            return False
-        
+            return True
+
         try:
             serialized_data = self._serialize_data(data)
             if ttl:
@@ -265,31 +452,45 @@ class RedisCacheManager:
                 await self.redis.set(key, serialized_data)
             return True
         except Exception as e:
+            self.redis_stats['errors'] += 1
             log.error(f"Redis SET error for key {key}: {e}")
             return False
-    
+
     async def delete(self, key: str) -> bool:
-        """Delete data from Redis cache"""
+        """Delete data from both cache tiers"""
+        deleted = self.memory.delete(key)
         if not self.redis:
-            return False
-        
+            return deleted
+
         try:
             await self.redis.delete(key)
             return True
         except Exception as e:
             log.error(f"Redis DELETE error for key {key}: {e}")
-            return False
-    
+            return deleted
+
     async def exists(self, key: str) -> bool:
-        """Check if key exists in Redis cache"""
+        """Check if key exists in either cache tier"""
+        if self.memory.exists(key):
+            return True
         if not self.redis:
             return False
-        
+
         try:
             return await self.redis.exists(key)
         except Exception as e:
             log.error(f"Redis EXISTS error for key {key}: {e}")
             return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for both tiers"""
+        return {
+            'memory': self.memory.get_stats(),
+            'redis': {
+                'enabled': self.redis is not None,
+                **self.redis_stats
+            }
+        }
     
     async def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cached quote data"""
@@ -331,6 +532,104 @@ class RedisCacheManager:
         key = self._get_cache_key("technical", symbol, indicators=",".join(indicators))
         return await self.set(key, data, self.config.technical_ttl)
 
+# ============================================================================
+# ASYNC TOKEN BUCKET RATE LIMITER
+# ============================================================================
+
+class AsyncTokenBucket:
+    """
+    Async token bucket enforcing several windows at once (Rev 00234)
+
+    Each window (e.g. 10/minute, 500/hour, 10000/day) is a bucket that refills
+    continuously at limit/window_seconds. A call proceeds only when every window has
+    a token, so concurrent fan-out can never exceed any of the modeled limits.
+    The wait is computed under the lock and slept outside it, so waiters do not queue
+    behind one sleeper; the asyncio lock is created per event loop, so one bucket can be
+    shared by callers running their own loops (asyncio.run per batch, worker threads).
+    """
+
+    def __init__(self, name: str, limits: Dict[str, Tuple[int, float]]):
+        """
+        Args:
+            name: Label for logging
+            limits: window label -> (max calls, window seconds)
+        """
+        self.name = name
+        now = time.monotonic()
+        self._windows = {
+            label: {
+                'capacity': float(max_calls),
+                'rate': float(max_calls) / float(window_seconds),
+                'tokens': float(max_calls),
+                'updated': now
+            }
+            for label, (max_calls, window_seconds) in limits.items()
+            if max_calls and window_seconds
+        }
+        self._loop_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+        self._state_lock = threading.Lock()  # Window state is shared across loops/threads
+        self.stats = {'granted': 0, 'rejected': 0, 'waits': 0, 'total_wait_seconds': 0.0}
+
+    def _lock(self) -> asyncio.Lock:
+        """asyncio.Lock for the running loop (created on first use in that loop)"""
+        loop = asyncio.get_running_loop()
+        with self._state_lock:
+            lock = self._loop_locks.get(loop)
+            if lock is None:
+                lock = self._loop_locks[loop] = asyncio.Lock()
+        return lock
+
+    def _refill(self):
+        now = time.monotonic()
+        for window in self._windows.values():
+            elapsed = now - window['updated']
+            window['tokens'] = min(window['capacity'], window['tokens'] + elapsed * window['rate'])
+            window['updated'] = now
+
+    def _wait_needed(self, tokens: int) -> float:
+        wait = 0.0
+        for window in self._windows.values():
+            if window['tokens'] < tokens:
+                wait = max(wait, (tokens - window['tokens']) / window['rate'])
+        return wait
+
+    async def acquire(self, tokens: int = 1, max_wait: Optional[float] = None) -> bool:
+        """
+        Wait for tokens in every window
+
+        Returns:
+            True when granted, False if the wait would exceed max_wait
+        """
+        waited = 0.0
+        while True:
+            async with self._lock():
+                with self._state_lock:
+                    self._refill()
+                    wait = self._wait_needed(tokens)
+                    if wait <= 0:
+                        for window in self._windows.values():
+                            window['tokens'] -= tokens
+                        self.stats['granted'] += tokens
+                        if waited > 0:
+                            self.stats['waits'] += 1
+                            self.stats['total_wait_seconds'] += waited
+                        return True
+                    if max_wait is not None and waited + wait > max_wait:
+                        self.stats['rejected'] += 1
+                        log.warning(f"⚠️ {self.name} rate limit: {wait:.1f}s wait exceeds {max_wait:.1f}s budget - request skipped")
+                        return False
+            # Sleep outside the lock, then re-check (another waiter may have taken the refill)
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._state_lock:
+            self._refill()
+            return {
+                **self.stats,
+                'available': {label: int(w['tokens']) for label, w in self._windows.items()}
+            }
+
 # ============================================================================
 # OPTIMIZED E*TRADE DATA PROVIDER
 # ============================================================================
@@ -338,17 +637,25 @@ class RedisCacheManager:
 class OptimizedETradeDataProvider:
     """Optimized E*TRADE data provider with connection pooling and caching"""
     
-    def __init__(self, etrade_oauth, cache_manager: RedisCacheManager, connection_pool):
+    def __init__(self, etrade_oauth, cache_manager: RedisCacheManager, connection_pool,
+                 token_bucket: Optional[AsyncTokenBucket] = None, usage_callback=None):
         self.etrade_oauth = etrade_oauth
         self.cache_manager = cache_manager
         self.connection_pool = connection_pool
         self.etrade_trader = None
         self._rate_limiter = asyncio.Semaphore(10)  # Limit concurrent requests
         
+        # Rev 00234: Concurrent batch-quote fan-out under the shared E*TRADE token bucket
+        self.token_bucket = token_bucket
+        self.usage_callback = usage_callback  # Called with number of API calls made
+        self.fanout_enabled = get_config_value("ETRADE_QUOTE_FANOUT_ENABLED", True)
+        self.rate_limit_max_wait = get_config_value("ETRADE_RATE_LIMIT_MAX_WAIT_SECONDS", 30)
+        
         # Initialize E*TRADE trader if OAuth is available
         if etrade_oauth and ETRADE_AVAILABLE:
             try:
-                self.etrade_trader = PrimeETradeTrading('prod' if hasattr(etrade_oauth, 'environment') and etrade_oauth.environment == 'prod' else 'demo')
+                # Rev 00251: Handle on the shared E*TRADE client (no extra Secret Manager/account calls)
+                self.etrade_trader = get_etrade_client_hub().handle('prod' if hasattr(etrade_oauth, 'environment') and etrade_oauth.environment == 'prod' else 'demo')
                 log.info("✅ Optimized E*TRADE data provider initialized")
             except Exception as e:
                 log.error(f"❌ Failed to initialize E*TRADE trader: {e}")
@@ -410,59 +717,84 @@ class OptimizedETradeDataProvider:
             
             # Get uncached quotes using E*TRADE REAL batch API (25 symbols per call)
             if uncached_symbols and self.etrade_trader:
-                log.info(f"📥 Fetching {len(uncached_symbols)} quotes via E*TRADE batch API (25/call)...")
-                
                 # Split into batches of 25 (E*TRADE limit)
                 batch_size = 25
-                for i in range(0, len(uncached_symbols), batch_size):
-                    batch = uncached_symbols[i:i+batch_size]
-                    
-                    try:
-                        # Use E*TRADE's REAL batch quotes API
-                        log.debug(f"📞 Calling etrade_trader.get_quotes() for batch of {len(batch)} symbols: {batch[:5]}...")
-                        etrade_quotes = await asyncio.to_thread(self.etrade_trader.get_quotes, batch)
-                        
-                        log.info(f"📊 E*TRADE returned {len(etrade_quotes) if etrade_quotes else 0} quotes for batch of {len(batch)}")
-                        
-                        if not etrade_quotes:
-                            log.warning(f"⚠️ E*TRADE returned empty list for batch: {batch[:5]}...")
-                            continue
-                        
-                        # Convert E*TRADE quotes to standard format
-                        converted_count = 0
-                        for eq in etrade_quotes:
-                            try:
-                                quote = {
-                                    'symbol': eq.symbol,
-                                    'last': eq.last_price,
-                                    'bid': eq.bid,  # FIXED: ETrade uses 'bid' not 'bid_price'
-                                    'ask': eq.ask,  # FIXED: ETrade uses 'ask' not 'ask_price'
-                                    'open': eq.open,  # FIXED: ETrade uses 'open' not 'open_price'
-                                    'high': eq.high,  # FIXED: ETrade uses 'high' not 'high_price'
-                                    'low': eq.low,  # FIXED: ETrade uses 'low' not 'low_price'
-                                    'volume': eq.volume,
-                                    'timestamp': datetime.utcnow().isoformat()
-                                }
-                                cached_quotes[eq.symbol] = quote
-                                converted_count += 1
-                                
-                                # Cache the result
-                                await self.cache_manager.set_quote(eq.symbol, quote)
-                            except Exception as convert_error:
-                                log.warning(f"⚠️ Failed to convert quote for {getattr(eq, 'symbol', 'unknown')}: {convert_error}")
-                            
-                        log.info(f"✅ E*TRADE batch: {converted_count}/{len(batch)} quotes retrieved and converted")
-                        
-                    except Exception as batch_error:
-                        log.error(f"❌ E*TRADE batch failed for {len(batch)} symbols: {batch_error}", exc_info=True)
+                batches = [uncached_symbols[i:i+batch_size] for i in range(0, len(uncached_symbols), batch_size)]
+                fanout = self.fanout_enabled and len(batches) > 1
+                log.info(f"📥 Fetching {len(uncached_symbols)} quotes via E*TRADE batch API "
+                         f"({len(batches)} calls, {'concurrent fan-out' if fanout else 'sequential'})...")
+                
+                if fanout:
+                    # Rev 00234: All chunks in flight at once; token bucket + semaphore bound the burst
+                    results = await asyncio.gather(*[self._fetch_quote_chunk(batch) for batch in batches])
+                else:
+                    results = [await self._fetch_quote_chunk(batch) for batch in batches]
+                
+                for chunk_quotes in results:
+                    cached_quotes.update(chunk_quotes)
             
-            log.info(f"✅ Total quotes: {len(cached_quotes)}/{len(symbols)} ({len(cached_quotes)-len(uncached_symbols)} cached, {len(cached_quotes)-(len(cached_quotes)-len(uncached_symbols))} fetched)")
+            cache_hit_count = len(symbols) - len(uncached_symbols)
+            log.info(f"✅ Total quotes: {len(cached_quotes)}/{len(symbols)} ({cache_hit_count} cached, {len(cached_quotes) - cache_hit_count} fetched)")
             return cached_quotes
             
         except Exception as e:
             log.error(f"Error getting batch quotes: {e}")
             return {}
 
+    async def _fetch_quote_chunk(self, batch: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch and cache one E*TRADE batch-quote call (max 25 symbols)"""
+        chunk_quotes = {}
+        
+        if self.token_bucket and not await self.token_bucket.acquire(1, max_wait=self.rate_limit_max_wait):
+            log.warning(f"⚠️ E*TRADE rate limit - skipped batch of {len(batch)} symbols: {batch[:5]}...")
+            return chunk_quotes
+        
+        try:
+            async with self._rate_limiter:
+                # Use E*TRADE's REAL batch quotes API on the E*TRADE worker pool
+                log.debug(f"📞 Calling etrade_trader.get_quotes() for batch of {len(batch)} symbols: {batch[:5]}...")
+                loop = asyncio.get_running_loop()
+                etrade_quotes = await loop.run_in_executor(self.connection_pool, self.etrade_trader.get_quotes, batch)
+            
+            if self.usage_callback:
+                self.usage_callback('etrade', 1)
+            
+            log.info(f"📊 E*TRADE returned {len(etrade_quotes) if etrade_quotes else 0} quotes for batch of {len(batch)}")
+            
+            if not etrade_quotes:
+                log.warning(f"⚠️ E*TRADE returned empty list for batch: {batch[:5]}...")
+                return chunk_quotes
+            
+            # Convert E*TRADE quotes to standard format
+            for eq in etrade_quotes:
+                try:
+                    quote = {
+                        'symbol': eq.symbol,
+                        'last': eq.last_price,
+                        'bid': eq.bid,  # FIXED: ETrade uses 'bid' not 'bid_price'
+                        'ask': eq.ask,  # FIXED: ETrade uses 'ask' not 'ask_price'
+                        'open': eq.open,  # FIXED: ETrade uses 'open' not 'open_price'
+                        'high': eq.high,  # FIXED: ETrade uses 'high' not 'high_price'
+                        'low': eq.low,  # FIXED: ETrade uses 'low' not 'low_price'
+                        'volume': eq.volume,
+                        'change': eq.change,  # Rev 00235: Needed for RS vs SPY / benchmark context
+                        'change_pct': eq.change_pct,
+                        'timestamp': datetime.utcnow().isoformat()
+                    }
+                    chunk_quotes[eq.symbol] = quote
+                    
+                    # Cache the result
+                    await self.cache_manager.set_quote(eq.symbol, quote)
+                except Exception as convert_error:
+                    log.warning(f"⚠️ Failed to convert quote for {getattr(eq, 'symbol', 'unknown')}: {convert_error}")
+            
+            log.info(f"✅ E*TRADE batch: {len(chunk_quotes)}/{len(batch)} quotes retrieved and converted")
+            
+        except Exception as batch_error:
+            log.error(f"❌ E*TRADE batch failed for {len(batch)} symbols: {batch_error}", exc_info=True)
+        
+        return chunk_quotes
+
 # ============================================================================
 # OPTIMIZED YAHOO FINANCE PROVIDER
 # ============================================================================
@@ -501,6 +833,7 @@ class OptimizedYFProvider:
                         'high': info.get('regularMarketDayHigh', 0),
                         'low': info.get('regularMarketDayLow', 0),
                         'volume': info.get('regularMarketVolume', 0),
+                        'change_pct': info.get('regularMarketChangePercent', 0),
                         'timestamp': datetime.utcnow().isoformat()
                     }
                     
@@ -705,6 +1038,13 @@ class PrimeDataManager:
             'last_minute_reset': time.time()
         }
         
+        # Rev 00234: Token bucket enforcing the E*TRADE minute/hour/day limits above
+        self.etrade_token_bucket = AsyncTokenBucket('E*TRADE', {
+            'minute': (self.api_limits['etrade_minute_limit'], 60),
+            'hour': (self.api_limits['etrade_hourly_limit'], 3600),
+            'day': (self.api_limits['etrade_daily_limit'], 86400)
+        })
+        
         # Batch Processing State
         self.batch_state = {
             'current_batch_index': 0,
@@ -730,7 +1070,9 @@ class PrimeDataManager:
             self.etrade_provider = OptimizedETradeDataProvider(
                 self.etrade_oauth, 
                 self.cache_manager,
-                self.connection_pool_manager.etrade_pool
+                self.connection_pool_manager.etrade_pool,
+                token_bucket=self.etrade_token_bucket,
+                usage_callback=self._update_api_usage
             )
             
             self.yf_provider = OptimizedYFProvider(
@@ -889,21 +1231,16 @@ class PrimeDataManager:
             
             log.info(f"✅ Fetched historical data for {len(historical_data)}/{len(symbols)} symbols")
             
-            # Calculate TTL: Until 4:05 PM ET today
-            now = datetime.utcnow()  # Rev 00075: UTC consistency
-            eod_time = now.replace(hour=16, minute=5, second=0, microsecond=0)
-            
-            # If it's already past 4:05 PM, cache until 4:05 PM tomorrow
-            if now >= eod_time:
-                eod_time = eod_time + timedelta(days=1)
-            
-            ttl_seconds = max(60, int((eod_time - now).total_seconds()))  # Minimum 60 seconds
+            # Calculate TTL: Until 4:05 PM ET today (tomorrow if already past)
+            ttl_seconds = seconds_until_session_close()
             
             # Cache with full-day TTL
             if self.cache_manager:
                 try:
-                    await self.cache_manager.set(cache_key, historical_data, ttl=ttl_seconds)
-                    log.info(f"✅ Cached historical data until 4:05 PM ET ({ttl_seconds/3600:.1f} hours)")
+                    if await self.cache_manager.set(cache_key, historical_data, ttl=ttl_seconds):
+                        log.info(f"✅ Cached historical data until 4:05 PM ET ({ttl_seconds/3600:.1f} hours)")
+                    else:
+                        log.warning("⚠️ Historical data cached in memory only until 4:05 PM ET (Redis write failed)")
                 except Exception as cache_error:
                     log.warning(f"Failed to cache historical data: {cache_error}")
             
@@ -943,9 +1280,9 @@ class PrimeDataManager:
                     
                     log.info("🗑️ Starting historical data cleanup...")
                     
-                    # For now, just log that cleanup would happen
-                    # The cache TTL will naturally expire old entries
-                    log.info(f"✅ Cache TTL will auto-expire old historical data after 4:05 PM ET")
+                    # Memory tier: drop expired entries now (Redis expires on its own TTL)
+                    removed_count = self.cache_manager.memory.purge_expired()
+                    log.info(f"✅ Purged {removed_count} expired in-memory cache entries")
                     log.info(f"📌 Today's cache key: {today_key} (preserved)")
                     
                     # Perform garbage collection
@@ -973,12 +1310,31 @@ class PrimeDataManager:
         """
         start_time = time.time()
         result = {}
+        start_str = start_date.strftime("%Y-%m-%d")
+        end_str = end_date.strftime("%Y-%m-%d")
         
         try:
             import yfinance as yf
             import warnings
             warnings.filterwarnings('ignore')
             
+            # Rev 00232: Serve already-cached symbols from the cache tiers, download only the rest
+            if self.cache_manager:
+                uncached_symbols = []
+                for symbol in symbols:
+                    cached_data = await self.cache_manager.get_historical_data(symbol, start_str, end_str, interval)
+                    if cached_data:
+                        result[symbol] = cached_data
+                    else:
+                        uncached_symbols.append(symbol)
+                if not uncached_symbols:
+                    log.info(f"✅ All {len(symbols)} symbols served from cache")
+                    self._update_metrics(start_time, cache_hit=True, batch_size=len(symbols))
+                    return result
+                if result:
+                    self._update_metrics(start_time, cache_hit=True, batch_size=len(result))
+                symbols = uncached_symbols
+            
             log.info(f"📥 Batch downloading historical data for {len(symbols)} symbols...")
             
             # yfinance batch download (ONE API call for all symbols!)
@@ -1025,8 +1381,6 @@ class PrimeDataManager:
                         result[symbol] = historical_data
                         
                         # Cache individual symbol data
-                        start_str = start_date.strftime("%Y-%m-%d")
-                        end_str = end_date.strftime("%Y-%m-%d")
                         await self.cache_manager.set_historical_data(symbol, start_str, end_str, interval, historical_data)
                         
                 except Exception as symbol_error:
@@ -1483,7 +1837,9 @@ class PrimeDataManager:
             'cache_misses': self.metrics['cache_misses'],
             'api_calls': self.metrics['api_calls'],
             'avg_response_time_ms': f"{self.metrics['avg_response_time']:.2f}",
-            'total_requests': self.metrics['total_requests']
+            'total_requests': self.metrics['total_requests'],
+            'cache_tiers': self.cache_manager.get_stats() if self.cache_manager else {},
+            'etrade_rate_limiter': self.etrade_token_bucket.get_stats()
         }
     
     def _reset_api_counters(self):
@@ -1542,6 +1898,7 @@ class PrimeDataManager:
     
     def _update_api_usage(self, provider: str, calls_made: int):
         """Update API usage counters"""
+        self._reset_api_counters()
         self.metrics['daily_api_usage'] += calls_made
         self.metrics['hourly_api_usage'] += calls_made
         self.api_limits['current_hour_calls'] += calls_made
@@ -1594,21 +1951,17 @@ class PrimeDataManager:
         if not batch:
             return {}
         
-        # Check API limits before making calls
-        if not self._check_api_limits('etrade', len(batch)):
-            log.warning("⚠️ API limit reached, skipping batch")
-            return {}
-        
         start_time = time.time()
         
         try:
             # Try E*TRADE first (primary source)
+            # Rev 00234: E*TRADE limits are enforced by the token bucket inside the provider
+            # (one token per batch call), and usage is recorded per call via usage_callback
             quotes = {}
             if self.etrade_provider and self.etrade_provider.etrade_trader:
                 etrade_quotes = await self.etrade_provider.get_batch_quotes(batch)
                 if etrade_quotes:
                     quotes.update(etrade_quotes)
-                    self._update_api_usage('etrade', len(etrade_quotes))
             
             # Fallback to Yahoo Finance for missing quotes
             missing_symbols = [symbol for symbol in batch if symbol not in quotes]
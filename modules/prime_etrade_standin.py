@@ -0,0 +1,742 @@
+"""
+Prime E*TRADE Stand-in
+
+Local aiohttp server implementing the E*TRADE v1 endpoints PrimeETradeTrading calls,
+so the SO batch path can be load-tested end to end without touching live E*TRADE.
+
+Rev 00255:
+- Endpoints: accounts list, balance, portfolio, orders list/status, quotes
+  (25 symbols per call, 50 with overrideSymbolCount), option chains,
+  order preview / place / cancel, market hours
+- Per-endpoint latency: lognormal distribution fitted to p50/p99
+- 429 throttling: non-blocking token bucket per throttle group
+  (accounts / market / orders, like the E*TRADE per-module limits)
+- Error injection: a fraction of requests per endpoint answered with error_status
+- Prices come from a seeded synthetic market (deterministic per seed and symbol,
+  random walk on every quote); placed orders show up in the portfolio
+- Duplicate clientOrderId placements are rejected, as on E*TRADE
+- The OAuth Authorization header is required but its signature is not verified
+- GET /standin/stats (requests, throttles, injected errors, injected latency
+  percentiles per endpoint); POST /standin/reset clears stats and orders
+
+Order payloads are read from a JSON body ({"PlaceOrderRequest": {...}}) or from the
+query string; orders without a symbol/quantity are accepted but counted as malformed.
+
+Profile JSON (--profile / ETRADE_STANDIN_PROFILE) overrides the defaults per key:
+    {"endpoints": {"quote": {"p50_ms": 60, "p99_ms": 300, "error_rate": 0.01}},
+     "throttles": {"orders": {"rate_per_second": 2, "burst": 4}}}
+
+Usage:
+    python -m modules.prime_etrade_standin --port 8765
+    python -m modules.prime_etrade_standin --profile standin.json --error-rate 0.02
+    ETRADE_API_BASE_URL=http://127.0.0.1:8765 python main.py
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+log = logging.getLogger("prime_etrade_standin")
+
+ETRADE_STANDIN_PROFILE = os.getenv('ETRADE_STANDIN_PROFILE', '')
+ETRADE_STANDIN_SEED = int(os.getenv('ETRADE_STANDIN_SEED', '7'))
+
+# z-score of the 99th percentile (lognormal sigma from p50/p99)
+_Z99 = 2.3263
+_LATENCY_SAMPLES = 100_000
+
+QUOTE_MAX_SYMBOLS = 25
+QUOTE_MAX_SYMBOLS_OVERRIDE = 50
+
+# ============================================================================
+# PROFILES
+# ============================================================================
+
+@dataclass
+class EndpointProfile:
+    """Latency distribution and fault injection for one endpoint"""
+    p50_ms: float
+    p99_ms: float
+    throttle_group: str = 'market'
+    error_rate: float = 0.0    # Fraction of requests answered with error_status
+    error_status: int = 500
+
+@dataclass
+class ThrottleProfile:
+    """Token bucket for one throttle group (rate_per_second <= 0 = unlimited)"""
+    rate_per_second: float
+    burst: int
+
+DEFAULT_ENDPOINTS: Dict[str, EndpointProfile] = {
+    'accounts_list': EndpointProfile(150, 600, 'accounts'),
+    'balance': EndpointProfile(180, 700, 'accounts'),
+    'portfolio': EndpointProfile(220, 900, 'accounts'),
+    'orders_list': EndpointProfile(200, 800, 'orders'),
+    'order_status': EndpointProfile(150, 600, 'orders'),
+    'preview': EndpointProfile(250, 900, 'orders'),
+    'place': EndpointProfile(300, 1200, 'orders'),
+    'cancel': EndpointProfile(200, 800, 'orders'),
+    'quote': EndpointProfile(120, 450, 'market'),
+    'optionchains': EndpointProfile(250, 900, 'market'),
+    'market_hours': EndpointProfile(80, 250, 'market'),
+}
+
+# Roughly the published E*TRADE per-second limits per API module
+DEFAULT_THROTTLES: Dict[str, ThrottleProfile] = {
+    'accounts': ThrottleProfile(2, 4),
+    'market': ThrottleProfile(4, 8),
+    'orders': ThrottleProfile(2, 4),
+}
+
+def load_profile(path: str) -> Tuple[Dict[str, EndpointProfile], Dict[str, ThrottleProfile]]:
+    """Default profiles with the overrides from a profile JSON file applied"""
+    endpoints = dict(DEFAULT_ENDPOINTS)
+    throttles = dict(DEFAULT_THROTTLES)
+    if not path:
+        return endpoints, throttles
+    with open(path, 'r') as f:
+        data = json.load(f)
+    for name, overrides in data.get('endpoints', {}).items():
+        if name not in endpoints:
+            raise ValueError(f"Unknown stand-in endpoint '{name}' (known: {', '.join(sorted(endpoints))})")
+        endpoints[name] = replace(endpoints[name], **overrides)
+    for group, overrides in data.get('throttles', {}).items():
+        base = throttles.get(group, ThrottleProfile(0, 1))
+        throttles[group] = replace(base, **overrides)
+    return endpoints, throttles
+
+class _Throttle:
+    """Non-blocking token bucket: a request that finds no token is answered 429"""
+
+    def __init__(self, profile: ThrottleProfile):
+        self.rate = profile.rate_per_second
+        self.burst = max(1, int(profile.burst))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def allow(self) -> bool:
+        if self.rate <= 0:
+            return True
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
+
+# ============================================================================
+# SYNTHETIC MARKET
+# ============================================================================
+
+class SyntheticMarket:
+    """
+    Seeded per-symbol prices
+
+    Previous close, open and volume are fixed per (seed, symbol); every quote moves the
+    last trade one random-walk step (drift_bps mean, volatility_bps standard deviation).
+    """
+
+    def __init__(self, seed: int = ETRADE_STANDIN_SEED, drift_bps: float = 1.0, volatility_bps: float = 5.0):
+        self.seed = seed
+        self.drift = drift_bps / 10_000
+        self.volatility = volatility_bps / 10_000
+        self._symbols: Dict[str, Dict[str, Any]] = {}
+
+    def _state(self, symbol: str) -> Dict[str, Any]:
+        state = self._symbols.get(symbol)
+        if state is None:
+            rng = random.Random(f"{self.seed}:{symbol}")
+            previous_close = round(rng.uniform(10, 400), 2)
+            open_price = round(previous_close * (1 + rng.gauss(0.003, 0.01)), 2)
+            state = self._symbols[symbol] = {
+                'rng': rng,
+                'previous_close': previous_close,
+                'open': open_price,
+                'last': open_price,
+                'high': open_price,
+                'low': open_price,
+                'volume': rng.randint(200_000, 5_000_000),
+            }
+        return state
+
+    def peek(self, symbol: str) -> Dict[str, Any]:
+        """Current quote fields without advancing the walk"""
+        state = self._state(symbol)
+        last = state['last']
+        change = last - state['previous_close']
+        spread = max(0.01, round(last * 0.0002, 2))
+        return {
+            'symbol': symbol,
+            'lastTrade': round(last, 2),
+            'previousClose': state['previous_close'],
+            'open': state['open'],
+            'high': round(state['high'], 2),
+            'low': round(state['low'], 2),
+            'change': round(change, 2),
+            'changePercent': round(change / state['previous_close'] * 100, 2),
+            'totalVolume': state['volume'],
+            'bid': round(last - spread / 2, 2),
+            'ask': round(last + spread / 2, 2),
+        }
+
+    def tick(self, symbol: str) -> Dict[str, Any]:
+        """Advance the walk one step and return the quote fields"""
+        state = self._state(symbol)
+        rng = state['rng']
+        state['last'] = max(0.01, state['last'] * (1 + rng.gauss(self.drift, self.volatility)))
+        state['high'] = max(state['high'], state['last'])
+        state['low'] = min(state['low'], state['last'])
+        state['volume'] += rng.randint(100, 5_000)
+        return self.peek(symbol)
+
+    def option_pairs(self, symbol: str, option_type: str, strikes: int) -> List[Dict[str, Any]]:
+        """Strikes centred on the last trade with intrinsic + decaying time value"""
+        spot = self._state(symbol)['last']
+        step = 1.0 if spot < 100 else 5.0
+        centre = round(spot / step) * step
+        pairs = []
+        for i in range(-(strikes // 2), strikes - strikes // 2):
+            strike = round(centre + i * step, 2)
+            if strike <= 0:
+                continue
+            time_value = spot * 0.004 * math.exp(-abs(strike - spot) / (spot * 0.02))
+            moneyness = (spot - strike) / (spot * 0.02)
+            call_delta = 1 / (1 + math.exp(-1.7 * moneyness))
+            pair: Dict[str, Any] = {'strikePrice': strike}
+            for side, intrinsic, delta in (('Call', max(0.0, spot - strike), call_delta),
+                                           ('Put', max(0.0, strike - spot), call_delta - 1)):
+                if option_type not in ('CALLPUT', side.upper()):
+                    continue
+                mid = intrinsic + time_value
+                pair[side] = {
+                    'symbol': symbol,
+                    'optionType': side.upper(),
+                    'strikePrice': strike,
+                    'bid': round(max(0.0, mid - 0.02), 2),
+                    'ask': round(mid + 0.02, 2),
+                    'lastPrice': round(mid, 2),
+                    'volume': int(2_000 * math.exp(-abs(moneyness))),
+                    'openInterest': int(10_000 * math.exp(-abs(moneyness) / 2)),
+                    'OptionGreeks': {'delta': round(delta, 4), 'gamma': 0.05, 'theta': round(-time_value / 2, 4),
+                                     'vega': 0.02, 'iv': 0.35},
+                }
+            pairs.append(pair)
+        return pairs
+
+# ============================================================================
+# STAND-IN SERVER
+# ============================================================================
+
+class ETradeStandIn:
+    """
+    Local E*TRADE API
+
+    Usage:
+        standin = ETradeStandIn()
+        base_url = await standin.start(port=0)  # Ephemeral port
+        ...  # config['base_url'] = base_url
+        print(standin.get_stats())
+        await standin.stop()
+    """
+
+    ACCOUNT_ID = '84000001'
+    ACCOUNT_ID_KEY = 'STANDIN0001'
+
+    def __init__(self, endpoints: Optional[Dict[str, EndpointProfile]] = None,
+                 throttles: Optional[Dict[str, ThrottleProfile]] = None,
+                 seed: int = ETRADE_STANDIN_SEED, latency_scale: float = 1.0,
+                 account_value: float = 100_000.0, market: Optional[SyntheticMarket] = None):
+        """
+        Args:
+            endpoints: Endpoint profiles (DEFAULT_ENDPOINTS when None)
+            throttles: Throttle group profiles (DEFAULT_THROTTLES when None)
+            seed: Seed for latency/error sampling and the synthetic market
+            latency_scale: Multiplier on every sampled latency (0 = no injected latency)
+            account_value: Cash reported by the balance endpoint
+            market: Synthetic market (a seeded one when None)
+        """
+        self.endpoints = dict(endpoints or DEFAULT_ENDPOINTS)
+        self.throttle_profiles = dict(throttles or DEFAULT_THROTTLES)
+        self.latency_scale = latency_scale
+        self.account_value = account_value
+        self.market = market or SyntheticMarket(seed)
+        self._rng = random.Random(seed)
+        self._runner = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self.reset()
+
+    def reset(self):
+        """Clear stats, throttles and order book"""
+        self._throttles = {group: _Throttle(profile) for group, profile in self.throttle_profiles.items()}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self.counters = {'malformed_orders': 0, 'duplicate_orders': 0, 'oversized_quote_requests': 0,
+                         'unauthorized': 0}
+        self._next_id = 1000
+        self._previews: Dict[str, str] = {}       # previewId -> clientOrderId
+        self._client_orders: Dict[str, str] = {}  # clientOrderId -> orderId
+        self.orders: Dict[str, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Fault injection
+    # ------------------------------------------------------------------
+
+    def _sample_latency_ms(self, profile: EndpointProfile) -> float:
+        if self.latency_scale <= 0 or profile.p50_ms <= 0:
+            return 0.0
+        if profile.p99_ms <= profile.p50_ms:
+            return profile.p50_ms * self.latency_scale
+        sigma = math.log(profile.p99_ms / profile.p50_ms) / _Z99
+        return self._rng.lognormvariate(math.log(profile.p50_ms), sigma) * self.latency_scale
+
+    def _endpoint_stats(self, endpoint: str) -> Dict[str, Any]:
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            stats = self._stats[endpoint] = {'requests': 0, 'ok': 0, 'throttled': 0, 'errors': 0, 'rejected': 0,
+                                             'latency_ms': deque(maxlen=_LATENCY_SAMPLES)}
+        return stats
+
+    @staticmethod
+    def _error(status: int, code: int, message: str):
+        from aiohttp import web
+        return web.json_response({'Error': {'code': code, 'message': message}}, status=status)
+
+    async def _serve(self, endpoint: str, request, build):
+        """Auth check, throttle, injected latency, injected error, then build(request) -> payload"""
+        from aiohttp import web
+
+        profile = self.endpoints[endpoint]
+        stats = self._endpoint_stats(endpoint)
+        stats['requests'] += 1
+
+        if not request.headers.get('Authorization', '').startswith('OAuth'):
+            self.counters['unauthorized'] += 1
+            return self._error(401, 401, 'oauth_problem=parameter_absent')
+
+        throttle = self._throttles.get(profile.throttle_group)
+        if throttle is not None and not throttle.allow():
+            stats['throttled'] += 1
+            return self._error(429, 429, 'Too many requests - rate limit exceeded')
+
+        latency_ms = self._sample_latency_ms(profile)
+        stats['latency_ms'].append(latency_ms)
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+
+        if profile.error_rate > 0 and self._rng.random() < profile.error_rate:
+            stats['errors'] += 1
+            return self._error(profile.error_status, 100, 'Injected stand-in error')
+
+        payload = await build(request)
+        if isinstance(payload, web.StreamResponse):
+            stats['rejected'] += 1  # Request-level error (oversized quote, duplicate order, ...)
+            return payload
+        stats['ok'] += 1
+        return web.json_response(payload)
+
+    # ------------------------------------------------------------------
+    # Accounts
+    # ------------------------------------------------------------------
+
+    async def _accounts_list(self, request):
+        return {'AccountListResponse': {'Accounts': {'Account': [{
+            'accountId': self.ACCOUNT_ID,
+            'accountIdKey': self.ACCOUNT_ID_KEY,
+            'accountName': 'Stand-in Brokerage',
+            'accountDesc': 'Individual Brokerage',
+            'accountMode': 'MARGIN',
+            'accountType': 'INDIVIDUAL',
+            'institutionType': 'BROKERAGE',
+            'accountStatus': 'ACTIVE',
+        }]}}}
+
+    async def _balance(self, request):
+        invested = sum(o['quantity'] * o['price'] for o in self.orders.values() if o['status'] == 'EXECUTED')
+        cash = round(self.account_value - invested, 2)
+        return {'BalanceResponse': {
+            'accountId': self.ACCOUNT_ID,
+            'accountType': 'MARGIN',
+            'Computed': {
+                'cashAvailableForInvestment': cash,
+                'cashBuyingPower': cash,
+                'totalAccountValue': round(self.account_value, 2),
+                'RealTimeValues': {'totalAccountValue': round(self.account_value, 2)},
+            },
+        }}
+
+    async def _portfolio(self, request):
+        holdings: Dict[str, Dict[str, float]] = {}
+        for order in self.orders.values():
+            if order['status'] != 'EXECUTED':
+                continue
+            held = holdings.setdefault(order['symbol'], {'quantity': 0, 'cost': 0.0})
+            sign = -1 if order['action'].startswith('SELL') else 1
+            held['quantity'] += sign * order['quantity']
+            held['cost'] += sign * order['quantity'] * order['price']
+        positions = []
+        for i, (symbol, held) in enumerate(sorted(holdings.items())):
+            if held['quantity'] == 0:
+                continue
+            last = self.market.peek(symbol)['lastTrade']
+            value = held['quantity'] * last
+            positions.append({
+                'positionId': 5000 + i,
+                'symbolDescription': symbol,
+                'Product': {'symbol': symbol, 'securityType': 'EQ'},
+                'quantity': held['quantity'],
+                'positionType': 'LONG' if held['quantity'] > 0 else 'SHORT',
+                'pricePaid': round(held['cost'] / held['quantity'], 4),
+                'marketValue': round(value, 2),
+                'totalCost': round(held['cost'], 2),
+                'totalGain': round(value - held['cost'], 2),
+                'totalGainPct': round((value - held['cost']) / held['cost'] * 100, 2) if held['cost'] else 0.0,
+            })
+        return {'PortfolioResponse': {'AccountPortfolio': [{'accountId': self.ACCOUNT_ID, 'Position': positions}]}}
+
+    # ------------------------------------------------------------------
+    # Market
+    # ------------------------------------------------------------------
+
+    async def _quotes(self, request):
+        symbols = [s.strip().upper() for s in request.match_info['symbols'].split(',') if s.strip()]
+        limit = QUOTE_MAX_SYMBOLS_OVERRIDE if request.query.get('overrideSymbolCount') == 'true' else QUOTE_MAX_SYMBOLS
+        if len(symbols) > limit:
+            self.counters['oversized_quote_requests'] += 1
+            return self._error(400, 1019, f"Too many symbols: {len(symbols)} (max {limit})")
+        now = int(time.time())
+        quote_data = []
+        for symbol in symbols:
+            quote = self.market.tick(symbol)
+            quote_data.append({
+                'dateTimeUTC': now,
+                'quoteStatus': 'REALTIME',
+                'ahFlag': 'false',
+                'Product': {'symbol': symbol, 'securityType': 'EQ'},
+                'All': {k: v for k, v in quote.items() if k != 'symbol'},
+            })
+        return {'QuoteResponse': {'QuoteData': quote_data}}
+
+    async def _option_chains(self, request):
+        symbol = request.query.get('symbol', '').upper()
+        if not symbol:
+            return self._error(400, 10033, 'symbol is required')
+        option_type = request.query.get('optionType', request.query.get('chainType', 'CALLPUT')).upper()
+        try:
+            strikes = int(request.query.get('noOfStrikes', request.query.get('strikeCount', '20')))
+        except ValueError:
+            strikes = 20
+        expiry = request.query.get('expiryDate', datetime.now().strftime('%Y-%m-%d')).replace('-', '')
+        return {'OptionChainResponse': {
+            'OptionPair': self.market.option_pairs(symbol, option_type, max(1, strikes)),
+            'timeStamp': int(time.time()),
+            'quoteType': 'REALTIME',
+            'SelectedED': {'year': int(expiry[:4]), 'month': int(expiry[4:6]), 'day': int(expiry[6:8])},
+        }}
+
+    async def _market_hours(self, request):
+        return {'MarketHoursResponse': {'Market': [{'name': 'NYSE', 'open': '09:30', 'close': '16:00',
+                                                    'timeZone': 'America/New_York', 'status': 'OPEN'}]}}
+
+    # ------------------------------------------------------------------
+    # Orders
+    # ------------------------------------------------------------------
+
+    async def _order_request(self, request, wrapper: str) -> Dict[str, Any]:
+        """Order payload from the JSON body, else from the query string"""
+        payload: Dict[str, Any] = {}
+        if request.can_read_body:
+            try:
+                body = await request.json()
+                payload = body.get(wrapper, body) if isinstance(body, dict) else {}
+            except (ValueError, UnicodeDecodeError):
+                payload = {}
+        if not payload:
+            query = request.query
+            payload = {
+                'orderType': query.get('orderType', 'EQ'),
+                'clientOrderId': query.get('clientOrderId', ''),
+                'PreviewIds': [{'previewId': v} for v in query.getall('previewId', [])],
+            }
+        orders = payload.get('Order') or []
+        order = orders[0] if isinstance(orders, list) and orders and isinstance(orders[0], dict) else {}
+        instrument = (order.get('Instrument') or [{}])[0] if isinstance(order.get('Instrument'), list) else {}
+        symbol = order.get('symbol') or (instrument.get('Product') or {}).get('symbol')
+        quantity = order.get('quantity') or instrument.get('quantity')
+        if not symbol or not quantity:
+            self.counters['malformed_orders'] += 1
+            if self.counters['malformed_orders'] == 1:
+                log.warning("⚠️ Order payload without symbol/quantity (query-string form?) - accepted as UNKNOWN x1")
+        try:
+            quantity = int(quantity or 1)
+        except (TypeError, ValueError):
+            quantity = 1
+        symbol = str(symbol or 'UNKNOWN').upper()
+        return {
+            'order_type': payload.get('orderType', 'EQ'),
+            'client_order_id': str(payload.get('clientOrderId') or ''),
+            'symbol': symbol,
+            'quantity': quantity,
+            'action': str(order.get('orderAction') or instrument.get('orderAction') or 'BUY'),
+            'price_type': str(order.get('priceType', 'MARKET')),
+            'limit_price': order.get('limitPrice'),
+            'preview_ids': [str(p.get('previewId')) for p in payload.get('PreviewIds') or [] if isinstance(p, dict)],
+        }
+
+    def _order_echo(self, order: Dict[str, Any], price: float) -> List[Dict[str, Any]]:
+        return [{
+            'priceType': order['price_type'],
+            'orderTerm': 'GOOD_FOR_DAY',
+            'limitPrice': order['limit_price'] or 0,
+            'estimatedTotalAmount': round(order['quantity'] * price, 2),
+            'Instrument': [{'Product': {'symbol': order['symbol'], 'securityType': 'EQ'},
+                            'orderAction': order['action'], 'quantity': order['quantity']}],
+        }]
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    async def _preview(self, request):
+        order = await self._order_request(request, 'PreviewOrderRequest')
+        preview_id = self._new_id()
+        self._previews[str(preview_id)] = order['client_order_id']
+        price = self.market.peek(order['symbol'])['ask']
+        return {'PreviewOrderResponse': {
+            'orderType': order['order_type'],
+            'clientOrderId': order['client_order_id'],
+            'accountId': self.ACCOUNT_ID,
+            'previewTime': int(time.time() * 1000),
+            'PreviewIds': [{'previewId': preview_id}],
+            'Order': self._order_echo(order, price),
+        }}
+
+    async def _place(self, request):
+        order = await self._order_request(request, 'PlaceOrderRequest')
+        client_order_id = order['client_order_id']
+        if client_order_id and client_order_id in self._client_orders:
+            self.counters['duplicate_orders'] += 1
+            return self._error(400, 1036, f"Duplicate clientOrderId {client_order_id} "
+                                          f"(order {self._client_orders[client_order_id]})")
+        order_id = str(self._new_id())
+        if client_order_id:
+            self._client_orders[client_order_id] = order_id
+        quote = self.market.peek(order['symbol'])
+        price = quote['ask'] if not order['action'].startswith('SELL') else quote['bid']
+        self.orders[order_id] = {
+            'order_id': order_id, 'client_order_id': client_order_id, 'symbol': order['symbol'],
+            'quantity': order['quantity'], 'action': order['action'], 'price': price,
+            'status': 'EXECUTED' if order['price_type'] == 'MARKET' else 'OPEN',
+            'placed_time': int(time.time() * 1000),
+        }
+        return {'PlaceOrderResponse': {
+            'orderType': order['order_type'],
+            'clientOrderId': client_order_id,
+            'accountId': self.ACCOUNT_ID,
+            'placedTime': self.orders[order_id]['placed_time'],
+            'OrderIds': [{'orderId': int(order_id)}],
+            'Order': self._order_echo(order, price),
+        }}
+
+    async def _cancel(self, request):
+        order_id = request.query.get('orderId', '')
+        if not order_id and request.can_read_body:
+            try:
+                body = await request.json()
+                order_id = str((body.get('CancelOrderRequest') or body).get('orderId', ''))
+            except (ValueError, UnicodeDecodeError, AttributeError):
+                order_id = ''
+        order = self.orders.get(order_id)
+        if order is None:
+            return self._error(400, 5001, f"Order {order_id or '?'} not found")
+        if order['status'] == 'EXECUTED':
+            return self._error(400, 5002, f"Order {order_id} already executed")
+        order['status'] = 'CANCELLED'
+        return {'CancelOrderResponse': {'accountId': self.ACCOUNT_ID, 'orderId': int(order_id),
+                                        'cancelTime': int(time.time() * 1000)}}
+
+    def _order_view(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'orderId': int(order['order_id']),
+            'clientOrderId': order['client_order_id'],
+            'OrderDetail': [{
+                'status': order['status'],
+                'placedTime': order['placed_time'],
+                'Instrument': [{'Product': {'symbol': order['symbol'], 'securityType': 'EQ'},
+                                'orderAction': order['action'], 'orderedQuantity': order['quantity'],
+                                'filledQuantity': order['quantity'] if order['status'] == 'EXECUTED' else 0,
+                                'averageExecutionPrice': order['price']}],
+            }],
+        }
+
+    async def _orders_list(self, request):
+        status = request.query.get('status', '').upper()
+        orders = [self._order_view(o) for o in self.orders.values() if not status or o['status'] == status]
+        return {'OrdersResponse': {'Order': orders}}
+
+    async def _order_status(self, request):
+        order = self.orders.get(request.match_info['order_id'])
+        if order is None:
+            return self._error(400, 5001, f"Order {request.match_info['order_id']} not found")
+        return {'OrdersResponse': {'Order': [self._order_view(order)]}}
+
+    # ------------------------------------------------------------------
+    # App
+    # ------------------------------------------------------------------
+
+    def _route(self, endpoint: str, build):
+        async def handler(request):
+            return await self._serve(endpoint, request, build)
+        return handler
+
+    async def _handle_stats(self, request):
+        from aiohttp import web
+        return web.json_response(self.get_stats())
+
+    async def _handle_reset(self, request):
+        from aiohttp import web
+        self.reset()
+        return web.json_response({'status': 'reset'})
+
+    def make_app(self):
+        """aiohttp Application serving the stand-in routes"""
+        from aiohttp import web
+
+        app = web.Application()
+        accounts = '/v1/accounts/{account_key}'
+        app.router.add_get('/v1/accounts/list', self._route('accounts_list', self._accounts_list))
+        app.router.add_get(f'{accounts}/balance', self._route('balance', self._balance))
+        app.router.add_get(f'{accounts}/portfolio', self._route('portfolio', self._portfolio))
+        app.router.add_get(f'{accounts}/orders', self._route('orders_list', self._orders_list))
+        app.router.add_post(f'{accounts}/orders/preview', self._route('preview', self._preview))
+        app.router.add_post(f'{accounts}/orders/place', self._route('place', self._place))
+        app.router.add_put(f'{accounts}/orders/cancel', self._route('cancel', self._cancel))
+        app.router.add_delete(f'{accounts}/orders/cancel', self._route('cancel', self._cancel))
+        app.router.add_get(f'{accounts}/orders/{{order_id}}', self._route('order_status', self._order_status))
+        app.router.add_get('/v1/market/quote/{symbols}', self._route('quote', self._quotes))
+        app.router.add_get('/v1/market/optionchains', self._route('optionchains', self._option_chains))
+        app.router.add_get('/v1/market/hours', self._route('market_hours', self._market_hours))
+        app.router.add_get('/standin/stats', self._handle_stats)
+        app.router.add_post('/standin/reset', self._handle_reset)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """Serve on host:port inside the running event loop (port 0 = ephemeral); returns the base URL"""
+        from aiohttp import web
+
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        base_url = f"http://{host}:{bound_port}"
+        log.info(f"🧪 E*TRADE stand-in listening on {base_url}")
+        return base_url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start_in_thread(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Serve from a dedicated thread and event loop; returns the base URL
+
+        Use this when the code under test shares a loop with the caller: its blocking
+        E*TRADE calls would otherwise stall the stand-in that has to answer them.
+        """
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        self._thread = threading.Thread(target=loop.run_forever, name="etrade-standin", daemon=True)
+        self._thread.start()
+        return asyncio.run_coroutine_threadsafe(self.start(host, port), loop).result()
+
+    def stop_thread(self):
+        """Stop the server started by start_in_thread()"""
+        loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5)
+        loop.close()
+        self._thread = None
+
+    def call(self, fn, *args):
+        """Run fn on the serving loop's thread (start_in_thread), so it does not race the handlers"""
+        if self._loop is None:
+            return fn(*args)
+
+        async def run():
+            return fn(*args)
+        return asyncio.run_coroutine_threadsafe(run(), self._loop).result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        endpoints = {}
+        for endpoint, stats in sorted(self._stats.items()):
+            latencies = sorted(stats['latency_ms'])
+            endpoints[endpoint] = {
+                **{k: v for k, v in stats.items() if k != 'latency_ms'},
+                'injected_p50_ms': round(_percentile(latencies, 50), 1),
+                'injected_p99_ms': round(_percentile(latencies, 99), 1),
+            }
+        return {
+            'endpoints': endpoints,
+            'counters': dict(self.counters),
+            'orders': len(self.orders),
+            'profiles': {name: asdict(p) for name, p in self.endpoints.items()},
+            'throttles': {group: asdict(p) for group, p in self.throttle_profiles.items()},
+        }
+
+def build_standin(profile_path: str = ETRADE_STANDIN_PROFILE, latency_scale: float = 1.0,
+                  error_rate: Optional[float] = None, throttle: bool = True,
+                  seed: int = ETRADE_STANDIN_SEED) -> ETradeStandIn:
+    """Stand-in from a profile file plus the CLI-style global overrides"""
+    endpoints, throttles = load_profile(profile_path)
+    if error_rate is not None:
+        endpoints = {name: replace(p, error_rate=error_rate) for name, p in endpoints.items()}
+    if not throttle:
+        throttles = {group: replace(p, rate_per_second=0) for group, p in throttles.items()}
+    return ETradeStandIn(endpoints, throttles, seed=seed, latency_scale=latency_scale)
+
+def add_standin_arguments(parser: argparse.ArgumentParser) -> None:
+    """Fault-injection flags shared by the stand-in and the load benchmark CLIs"""
+    parser.add_argument("--profile", default=ETRADE_STANDIN_PROFILE, help="Profile JSON overriding endpoint/throttle defaults")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Multiplier on injected latency (0 = none)")
+    parser.add_argument("--error-rate", type=float, default=None, help="Error-injection rate applied to every endpoint")
+    parser.add_argument("--no-throttle", action="store_true", help="Disable 429 throttling")
+    parser.add_argument("--seed", type=int, default=ETRADE_STANDIN_SEED)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local E*TRADE API stand-in with latency, 429 and error injection")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_standin_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    from aiohttp import web
+
+    standin = build_standin(args.profile, args.latency_scale, args.error_rate, not args.no_throttle, args.seed)
+    log.info(f"🧪 E*TRADE stand-in on http://{args.host}:{args.port} "
+             f"(latency x{args.latency_scale}, throttling {'off' if args.no_throttle else 'on'}, "
+             f"stats at /standin/stats)")
+    web.run_app(standin.make_app(), host=args.host, port=args.port, access_log=None, print=None)
+
+if __name__ == "__main__":
+    main()
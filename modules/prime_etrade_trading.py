@@ -37,14 +37,51 @@ except ImportError:
 # Import requests-oauthlib for correct OAuth 1.0a implementation
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     from requests_oauthlib import OAuth1
     REQUESTS_OAUTH_AVAILABLE = True
 except ImportError:
     REQUESTS_OAUTH_AVAILABLE = False
     logging.warning("requests-oauthlib not available. Using fallback OAuth implementation.")
 
+# Rev 00237: Vectorized indicator engine (falls back to the list-based calculators below)
+try:
+    from .prime_indicator_engine import compute_indicators
+    INDICATOR_ENGINE_AVAILABLE = True
+except ImportError:
+    INDICATOR_ENGINE_AVAILABLE = False
+
+# Rev 00253: Shared memory-mapped daily OHLCV store (falls back to direct yfinance downloads)
+try:
+    from .prime_ohlcv_store import get_ohlcv_store, OHLCV_STORE_ENABLED
+except ImportError:
+    OHLCV_STORE_ENABLED = False
+
 log = logging.getLogger(__name__)
 
+# Rev 00233: Keep-alive connection pool for api.etrade.com
+# Sized to match the E*TRADE worker pool in ConnectionPoolManager (ETRADE_MAX_CONNECTIONS),
+# so concurrent quote/order threads never queue for a socket or open a fresh TLS connection.
+ETRADE_HTTP_POOL_SIZE = int(os.getenv('ETRADE_MAX_CONNECTIONS', '10'))
+ETRADE_HTTP_TIMEOUT = 30
+
+# Upper bounds (ms) for per-endpoint latency histogram buckets
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Rev 00236: SO enrichment pipeline - session cache for daily history + indicator worker threads
+ENRICHMENT_MAX_WORKERS = int(os.getenv('ENRICHMENT_MAX_WORKERS', '8'))
+ENRICHMENT_HISTORY_CACHE_TTL = int(os.getenv('ENRICHMENT_HISTORY_CACHE_TTL_SECONDS', '3600'))
+ETRADE_QUOTE_BATCH_SIZE = 25
+
+# Rev 00251: Process-wide client hub - one token store, account cache and HTTP pool per environment
+ETRADE_CLIENT_HUB_ENABLED = os.getenv('ETRADE_CLIENT_HUB_ENABLED', 'true').lower() == 'true'
+ETRADE_CONNECTION_TEST_TTL = float(os.getenv('ETRADE_CONNECTION_TEST_TTL_SECONDS', '300'))
+ETRADE_BALANCE_CACHE_SECONDS = float(os.getenv('ETRADE_BALANCE_CACHE_SECONDS', '5'))
+ETRADE_QUOTE_CACHE_SECONDS = float(os.getenv('ETRADE_QUOTE_CACHE_SECONDS', '1'))
+
+# Rev 00255: Base URL override (e.g. a local prime_etrade_standin for load tests); empty = E*TRADE
+ETRADE_API_BASE_URL = os.getenv('ETRADE_API_BASE_URL', '').strip().rstrip('/')
+
 @dataclass
 class ETradeAccount:
     """ETrade Account Information"""
@@ -92,19 +129,128 @@ class ETradeQuote:
     low: float
     open: float
 
+class ETradeSharedState:
+    """
+    E*TRADE state shared by every PrimeETradeTrading handle of one environment (Rev 00251)
+    
+    Credentials, OAuth tokens, the account list, the keep-alive HTTP session, the OAuth
+    signer, latency histograms, the daily history cache and short-lived balance/quote
+    caches live here; a token reload is seen by all handles on their next call.
+    """
+    
+    def __init__(self, environment: str):
+        self.environment = environment
+        self.config = None
+        self.tokens = None
+        self.accounts: List[ETradeAccount] = []
+        self.loaded = False
+        self.load_lock = threading.RLock()
+        self.connection_verified_at: Optional[float] = None  # time.monotonic()
+        
+        # Rev 00233: Persistent HTTP session + cached OAuth signer + latency histograms
+        self.http_session = None
+        self.http_lock = threading.Lock()
+        self.oauth_signer = None
+        self.oauth_signer_key: Optional[Tuple[str, str, str, str]] = None
+        self.latency_lock = threading.Lock()
+        self.endpoint_latency: Dict[str, Dict[str, Any]] = {}
+        
+        # Rev 00236: Session cache of daily history (symbol -> (fetched_at, date, bars))
+        self.history_cache: Dict[str, Tuple[float, str, List[Dict[str, Any]]]] = {}
+        self.history_lock = threading.Lock()
+        
+        # Short-lived caches so components do not repeat the same balance/quote calls
+        self.cache_lock = threading.Lock()
+        self.balance_cache: Dict[str, Tuple[float, ETradeBalance]] = {}  # accountIdKey -> (at, balance)
+        self.quote_cache: Dict[str, Tuple[float, ETradeQuote]] = {}  # symbol -> (at, quote)
+        self.stats = {'handles': 0, 'credential_loads': 0, 'token_loads': 0, 'account_loads': 0,
+                      'connection_tests': 0, 'balance_hits': 0, 'quote_hits': 0}
+    
+    def connection_recently_verified(self) -> bool:
+        return (self.connection_verified_at is not None
+                and time.monotonic() - self.connection_verified_at < ETRADE_CONNECTION_TEST_TTL)
+    
+    def cached_balance(self, account_id_key: str) -> Optional[ETradeBalance]:
+        with self.cache_lock:
+            entry = self.balance_cache.get(account_id_key)
+            if entry and time.monotonic() - entry[0] < ETRADE_BALANCE_CACHE_SECONDS:
+                self.stats['balance_hits'] += 1
+                return entry[1]
+        return None
+    
+    def store_balance(self, account_id_key: str, balance: ETradeBalance):
+        with self.cache_lock:
+            self.balance_cache[account_id_key] = (time.monotonic(), balance)
+    
+    def cached_quotes(self, symbols: List[str]) -> Tuple[List[ETradeQuote], List[str]]:
+        """(fresh cached quotes, symbols still to fetch)"""
+        if ETRADE_QUOTE_CACHE_SECONDS <= 0:
+            return [], list(symbols)
+        now = time.monotonic()
+        hits, missing = [], []
+        with self.cache_lock:
+            for symbol in symbols:
+                entry = self.quote_cache.get(symbol)
+                if entry and now - entry[0] < ETRADE_QUOTE_CACHE_SECONDS:
+                    hits.append(entry[1])
+                else:
+                    missing.append(symbol)
+            self.stats['quote_hits'] += len(hits)
+        return hits, missing
+    
+    def store_quotes(self, quotes: List[ETradeQuote]):
+        if ETRADE_QUOTE_CACHE_SECONDS <= 0:
+            return
+        now = time.monotonic()
+        with self.cache_lock:
+            for quote in quotes:
+                self.quote_cache[quote.symbol] = (now, quote)
+    
+    def invalidate_account_caches(self):
+        """Drop cached balances (after an order is placed or cancelled)"""
+        with self.cache_lock:
+            self.balance_cache.clear()
+
+class _Shared:
+    """PrimeETradeTrading attribute stored on its ETradeSharedState"""
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __get__(self, obj, owner=None):
+        return self if obj is None else getattr(obj._shared, self.name)
+    
+    def __set__(self, obj, value):
+        setattr(obj._shared, self.name, value)
+
 class PrimeETradeTrading:
     """
     Prime ETrade Trading System
     
     Comprehensive ETrade API integration for the trading strategy.
     Handles authentication, account management, portfolio tracking, and trading operations.
+    
+    Rev 00251: Instances are lightweight handles over an ETradeSharedState. Use
+    get_etrade_client_hub().handle(environment) so all components share one token store,
+    account cache and connection pool; each handle keeps its own selected account.
     """
     
-    def __init__(self, environment: str = 'prod'):
+    # Shared across handles of the same environment (Rev 00251)
+    config = _Shared('config')
+    tokens = _Shared('tokens')
+    accounts = _Shared('accounts')
+    _http_session = _Shared('http_session')
+    _http_lock = _Shared('http_lock')
+    _oauth_signer = _Shared('oauth_signer')
+    _oauth_signer_key = _Shared('oauth_signer_key')
+    _latency_lock = _Shared('latency_lock')
+    _endpoint_latency = _Shared('endpoint_latency')
+    _history_cache = _Shared('history_cache')
+    _history_lock = _Shared('history_lock')
+    
+    def __init__(self, environment: str = 'prod', shared: Optional[ETradeSharedState] = None):
         self.environment = environment
-        self.config = None
-        self.tokens = None
-        self.accounts: List[ETradeAccount] = []
+        self._shared = shared if shared is not None else ETradeSharedState(environment)
         self.selected_account: Optional[ETradeAccount] = None
         self.balance: Optional[ETradeBalance] = None
         self.portfolio: List[ETradePosition] = []
@@ -112,9 +258,20 @@ class PrimeETradeTrading:
         if not ETradeOAuth_AVAILABLE:
             raise Exception("ETradeOAuth not available. Please set up ETradeOAuth system first.")
         
-        self._load_credentials()
-        self._load_tokens()
-        self._load_accounts()
+        # Credentials, tokens and accounts are loaded once per shared state
+        with self._shared.load_lock:
+            if not self._shared.loaded:
+                self._load_credentials()
+                self._load_tokens()
+                self._load_accounts()
+                self._shared.loaded = True
+    
+    def derive_handle(self) -> 'PrimeETradeTrading':
+        """New handle on the same shared state (own account selection, no API calls)"""
+        handle = PrimeETradeTrading(self.environment, shared=self._shared)
+        handle.selected_account = self.selected_account
+        self._shared.stats['handles'] += 1
+        return handle
     
     def initialize(self) -> bool:
         """
@@ -131,10 +288,12 @@ class PrimeETradeTrading:
                 log.error("❌ OAuth token validation failed")
                 return False
             
-            # Test API connection
-            if not self._test_api_connection():
-                log.error("❌ API connection test failed")
-                return False
+            # Test API connection (Rev 00251: once per shared state within the test TTL)
+            if not self._shared.connection_recently_verified():
+                if not self._test_api_connection():
+                    log.error("❌ API connection test failed")
+                    return False
+                self._shared.connection_verified_at = time.monotonic()
             
             # Load account data
             if not self.accounts:
@@ -317,6 +476,7 @@ class PrimeETradeTrading:
         """
         try:
             log.info("🔍 Testing API connection...")
+            self._shared.stats['connection_tests'] += 1
             
             # Test with account list call
             response = self._make_etrade_api_call(
@@ -399,15 +559,8 @@ class PrimeETradeTrading:
                 log.error(f"Missing OAuth parameters: consumer_key={bool(consumer_key)}, consumer_secret={bool(consumer_secret)}, oauth_token={bool(oauth_token)}, oauth_token_secret={bool(oauth_token_secret)}")
                 return {"error": "Missing OAuth parameters"}
             
-            # Set up OAuth 1.0a with HMAC-SHA1
-            oauth = OAuth1(
-                client_key=consumer_key,
-                client_secret=consumer_secret,
-                resource_owner_key=oauth_token,
-                resource_owner_secret=oauth_token_secret,
-                signature_method="HMAC-SHA1",
-                signature_type="AUTH_HEADER",  # OAuth params in Authorization header
-            )
+            # OAuth 1.0a HMAC-SHA1 signer (cached per token pair - Rev 00233)
+            oauth = self._get_oauth_signer(consumer_key, consumer_secret, oauth_token, oauth_token_secret)
             
             # Make the request
             if url.startswith('/'):
@@ -418,14 +571,19 @@ class PrimeETradeTrading:
             # Add Accept header for JSON responses
             headers = {"Accept": "application/json"}
             
-            response = requests.request(
-                method=method,
-                url=full_url,
-                params=params or {},
-                headers=headers,
-                auth=oauth,
-                timeout=30
-            )
+            # Rev 00233: Reuse pooled keep-alive connections instead of a new TLS handshake per call
+            request_start = time.perf_counter()
+            try:
+                response = self._get_http_session().request(
+                    method=method,
+                    url=full_url,
+                    params=params or {},
+                    headers=headers,
+                    auth=oauth,
+                    timeout=ETRADE_HTTP_TIMEOUT
+                )
+            finally:
+                self._record_api_latency(method, full_url, (time.perf_counter() - request_start) * 1000)
             
             # Handle response
             if response.status_code == 200:
@@ -443,6 +601,125 @@ class PrimeETradeTrading:
             log.error(f"OAuth API call failed: {e}")
             return {"error": str(e)}
     
+    def _get_http_session(self):
+        """Get the shared keep-alive session (created lazily, thread-safe)"""
+        session = self._http_session
+        if session is not None:
+            return session
+        with self._http_lock:
+            if self._http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=ETRADE_HTTP_POOL_SIZE,
+                    pool_maxsize=ETRADE_HTTP_POOL_SIZE,
+                    max_retries=0  # Retries are handled by callers (order retry logic)
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._http_session = session
+                log.debug(f"E*TRADE HTTP session created (pool size {ETRADE_HTTP_POOL_SIZE})")
+            return self._http_session
+    
+    def _get_oauth_signer(self, consumer_key: str, consumer_secret: str,
+                          oauth_token: str, oauth_token_secret: str):
+        """
+        Get the OAuth1 signer for the current token pair
+        
+        The signer is rebuilt only when credentials or tokens change (e.g. after a
+        Secret Manager token refresh), so every request does not re-create it.
+        """
+        signer_key = (consumer_key, consumer_secret, oauth_token, oauth_token_secret)
+        with self._http_lock:
+            if self._oauth_signer is None or self._oauth_signer_key != signer_key:
+                self._oauth_signer = OAuth1(
+                    client_key=consumer_key,
+                    client_secret=consumer_secret,
+                    resource_owner_key=oauth_token,
+                    resource_owner_secret=oauth_token_secret,
+                    signature_method="HMAC-SHA1",
+                    signature_type="AUTH_HEADER",  # OAuth params in Authorization header
+                )
+                self._oauth_signer_key = signer_key
+            return self._oauth_signer
+    
+    @staticmethod
+    def _endpoint_name(method: str, url: str) -> str:
+        """Normalize a request URL to an endpoint label (account keys and symbols stripped)"""
+        path = url.split('://', 1)[-1]
+        path = path[path.find('/'):] if '/' in path else '/'
+        path = path.split('?', 1)[0]
+        if path.endswith('.json'):
+            path = path[:-5]
+        parts = [p for p in path.split('/') if p]
+        normalized = []
+        for i, part in enumerate(parts):
+            prev = parts[i - 1] if i > 0 else ''
+            if prev == 'accounts' and part != 'list':
+                normalized.append('{accountIdKey}')
+            elif prev == 'quote':
+                continue  # Symbol list
+            elif prev == 'orders' and part not in ('preview', 'place', 'cancel'):
+                normalized.append('{orderId}')
+            else:
+                normalized.append(part)
+        return f"{method.upper()} /{'/'.join(normalized)}"
+    
+    def _record_api_latency(self, method: str, url: str, latency_ms: float):
+        """Record one request in the per-endpoint latency histogram"""
+        try:
+            endpoint = self._endpoint_name(method, url)
+            with self._latency_lock:
+                stats = self._endpoint_latency.get(endpoint)
+                if stats is None:
+                    stats = {
+                        'count': 0,
+                        'total_ms': 0.0,
+                        'max_ms': 0.0,
+                        'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1)
+                    }
+                    self._endpoint_latency[endpoint] = stats
+                stats['count'] += 1
+                stats['total_ms'] += latency_ms
+                stats['max_ms'] = max(stats['max_ms'], latency_ms)
+                bucket = len(LATENCY_BUCKETS_MS)
+                for idx, upper in enumerate(LATENCY_BUCKETS_MS):
+                    if latency_ms <= upper:
+                        bucket = idx
+                        break
+                stats['buckets'][bucket] += 1
+        except Exception as e:
+            log.debug(f"Could not record API latency: {e}")
+    
+    def get_api_latency_stats(self) -> Dict[str, Any]:
+        """
+        Per-endpoint latency histograms for E*TRADE API calls
+        
+        Returns:
+            Dict mapping endpoint label -> {count, avg_ms, max_ms, buckets}
+            where buckets maps an upper bound in ms ('+Inf' for overflow) to a count
+        """
+        labels = [str(b) for b in LATENCY_BUCKETS_MS] + ['+Inf']
+        with self._latency_lock:
+            return {
+                endpoint: {
+                    'count': stats['count'],
+                    'avg_ms': round(stats['total_ms'] / stats['count'], 2) if stats['count'] else 0.0,
+                    'max_ms': round(stats['max_ms'], 2),
+                    'buckets': dict(zip(labels, stats['buckets']))
+                }
+                for endpoint, stats in self._endpoint_latency.items()
+            }
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        with self._http_lock:
+            if self._http_session is not None:
+                try:
+                    self._http_session.close()
+                except Exception as e:
+                    log.debug(f"Error closing E*TRADE HTTP session: {e}")
+                self._http_session = None
+    
     def _make_legacy_oauth_call(self, method: str, url: str, params: Dict = None):
         """Fallback OAuth implementation using original method"""
         original_cwd = os.getcwd()
@@ -486,6 +763,7 @@ class PrimeETradeTrading:
             
             if not self.config:
                 raise Exception(f"Failed to load config for {self.environment}")
+            self._shared.stats['credential_loads'] += 1
             
             # Validate that we have the required credentials
             if not self.config.get('consumer_key') or not self.config.get('consumer_secret'):
@@ -507,6 +785,10 @@ class PrimeETradeTrading:
                 self._use_mock_credentials_for_local_testing()
             else:
                 raise
+        
+        if ETRADE_API_BASE_URL and self.config:
+            self.config['base_url'] = ETRADE_API_BASE_URL
+            log.warning(f"⚠️ E*TRADE {self.environment} base URL overridden: {ETRADE_API_BASE_URL}")
     
     def _use_mock_credentials_for_local_testing(self):
         """Use mock credentials for local testing when Secret Manager is not available"""
@@ -682,6 +964,7 @@ class PrimeETradeTrading:
             
             if not self.tokens:
                 raise Exception(f"No tokens found for {self.environment}")
+            self._shared.stats['token_loads'] += 1
             
             log.info(f"✅ Loaded ETrade tokens for {self.environment}")
             
@@ -784,6 +1067,7 @@ class PrimeETradeTrading:
         """Load and parse account list"""
         try:
             log.info("📋 Loading ETrade accounts...")
+            self._shared.stats['account_loads'] += 1
             
             response = self._make_etrade_api_call(
                 method='GET',
@@ -833,6 +1117,7 @@ class PrimeETradeTrading:
             if not isinstance(accounts_data, list):
                 accounts_data = [accounts_data]
             
+            self.accounts = []
             for account_data in accounts_data:
                 account = ETradeAccount(
                     account_id=account_data.get('accountId'),
@@ -903,6 +1188,12 @@ class PrimeETradeTrading:
         if not self.selected_account:
             raise Exception("No account selected")
         
+        # Rev 00251: Reuse a balance another component fetched moments ago
+        cached = self._shared.cached_balance(self.selected_account.account_id_key)
+        if cached is not None:
+            self.balance = cached
+            return self.balance
+        
         try:
             log.info(f"💰 Fetching balance for account {self.selected_account.account_id}...")
             
@@ -918,6 +1209,7 @@ class PrimeETradeTrading:
             
             if response and not isinstance(response, dict) or 'error' not in response:
                 self.balance = self._parse_balance_response(response)
+                self._shared.store_balance(self.selected_account.account_id_key, self.balance)
                 log.info(f"✅ Retrieved balance: Cash Available for Investment: ${self.balance.cash_available_for_investment}")
                 return self.balance
             else:
@@ -1107,6 +1399,11 @@ class PrimeETradeTrading:
             if not symbols:
                 return []
             
+            # Rev 00251: Quotes fetched by another component within ETRADE_QUOTE_CACHE_SECONDS are reused
+            cached_quotes, symbols = self._shared.cached_quotes(symbols)
+            if not symbols:
+                return cached_quotes
+            
             log.info(f"📈 Fetching quotes for {len(symbols)} symbols...")
             
             # ETrade API accepts comma-separated symbols
@@ -1130,11 +1427,12 @@ class PrimeETradeTrading:
                     log.info(f"📊 Full response (first 1000 chars): {str(response)[:1000]}")
                 else:
                     log.info(f"✅ Retrieved {len(quotes)} quotes")
+                    self._shared.store_quotes(quotes)
                     
-                return quotes
+                return cached_quotes + quotes
             else:
                 log.warning(f"⚠️ E*TRADE returned empty/None response for {len(symbols)} symbols")
-                return []
+                return cached_quotes
                 
         except Exception as e:
             log.error(f"Failed to get quotes: {e}")
@@ -1264,163 +1562,277 @@ class PrimeETradeTrading:
             # Only fetched for symbols we're actually trading, calculated, then discarded
             historical_data = self._get_historical_data_for_symbol(symbol)
             
-            # Calculate comprehensive technical indicators
-            technical_indicators = self._calculate_technical_indicators(quote, historical_data)
+            spy_quotes = self.get_quotes(['SPY'])
+            spy_quote = spy_quotes[0] if spy_quotes else None
             
-            # Build comprehensive market data
-            market_data = {
-                'symbol': symbol,
-                'current_price': quote.last_price,
-                'bid': quote.bid,
-                'ask': quote.ask,
-                'open': quote.open,
-                'high': quote.high,
-                'low': quote.low,
-                'volume': quote.volume,
-                'change': quote.change,
-                'change_pct': quote.change_pct,
-                'timestamp': datetime.utcnow().isoformat(),
-                
-                # Price arrays for technical analysis (enhanced)
-                'prices': self._build_price_array(quote, historical_data),
-                'volumes': self._build_volume_array(quote, historical_data),
-                'closes': self._build_closes_array(quote, historical_data),
-                'highs': self._build_highs_array(quote, historical_data),
-                'lows': self._build_lows_array(quote, historical_data),
-                'opens': self._build_opens_array(quote, historical_data),
-                
-                # Technical indicators (comprehensive)
-                'rsi': technical_indicators['rsi'],
-                'rsi_14': technical_indicators['rsi_14'],
-                'rsi_21': technical_indicators['rsi_21'],
-                'macd': technical_indicators['macd'],
-                'macd_signal': technical_indicators['macd_signal'],
-                'macd_histogram': technical_indicators['macd_histogram'],
-                'sma_20': technical_indicators['sma_20'],
-                'sma_50': technical_indicators['sma_50'],
-                'sma_200': technical_indicators['sma_200'],
-                'ema_12': technical_indicators['ema_12'],
-                'ema_26': technical_indicators['ema_26'],
-                'atr': technical_indicators['atr'],
-                'bollinger_upper': technical_indicators['bollinger_upper'],
-                'bollinger_middle': technical_indicators['bollinger_middle'],
-                'bollinger_lower': technical_indicators['bollinger_lower'],
-                'bollinger_width': technical_indicators['bollinger_width'],
-                
-                # Volume analysis
-                'volume_ratio': technical_indicators['volume_ratio'],
-                'volume_sma': technical_indicators['volume_sma'],
-                'obv': technical_indicators['obv'],
-                'ad_line': technical_indicators['ad_line'],
-                
-                # Pattern recognition
-                'doji': technical_indicators['doji'],
-                'hammer': technical_indicators['hammer'],
-                'engulfing': technical_indicators['engulfing'],
-                'morning_star': technical_indicators['morning_star'],
-                
-                # Market data metadata
-                'data_source': 'ETRADE',
-                'data_quality': technical_indicators['data_quality'],
-                'historical_points': len(historical_data) if historical_data else 0,
-                'last_updated': datetime.utcnow().isoformat()
-            }
+            return self._build_strategy_market_data(symbol, quote, historical_data, spy_quote)
             
-            # Rev 00181: Calculate RS vs SPY (Relative Strength) - Enhanced with better fallback logic
-            # RS vs SPY = (Symbol change % - SPY change %)
-            # This indicates how much the symbol is outperforming/underperforming the market
+        except Exception as e:
+            log.error(f"Failed to get market data for strategy: {e}", exc_info=True)
+            log.warning(f"   • Exception in get_market_data_for_strategy({symbol}): {type(e).__name__}: {e}")
+            log.warning(f"   • Returning fallback data (RSI=50.0, Volume=1.0) to prevent invalid 0.0 values")
+            fallback_data = self._get_fallback_market_data(symbol)
+            log.debug(f"   ✅ Fallback data for {symbol}: RSI={fallback_data.get('rsi')}, Volume={fallback_data.get('volume_ratio')}")
+            return fallback_data
+    
+    def get_market_data_for_strategy_batch(self, symbols: List[str], max_workers: Optional[int] = None,
+                                           quotes: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Comprehensive market data for many symbols at once (Rev 00236: SO enrichment pipeline)
+        
+        1. One batched E*TRADE quote request (25 per call) including SPY - only for symbols
+           missing from `quotes` (ETradeQuote or data-manager quote dicts already fetched this tick)
+        2. One batched yfinance daily-history download for symbols not in the session cache
+        3. One vectorized indicator pass for all symbols, then per-symbol assembly across worker threads
+        
+        Blocking - call via asyncio.to_thread from the event loop. Each result carries
+        'enrichment_ms' (indicator build time) and 'enrichment_fetch_ms' (shared fetch time).
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        unique_symbols = list(dict.fromkeys(s for s in symbols if s))
+        if not unique_symbols:
+            return results
+        
+        started = time.perf_counter()
+        quotes_by_symbol: Dict[str, ETradeQuote] = {}
+        for symbol, quote in (quotes or {}).items():
+            if isinstance(quote, dict):
+                quote = self._quote_from_dict(symbol, quote)
+            if quote is not None:
+                quotes_by_symbol[symbol] = quote
+        quote_symbols = [s for s in unique_symbols + ['SPY'] if s not in quotes_by_symbol]
+        quote_symbols = list(dict.fromkeys(quote_symbols))
+        for i in range(0, len(quote_symbols), ETRADE_QUOTE_BATCH_SIZE):
+            for quote in self.get_quotes(quote_symbols[i:i + ETRADE_QUOTE_BATCH_SIZE]):
+                quotes_by_symbol[quote.symbol] = quote
+        
+        self.prefetch_historical_data(unique_symbols)
+        
+        spy_quote = quotes_by_symbol.get('SPY')
+        spy_change_pct = self._resolve_spy_change_pct(spy_quote)[0] if spy_quote else None
+        fetch_ms = (time.perf_counter() - started) * 1000
+        
+        # Rev 00237: One vectorized indicator pass over every symbol with a quote
+        history_by_symbol = {s: self._get_historical_data_for_symbol(s) for s in unique_symbols if s in quotes_by_symbol}
+        precomputed: Dict[str, Dict[str, float]] = {}
+        if INDICATOR_ENGINE_AVAILABLE and history_by_symbol:
+            indicators_started = time.perf_counter()
             try:
-                spy_quotes = self.get_quotes(['SPY'])
-                if spy_quotes and len(spy_quotes) > 0:
-                    spy_quote = spy_quotes[0]
-                    
-                    # Rev 00181: Better detection of missing change_pct (None, 0.0, or missing attribute)
-                    spy_change_pct = getattr(spy_quote, 'change_pct', None)
-                    if spy_change_pct is None:
-                        spy_change_pct = 0.0
-                    
-                    symbol_change_pct = getattr(quote, 'change_pct', None)
-                    if symbol_change_pct is None:
-                        symbol_change_pct = 0.0
-                    
-                    # Rev 00181: Enhanced fallback - check if change_pct is actually 0.0 or missing
-                    # Use open price vs previous close if available (more accurate for early morning)
-                    symbol_change_calculated = False
-                    if (symbol_change_pct == 0.0 or symbol_change_pct is None) and quote.open and quote.last_price:
-                        # Try using open price vs previous close from historical data
-                        if historical_data and len(historical_data) >= 2:
-                            try:
-                                prev_close = historical_data[-2].get('close', None) if isinstance(historical_data[-2], dict) else (getattr(historical_data[-2], 'close', None) if hasattr(historical_data[-2], 'close') else None)
-                                if prev_close and prev_close > 0:
-                                    # Use open price if available (more accurate for intraday)
-                                    base_price = quote.open if quote.open > 0 else quote.last_price
-                                    symbol_change_pct = ((base_price - prev_close) / prev_close) * 100
-                                    symbol_change_calculated = True
-                                    log.debug(f"📊 Calculated symbol change % from open vs prev close for {symbol}: {symbol_change_pct:.2f}%")
-                            except Exception as hist_error:
-                                log.debug(f"⚠️ Could not calculate symbol change % from historical data for {symbol}: {hist_error}")
-                        
-                        # Fallback: use current price vs previous close if open not available
-                        if not symbol_change_calculated and historical_data and len(historical_data) >= 2:
-                            try:
-                                prev_close = historical_data[-2].get('close', None) if isinstance(historical_data[-2], dict) else (getattr(historical_data[-2], 'close', None) if hasattr(historical_data[-2], 'close') else None)
-                                if prev_close and prev_close > 0 and quote.last_price:
-                                    symbol_change_pct = ((quote.last_price - prev_close) / prev_close) * 100
-                                    symbol_change_calculated = True
-                                    log.debug(f"📊 Calculated symbol change % from current vs prev close for {symbol}: {symbol_change_pct:.2f}%")
-                            except Exception as hist_error:
-                                log.debug(f"⚠️ Could not calculate symbol change % from current price for {symbol}: {hist_error}")
-                    
-                    # Rev 00181: Enhanced SPY fallback - use yfinance if change_pct is 0.0 or missing
-                    spy_change_calculated = False
-                    if (spy_change_pct == 0.0 or spy_change_pct is None) and spy_quote.open and spy_quote.last_price:
-                        # Try using SPY open price vs previous close
+                precomputed = compute_indicators({
+                    s: (self._build_closes_array(quotes_by_symbol[s], hist), self._build_highs_array(quotes_by_symbol[s], hist),
+                        self._build_lows_array(quotes_by_symbol[s], hist), self._build_volume_array(quotes_by_symbol[s], hist))
+                    for s, hist in history_by_symbol.items()
+                })
+            except Exception as e:
+                log.warning(f"⚠️ Vectorized indicator pass failed, computing per symbol: {e}")
+            log.debug(f"Vectorized indicators for {len(precomputed)} symbols in {(time.perf_counter() - indicators_started) * 1000:.1f}ms")
+        
+        def build(symbol: str) -> Tuple[str, Dict[str, Any]]:
+            symbol_started = time.perf_counter()
+            quote = quotes_by_symbol.get(symbol)
+            try:
+                if quote:
+                    data = self._build_strategy_market_data(
+                        symbol, quote, history_by_symbol.get(symbol, []), spy_quote, spy_change_pct, precomputed.get(symbol)
+                    )
+                else:
+                    log.warning(f"No quote data available for {symbol}")
+                    data = self._get_fallback_market_data(symbol)
+            except Exception as e:
+                log.error(f"Failed to build market data for {symbol}: {e}", exc_info=True)
+                data = self._get_fallback_market_data(symbol)
+            data['enrichment_ms'] = round((time.perf_counter() - symbol_started) * 1000, 2)
+            data['enrichment_fetch_ms'] = round(fetch_ms, 2)
+            return symbol, data
+        
+        from concurrent.futures import ThreadPoolExecutor
+        workers = max(1, min(max_workers or ENRICHMENT_MAX_WORKERS, len(unique_symbols)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as executor:
+            for symbol, data in executor.map(build, unique_symbols):
+                results[symbol] = data
+        
+        total_ms = (time.perf_counter() - started) * 1000
+        log.info(f"⚡ Batch market data for {len(results)} symbols in {total_ms:.0f}ms "
+                 f"(fetch {fetch_ms:.0f}ms, {workers} indicator workers)")
+        return results
+    
+    @staticmethod
+    def _quote_from_dict(symbol: str, quote: Dict[str, Any]) -> Optional[ETradeQuote]:
+        """ETradeQuote from a data-manager quote dict ('last'/'bid'/'ask'/... keys), None without a price"""
+        last_price = quote.get('last', quote.get('price'))
+        if not last_price:
+            return None
+        return ETradeQuote(
+            symbol=symbol,
+            last_price=float(last_price),
+            change=float(quote.get('change') or 0.0),
+            change_pct=float(quote.get('change_pct') or 0.0),
+            volume=int(quote.get('volume') or 0),
+            bid=float(quote.get('bid') or 0.0),
+            ask=float(quote.get('ask') or 0.0),
+            high=float(quote.get('high') or last_price),
+            low=float(quote.get('low') or last_price),
+            open=float(quote.get('open') or last_price),
+        )
+    
+    def _resolve_spy_change_pct(self, spy_quote: ETradeQuote) -> Tuple[float, bool]:
+        """SPY change %, with the Rev 00181 yfinance open-vs-prev-close fallback; returns (pct, used_fallback)"""
+        # Rev 00181: Better detection of missing change_pct (None, 0.0, or missing attribute)
+        spy_change_pct = getattr(spy_quote, 'change_pct', None)
+        if spy_change_pct is None:
+            spy_change_pct = 0.0
+        
+        # Rev 00181: Enhanced SPY fallback - use yfinance if change_pct is 0.0 or missing
+        if spy_change_pct == 0.0 and spy_quote.open and spy_quote.last_price:
+            # Try using SPY open price vs previous close
+            try:
+                import yfinance as yf
+                spy_ticker = yf.Ticker("SPY")
+                spy_hist = spy_ticker.history(period="2d", interval="1d")
+                if not spy_hist.empty and len(spy_hist) >= 2:
+                    spy_prev_close = spy_hist['Close'].iloc[-2]
+                    # Use open price if available (more accurate for intraday)
+                    spy_base_price = spy_quote.open if spy_quote.open > 0 else spy_quote.last_price
+                    if spy_prev_close > 0:
+                        log.debug(f"📊 Calculated SPY change % from open vs prev close")
+                        return ((spy_base_price - spy_prev_close) / spy_prev_close) * 100, True
+            except Exception as spy_hist_error:
+                log.debug(f"⚠️ Could not calculate SPY change % from historical data: {spy_hist_error}")
+        
+        return spy_change_pct, False
+    
+    def _build_strategy_market_data(self, symbol: str, quote: ETradeQuote, historical_data: List[Dict[str, Any]],
+                                    spy_quote: Optional[ETradeQuote] = None,
+                                    spy_change_pct: Optional[float] = None,
+                                    precomputed: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Build the strategy market data dict from a quote and daily history (no network unless SPY fallback needed)"""
+        # Calculate comprehensive technical indicators
+        technical_indicators = self._calculate_technical_indicators(quote, historical_data, precomputed)
+        
+        # Build comprehensive market data
+        market_data = {
+            'symbol': symbol,
+            'current_price': quote.last_price,
+            'bid': quote.bid,
+            'ask': quote.ask,
+            'open': quote.open,
+            'high': quote.high,
+            'low': quote.low,
+            'volume': quote.volume,
+            'change': quote.change,
+            'change_pct': quote.change_pct,
+            'timestamp': datetime.utcnow().isoformat(),
+            
+            # Price arrays for technical analysis (enhanced)
+            'prices': self._build_price_array(quote, historical_data),
+            'volumes': self._build_volume_array(quote, historical_data),
+            'closes': self._build_closes_array(quote, historical_data),
+            'highs': self._build_highs_array(quote, historical_data),
+            'lows': self._build_lows_array(quote, historical_data),
+            'opens': self._build_opens_array(quote, historical_data),
+            
+            # Technical indicators (comprehensive)
+            'rsi': technical_indicators['rsi'],
+            'rsi_14': technical_indicators['rsi_14'],
+            'rsi_21': technical_indicators['rsi_21'],
+            'macd': technical_indicators['macd'],
+            'macd_signal': technical_indicators['macd_signal'],
+            'macd_histogram': technical_indicators['macd_histogram'],
+            'sma_20': technical_indicators['sma_20'],
+            'sma_50': technical_indicators['sma_50'],
+            'sma_200': technical_indicators['sma_200'],
+            'ema_12': technical_indicators['ema_12'],
+            'ema_26': technical_indicators['ema_26'],
+            'atr': technical_indicators['atr'],
+            'bollinger_upper': technical_indicators['bollinger_upper'],
+            'bollinger_middle': technical_indicators['bollinger_middle'],
+            'bollinger_lower': technical_indicators['bollinger_lower'],
+            'bollinger_width': technical_indicators['bollinger_width'],
+            
+            # Volume analysis
+            'volume_ratio': technical_indicators['volume_ratio'],
+            'volume_sma': technical_indicators['volume_sma'],
+            'obv': technical_indicators['obv'],
+            'ad_line': technical_indicators['ad_line'],
+            
+            # Pattern recognition
+            'doji': technical_indicators['doji'],
+            'hammer': technical_indicators['hammer'],
+            'engulfing': technical_indicators['engulfing'],
+            'morning_star': technical_indicators['morning_star'],
+            
+            # Market data metadata
+            'data_source': 'ETRADE',
+            'data_quality': technical_indicators['data_quality'],
+            'historical_points': len(historical_data) if historical_data else 0,
+            'last_updated': datetime.utcnow().isoformat()
+        }
+        
+        # Rev 00181: Calculate RS vs SPY (Relative Strength) - Enhanced with better fallback logic
+        # RS vs SPY = (Symbol change % - SPY change %)
+        # This indicates how much the symbol is outperforming/underperforming the market
+        try:
+            if spy_quote:
+                symbol_change_pct = getattr(quote, 'change_pct', None)
+                if symbol_change_pct is None:
+                    symbol_change_pct = 0.0
+                
+                # Rev 00181: Enhanced fallback - check if change_pct is actually 0.0 or missing
+                # Use open price vs previous close if available (more accurate for early morning)
+                symbol_change_calculated = False
+                if (symbol_change_pct == 0.0 or symbol_change_pct is None) and quote.open and quote.last_price:
+                    # Try using open price vs previous close from historical data
+                    if historical_data and len(historical_data) >= 2:
                         try:
-                            import yfinance as yf
-                            spy_ticker = yf.Ticker("SPY")
-                            spy_hist = spy_ticker.history(period="2d", interval="1d")
-                            if not spy_hist.empty and len(spy_hist) >= 2:
-                                spy_prev_close = spy_hist['Close'].iloc[-2]
+                            prev_close = historical_data[-2].get('close', None) if isinstance(historical_data[-2], dict) else (getattr(historical_data[-2], 'close', None) if hasattr(historical_data[-2], 'close') else None)
+                            if prev_close and prev_close > 0:
                                 # Use open price if available (more accurate for intraday)
-                                spy_base_price = spy_quote.open if spy_quote.open > 0 else spy_quote.last_price
-                                if spy_prev_close > 0:
-                                    spy_change_pct = ((spy_base_price - spy_prev_close) / spy_prev_close) * 100
-                                    spy_change_calculated = True
-                                    log.debug(f"📊 Calculated SPY change % from open vs prev close: {spy_change_pct:.2f}%")
-                        except Exception as spy_hist_error:
-                            log.debug(f"⚠️ Could not calculate SPY change % from historical data: {spy_hist_error}")
-                    
-                    rs_vs_spy = symbol_change_pct - spy_change_pct
+                                base_price = quote.open if quote.open > 0 else quote.last_price
+                                symbol_change_pct = ((base_price - prev_close) / prev_close) * 100
+                                symbol_change_calculated = True
+                                log.debug(f"📊 Calculated symbol change % from open vs prev close for {symbol}: {symbol_change_pct:.2f}%")
+                        except Exception as hist_error:
+                            log.debug(f"⚠️ Could not calculate symbol change % from historical data for {symbol}: {hist_error}")
                     
-                    market_data['rs_vs_spy'] = rs_vs_spy
-                    market_data['spy_price'] = spy_quote.last_price
-                    market_data['spy_change_pct'] = spy_change_pct
-                    
-                    if symbol_change_calculated or spy_change_calculated:
-                        log.info(f"✅ Calculated RS vs SPY for {symbol} (using fallback): {rs_vs_spy:.2f}% (symbol: {symbol_change_pct:.2f}%, SPY: {spy_change_pct:.2f}%)")
-                    else:
-                        log.debug(f"✅ Calculated RS vs SPY for {symbol}: {rs_vs_spy:.2f}% (symbol: {symbol_change_pct:.2f}%, SPY: {spy_change_pct:.2f}%)")
+                    # Fallback: use current price vs previous close if open not available
+                    if not symbol_change_calculated and historical_data and len(historical_data) >= 2:
+                        try:
+                            prev_close = historical_data[-2].get('close', None) if isinstance(historical_data[-2], dict) else (getattr(historical_data[-2], 'close', None) if hasattr(historical_data[-2], 'close') else None)
+                            if prev_close and prev_close > 0 and quote.last_price:
+                                symbol_change_pct = ((quote.last_price - prev_close) / prev_close) * 100
+                                symbol_change_calculated = True
+                                log.debug(f"📊 Calculated symbol change % from current vs prev close for {symbol}: {symbol_change_pct:.2f}%")
+                        except Exception as hist_error:
+                            log.debug(f"⚠️ Could not calculate symbol change % from current price for {symbol}: {hist_error}")
+                
+                # Rev 00236: Batch callers resolve SPY change % once and pass it in
+                spy_change_calculated = False
+                if spy_change_pct is None:
+                    spy_change_pct, spy_change_calculated = self._resolve_spy_change_pct(spy_quote)
+                
+                rs_vs_spy = symbol_change_pct - spy_change_pct
+                
+                market_data['rs_vs_spy'] = rs_vs_spy
+                market_data['spy_price'] = spy_quote.last_price
+                market_data['spy_change_pct'] = spy_change_pct
+                
+                if symbol_change_calculated or spy_change_calculated:
+                    log.info(f"✅ Calculated RS vs SPY for {symbol} (using fallback): {rs_vs_spy:.2f}% (symbol: {symbol_change_pct:.2f}%, SPY: {spy_change_pct:.2f}%)")
                 else:
-                    log.warning(f"⚠️ Could not fetch SPY quote for RS vs SPY calculation for {symbol}")
-                    market_data['rs_vs_spy'] = 0.0
-                    market_data['spy_price'] = None
-                    market_data['spy_change_pct'] = 0.0
-            except Exception as rs_error:
-                log.warning(f"⚠️ Error calculating RS vs SPY for {symbol}: {rs_error}", exc_info=True)
+                    log.debug(f"✅ Calculated RS vs SPY for {symbol}: {rs_vs_spy:.2f}% (symbol: {symbol_change_pct:.2f}%, SPY: {spy_change_pct:.2f}%)")
+            else:
+                log.warning(f"⚠️ Could not fetch SPY quote for RS vs SPY calculation for {symbol}")
                 market_data['rs_vs_spy'] = 0.0
                 market_data['spy_price'] = None
                 market_data['spy_change_pct'] = 0.0
-            
-            log.debug(f"📊 Generated comprehensive market data for {symbol}: {technical_indicators['data_quality']} quality")
-            return market_data
-            
-        except Exception as e:
-            log.error(f"Failed to get market data for strategy: {e}", exc_info=True)
-            log.warning(f"   • Exception in get_market_data_for_strategy({symbol}): {type(e).__name__}: {e}")
-            log.warning(f"   • Returning fallback data (RSI=50.0, Volume=1.0) to prevent invalid 0.0 values")
-            fallback_data = self._get_fallback_market_data(symbol)
-            log.debug(f"   ✅ Fallback data for {symbol}: RSI={fallback_data.get('rsi')}, Volume={fallback_data.get('volume_ratio')}")
-            return fallback_data
+        except Exception as rs_error:
+            log.warning(f"⚠️ Error calculating RS vs SPY for {symbol}: {rs_error}", exc_info=True)
+            market_data['rs_vs_spy'] = 0.0
+            market_data['spy_price'] = None
+            market_data['spy_change_pct'] = 0.0
+        
+        log.debug(f"📊 Generated comprehensive market data for {symbol}: {technical_indicators['data_quality']} quality")
+        return market_data
     
     def _calculate_basic_rsi(self, quote: ETradeQuote) -> float:
         """Calculate basic RSI from available data"""
@@ -1462,12 +1874,18 @@ class PrimeETradeTrading:
         Max needed: 200 days (for SMA_200 technical indicator)
         """
         try:
+            # Rev 00236: Session cache first (filled by prefetch_historical_data or a previous call)
+            cached = self._get_cached_history(symbol)
+            if cached is not None:
+                return cached
+            
             # Fetch historical data on-demand from yfinance (lightweight, no storage)
             # Only called when we need technical indicators for a symbol we're actually trading
             historical_data = self._fetch_historical_data_on_demand(symbol, days=200)
             
             if historical_data and len(historical_data) > 0:
-                log.debug(f"✅ Fetched {len(historical_data)} days of historical data for {symbol} (on-demand, not stored)")
+                log.debug(f"✅ Fetched {len(historical_data)} days of historical data for {symbol} (on-demand)")
+                self._store_cached_history(symbol, historical_data)
                 return historical_data
             else:
                 log.debug(f"No historical data available for {symbol} - using E*TRADE quote for basic calculations")
@@ -1477,12 +1895,122 @@ class PrimeETradeTrading:
             log.debug(f"No historical data available for {symbol}: {e}")
             return []
     
+    def _get_cached_history(self, symbol: str) -> Optional[List[Dict[str, Any]]]:
+        """Session-cached daily history for symbol, or None if missing/expired (Rev 00236)"""
+        with self._history_lock:
+            entry = self._history_cache.get(symbol)
+            if not entry:
+                return None
+            fetched_at, fetched_date, bars = entry
+            if fetched_date != datetime.now().strftime("%Y-%m-%d") or time.time() - fetched_at > ENRICHMENT_HISTORY_CACHE_TTL:
+                del self._history_cache[symbol]
+                return None
+            return bars
+    
+    def _store_cached_history(self, symbol: str, bars: List[Dict[str, Any]]):
+        with self._history_lock:
+            self._history_cache[symbol] = (time.time(), datetime.now().strftime("%Y-%m-%d"), bars)
+    
+    def prefetch_historical_data(self, symbols: List[str], days: int = 200) -> int:
+        """
+        Batch-download daily history for symbols not already in the session cache (Rev 00236)
+        
+        One yfinance request for all symbols instead of one Ticker().history() per symbol.
+        Returns the number of symbols newly cached.
+        """
+        missing = [s for s in dict.fromkeys(symbols) if self._get_cached_history(s) is None]
+        if not missing:
+            return 0
+        
+        # Rev 00253: Served from the OHLCV store (only sessions missing on disk are downloaded)
+        from_store = 0
+        history = self._load_history_from_store(missing, days)
+        if history is not None:
+            for symbol, bars in history.items():
+                self._store_cached_history(symbol, bars)
+            from_store = len(history)
+            log.info(f"📥 Loaded daily history for {from_store}/{len(missing)} symbols from OHLCV store (session cache: {len(self._history_cache)})")
+            # Symbols the store has no rows for (e.g. a throttled download) fall back to yfinance directly
+            missing = [s for s in missing if s not in history]
+            if not missing or get_ohlcv_store().offline:
+                return from_store
+        
+        try:
+            import yfinance as yf
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days + 30)  # Extra days for weekends/holidays
+            
+            data = yf.download(
+                tickers=' '.join(missing),
+                start=start_date,
+                end=end_date,
+                interval="1d",
+                auto_adjust=True,
+                group_by='ticker',
+                threads=True,
+                progress=False
+            )
+        except ImportError:
+            log.warning(f"yfinance not available - skipping history prefetch for {len(missing)} symbols")
+            return from_store
+        except Exception as e:
+            log.warning(f"⚠️ Batch history download failed for {len(missing)} symbols: {e}")
+            return from_store
+        
+        cached = 0
+        for symbol in missing:
+            try:
+                if len(missing) == 1:
+                    symbol_df = data
+                elif hasattr(data.columns, 'levels') and symbol in data.columns.levels[0]:
+                    symbol_df = data[symbol]
+                else:
+                    continue
+                
+                symbol_df = symbol_df.dropna(subset=['Close'])
+                if symbol_df.empty:
+                    continue
+                
+                formatted_data = [{
+                    'date': idx.strftime("%Y-%m-%d"),
+                    'open': float(row['Open']),
+                    'high': float(row['High']),
+                    'low': float(row['Low']),
+                    'close': float(row['Close']),
+                    'volume': int(row['Volume'])
+                } for idx, row in symbol_df.iterrows()]
+                
+                self._store_cached_history(symbol, formatted_data[-days:])
+                cached += 1
+            except Exception as e:
+                log.debug(f"Could not parse batch history for {symbol}: {e}")
+        
+        log.info(f"📥 Prefetched daily history for {cached}/{len(missing)} symbols (session cache: {len(self._history_cache)})")
+        return from_store + cached
+    
+    def _load_history_from_store(self, symbols: List[str], days: int) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Completed daily sessions from the OHLCV store ({symbol: bars} for symbols with data), or None if unavailable (Rev 00253)"""
+        if not OHLCV_STORE_ENABLED:
+            return None
+        try:
+            series = get_ohlcv_store().history(symbols, days)
+        except Exception as e:
+            log.warning(f"⚠️ OHLCV store unavailable, downloading history directly: {e}")
+            return None
+        return {symbol: series[symbol.upper()].to_bars() for symbol in symbols if len(series.get(symbol.upper(), ()))}
+    
     def _fetch_historical_data_on_demand(self, symbol: str, days: int = 200) -> List[Dict[str, Any]]:
         """
         Fetch historical data on-demand from yfinance (lightweight, no storage)
         Only called when we need technical indicators for symbols we're actually trading
         Data is calculated, used, then discarded - no persistent storage
         """
+        # Rev 00253: OHLCV store first (completed sessions; the live quote is appended by the callers)
+        history = self._load_history_from_store([symbol], days)
+        if history is not None and (history.get(symbol) or get_ohlcv_store().offline):
+            return history.get(symbol, [])
+        # No rows in the store (e.g. its download was throttled): fetch directly
+        
         try:
             import yfinance as yf
             # Use module-level datetime import (line 21)
@@ -1519,8 +2047,15 @@ class PrimeETradeTrading:
             return []
     
     
-    def _calculate_technical_indicators(self, quote: ETradeQuote, historical_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate comprehensive technical indicators"""
+    def _calculate_technical_indicators(self, quote: ETradeQuote, historical_data: List[Dict[str, Any]],
+                                        precomputed: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Calculate comprehensive technical indicators
+        
+        Rev 00237: Raw indicator values come from the vectorized indicator engine (bit-identical to the
+        list-based calculators, which remain as the fallback). Batch callers pass `precomputed` values
+        from one compute_indicators() call over all symbols.
+        """
         try:
             # Build price arrays from available data
             closes = self._build_closes_array(quote, historical_data)
@@ -1531,43 +2066,50 @@ class PrimeETradeTrading:
             # Determine data quality
             data_quality = 'excellent' if len(historical_data) >= 200 else 'good' if len(historical_data) >= 50 else 'limited' if len(historical_data) >= 20 else 'minimal'
             
+            raw = precomputed
+            if raw is None and INDICATOR_ENGINE_AVAILABLE:
+                raw = compute_indicators({quote.symbol: (closes, highs, lows, volumes)})[quote.symbol]
+            if raw is None:
+                raw = self._calculate_raw_indicators(closes, highs, lows, volumes)
+            
             # Calculate indicators based on available data
             indicators = {
                 # RSI calculations
-                'rsi': self._calculate_rsi(closes, 14) if len(closes) >= 15 else self._calculate_basic_rsi(quote),
-                'rsi_14': self._calculate_rsi(closes, 14) if len(closes) >= 15 else self._calculate_basic_rsi(quote),
-                'rsi_21': self._calculate_rsi(closes, 21) if len(closes) >= 22 else self._calculate_basic_rsi(quote),
+                'rsi': raw['rsi_14'] if len(closes) >= 15 else self._calculate_basic_rsi(quote),
+                'rsi_14': raw['rsi_14'] if len(closes) >= 15 else self._calculate_basic_rsi(quote),
+                'rsi_21': raw['rsi_21'] if len(closes) >= 22 else self._calculate_basic_rsi(quote),
                 
                 # MACD calculations
-                'macd': self._calculate_macd(closes) if len(closes) >= 26 else self._calculate_basic_macd(quote),
-                'macd_signal': self._calculate_macd_signal(closes) if len(closes) >= 26 else 0.0,
-                'macd_histogram': self._calculate_macd_histogram(closes) if len(closes) >= 26 else 0.0,
+                'macd': raw['macd'] if len(closes) >= 26 else self._calculate_basic_macd(quote),
+                'macd_signal': raw['macd_signal'] if len(closes) >= 26 else 0.0,
+                'macd_histogram': raw['macd_histogram'] if len(closes) >= 26 else 0.0,
                 
                 # Moving averages
-                'sma_20': self._calculate_sma(closes, 20) if len(closes) >= 20 else quote.last_price,
-                'sma_50': self._calculate_sma(closes, 50) if len(closes) >= 50 else quote.last_price,
-                'sma_200': self._calculate_sma(closes, 200) if len(closes) >= 200 else quote.last_price,
-                'ema_12': self._calculate_ema(closes, 12) if len(closes) >= 12 else quote.last_price,
-                'ema_26': self._calculate_ema(closes, 26) if len(closes) >= 26 else quote.last_price,
+                'sma_20': raw['sma_20'] if len(closes) >= 20 else quote.last_price,
+                'sma_50': raw['sma_50'] if len(closes) >= 50 else quote.last_price,
+                'sma_200': raw['sma_200'] if len(closes) >= 200 else quote.last_price,
+                'ema_12': raw['ema_12'] if len(closes) >= 12 else quote.last_price,
+                'ema_26': raw['ema_26'] if len(closes) >= 26 else quote.last_price,
                 
                 # Volatility indicators
-                'atr': self._calculate_atr(highs, lows, closes) if len(highs) >= 14 else self._calculate_basic_atr(quote),
+                'atr': raw['atr'] if len(highs) >= 14 else self._calculate_basic_atr(quote),
                 
                 # Bollinger Bands
-                'bollinger_upper': self._calculate_bollinger_upper(closes) if len(closes) >= 20 else quote.high,
-                'bollinger_middle': self._calculate_bollinger_middle(closes) if len(closes) >= 20 else quote.last_price,
-                'bollinger_lower': self._calculate_bollinger_lower(closes) if len(closes) >= 20 else quote.low,
-                'bollinger_width': self._calculate_bollinger_width(closes) if len(closes) >= 20 else 0.0,
+                'bollinger_upper': raw['bollinger_upper'] if len(closes) >= 20 else quote.high,
+                'bollinger_middle': raw['bollinger_middle'] if len(closes) >= 20 else quote.last_price,
+                'bollinger_lower': raw['bollinger_lower'] if len(closes) >= 20 else quote.low,
+                'bollinger_width': raw['bollinger_width'] if len(closes) >= 20 else 0.0,
                 
                 # Volume analysis
-                'volume_ratio': self._calculate_volume_ratio(volumes) if len(volumes) >= 20 else 1.0,
-                'volume_sma': self._calculate_sma(volumes, 20) if len(volumes) >= 20 else quote.volume,
-                'obv': self._calculate_obv(closes, volumes) if len(closes) >= 2 else 0.0,
-                'ad_line': self._calculate_ad_line(highs, lows, closes, volumes) if len(highs) >= 2 else 0.0,
+                'volume_ratio': raw['volume_ratio'] if len(volumes) >= 20 else 1.0,
+                'volume_sma': raw['volume_sma'] if len(volumes) >= 20 else quote.volume,
+                'obv': raw['obv'] if len(closes) >= 2 else 0.0,
+                'ad_line': raw['ad_line'] if len(highs) >= 2 else 0.0,
                 
                 # Pattern recognition
-                'doji': self._detect_doji(quote) if quote.open and quote.close else False,
-                'hammer': self._detect_hammer(quote) if quote.open and quote.close and quote.high and quote.low else False,
+                # ETradeQuote has no close - getattr keeps these False instead of failing the whole calculation
+                'doji': self._detect_doji(quote) if quote.open and getattr(quote, 'close', None) else False,
+                'hammer': self._detect_hammer(quote) if quote.open and getattr(quote, 'close', None) and quote.high and quote.low else False,
                 'engulfing': False,  # Would need previous candle data
                 'morning_star': False,  # Would need previous candle data
                 
@@ -1581,6 +2123,30 @@ class PrimeETradeTrading:
             log.error(f"Error calculating technical indicators: {e}")
             return self._get_basic_indicators(quote)
     
+    def _calculate_raw_indicators(self, closes: List[float], highs: List[float], lows: List[float], volumes: List[int]) -> Dict[str, float]:
+        """List-based indicator set (reference implementation; used when NumPy is unavailable)"""
+        return {
+            'rsi_14': self._calculate_rsi(closes, 14),
+            'rsi_21': self._calculate_rsi(closes, 21),
+            'macd': self._calculate_macd(closes),
+            'macd_signal': self._calculate_macd_signal(closes),
+            'macd_histogram': self._calculate_macd_histogram(closes),
+            'sma_20': self._calculate_sma(closes, 20),
+            'sma_50': self._calculate_sma(closes, 50),
+            'sma_200': self._calculate_sma(closes, 200),
+            'ema_12': self._calculate_ema(closes, 12),
+            'ema_26': self._calculate_ema(closes, 26),
+            'atr': self._calculate_atr(highs, lows, closes),
+            'bollinger_upper': self._calculate_bollinger_upper(closes),
+            'bollinger_middle': self._calculate_bollinger_middle(closes),
+            'bollinger_lower': self._calculate_bollinger_lower(closes),
+            'bollinger_width': self._calculate_bollinger_width(closes),
+            'volume_ratio': self._calculate_volume_ratio(volumes),
+            'volume_sma': self._calculate_sma(volumes, 20),
+            'obv': self._calculate_obv(closes, volumes),
+            'ad_line': self._calculate_ad_line(highs, lows, closes, volumes),
+        }
+    
     def _build_price_array(self, quote: ETradeQuote, historical_data: List[Dict[str, Any]]) -> List[float]:
         """Build price array for technical analysis"""
         try:
@@ -2272,7 +2838,8 @@ class PrimeETradeTrading:
             return []
     
     def preview_order(self, symbol: str, quantity: int, side: str, order_type: str = 'MARKET', 
-                     price: Optional[float] = None, stop_price: Optional[float] = None) -> Dict[str, Any]:
+                     price: Optional[float] = None, stop_price: Optional[float] = None,
+                     client_order_id: Optional[str] = None) -> Dict[str, Any]:
         """Preview order before placing
         
         Args:
@@ -2282,6 +2849,7 @@ class PrimeETradeTrading:
             order_type: 'MARKET', 'LIMIT', 'STOP', 'STOP_LIMIT'
             price: Limit price (for LIMIT orders)
             stop_price: Stop price (for STOP orders)
+            client_order_id: Custom order ID (must match the later place_order call)
         """
         if not self.selected_account:
             raise Exception("No account selected")
@@ -2292,7 +2860,7 @@ class PrimeETradeTrading:
             # Build order data
             order_data = {
                 'orderType': order_type,
-                'clientOrderId': f"PREVIEW_{int(time.time())}",
+                'clientOrderId': client_order_id or f"PREVIEW_{int(time.time())}",
                 'Order': [{
                     'allOrNone': False,
                     'priceType': 'MARKET' if order_type == 'MARKET' else 'LIMIT',
@@ -2326,7 +2894,8 @@ class PrimeETradeTrading:
     
     def place_order(self, symbol: str, quantity: int, side: str, order_type: str = 'MARKET',
                    price: Optional[float] = None, stop_price: Optional[float] = None,
-                   client_order_id: Optional[str] = None) -> Dict[str, Any]:
+                   client_order_id: Optional[str] = None,
+                   preview_ids: Optional[List[str]] = None) -> Dict[str, Any]:
         """Place an order
         
         Args:
@@ -2337,6 +2906,7 @@ class PrimeETradeTrading:
             price: Limit price (for LIMIT orders)
             stop_price: Stop price (for STOP orders)
             client_order_id: Custom order ID
+            preview_ids: previewId(s) from preview_order for the same clientOrderId
         """
         if not self.selected_account:
             raise Exception("No account selected")
@@ -2370,6 +2940,10 @@ class PrimeETradeTrading:
             if order_type in ['STOP', 'STOP_LIMIT'] and stop_price:
                 order_data['Order'][0]['stopPrice'] = stop_price
             
+            # Rev 00244: Reference the preview this placement was validated against
+            if preview_ids:
+                order_data['PreviewIds'] = [{'previewId': preview_id} for preview_id in preview_ids]
+            
             # DIAGNOSTIC (Rev 00180): Log order details before placing
             log.info(f"📋 Order Details:")
             log.info(f"   Account: {self.selected_account.account_id_key}")
@@ -2385,6 +2959,7 @@ class PrimeETradeTrading:
                 url=f"{self.config['base_url']}/v1/accounts/{self.selected_account.account_id_key}/orders/place",
                 params=order_data
             )
+            self._shared.invalidate_account_caches()
             
             # DIAGNOSTIC (Rev 00180): Log full response
             log.info(f"📬 ETrade Response: {response}")
@@ -2412,6 +2987,7 @@ class PrimeETradeTrading:
                 url=f"{self.config['base_url']}/v1/accounts/{self.selected_account.account_id_key}/orders/cancel",
                 params={'orderId': order_id}
             )
+            self._shared.invalidate_account_caches()
             
             log.info(f"✅ Order cancelled successfully")
             return response
@@ -2444,7 +3020,47 @@ class PrimeETradeTrading:
         except Exception as e:
             log.error(f"Failed to get order status: {e}")
             raise
-    
+
+    def find_order_by_client_id(self, client_order_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Today's order placed with client_order_id, or None when E*TRADE has none (Rev 00244)
+
+        Used to reconcile a place that timed out or came back as a duplicate clientOrderId.
+        Raises when the order list itself could not be read (the outcome is then unknown).
+
+        Returns:
+            {'order_id', 'status', 'client_order_id'}
+        """
+        if not self.selected_account:
+            raise Exception("No account selected")
+
+        response = self._make_etrade_api_call(
+            method='GET',
+            url=f"{self.config['base_url']}/v1/accounts/{self.selected_account.account_id_key}/orders",
+            params={'fromDate': datetime.now().strftime("%m%d%Y"), 'count': 100}
+        )
+        if isinstance(response, dict) and 'error' in response:
+            raise Exception(f"Order lookup failed: {response['error']}")
+
+        if isinstance(response, dict) and '<?xml version' in response:
+            xml_data = response['<?xml version']
+            if not xml_data.strip().startswith('<?xml'):
+                xml_data = '<?xml version=' + xml_data
+            for order in ET.fromstring(xml_data).iter('Order'):
+                if order.findtext('.//clientOrderId') == client_order_id:
+                    return {'order_id': order.findtext('orderId'), 'status': order.findtext('.//status'),
+                            'client_order_id': client_order_id}
+            return None
+
+        orders = (response.get('OrdersResponse') or {}).get('Order') or [] if isinstance(response, dict) else []
+        for order in orders if isinstance(orders, list) else [orders]:
+            details = order.get('OrderDetail') or [{}]
+            detail = details[0] if isinstance(details, list) else details
+            if client_order_id in (order.get('clientOrderId'), detail.get('clientOrderId')):
+                return {'order_id': str(order.get('orderId')), 'status': detail.get('status'),
+                        'client_order_id': client_order_id}
+        return None
+
     def get_market_hours(self) -> Dict[str, Any]:
         """Get market hours information"""
         try:
@@ -2465,105 +3081,60 @@ class PrimeETradeTrading:
     
     def execute_batch_orders(self, orders: List[Dict[str, Any]], max_concurrent: int = 3) -> Dict[str, Any]:
         """
-        Execute multiple orders with controlled concurrency (Rev 00180T)
+        Execute multiple orders with controlled concurrency (Rev 00180T, Rev 00244)
         
-        Handles 30-40 simultaneous orders efficiently with:
-        - Controlled concurrency (3 at a time)
-        - Rate limiting (1.2s spacing)
-        - Automatic retry on errors
-        - Order verification
+        Synchronous wrapper around execute_batch_orders_async for callers without an
+        event loop. Async callers should await execute_batch_orders_async directly;
+        when called from a running loop the batch runs on a worker thread (blocking
+        that loop until it completes) because asyncio.run cannot nest.
         
         Args:
             orders: List of order dictionaries with keys:
                     {symbol, quantity, side, order_type, signal_type, confidence}
-            max_concurrent: Maximum concurrent orders (default 3)
+            max_concurrent: Maximum orders in flight (default 3)
         
         Returns:
             Dict with execution results:
-                {success_count, failed_count, executed_orders, failed_orders}
+                {success_count, failed_count, executed_orders, failed_orders, duration, latency}
         """
+        import asyncio
         try:
-            import asyncio
-            from concurrent.futures import ThreadPoolExecutor
-            import time
-            
-            log.info(f"")
-            log.info(f"{'='*80}")
-            log.info(f"🎯 BATCH EXECUTION: {len(orders)} orders")
-            log.info(f"{'='*80}")
-            log.info(f"   Max Concurrent: {max_concurrent}")
-            log.info(f"   Spacing: 1.2s between bursts")
-            log.info(f"")
-            
-            executed_orders = []
-            failed_orders = []
-            
-            # Sort by confidence (highest first)
-            sorted_orders = sorted(orders, key=lambda x: x.get('confidence', 0.85), reverse=True)
-            
-            # Log prioritized queue
-            log.info(f"📊 PRIORITIZED ORDER QUEUE:")
-            for i, order in enumerate(sorted_orders[:10], 1):
-                log.info(f"   {i}. {order['symbol']} {order.get('side', 'BUY')} {order.get('quantity', 0)} (conf={order.get('confidence', 0.85):.0%})")
-            if len(sorted_orders) > 10:
-                log.info(f"   ... and {len(sorted_orders) - 10} more")
-            log.info(f"")
-            
-            # Execute in batches of max_concurrent
-            start_time = time.time()
-            
-            for i in range(0, len(sorted_orders), max_concurrent):
-                batch = sorted_orders[i:i+max_concurrent]
-                batch_num = i // max_concurrent + 1
-                
-                log.info(f"📦 Batch {batch_num}: Executing {len(batch)} orders...")
-                
-                # Execute this batch concurrently
-                with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-                    futures = []
-                    
-                    for order in batch:
-                        future = executor.submit(self._execute_single_order_with_retry, order)
-                        futures.append((future, order))
-                    
-                    # Wait for all in this batch to complete
-                    for future, order in futures:
-                        try:
-                            result = future.result(timeout=30)
-                            if result.get('success'):
-                                executed_orders.append(result)
-                                log.info(f"   ✅ {order['symbol']}: Executed")
-                            else:
-                                failed_orders.append({'order': order, 'error': result.get('error', 'Unknown')})
-                                log.warning(f"   ❌ {order['symbol']}: Failed - {result.get('error', 'Unknown')}")
-                        except Exception as e:
-                            failed_orders.append({'order': order, 'error': str(e)})
-                            log.error(f"   ❌ {order['symbol']}: Exception - {e}")
-                
-                # Spacing between batches (rate limiting)
-                if i + max_concurrent < len(sorted_orders):
-                    time.sleep(1.2)
-            
-            duration = time.time() - start_time
-            
-            log.info(f"")
-            log.info(f"{'='*80}")
-            log.info(f"✅ BATCH EXECUTION COMPLETE")
-            log.info(f"{'='*80}")
-            log.info(f"   Duration: {duration:.1f}s")
-            log.info(f"   Success: {len(executed_orders)}/{len(orders)} ✅")
-            log.info(f"   Failed: {len(failed_orders)}/{len(orders)}")
-            log.info(f"   Success Rate: {len(executed_orders)/len(orders)*100:.1f}%")
-            log.info(f"")
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.execute_batch_orders_async(orders, max_concurrent=max_concurrent))
+        
+        log.warning("⚠️ execute_batch_orders called from a running event loop - "
+                    "await execute_batch_orders_async instead; running batch on a worker thread")
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='batch-orders') as pool:
+            return pool.submit(
+                asyncio.run, self.execute_batch_orders_async(orders, max_concurrent=max_concurrent)
+            ).result()
+    
+    async def execute_batch_orders_async(self, orders: List[Dict[str, Any]], max_concurrent: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Execute multiple orders through the sliding-window preview/place pipeline (Rev 00244)
+        
+        - Sliding in-flight window (ETRADE_ORDER_MAX_IN_FLIGHT) instead of fixed bursts
+        - Token-bucket rate limiting (ETRADE_ORDER_RATE_PER_SECOND / ETRADE_ORDER_RATE_BURST)
+        - Previews pipelined ahead of placements
+        - Non-blocking jittered retries
+        - Per-order submit-to-ack latency
+        
+        Args:
+            orders: List of order dictionaries with keys:
+                    {symbol, quantity, side, order_type, signal_type, confidence}
+            max_concurrent: Override for the in-flight window
+        
+        Returns:
+            Dict with execution results:
+                {success_count, failed_count, executed_orders, failed_orders, duration, latency}
+        """
+        try:
+            from .prime_order_executor import AsyncOrderExecutor, ORDER_MAX_IN_FLIGHT
             
-            return {
-                'success': True,
-                'success_count': len(executed_orders),
-                'failed_count': len(failed_orders),
-                'executed_orders': executed_orders,
-                'failed_orders': failed_orders,
-                'duration': duration
-            }
+            executor = AsyncOrderExecutor(self, max_in_flight=max_concurrent or ORDER_MAX_IN_FLIGHT)
+            return await executor.execute(orders)
             
         except Exception as e:
             log.error(f"Batch execution failed: {e}", exc_info=True)
@@ -2576,61 +3147,6 @@ class PrimeETradeTrading:
                 'error': str(e)
             }
     
-    def _execute_single_order_with_retry(self, order: Dict[str, Any], max_retries: int = 3) -> Dict[str, Any]:
-        """
-        Execute single order with retry logic
-        
-        Args:
-            order: Order dictionary
-            max_retries: Maximum retry attempts
-        
-        Returns:
-            Execution result dict
-        """
-        for attempt in range(1, max_retries + 1):
-            try:
-                # Place order
-                response = self.place_order(
-                    symbol=order['symbol'],
-                    quantity=order['quantity'],
-                    side=order.get('side', 'BUY'),
-                    order_type=order.get('order_type', 'MARKET')
-                )
-                
-                # Check response
-                if response and not isinstance(response, dict) or 'error' not in response:
-                    # Success
-                    order_id = self._extract_order_id_from_response(response)
-                    return {
-                        'success': True,
-                        'symbol': order['symbol'],
-                        'quantity': order['quantity'],
-                        'side': order.get('side', 'BUY'),
-                        'order_id': order_id,
-                        'signal_type': order.get('signal_type', 'TRADE')
-                    }
-                else:
-                    # Error response
-                    error_msg = response.get('error', 'Unknown') if isinstance(response, dict) else str(response)
-                    
-                    # Check if retriable
-                    if self._is_retriable_error(error_msg) and attempt < max_retries:
-                        wait_time = 2 ** attempt
-                        log.warning(f"   ⚠️ Retry {attempt}/{max_retries} for {order['symbol']}: {error_msg}")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        return {'success': False, 'symbol': order['symbol'], 'error': error_msg}
-            
-            except Exception as e:
-                if attempt < max_retries:
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    return {'success': False, 'symbol': order['symbol'], 'error': str(e)}
-        
-        return {'success': False, 'symbol': order['symbol'], 'error': 'Max retries exceeded'}
-    
     def _extract_order_id_from_response(self, response) -> Optional[str]:
         """Extract order ID from E*TRADE response"""
         try:
@@ -2641,19 +3157,20 @@ class PrimeETradeTrading:
                 
                 if 'OrderResponse' in response:
                     return self._extract_order_id_from_response(response['OrderResponse'])
+                if 'PlaceOrderResponse' in response:
+                    return self._extract_order_id_from_response(response['PlaceOrderResponse'])
+                if 'OrderIds' in response:
+                    return self._extract_order_id_from_response(response['OrderIds'])
                 if 'Order' in response:
                     return self._extract_order_id_from_response(response['Order'])
+            elif isinstance(response, list) and response:
+                # PlaceOrderResponse.OrderIds: [{'orderId': ...}]
+                return self._extract_order_id_from_response(response[0])
             
             return None
         except:
             return None
     
-    def _is_retriable_error(self, error_msg: str) -> bool:
-        """Check if error should be retried"""
-        retriable = ['rate limit', '429', 'timeout', 'temporary', 'unavailable', 'network', 'connection']
-        error_lower = str(error_msg).lower()
-        return any(keyword in error_lower for keyword in retriable)
-    
     def get_option_chains(self, symbol: str, expiry_date: str, option_type: str = 'CALL') -> Dict[str, Any]:
         """Get option chains for a symbol
         
@@ -2741,16 +3258,95 @@ class PrimeETradeTrading:
             log.error(f"Failed to parse alerts XML: {e}")
             return []
 
-# Global instance
+class ETradeClientHub:
+    """
+    Process-wide E*TRADE client hub (Rev 00251)
+    
+    Holds one ETradeSharedState per environment. Components take lightweight
+    PrimeETradeTrading handles from it instead of each repeating the Secret Manager
+    credential/token reads, the account list call and the connection test.
+    """
+    
+    def __init__(self):
+        self._states: Dict[str, ETradeSharedState] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(environment: str) -> str:
+        # Everything except 'sandbox' resolves to the production credentials/base URL
+        return 'sandbox' if str(environment).lower() == 'sandbox' else 'prod'
+    
+    def state(self, environment: str) -> ETradeSharedState:
+        key = self._key(environment)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = ETradeSharedState(key)
+            return state
+    
+    def handle(self, environment: str = 'prod') -> PrimeETradeTrading:
+        """New handle for a component (loads credentials/tokens/accounts on first use only)"""
+        if not ETRADE_CLIENT_HUB_ENABLED:
+            return PrimeETradeTrading(environment)
+        state = self.state(environment)
+        handle = PrimeETradeTrading(environment, shared=state)
+        state.stats['handles'] += 1
+        return handle
+    
+    def reload_tokens(self, environment: str = 'prod') -> bool:
+        """
+        Re-read OAuth tokens once (e.g. after the token-renewed webhook)
+        
+        Every handle of the environment uses the new tokens on its next call.
+        """
+        state = self._states.get(self._key(environment))
+        if state is None or not state.loaded:
+            return False
+        try:
+            with state.load_lock:
+                PrimeETradeTrading(environment, shared=state)._load_tokens()
+                state.connection_verified_at = None
+            log.info(f"🔄 E*TRADE tokens reloaded for {state.environment} (shared by {state.stats['handles']} handles)")
+            return True
+        except Exception as e:
+            log.error(f"❌ E*TRADE token reload failed for {environment}: {e}")
+            return False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {key: {**state.stats, 'loaded': state.loaded, 'accounts': len(state.accounts)}
+                for key, state in self._states.items()}
+    
+    def close(self):
+        """Close pooled HTTP connections of every environment"""
+        for state in list(self._states.values()):
+            with state.http_lock:
+                if state.http_session is not None:
+                    try:
+                        state.http_session.close()
+                    except Exception as e:
+                        log.debug(f"Error closing E*TRADE HTTP session: {e}")
+                    state.http_session = None
+
+# Global instances
+_etrade_client_hub: Optional[ETradeClientHub] = None
 _etrade_trading_instance: Optional[PrimeETradeTrading] = None
 _etrade_trading_lock = threading.Lock()
 
+def get_etrade_client_hub() -> ETradeClientHub:
+    """Get the process-wide E*TRADE client hub"""
+    global _etrade_client_hub
+    with _etrade_trading_lock:
+        if _etrade_client_hub is None:
+            _etrade_client_hub = ETradeClientHub()
+        return _etrade_client_hub
+
 def get_etrade_trading(environment: str = 'prod') -> PrimeETradeTrading:
     """Get or create ETrade trading instance"""
     global _etrade_trading_instance
+    hub = get_etrade_client_hub()
     with _etrade_trading_lock:
         if _etrade_trading_instance is None:
-            _etrade_trading_instance = PrimeETradeTrading(environment)
+            _etrade_trading_instance = hub.handle(environment)
         return _etrade_trading_instance
 
 def test_etrade_trading():
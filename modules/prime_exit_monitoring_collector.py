@@ -6,15 +6,23 @@ Duration: Temporary - will be removed after exit settings are optimized
 Data Collected: Only data needed for exit triggers (price, RSI, volume, ATR, etc.)
 NOT: All 89 technical indicators (only collected on entry via Priority Enhancer)
 
+Storage (Rev 00238): append-only compressed JSONL segments per flush, merged by a daily
+compaction into exit_monitoring/{date}/{symbol}_monitoring.json. Use
+iter_exit_monitoring_records() to read a day's data regardless of compaction state.
+
 Last Updated: January 6, 2026 (Rev 00231)
 Version: 2.31.0
 """
 
+import gzip
 import json
 import os
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Iterator, Iterable
 from dataclasses import dataclass, asdict
 from google.cloud import storage
 
@@ -23,6 +31,40 @@ log = logging.getLogger(__name__)
 # TEMPORARY FEATURE FLAG - Set to False to disable data collection
 EXIT_MONITORING_ENABLED = os.getenv("EXIT_MONITORING_ENABLED", "true").lower() == "true"
 
+# Rev 00238: Append-only storage layout
+#   exit_monitoring/{date}/segments/{symbol}/{HHMMSSffffff}-{writer}-{seq}.jsonl.gz  (one per flush)
+#   exit_monitoring/{date}/{symbol}_monitoring.json                                 (daily compaction output)
+EXIT_MONITORING_PREFIX = "exit_monitoring"
+SEGMENT_SUFFIX = ".jsonl.gz"
+EXIT_MONITORING_UPLOAD_WORKERS = int(os.getenv("EXIT_MONITORING_UPLOAD_WORKERS", "2"))
+
+def _segment_prefix(date_str: str, symbol: Optional[str] = None) -> str:
+    base = f"{EXIT_MONITORING_PREFIX}/{date_str}/segments/"
+    return f"{base}{symbol}/" if symbol else base
+
+def _compacted_path(date_str: str, symbol: str) -> str:
+    return f"{EXIT_MONITORING_PREFIX}/{date_str}/{symbol}_monitoring.json"
+
+def _encode_segment(records: List[Dict[str, Any]]) -> bytes:
+    lines = "\n".join(json.dumps(record, separators=(",", ":")) for record in records)
+    return gzip.compress((lines + "\n").encode("utf-8"))
+
+def decode_segment(payload: bytes) -> Iterator[Dict[str, Any]]:
+    """Records of one gzipped JSON-lines segment (as written by the collector)"""
+    for line in gzip.decompress(payload).decode("utf-8").splitlines():
+        if line.strip():
+            yield json.loads(line)
+
+def dedupe_records(records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Drop repeats of (trade_id, timestamp) - a segment can outlive its compaction if its delete failed"""
+    seen = set()
+    for record in records:
+        key = (record.get("trade_id"), record.get("timestamp"))
+        if key in seen:
+            continue
+        seen.add(key)
+        yield record
+
 @dataclass
 class ExitMonitoringData:
     """Exit monitoring data - 35 technical indicators collected every 30 seconds for exit optimization"""
@@ -138,9 +180,10 @@ class PrimeExitMonitoringCollector:
     - This allows daily review of exit settings to optimize profit capture
     """
     
-    def __init__(self, gcs_bucket: str = "easy-etrade-strategy-data"):
+    def __init__(self, gcs_bucket: str = "easy-etrade-strategy-data", clock=None):
         self.enabled = EXIT_MONITORING_ENABLED
         self.gcs_bucket = gcs_bucket
+        self.clock = clock  # Rev 00242: Injectable clock shared with stealth trailing (replay); None = wall clock
         self.storage_client = None
         
         # In-memory buffer (flushed to GCS periodically)
@@ -153,6 +196,15 @@ class PrimeExitMonitoringCollector:
         # Rev 00170: Track last collection time for health monitoring
         self.last_collection_time: Optional[datetime] = None
         
+        # Rev 00238: Segment uploads run on a small worker pool (never on the 30s update path)
+        self._buffer_lock = threading.Lock()
+        self._writer_id = uuid.uuid4().hex[:8]
+        self._segment_seq = 0
+        self._uploader: Optional[ThreadPoolExecutor] = None
+        self._pending_uploads: List[Future] = []
+        self.segments_written = 0
+        self.bytes_uploaded = 0
+        
         if self.enabled:
             try:
                 self.storage_client = storage.Client()
@@ -163,6 +215,10 @@ class PrimeExitMonitoringCollector:
         else:
             log.info("ℹ️ Exit Monitoring Collector initialized (DISABLED via env var)")
     
+    def _utcnow(self) -> datetime:
+        """Current naive-UTC time (from the injected clock when replaying)"""
+        return self.clock.utcnow() if self.clock else datetime.utcnow()
+    
     def collect_monitoring_data(
         self,
         symbol: str,
@@ -202,7 +258,8 @@ class PrimeExitMonitoringCollector:
             profit_capture_pct = (unrealized_pnl / peak_pnl) if peak_pnl > 0 else 0.0
             
             # Time calculations
-            holding_minutes = (datetime.utcnow() - position_state.entry_time).total_seconds() / 60
+            now = self._utcnow()
+            holding_minutes = (now - position_state.entry_time).total_seconds() / 60
             
             # Stop loss data
             current_stop_loss = position_state.current_stop_loss
@@ -218,19 +275,16 @@ class PrimeExitMonitoringCollector:
             gap_risk_pct = (current_price - peak_price) / peak_price if peak_price > 0 else 0.0
             entry_bar_volatility = getattr(position_state, 'entry_bar_volatility', 0.0)
             
-            # Time-weighted peak (last 45 minutes)
+            # Time-weighted peak (Rev 00239: rolling window max, window = time-weighted peak minutes)
             time_weighted_peak = peak_price
-            if hasattr(position_state, 'price_history') and position_state.price_history:
-                now = datetime.utcnow()
-                recent_cutoff = now - timedelta(minutes=45)
-                recent_prices = [
-                    entry.get('price', 0) for entry in position_state.price_history
-                    if isinstance(entry, dict) and entry.get('timestamp', now) >= recent_cutoff
-                ]
-                if recent_prices:
-                    time_weighted_peak = max(recent_prices)
+            price_history = getattr(position_state, 'price_history', None)
+            if price_history:
+                recent_peak = price_history.peak(now)
+                if recent_peak is not None:
+                    time_weighted_peak = recent_peak
             
             # Technical indicators (35 fields for exit optimization)
+            # Read from market_data: computed upstream by prime_indicator_engine (batch) or prime_streaming_indicators
             # Momentum Indicators
             rsi = market_data.get('rsi') or market_data.get('rsi_14')
             rsi_14 = market_data.get('rsi_14') or market_data.get('rsi')
@@ -286,7 +340,7 @@ class PrimeExitMonitoringCollector:
             
             # Create monitoring data record
             monitoring_data = ExitMonitoringData(
-                timestamp=datetime.utcnow().isoformat(),
+                timestamp=now.isoformat(),
                 symbol=symbol,
                 trade_id=trade_id,
                 current_price=current_price,
@@ -347,9 +401,8 @@ class PrimeExitMonitoringCollector:
             )
             
             # Add to buffer
-            if symbol not in self.monitoring_buffer:
-                self.monitoring_buffer[symbol] = []
-            self.monitoring_buffer[symbol].append(monitoring_data)
+            with self._buffer_lock:
+                self.monitoring_buffer.setdefault(symbol, []).append(monitoring_data)
             
             # Rev 00170: Update last collection time for health monitoring
             self.last_collection_time = datetime.utcnow()
@@ -408,10 +461,11 @@ class PrimeExitMonitoringCollector:
                 # Rev 00170: If no buffer data, create a final record
                 log.warning(f"⚠️ No monitoring buffer data for {symbol} at exit - creating final record")
                 # Create a minimal exit record
+                now = self._utcnow()
                 final_record = ExitMonitoringData(
-                    timestamp=datetime.utcnow().isoformat(),
+                    timestamp=now.isoformat(),
                     symbol=symbol,
-                    trade_id=f"{symbol}_{datetime.utcnow().strftime('%Y%m%d')}",
+                    trade_id=f"{symbol}_{now.strftime('%Y%m%d')}",
                     current_price=exit_price,
                     entry_price=0.0,  # Unknown if not in buffer
                     peak_price=exit_price,
@@ -421,7 +475,7 @@ class PrimeExitMonitoringCollector:
                     peak_pnl=final_pnl,
                     peak_pnl_pct=final_pnl_pct,
                     profit_capture_pct=1.0,
-                    entry_time=datetime.utcnow().isoformat(),
+                    entry_time=now.isoformat(),
                     holding_minutes=0.0,
                     current_stop_loss=exit_price,
                     stop_loss_distance_pct=0.0,
@@ -435,67 +489,116 @@ class PrimeExitMonitoringCollector:
                     exit_reason=exit_reason,
                     exit_price=exit_price
                 )
-                if symbol not in self.monitoring_buffer:
-                    self.monitoring_buffer[symbol] = []
-                self.monitoring_buffer[symbol].append(final_record)
+                with self._buffer_lock:
+                    self.monitoring_buffer.setdefault(symbol, []).append(final_record)
                 self._flush_symbol_data(symbol)
                 
         except Exception as e:
             log.error(f"❌ Error recording exit for {symbol}: {e}", exc_info=True)
     
-    def _flush_symbol_data(self, symbol: str) -> None:
-        """Flush monitoring data for a symbol to GCS"""
-        if not self.enabled or not self.storage_client or symbol not in self.monitoring_buffer:
-            return
+    def _flush_symbol_data(self, symbol: str) -> Optional[Future]:
+        """
+        Flush monitoring data for a symbol to GCS
         
-        try:
-            today = datetime.utcnow().date()
-            date_str = today.isoformat()
-            
-            # Get data to flush
-            data_to_flush = self.monitoring_buffer[symbol].copy()
-            self.monitoring_buffer[symbol] = []  # Clear buffer
-            
+        Rev 00238: Writes one new compressed JSONL segment per flush (append-only) instead of
+        downloading and re-uploading the whole day's JSON. The upload runs on the uploader
+        pool; records are returned to the buffer if it fails.
+        """
+        if not self.enabled or not self.storage_client:
+            return None
+        
+        with self._buffer_lock:
+            data_to_flush = self.monitoring_buffer.get(symbol, [])
             if not data_to_flush:
-                return
-            
-            # Convert to JSON
-            json_data = [asdict(record) for record in data_to_flush]
-            
-            # Upload to GCS
+                return None
+            self.monitoring_buffer[symbol] = []  # Clear buffer
+            self._segment_seq += 1
+            seq = self._segment_seq
+        
+        # Serialize now so later mutation of the records (record_exit) cannot race the upload
+        now = datetime.utcnow()
+        blob_path = f"{_segment_prefix(now.date().isoformat(), symbol)}{now.strftime('%H%M%S%f')}-{self._writer_id}-{seq:06d}{SEGMENT_SUFFIX}"
+        payload = _encode_segment([asdict(record) for record in data_to_flush])
+        
+        if self._uploader is None:
+            self._uploader = ThreadPoolExecutor(max_workers=EXIT_MONITORING_UPLOAD_WORKERS, thread_name_prefix="exit-monitor-upload")
+        future = self._uploader.submit(self._upload_segment, symbol, blob_path, payload, data_to_flush)
+        self._pending_uploads = [f for f in self._pending_uploads if not f.done()] + [future]
+        return future
+    
+    def _upload_segment(self, symbol: str, blob_path: str, payload: bytes, records: List[ExitMonitoringData]) -> bool:
+        """Upload one segment (uploader thread)"""
+        try:
             bucket = self.storage_client.bucket(self.gcs_bucket)
-            blob_path = f"exit_monitoring/{date_str}/{symbol}_monitoring.json"
             blob = bucket.blob(blob_path)
-            
-            # Append to existing data if file exists
-            existing_data = []
-            if blob.exists():
-                try:
-                    existing_content = blob.download_as_text()
-                    existing_data = json.loads(existing_content)
-                except:
-                    existing_data = []
-            
-            # Combine and upload
-            combined_data = existing_data + json_data
-            blob.upload_from_string(
-                json.dumps(combined_data, indent=2),
-                content_type="application/json"
-            )
-            
-            log.debug(f"📊 Flushed {len(data_to_flush)} monitoring records for {symbol} to GCS")
+            blob.content_encoding = "gzip"
+            blob.upload_from_string(payload, content_type="application/x-ndjson")
+            self.segments_written += 1
+            self.bytes_uploaded += len(payload)
+            log.debug(f"📊 Flushed {len(records)} monitoring records for {symbol} to GCS ({len(payload)} bytes, {blob_path})")
+            return True
             
         except Exception as e:
             log.error(f"❌ Error flushing monitoring data for {symbol}: {e}", exc_info=True)
-            # Re-add to buffer on error
-            if symbol not in self.monitoring_buffer:
-                self.monitoring_buffer[symbol] = []
-            self.monitoring_buffer[symbol].extend(data_to_flush)
+            # Re-add to buffer on error (ahead of anything collected since)
+            with self._buffer_lock:
+                self.monitoring_buffer[symbol] = records + self.monitoring_buffer.get(symbol, [])
+                buffer_size = len(self.monitoring_buffer[symbol])
             
             # Rev 00170: Alert if GCS errors persist (buffer growing)
-            buffer_size = len(self.monitoring_buffer[symbol])
             if buffer_size > 50:  # Alert if buffer exceeds 50 records
                 log.warning(f"⚠️ Exit monitoring buffer for {symbol} is large ({buffer_size} records) - GCS upload may be failing")
+            return False
+    
+    def wait_for_uploads(self, timeout: Optional[float] = 60.0) -> int:
+        """Block until in-flight segment uploads finish; returns the number still pending"""
+        pending = [f for f in self._pending_uploads if not f.done()]
+        if pending:
+            wait(pending, timeout=timeout)
+        self._pending_uploads = [f for f in self._pending_uploads if not f.done()]
+        return len(self._pending_uploads)
+    
+    def compact_date(self, date_str: Optional[str] = None) -> Dict[str, int]:
+        """
+        Daily compaction (Rev 00238): merge each symbol's segments into
+        exit_monitoring/{date}/{symbol}_monitoring.json and delete the merged segments.
+        
+        Safe to re-run: an existing compacted file is merged with any newer segments, and
+        records already in it (by trade_id, timestamp) are skipped, so segments left behind by
+        a failed delete are not merged twice. Returns {symbol: total_records}.
+        """
+        if not self.storage_client:
+            return {}
+        
+        date_str = date_str or datetime.utcnow().date().isoformat()
+        bucket = self.storage_client.bucket(self.gcs_bucket)
+        segments_by_symbol: Dict[str, List[Any]] = {}
+        for blob in self.storage_client.list_blobs(self.gcs_bucket, prefix=_segment_prefix(date_str)):
+            if blob.name.endswith(SEGMENT_SUFFIX):
+                symbol = blob.name[len(_segment_prefix(date_str)):].split("/", 1)[0]
+                segments_by_symbol.setdefault(symbol, []).append(blob)
+        
+        compacted: Dict[str, int] = {}
+        for symbol, segment_blobs in segments_by_symbol.items():
+            try:
+                target = bucket.blob(_compacted_path(date_str, symbol))
+                records: List[Dict[str, Any]] = []
+                if target.exists():
+                    records = json.loads(target.download_as_text())
+                for segment in sorted(segment_blobs, key=lambda b: b.name):
+                    records.extend(decode_segment(segment.download_as_bytes(raw_download=True)))
+                records = list(dedupe_records(records))
+                target.upload_from_string(json.dumps(records), content_type="application/json")
+                for segment in segment_blobs:
+                    segment.delete()
+                compacted[symbol] = len(records)
+            except Exception as e:
+                log.error(f"❌ Exit monitoring compaction failed for {symbol} ({date_str}): {e}", exc_info=True)
+        
+        if compacted:
+            log.info(f"🗜️ Compacted exit monitoring segments for {len(compacted)} symbols ({date_str}): "
+                     f"{sum(compacted.values())} records")
+        return compacted
     
     def _check_periodic_flush(self) -> None:
         """Rev 00170: Check if periodic flush is needed (every 5 minutes)"""
@@ -521,14 +624,14 @@ class PrimeExitMonitoringCollector:
         if not self.enabled:
             return
         
-        symbols_to_flush = list(self.monitoring_buffer.keys())
+        with self._buffer_lock:
+            symbols_to_flush = [symbol for symbol, records in self.monitoring_buffer.items() if records]
         if not symbols_to_flush:
             return
         
         flushed_count = 0
         for symbol in symbols_to_flush:
-            if self.monitoring_buffer[symbol]:  # Only flush if buffer has data
-                self._flush_symbol_data(symbol)
+            if self._flush_symbol_data(symbol):
                 flushed_count += 1
         
         if flushed_count > 0:
@@ -542,6 +645,10 @@ class PrimeExitMonitoringCollector:
         log.info("📊 EOD flush: Flushing all exit monitoring data to GCS")
         self._flush_all_symbols()
         self.last_periodic_flush = datetime.utcnow()
+        # EOD flush must be durable before the caller moves on (and before compaction)
+        still_pending = self.wait_for_uploads()
+        if still_pending:
+            log.warning(f"⚠️ {still_pending} exit monitoring segment uploads still pending after EOD flush")
         log.info("✅ Flushed all exit monitoring data to GCS")
     
     def get_health_status(self) -> Dict[str, Any]:
@@ -554,6 +661,9 @@ class PrimeExitMonitoringCollector:
             'symbols_tracked': len(self.monitoring_buffer),
             'last_collection_time': self.last_collection_time.isoformat() if self.last_collection_time else None,
             'last_periodic_flush': self.last_periodic_flush.isoformat() if self.last_periodic_flush else None,
+            'pending_uploads': sum(1 for f in self._pending_uploads if not f.done()),
+            'segments_written': self.segments_written,
+            'bytes_uploaded': self.bytes_uploaded,
         }
         
         # Check if collection is stale (no data for 10 minutes)
@@ -568,7 +678,45 @@ class PrimeExitMonitoringCollector:
         return status
 
 
-def get_exit_monitoring_collector() -> PrimeExitMonitoringCollector:
+def get_exit_monitoring_collector(clock=None) -> PrimeExitMonitoringCollector:
     """Factory function to get exit monitoring collector instance"""
-    return PrimeExitMonitoringCollector()
+    return PrimeExitMonitoringCollector(clock=clock)
+
+
+def iter_exit_monitoring_records(
+    date_str: str,
+    symbol: Optional[str] = None,
+    gcs_bucket: str = "easy-etrade-strategy-data",
+    storage_client: Any = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream exit monitoring records for a date (Rev 00238 reader helper, e.g. for priority_optimizer)
+    
+    Yields the compacted {symbol}_monitoring.json records first, then any segments not yet
+    compacted, in write order. One segment is held in memory at a time. Records already
+    yielded (same trade_id and timestamp) are skipped.
+    """
+    client = storage_client or storage.Client()
+    yield from dedupe_records(_iter_stored_records(client, gcs_bucket, date_str, symbol))
+
+
+def _iter_stored_records(client: Any, gcs_bucket: str, date_str: str, symbol: Optional[str]) -> Iterator[Dict[str, Any]]:
+    bucket = client.bucket(gcs_bucket)
+    
+    compacted_prefix = f"{EXIT_MONITORING_PREFIX}/{date_str}/"
+    for blob in client.list_blobs(gcs_bucket, prefix=compacted_prefix, delimiter="/"):
+        if not blob.name.endswith("_monitoring.json"):
+            continue
+        blob_symbol = blob.name[len(compacted_prefix):-len("_monitoring.json")]
+        if symbol and blob_symbol != symbol:
+            continue
+        for record in json.loads(blob.download_as_text()):
+            yield record
+    
+    segment_blobs = [
+        blob for blob in client.list_blobs(gcs_bucket, prefix=_segment_prefix(date_str, symbol))
+        if blob.name.endswith(SEGMENT_SUFFIX)
+    ]
+    for blob in sorted(segment_blobs, key=lambda b: b.name):
+        yield from decode_segment(bucket.blob(blob.name).download_as_bytes(raw_download=True))
 
@@ -0,0 +1,490 @@
+"""
+Prime Exit Sweep
+
+Multi-process parameter sweep for StealthConfig exit settings.
+
+Rev 00243: Replays candidate exit settings (breakeven %, trailing activation %,
+activation minutes, trailing distance bands, gap-risk thresholds) against the
+stored exit-monitoring tick data and writes a ranked results table with P&L,
+profit capture, win rate and drawdown. Each candidate runs through the real
+PrimeStealthTrailingTP decision code (ReplayClock + ReplayExecutionAdapter from
+prime_replay_engine), so a sweep result matches what the live module would do
+on the same ticks. Candidates are spread across a process pool; each worker
+receives the trade paths once (pool initializer) and evaluates batches of
+configurations.
+
+Limitation: the recorded path ends where the live position exited. A candidate
+that would have held longer is closed at the last recorded tick
+('end_of_data'); the 'truncated' column counts these per candidate.
+
+Usage:
+    python -m modules.prime_exit_sweep --start 2025-11-03 --end 2026-01-30
+    python -m modules.prime_exit_sweep --start 2025-11-03 --end 2026-01-30 --random 3000 --seed 11
+    python -m modules.prime_exit_sweep --local-dir data/exit_monitoring --param breakeven_threshold_pct=0.005:0.0125:4
+"""
+
+import argparse
+import asyncio
+import csv
+import gzip
+import itertools
+import json
+import logging
+import math
+import os
+import random
+import time as perf_time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields, replace
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from .prime_exit_monitoring_collector import iter_exit_monitoring_records, decode_segment, dedupe_records, SEGMENT_SUFFIX
+    from .prime_models import PrimePosition, SignalSide
+    from .prime_replay_engine import ReplayClock, ReplayExecutionAdapter
+    from .prime_stealth_trailing_tp import ExitReason, PrimeStealthTrailingTP, StealthConfig
+except ImportError:
+    from prime_exit_monitoring_collector import iter_exit_monitoring_records, decode_segment, dedupe_records, SEGMENT_SUFFIX
+    from prime_models import PrimePosition, SignalSide
+    from prime_replay_engine import ReplayClock, ReplayExecutionAdapter
+    from prime_stealth_trailing_tp import ExitReason, PrimeStealthTrailingTP, StealthConfig
+
+log = logging.getLogger("prime_exit_sweep")
+
+SIM_QUANTITY = 100  # Per-trade quantity (results are reported in % of entry notional)
+
+# Band knobs: one multiplier scales a whole tier table so the grid stays tractable
+BAND_KNOBS = {
+    'trailing_band_scale': (
+        'base_trailing_pct', 'min_trailing_pct', 'max_trailing_pct',
+        'trailing_vol_extreme_pct', 'trailing_vol_high_pct', 'trailing_vol_moderate_pct', 'trailing_vol_low_pct',
+        'trailing_profit_max_pct', 'trailing_profit_high_pct', 'trailing_profit_medium_pct',
+    ),
+    'gap_risk_band_scale': (
+        'gap_risk_extreme_pct', 'gap_risk_high_pct', 'gap_risk_moderate_pct', 'gap_risk_low_pct',
+    ),
+}
+
+# Default grid: 4 x 4 x 3 x 4 x 3 x 3 x 2 = 3,456 candidates (plus the current config as baseline)
+DEFAULT_SWEEP_SPACE: Dict[str, List[float]] = {
+    'breakeven_threshold_pct': [0.005, 0.0075, 0.01, 0.0125],
+    'min_breakeven_activation_minutes': [3.5, 5.0, 6.4, 8.0],
+    'min_profit_for_trailing_pct': [0.005, 0.007, 0.01],
+    'min_trailing_activation_minutes': [3.5, 5.0, 6.4, 8.0],
+    'trailing_band_scale': [0.75, 1.0, 1.25],
+    'gap_risk_band_scale': [0.75, 1.0, 1.25],
+    'min_gap_risk_activation_minutes': [10.0, 20.0],
+}
+
+RANK_METRICS = ('total_pnl_pct', 'avg_pnl_pct', 'profit_capture_pct', 'win_rate', 'max_drawdown_pct', 'pnl_to_drawdown')
+
+# ============================================================================
+# TRADE PATHS
+# ============================================================================
+
+@dataclass
+class SweepTrade:
+    """One recorded position: entry context plus its monitoring ticks"""
+    trade_id: str
+    symbol: str
+    entry_price: float
+    entry_time: datetime
+    entry_bar_volatility: float
+    # (timestamp, price, rsi, volume_ratio, atr, volatility, momentum)
+    ticks: List[Tuple[datetime, float, Optional[float], Optional[float], Optional[float], Optional[float], Optional[float]]] = field(default_factory=list)
+    recorded_exit_reason: Optional[str] = None
+
+    @property
+    def peak_pct(self) -> float:
+        peak = max((t[1] for t in self.ticks), default=self.entry_price)
+        return (peak - self.entry_price) / self.entry_price if self.entry_price else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trade_id': self.trade_id,
+            'symbol': self.symbol,
+            'entry_price': self.entry_price,
+            'entry_time': self.entry_time.isoformat(),
+            'entry_bar_volatility': self.entry_bar_volatility,
+            'ticks': [[t[0].isoformat()] + list(t[1:]) for t in self.ticks],
+            'recorded_exit_reason': self.recorded_exit_reason,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SweepTrade':
+        return cls(
+            trade_id=data['trade_id'],
+            symbol=data['symbol'],
+            entry_price=float(data['entry_price']),
+            entry_time=datetime.fromisoformat(data['entry_time']),
+            entry_bar_volatility=float(data.get('entry_bar_volatility') or 2.0),
+            ticks=[(datetime.fromisoformat(t[0]), *t[1:]) for t in data.get('ticks', [])],
+            recorded_exit_reason=data.get('recorded_exit_reason'),
+        )
+
+def _naive_utc(value: str) -> datetime:
+    ts = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if ts.tzinfo is not None:
+        ts = (ts - ts.utcoffset()).replace(tzinfo=None)
+    return ts
+
+def build_trades(records: Iterable[Dict[str, Any]]) -> List[SweepTrade]:
+    """Group exit-monitoring records by trade_id into time-ordered trade paths"""
+    grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for record in records:
+        trade_id = record.get('trade_id')
+        if trade_id and record.get('current_price') and record.get('entry_price'):
+            grouped[trade_id].append(record)
+
+    trades = []
+    for trade_id, rows in grouped.items():
+        rows.sort(key=lambda r: r['timestamp'])
+        first = rows[0]
+        trade = SweepTrade(
+            trade_id=trade_id,
+            symbol=first['symbol'],
+            entry_price=float(first['entry_price']),
+            entry_time=_naive_utc(first.get('entry_time') or first['timestamp']),
+            entry_bar_volatility=float(first.get('entry_bar_volatility') or 2.0),
+            recorded_exit_reason=next((r.get('exit_reason') for r in reversed(rows) if r.get('exit_reason')), None),
+        )
+        seen = set()
+        for r in rows:
+            ts = _naive_utc(r['timestamp'])
+            if ts in seen or ts < trade.entry_time:
+                continue
+            seen.add(ts)
+            trade.ticks.append((
+                ts, float(r['current_price']),
+                r.get('rsi'), r.get('volume_ratio'), r.get('atr'), r.get('volatility'),
+                r.get('momentum_10'),
+            ))
+        if trade.ticks:
+            trades.append(trade)
+    trades.sort(key=lambda t: t.entry_time)
+    return trades
+
+def _weekdays(start: date, end: date) -> List[date]:
+    days, day = [], start
+    while day <= end:
+        if day.weekday() < 5:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+def _iter_local_records(local_dir: str, day: date) -> Iterable[Dict[str, Any]]:
+    """{local_dir}/{date}/ holding *_monitoring.json (compacted) and/or *.jsonl.gz segments"""
+    day_dir = os.path.join(local_dir, day.isoformat())
+    if not os.path.isdir(day_dir):
+        return
+    for root, _dirs, files in os.walk(day_dir):
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            if filename.endswith("_monitoring.json"):
+                with open(path, 'r') as f:
+                    yield from json.load(f)
+            elif filename.endswith(SEGMENT_SUFFIX):
+                with open(path, 'rb') as f:
+                    yield from decode_segment(f.read())
+
+def load_trades(start: date, end: date, local_dir: Optional[str] = None,
+                cache_path: Optional[str] = None, refresh: bool = False) -> List[SweepTrade]:
+    """Load trade paths for [start, end] from the local cache, a local export or GCS"""
+    # The cache is keyed by date range and source, so a --local-dir run never reuses GCS trades (or another dir's)
+    source = os.path.abspath(local_dir) if local_dir else 'gcs'
+    if cache_path and os.path.exists(cache_path) and not refresh:
+        with gzip.open(cache_path, 'rt') as f:
+            cached = json.load(f)
+        if (cached.get('start') == start.isoformat() and cached.get('end') == end.isoformat()
+                and cached.get('source') == source):
+            trades = [SweepTrade.from_dict(t) for t in cached['trades']]
+            log.info(f"📦 Loaded {len(trades)} trades from cache {cache_path}")
+            return trades
+
+    trades: List[SweepTrade] = []
+    for day in _weekdays(start, end):
+        if local_dir:
+            records = dedupe_records(_iter_local_records(local_dir, day))
+        else:
+            records = iter_exit_monitoring_records(day.isoformat())
+        day_trades = build_trades(records)
+        trades.extend(day_trades)
+        if day_trades:
+            log.info(f"📊 {day.isoformat()}: {len(day_trades)} trades, {sum(len(t.ticks) for t in day_trades)} ticks")
+
+    if cache_path:
+        os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+        with gzip.open(cache_path, 'wt') as f:
+            json.dump({'start': start.isoformat(), 'end': end.isoformat(), 'source': source,
+                       'trades': [t.to_dict() for t in trades]}, f, separators=(',', ':'))
+    return trades
+
+# ============================================================================
+# CANDIDATES
+# ============================================================================
+
+def _parse_values(spec: str) -> List[float]:
+    """'a,b,c' -> discrete values; 'lo:hi:n' -> n evenly spaced values"""
+    if ':' in spec:
+        lo, hi, n = spec.split(':')
+        lo, hi, n = float(lo), float(hi), int(n)
+        if n <= 1:
+            return [lo]
+        return [round(lo + (hi - lo) * i / (n - 1), 6) for i in range(n)]
+    return [float(v) for v in spec.split(',') if v.strip()]
+
+def parse_space(param_specs: Sequence[str]) -> Dict[str, List[float]]:
+    """--param name=spec overrides on top of DEFAULT_SWEEP_SPACE"""
+    config_fields = {f.name for f in fields(StealthConfig)}
+    space = dict(DEFAULT_SWEEP_SPACE)
+    for spec in param_specs or []:
+        name, _, values = spec.partition('=')
+        name = name.strip()
+        if name not in config_fields and name not in BAND_KNOBS:
+            raise ValueError(f"Unknown sweep parameter '{name}' (not a StealthConfig field or band knob)")
+        space[name] = _parse_values(values)
+    return space
+
+def grid_candidates(space: Dict[str, List[float]]) -> List[Dict[str, float]]:
+    names = sorted(space)
+    return [dict(zip(names, combo)) for combo in itertools.product(*(space[n] for n in names))]
+
+def random_candidates(space: Dict[str, List[float]], count: int, seed: int = 7) -> List[Dict[str, float]]:
+    """Uniform samples between each parameter's min and max (discrete when only one value)"""
+    rng = random.Random(seed)
+    names = sorted(space)
+    candidates = []
+    for _ in range(count):
+        candidate = {}
+        for name in names:
+            values = space[name]
+            lo, hi = min(values), max(values)
+            candidate[name] = round(rng.uniform(lo, hi), 6) if hi > lo else lo
+        candidates.append(candidate)
+    return candidates
+
+def apply_candidate(base: StealthConfig, params: Dict[str, float]) -> StealthConfig:
+    """StealthConfig with candidate values applied (band knobs scale their whole tier table)"""
+    overrides: Dict[str, Any] = {}
+    for name, value in params.items():
+        if name in BAND_KNOBS:
+            for field_name in BAND_KNOBS[name]:
+                overrides[field_name] = getattr(base, field_name) * value
+        else:
+            overrides[name] = value
+    return replace(base, **overrides)
+
+# ============================================================================
+# EVALUATION (worker side)
+# ============================================================================
+
+_WORKER: Dict[str, Any] = {}
+
+def _init_worker(trades: List[SweepTrade], log_level: int = logging.ERROR) -> None:
+    for name in ("prime_stealth_trailing", "prime_exit_monitoring_collector", "prime_orb_strategy_manager"):
+        logging.getLogger(name).setLevel(log_level)
+    clock = ReplayClock()
+    adapter = ReplayExecutionAdapter(clock)
+    stealth = PrimeStealthTrailingTP(execution_adapter=adapter, mode="SWEEP", clock=clock)
+    stealth.exit_monitor = None
+    _WORKER.update(trades=trades, clock=clock, adapter=adapter, stealth=stealth, base_config=stealth.config)
+
+def _tick_market_data(tick: Tuple) -> Dict[str, Any]:
+    _ts, price, rsi, volume_ratio, atr, volatility, momentum = tick
+    return {
+        'price': price,
+        'rsi': rsi if rsi is not None else 50.0,
+        'atr': atr if atr else price * 0.02,
+        'volume_ratio': volume_ratio if volume_ratio is not None else 1.0,
+        'volatility': volatility if volatility is not None else 0.02,
+        'momentum': momentum if momentum is not None else 0.0,
+    }
+
+async def _simulate_trade(trade: SweepTrade) -> Tuple[float, str, datetime]:
+    """Run one recorded path through stealth trailing; returns (pnl fraction, exit reason, exit time)"""
+    clock: ReplayClock = _WORKER['clock']
+    adapter: ReplayExecutionAdapter = _WORKER['adapter']
+    stealth: PrimeStealthTrailingTP = _WORKER['stealth']
+    entry = trade.entry_price
+    symbol = trade.symbol
+
+    stealth.active_positions.pop(symbol, None)
+    clock.set(trade.entry_time)
+    first = _tick_market_data(trade.ticks[0])
+    await stealth.add_position(PrimePosition(
+        position_id=trade.trade_id,
+        symbol=symbol,
+        side=SignalSide.LONG,
+        quantity=SIM_QUANTITY,
+        entry_price=entry,
+        current_price=entry,
+        take_profit=entry * (1 + stealth.config.base_take_profit_pct),
+        confidence=0.85,
+        entry_time=trade.entry_time
+    ), {
+        'price': entry,
+        'atr': first['atr'],
+        'volume_ratio': 1.0,
+        # Entry bar rebuilt from the recorded entry-bar volatility (drives the opening-bar stop tier)
+        'entry_bar_high': entry * (1 + trade.entry_bar_volatility / 100.0),
+        'entry_bar_low': entry,
+    })
+    fills_before = len(adapter.fills)
+
+    exit_reason = 'end_of_data'
+    exit_price = trade.ticks[-1][1]
+    exit_time = trade.ticks[-1][0]
+    for tick in trade.ticks:
+        clock.set(tick[0])
+        decision = await stealth.update_position(symbol, _tick_market_data(tick), defer_exit=True)
+        if decision and decision.action == "EXIT":
+            exit_reason = decision.exit_reason.value if decision.exit_reason else 'unknown'
+            exit_price = tick[1]
+            exit_time = tick[0]
+            break
+
+    remaining = stealth.active_positions[symbol].quantity if symbol in stealth.active_positions else 0
+    realized = sum(f.pnl for f in adapter.fills[fills_before:]) + remaining * (exit_price - entry)
+    del adapter.fills[fills_before:]
+    await stealth._remove_position(symbol, ExitReason.END_OF_DAY_CLOSE, send_alert=False)
+    return realized / (SIM_QUANTITY * entry), exit_reason, exit_time
+
+def _score(trades: List[SweepTrade], outcomes: List[Tuple[float, str, datetime]]) -> Dict[str, Any]:
+    pnls = [o[0] for o in outcomes]
+    wins = sum(1 for p in pnls if p > 0)
+    peak_total = sum(t.peak_pct for t in trades if t.peak_pct > 0)
+
+    equity = peak_equity = max_drawdown = 0.0
+    for pnl, _reason, _ts in sorted(outcomes, key=lambda o: o[2]):
+        equity += pnl
+        peak_equity = max(peak_equity, equity)
+        max_drawdown = max(max_drawdown, peak_equity - equity)
+
+    total = sum(pnls)
+    reasons = Counter(o[1] for o in outcomes)
+    return {
+        'trades': len(pnls),
+        'total_pnl_pct': round(total * 100, 4),
+        'avg_pnl_pct': round(total / len(pnls) * 100, 4) if pnls else 0.0,
+        'profit_capture_pct': round(total / peak_total * 100, 2) if peak_total else 0.0,
+        'win_rate': round(wins / len(pnls), 4) if pnls else 0.0,
+        'max_drawdown_pct': round(max_drawdown * 100, 4),
+        'pnl_to_drawdown': round(total / max_drawdown, 3) if max_drawdown > 0 else (999.0 if total > 0 else 0.0),
+        'truncated': reasons.get('end_of_data', 0),
+        'exit_reasons': dict(reasons),
+    }
+
+def evaluate_batch(batch: List[Tuple[int, Dict[str, float]]]) -> List[Dict[str, Any]]:
+    """Worker entry point: evaluate a batch of (candidate_id, params)"""
+    stealth: PrimeStealthTrailingTP = _WORKER['stealth']
+    trades: List[SweepTrade] = _WORKER['trades']
+
+    async def run() -> List[Dict[str, Any]]:
+        results = []
+        for candidate_id, params in batch:
+            stealth.config = apply_candidate(_WORKER['base_config'], params)
+            outcomes = [await _simulate_trade(trade) for trade in trades]
+            results.append({'candidate_id': candidate_id, 'params': params, **_score(trades, outcomes)})
+        return results
+
+    return asyncio.run(run())
+
+# ============================================================================
+# DRIVER
+# ============================================================================
+
+def run_sweep(trades: List[SweepTrade], candidates: List[Dict[str, float]],
+              workers: Optional[int] = None, batch_size: Optional[int] = None,
+              rank_by: str = 'total_pnl_pct') -> List[Dict[str, Any]]:
+    """Evaluate candidates across a process pool; returns results ranked best-first"""
+    if rank_by not in RANK_METRICS:
+        raise ValueError(f"rank_by must be one of {RANK_METRICS}")
+    workers = workers or os.cpu_count() or 1
+    indexed = list(enumerate(candidates))
+    # Several batches per worker keeps cores busy when candidate costs differ
+    batch_size = batch_size or max(1, math.ceil(len(indexed) / (workers * 4)))
+    batches = [indexed[i:i + batch_size] for i in range(0, len(indexed), batch_size)]
+
+    started = perf_time.perf_counter()
+    results: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(trades,)) as pool:
+        futures = [pool.submit(evaluate_batch, batch) for batch in batches]
+        for done, future in enumerate(as_completed(futures), 1):
+            results.extend(future.result())
+            if done % max(1, len(futures) // 10) == 0 or done == len(futures):
+                log.info(f"⏱️ Sweep progress: {len(results)}/{len(candidates)} candidates "
+                         f"({perf_time.perf_counter() - started:.1f}s)")
+
+    reverse = rank_by != 'max_drawdown_pct'
+    results.sort(key=lambda r: r[rank_by], reverse=reverse)
+    for rank, result in enumerate(results, 1):
+        result['rank'] = rank
+    return results
+
+def write_results(results: List[Dict[str, Any]], path: str) -> None:
+    """Ranked results table (CSV): rank, metrics, then one column per swept parameter"""
+    param_names = sorted({name for r in results for name in r['params']})
+    metric_names = ['trades', 'total_pnl_pct', 'avg_pnl_pct', 'profit_capture_pct', 'win_rate',
+                    'max_drawdown_pct', 'pnl_to_drawdown', 'truncated']
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['rank', 'candidate_id', 'baseline'] + metric_names + param_names + ['exit_reasons'])
+        for r in results:
+            writer.writerow(
+                [r['rank'], r['candidate_id'], r['candidate_id'] == 0]
+                + [r[m] for m in metric_names]
+                + [r['params'].get(p, '') for p in param_names]
+                + [json.dumps(r['exit_reasons'], sort_keys=True)]
+            )
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sweep StealthConfig exit settings over exit-monitoring tick data")
+    parser.add_argument("--start", required=True, help="First date (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last date (YYYY-MM-DD, default: --start)")
+    parser.add_argument("--local-dir", help="Local exit_monitoring export instead of GCS")
+    parser.add_argument("--cache", default="data/exit_sweep/trades_cache.json.gz", help="Trade path cache")
+    parser.add_argument("--refresh", action="store_true", help="Ignore the cache and reload tick data")
+    parser.add_argument("--param", action="append", default=[],
+                        help="name=a,b,c or name=lo:hi:n (StealthConfig field or band knob); repeatable")
+    parser.add_argument("--random", type=int, default=0, help="Random sample size instead of the full grid")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--rank-by", default="total_pnl_pct", choices=RANK_METRICS)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--output", default=None, help="Results CSV (default data/exit_sweep/<timestamp>_results.csv)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    for name in ("prime_stealth_trailing", "prime_exit_monitoring_collector"):
+        logging.getLogger(name).setLevel(logging.ERROR)
+
+    start = date.fromisoformat(args.start)
+    end = date.fromisoformat(args.end) if args.end else start
+    trades = load_trades(start, end, local_dir=args.local_dir, cache_path=args.cache, refresh=args.refresh)
+    if not trades:
+        log.error(f"❌ No exit-monitoring trades found for {start} → {end}")
+        return
+
+    space = parse_space(args.param)
+    candidates = random_candidates(space, args.random, args.seed) if args.random else grid_candidates(space)
+    candidates.insert(0, {})  # Candidate 0 = current configuration (baseline)
+    log.info(f"🔬 Sweeping {len(candidates)} candidates over {len(trades)} trades "
+             f"({sum(len(t.ticks) for t in trades)} ticks, {start} → {end})")
+
+    started = perf_time.perf_counter()
+    results = run_sweep(trades, candidates, workers=args.workers, rank_by=args.rank_by)
+    output = args.output or f"data/exit_sweep/{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_results.csv"
+    write_results(results, output)
+
+    baseline = next(r for r in results if r['candidate_id'] == 0)
+    log.info(f"✅ Sweep complete in {perf_time.perf_counter() - started:.1f}s → {output}")
+    log.info(f"   Baseline (current config): rank {baseline['rank']}, {args.rank_by}={baseline[args.rank_by]}")
+    for r in results[:args.top]:
+        log.info(f"   #{r['rank']}: {args.rank_by}={r[args.rank_by]} capture={r['profit_capture_pct']}% "
+                 f"win={r['win_rate']:.1%} dd={r['max_drawdown_pct']}% {r['params']}")
+
+if __name__ == "__main__":
+    main()
@@ -397,8 +397,9 @@ class PrimeHealthMonitor:
     def _check_etrade_api_health(self) -> bool:
         """Check ETrade API health"""
         try:
-            from .prime_etrade_trading import PrimeETradeTrading
-            etrade = PrimeETradeTrading()
+            # Rev 00251: Shared client handle - no credential/token/account reload per health check
+            from .prime_etrade_trading import get_etrade_client_hub
+            etrade = get_etrade_client_hub().handle()
             
             # Test API connectivity (lightweight check)
             # This would be a simple API call
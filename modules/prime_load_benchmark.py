@@ -0,0 +1,427 @@
+"""
+Prime Load Benchmark
+
+Load benchmark of the SO batch path against the local E*TRADE stand-in
+(prime_etrade_standin), at several universe sizes.
+
+Rev 00255: Stages (each run on a fresh PrimeTradingSystem):
+- scan:    PrimeTradingSystem._scan_orb_batch_signals in the SO window - batch quotes
+           through PrimeDataManager's E*TRADE provider, ORB analysis, benchmark snapshot,
+           SO pre-staging kicked off in the background
+- process: PrimeTradingSystem._process_orb_signals on the scan's SO signals - enrichment,
+           Red Day filter, ranking, batch sizing, preview/place via execute_batch_orders_async
+- execute: PrimeETradeTrading.execute_batch_orders with one market order per symbol
+
+The E*TRADE clients are the real ones talking HTTP to the stand-in (latency, 429s and
+injected errors included). The harness only supplies what a live morning would have:
+a 7:20 AM PT replay clock, ORB snapshots and pre-fetched 7:00 candles (a
+--signal-fraction of symbols break out), session-cached daily history, and Live mode.
+Client-side limits are the configured ones (ETRADE_ORDER_* for orders; the
+PrimeDataManager quote token bucket only with --client-quote-limits).
+
+Per stage and size: p50/p99 of per-run wall time over --runs runs, throughput
+(symbols or orders per second), and the stand-in's request/429/error counts.
+
+Usage:
+    python -m modules.prime_load_benchmark
+    python -m modules.prime_load_benchmark --sizes 100 500 --runs 5 --stages scan execute
+    python -m modules.prime_load_benchmark --latency-scale 0.5 --error-rate 0.01 --json bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time as perf_time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    from .prime_etrade_standin import ETradeStandIn, add_standin_arguments, build_standin
+    from .prime_replay_engine import PT_TZ, ReplayClock, pt_datetime
+except ImportError:
+    from prime_etrade_standin import ETradeStandIn, add_standin_arguments, build_standin
+    from prime_replay_engine import PT_TZ, ReplayClock, pt_datetime
+
+log = logging.getLogger("prime_load_benchmark")
+
+DEFAULT_SIZES = (100, 500, 1000)
+STAGES = ('scan', 'process', 'execute')
+SCAN_TIME_PT = time(7, 20)  # Inside the 7:15-7:30 AM PT SO window
+
+@dataclass
+class StageResult:
+    """Timings of one stage at one universe size"""
+    stage: str
+    size: int
+    items_per_run: List[int] = field(default_factory=list)  # Symbols scanned / signals processed / orders placed
+    seconds: List[float] = field(default_factory=list)
+    details: Dict[str, Any] = field(default_factory=dict)
+    standin: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def add_standin_stats(self, stats: Dict[str, Any]) -> None:
+        for endpoint, counts in stats['endpoints'].items():
+            totals = self.standin.setdefault(endpoint, {})
+            for key in ('requests', 'ok', 'throttled', 'errors', 'rejected'):
+                totals[key] = totals.get(key, 0) + counts.get(key, 0)
+
+    def summary(self) -> Dict[str, Any]:
+        runs_ms = np.asarray(self.seconds) * 1000
+        total_seconds = sum(self.seconds)
+        outcome = {}
+        if 'failed' in self.details:
+            # Failed orders are not throughput; a run dominated by failures is flagged, not reported as fast
+            attempted = sum(self.details['success']) + sum(self.details['failed'])
+            failure_rate = sum(self.details['failed']) / attempted if attempted else 0.0
+            outcome = {'failure_rate': round(failure_rate, 3), 'mostly_failed': failure_rate > 0.5}
+        return {
+            'stage': self.stage,
+            'size': self.size,
+            'runs': len(self.seconds),
+            'p50_ms': round(float(np.percentile(runs_ms, 50)), 1) if len(runs_ms) else 0.0,
+            'p99_ms': round(float(np.percentile(runs_ms, 99)), 1) if len(runs_ms) else 0.0,
+            'throughput_per_s': round(sum(self.items_per_run) / total_seconds, 1) if total_seconds else 0.0,
+            **self.details,
+            **outcome,
+            'standin': self.standin,
+        }
+
+class LoadBenchmark:
+    """
+    Drives the SO batch path against an ETradeStandIn
+
+    Usage:
+        bench = LoadBenchmark(build_standin())
+        await bench.setup()
+        results = await bench.run([100, 500], STAGES)
+        await bench.close()
+    """
+
+    def __init__(self, standin: ETradeStandIn, runs: int = 3, signal_fraction: float = 0.2,
+                 environment: str = 'prod', client_quote_limits: bool = False, history_days: int = 200):
+        """
+        Args:
+            standin: E*TRADE stand-in (started on its own thread by setup())
+            runs: Timed runs per stage and size
+            signal_fraction: Share of symbols whose ORB fixture breaks out (SO signals)
+            environment: E*TRADE environment of the benchmarked handle
+            client_quote_limits: Keep PrimeDataManager's E*TRADE quote token bucket
+            history_days: Daily bars seeded into the session history cache per symbol
+        """
+        self.standin = standin
+        self.runs = max(1, int(runs))
+        self.signal_fraction = signal_fraction
+        self.environment = environment
+        self.client_quote_limits = client_quote_limits
+        self.history_days = history_days
+        self.trading = None
+        self.pool: Optional[ThreadPoolExecutor] = None
+        self.session_day = datetime.now(PT_TZ).date()
+
+    # ------------------------------------------------------------------
+    # Setup
+    # ------------------------------------------------------------------
+
+    async def setup(self) -> None:
+        from .prime_etrade_trading import ETRADE_CLIENT_HUB_ENABLED, ETRADE_HTTP_POOL_SIZE
+
+        if not ETRADE_CLIENT_HUB_ENABLED:
+            raise RuntimeError("Load benchmark needs ETRADE_CLIENT_HUB_ENABLED=true (components take stand-in handles from the hub)")
+        # The stand-in gets its own thread and loop: the system under test makes blocking E*TRADE
+        # calls on this loop (balance, portfolio), which a same-loop server could not answer
+        base_url = await asyncio.to_thread(self.standin.start_in_thread)
+        self.trading = await asyncio.to_thread(self._connect, base_url)
+        self.pool = ThreadPoolExecutor(max_workers=ETRADE_HTTP_POOL_SIZE, thread_name_prefix="bench-etrade")
+
+    def _connect(self, base_url: str):
+        """Point every hub environment at the stand-in (no Secret Manager) and open the benchmark handle"""
+        from .prime_etrade_trading import get_etrade_client_hub
+
+        hub = get_etrade_client_hub()
+        tokens = {'oauth_token': 'standin', 'oauth_token_secret': 'standin',
+                  'last_used': datetime.now(timezone.utc).isoformat()}
+        for environment in ('prod', 'sandbox'):  # The risk manager takes an ETRADE_MODE handle
+            state = hub.state(environment)
+            with state.load_lock:
+                state.config = {'consumer_key': 'standin', 'consumer_secret': 'standin', 'base_url': base_url}
+                state.tokens = dict(tokens)
+                state.connection_verified_at = None
+                state.loaded = True
+            handle = hub.handle(environment)
+            handle._load_accounts()
+            if not handle.initialize():
+                raise RuntimeError(f"E*TRADE stand-in handle ({environment}) failed to initialize")
+        trading = hub.handle(self.environment)
+        trading.initialize()
+        return trading
+
+    async def close(self) -> None:
+        if self.trading is not None:
+            self.trading.close()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False)
+        await asyncio.to_thread(self.standin.stop_thread)
+
+    def _reset_run(self) -> None:
+        """Fresh stand-in stats/order book and empty client caches, so runs do not share quotes"""
+        self.standin.call(self.standin.reset)
+        shared = self.trading._shared
+        with shared.cache_lock:
+            shared.quote_cache.clear()
+        shared.invalidate_account_caches()
+
+    # ------------------------------------------------------------------
+    # Fixtures
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def universe(size: int) -> List[str]:
+        """Synthetic tickers (no clash with the inverse ETF map or the 0DTE list)"""
+        return [f"ZB{i:04d}" for i in range(size)]
+
+    def _seed_history(self, symbols: List[str]) -> None:
+        """Daily bars ending at the stand-in's previous close, in the session history cache"""
+        for symbol in symbols:
+            if self.trading._get_cached_history(symbol) is not None:
+                continue
+            rng = random.Random(f"{self.standin.market.seed}:{symbol}:daily")
+            close = self.standin.market.peek(symbol)['previousClose']
+            bars = []
+            day = self.session_day
+            for _ in range(self.history_days):
+                day -= timedelta(days=1)
+                while day.weekday() >= 5:
+                    day -= timedelta(days=1)
+                open_price = close * (1 + rng.gauss(0, 0.01))
+                bars.append({
+                    'date': day.strftime("%Y-%m-%d"),
+                    'open': round(open_price, 2),
+                    'high': round(max(open_price, close) * (1 + abs(rng.gauss(0, 0.006))), 2),
+                    'low': round(min(open_price, close) * (1 - abs(rng.gauss(0, 0.006))), 2),
+                    'close': round(close, 2),
+                    'volume': rng.randint(300_000, 6_000_000),
+                })
+                close = max(1.0, close / (1 + rng.gauss(0.0004, 0.018)))
+            bars.reverse()
+            self.trading._store_cached_history(symbol, bars)
+
+    def _orb_fixture(self, symbols: List[str]):
+        """
+        ORB snapshot and pre-fetched 15m candles around the stand-in's current price
+
+        Breakout symbols: ORB high 0.4% below the price, contained 6:45 candle, GREEN 7:00
+        candle closing above the ORB high. The rest have their ORB high 1% above the price.
+        """
+        rng = random.Random(f"{self.standin.market.seed}:orb:{len(symbols)}")
+        snapshot, intraday, colors = {}, {}, {}
+        capture = pt_datetime(self.session_day, time(6, 45)).isoformat()
+        candle_time = {t: PT_TZ.localize(datetime.combine(self.session_day, t)) for t in (time(6, 30), time(6, 45), time(7, 0))}
+        for symbol in symbols:
+            price = self.standin.market.peek(symbol)['lastTrade']
+            breakout = rng.random() < self.signal_fraction
+            orb_high = price * (0.996 if breakout else 1.01)
+            orb_low = orb_high * 0.985
+            snapshot[symbol] = {'orb_high': orb_high, 'orb_low': orb_low, 'orb_open': orb_low * 1.004,
+                                'orb_close': orb_high * 0.998, 'orb_volume': 250_000.0,
+                                'orb_range': orb_high - orb_low, 'orb_is_green': True, 'capture_time': capture}
+            last_open, last_close = (orb_high * 0.999, orb_high * 1.002) if breakout else (orb_high * 0.99, orb_high * 0.985)
+            intraday[symbol] = [
+                {'timestamp': candle_time[time(6, 30)], 'open': orb_low * 1.004, 'high': orb_high, 'low': orb_low,
+                 'close': orb_high * 0.998, 'volume': 250_000},
+                {'timestamp': candle_time[time(6, 45)], 'open': orb_high * 0.998, 'high': orb_high * 0.999,
+                 'low': orb_low * 1.001, 'close': orb_high * 0.995, 'volume': 180_000},
+                {'timestamp': candle_time[time(7, 0)], 'open': last_open, 'high': max(last_open, last_close) * 1.001,
+                 'low': min(last_open, last_close) * 0.999, 'close': last_close, 'volume': 200_000},
+            ]
+            colors[symbol] = "GREEN" if last_close > last_open else "RED"
+        return snapshot, intraday, colors
+
+    def _data_manager(self):
+        """PrimeDataManager whose E*TRADE provider uses the benchmark handle (memory cache tier only)"""
+        from .prime_data_manager import OptimizedETradeDataProvider, PrimeDataManager, RedisCacheManager
+
+        data_manager = PrimeDataManager()
+        data_manager.cache_manager = RedisCacheManager(None)
+        data_manager.etrade_provider = OptimizedETradeDataProvider(
+            None, data_manager.cache_manager, self.pool,
+            token_bucket=data_manager.etrade_token_bucket if self.client_quote_limits else None,
+            usage_callback=data_manager._update_api_usage
+        )
+        data_manager.etrade_provider.etrade_trader = self.trading
+        data_manager._initialized = True
+        return data_manager
+
+    def _system(self, symbols: List[str]):
+        """Live-mode PrimeTradingSystem wired to the stand-in, with the SO window fixture loaded"""
+        from .prime_orb_strategy_manager import PrimeORBStrategyManager
+        from .prime_risk_manager import get_prime_risk_manager
+        from .prime_trading_system import PrimeTradingSystem, SystemMode, TradingConfig
+
+        config = TradingConfig()
+        config.mode = SystemMode.LIVE_MODE
+        system = PrimeTradingSystem(config)
+        system._get_trading_mode = lambda: "LIVE_MODE"
+        system.data_manager = self._data_manager()
+        system.orb_strategy_manager = PrimeORBStrategyManager(
+            system.data_manager, clock=ReplayClock(pt_datetime(self.session_day, SCAN_TIME_PT))
+        )
+        system.risk_manager = get_prime_risk_manager(config.strategy_mode)
+        system.trade_manager = SimpleNamespace(etrade_trading=self.trading)
+        system.dte0_manager = None
+        system._orr_enabled = False
+        system.symbol_list = list(symbols)
+
+        snapshot, intraday, colors = self._orb_fixture(symbols)
+        system.orb_strategy_manager.load_orb_snapshot(snapshot)
+        system._prefetched_intraday = intraday
+        system._prefetched_volume_colors = colors
+        return system
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    async def _scan(self, system) -> List[Dict[str, Any]]:
+        result = await system._scan_orb_batch_signals()
+        return result.get('signals', [])
+
+    @staticmethod
+    async def _settle(system) -> None:
+        """Wait for the background SO pre-staging started by the scan"""
+        task = getattr(system, '_so_prestage_task', None)
+        if task is not None:
+            try:
+                await task
+            except Exception as e:
+                log.warning(f"⚠️ SO pre-staging failed: {e}")
+
+    async def run_scan(self, size: int) -> StageResult:
+        symbols = self.universe(size)
+        self._seed_history(symbols)
+        result = StageResult('scan', size)
+        signals = []
+        for _ in range(self.runs):
+            system = await asyncio.to_thread(self._system, symbols)
+            self._reset_run()
+            start = perf_time.perf_counter()
+            run_signals = await self._scan(system)
+            result.seconds.append(perf_time.perf_counter() - start)
+            result.items_per_run.append(len(system.symbol_list))
+            result.add_standin_stats(self.standin.call(self.standin.get_stats))
+            signals.append(len(run_signals))
+            await self._settle(system)
+        result.details['signals'] = signals
+        return result
+
+    async def run_process(self, size: int) -> StageResult:
+        symbols = self.universe(size)
+        self._seed_history(symbols)
+        result = StageResult('process', size)
+        signals, executed = [], []
+        for _ in range(self.runs):
+            system = await asyncio.to_thread(self._system, symbols)
+            self._reset_run()
+            so_signals = await self._scan(system)
+            await self._settle(system)
+            self.standin.call(self.standin.reset)
+            already_executed = len(getattr(system, '_so_executed_symbols_today', None) or ())
+            start = perf_time.perf_counter()
+            await system._process_orb_signals(so_signals)
+            result.seconds.append(perf_time.perf_counter() - start)
+            result.items_per_run.append(len(so_signals))
+            result.add_standin_stats(self.standin.call(self.standin.get_stats))
+            signals.append(len(so_signals))
+            # The live path keeps executed signals in a local; executed symbols are recorded on the system
+            executed.append(len(getattr(system, '_so_executed_symbols_today', None) or ()) - already_executed)
+        result.details.update({'signals': signals, 'executed': executed})
+        return result
+
+    async def run_execute(self, size: int) -> StageResult:
+        symbols = self.universe(size)
+        orders = [{'symbol': symbol, 'quantity': 1 + i % 5, 'side': 'BUY', 'order_type': 'MARKET',
+                   'signal_type': 'SO', 'confidence': round(0.95 - (i % 100) / 1000, 3)}
+                  for i, symbol in enumerate(symbols)]
+        result = StageResult('execute', size)
+        acks, successes, failures = [], [], []
+        for _ in range(self.runs):
+            self._reset_run()
+            start = perf_time.perf_counter()
+            batch = await asyncio.to_thread(self.trading.execute_batch_orders, orders)
+            result.seconds.append(perf_time.perf_counter() - start)
+            result.items_per_run.append(batch.get('success_count', 0))
+            result.add_standin_stats(self.standin.call(self.standin.get_stats))
+            acks.extend(o['submit_to_ack_ms'] for o in batch.get('executed_orders', []))
+            successes.append(batch.get('success_count', 0))
+            failures.append(batch.get('failed_count', 0))
+        result.details.update({
+            'orders': len(orders),
+            'success': successes,
+            'failed': failures,
+            'ack_p50_ms': round(float(np.percentile(acks, 50)), 1) if acks else 0.0,
+            'ack_p99_ms': round(float(np.percentile(acks, 99)), 1) if acks else 0.0,
+        })
+        return result
+
+    async def run(self, sizes: List[int], stages: List[str]) -> List[StageResult]:
+        runners = {'scan': self.run_scan, 'process': self.run_process, 'execute': self.run_execute}
+        results = []
+        for size in sizes:
+            for stage in stages:
+                log.info(f"⏱️ {stage} @ {size} symbols ({self.runs} runs)...")
+                result = await runners[stage](size)
+                summary = result.summary()
+                log.info(f"   {stage} @ {size}: p50 {summary['p50_ms']:.0f}ms, p99 {summary['p99_ms']:.0f}ms, "
+                         f"{summary['throughput_per_s']:.1f}/s")
+                if summary.get('mostly_failed'):
+                    log.warning(f"⚠️ {stage} @ {size}: {summary['failure_rate']:.0%} of orders failed - "
+                                f"throughput counts successful orders only")
+                results.append(result)
+        return results
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+async def _run_benchmark(args) -> List[StageResult]:
+    standin = build_standin(args.profile, args.latency_scale, args.error_rate, not args.no_throttle, args.seed)
+    bench = LoadBenchmark(standin, runs=args.runs, signal_fraction=args.signal_fraction,
+                          environment=args.environment, client_quote_limits=args.client_quote_limits)
+    await bench.setup()
+    try:
+        return await bench.run(args.sizes, args.stages)
+    finally:
+        await bench.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the SO batch path against the local E*TRADE stand-in")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Universe sizes (symbols)")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per stage and size")
+    parser.add_argument("--signal-fraction", type=float, default=0.2, help="Share of symbols with an SO breakout")
+    parser.add_argument("--environment", default="prod")
+    parser.add_argument("--client-quote-limits", action="store_true",
+                        help="Keep PrimeDataManager's E*TRADE minute/hour/day quote token bucket")
+    parser.add_argument("--json", help="Also write the summaries to this file")
+    parser.add_argument("--verbose", action="store_true")
+    add_standin_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    log.setLevel(logging.INFO)
+
+    summaries = [r.summary() for r in asyncio.run(_run_benchmark(args))]
+    for summary in summaries:
+        print(json.dumps(summary))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(summaries, f, indent=2)
+
+if __name__ == "__main__":
+    main()
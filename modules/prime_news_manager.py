@@ -23,8 +23,6 @@ from dataclasses import dataclass, field
 from collections import defaultdict, deque
 from enum import Enum
 
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-
 from .config_loader import get_config_value
 
 log = logging.getLogger(__name__)
@@ -181,8 +179,8 @@ class PrimeNewsManager:
             rate_limit_per_minute=get_config_value('NEWS_RATE_LIMIT', 60)
         )
         
-        # Sentiment analyzer
-        self.sentiment_analyzer = SentimentIntensityAnalyzer()
+        # Sentiment analyzer (Rev 00250: created on first use - vaderSentiment loads its lexicon at init)
+        self._sentiment_analyzer = None
         
         # Caching
         self.cache = {}
@@ -197,6 +195,14 @@ class PrimeNewsManager:
         
         log.info("Unified News Manager initialized")
     
+    @property
+    def sentiment_analyzer(self):
+        """VADER sentiment analyzer (imported and built on first use)"""
+        if self._sentiment_analyzer is None:
+            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+            self._sentiment_analyzer = SentimentIntensityAnalyzer()
+        return self._sentiment_analyzer
+    
     async def __aenter__(self):
         """Async context manager entry"""
         await self._ensure_session()
@@ -0,0 +1,473 @@
+"""
+Prime OHLCV Store
+
+Shared on-disk daily OHLCV history (Rev 00253).
+
+Each symbol has one file, data/ohlcv/<SYMBOL>.ohlcv. The file is a 32-byte
+header followed by fixed-width little-endian records (date, open, high, low,
+close, volume). Rows are ordered by date, and the date column doubles as the
+index: range reads are a searchsorted on it. Readers memory-map the file, and
+every column is a zero-copy view. Processes reading the same symbol share the
+same page-cache pages.
+
+Only completed sessions are stored. A session is final once
+OHLCV_STORE_FINAL_HOUR_ET has passed on its date. Callers that need today add
+the live quote themselves.
+
+refresh() only downloads what is missing. All symbols that need the same
+start date go into one batched yfinance request:
+- An append starts at the last stored session. That overlapping row is
+  compared with the stored one; if the adjusted close moved (dividend or
+  split), the symbol is rewritten from scratch instead of mixing adjustment
+  bases.
+- A request for older history than the file covers triggers a backfill
+  rewrite.
+- A file's mtime records when it was last checked, so a symbol is fetched at
+  most once per final session across all processes.
+
+With OHLCV_STORE_OFFLINE=true the store never downloads and serves only what
+is on disk (deterministic data for replays and tests).
+"""
+
+import logging
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pytz
+
+try:
+    import fcntl
+except ImportError:  # Non-POSIX: in-process locking only
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+OHLCV_STORE_ENABLED = os.getenv('OHLCV_STORE_ENABLED', 'true').lower() == 'true'
+OHLCV_STORE_DIR = os.getenv('OHLCV_STORE_DIR', 'data/ohlcv')
+OHLCV_STORE_OFFLINE = os.getenv('OHLCV_STORE_OFFLINE', 'false').lower() == 'true'
+OHLCV_STORE_FINAL_HOUR_ET = int(os.getenv('OHLCV_STORE_FINAL_HOUR_ET', '18'))
+OHLCV_STORE_ADJUSTMENT_TOLERANCE = float(os.getenv('OHLCV_STORE_ADJUSTMENT_TOLERANCE', '1e-6'))
+
+ET_TZ = pytz.timezone('America/New_York')
+_EPOCH = date(1970, 1, 1)
+
+RECORD_DTYPE = np.dtype([
+    ('date', '<i8'),  # Days since 1970-01-01
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+])
+_MAGIC = b'OHLCV01\x00'
+_HEADER = struct.Struct('<8sqq8x')  # magic, covered_from (day number requested from the provider), record size
+HEADER_SIZE = _HEADER.size
+
+# (symbols, start, end) -> {symbol: records}; end is exclusive
+Downloader = Callable[[List[str], date, date], Dict[str, np.ndarray]]
+
+
+def day_number(d: date) -> int:
+    return (d - _EPOCH).days
+
+
+def day_date(n: int) -> date:
+    return _EPOCH + timedelta(days=int(n))
+
+
+def last_final_session(now: Optional[datetime] = None) -> date:
+    """Latest calendar date whose session is final (weekends/holidays simply have no rows)"""
+    now_et = (now or datetime.now(pytz.utc)).astimezone(ET_TZ)
+    today = now_et.date()
+    return today if now_et.hour >= OHLCV_STORE_FINAL_HOUR_ET else today - timedelta(days=1)
+
+
+def final_boundary(now: Optional[datetime] = None) -> float:
+    """Epoch time at which the latest final session became final"""
+    session = last_final_session(now)
+    boundary = ET_TZ.localize(datetime(session.year, session.month, session.day, OHLCV_STORE_FINAL_HOUR_ET))
+    return boundary.timestamp()
+
+
+class OHLCVSeries:
+    """Zero-copy view of one symbol's stored sessions (oldest first)"""
+
+    __slots__ = ('symbol', 'records')
+
+    def __init__(self, symbol: str, records: np.ndarray):
+        self.symbol = symbol
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self.records['date']
+
+    @property
+    def opens(self) -> np.ndarray:
+        return self.records['open']
+
+    @property
+    def highs(self) -> np.ndarray:
+        return self.records['high']
+
+    @property
+    def lows(self) -> np.ndarray:
+        return self.records['low']
+
+    @property
+    def closes(self) -> np.ndarray:
+        return self.records['close']
+
+    @property
+    def volumes(self) -> np.ndarray:
+        return self.records['volume']
+
+    @property
+    def last_date(self) -> Optional[date]:
+        return day_date(self.records['date'][-1]) if len(self.records) else None
+
+    def to_bars(self) -> List[Dict[str, Any]]:
+        """Daily bar dicts in the PrimeETradeTrading history format (copies)"""
+        return [{
+            'date': day_date(r[0]).strftime("%Y-%m-%d"),
+            'open': float(r[1]),
+            'high': float(r[2]),
+            'low': float(r[3]),
+            'close': float(r[4]),
+            'volume': int(r[5]),
+        } for r in self.records.tolist()]
+
+    def to_frame(self):
+        """yfinance-shaped DataFrame (Open/High/Low/Close/Volume, DatetimeIndex) - requires pandas"""
+        import pandas as pd
+        index = pd.to_datetime(np.asarray(self.records['date'], dtype='datetime64[D]'))
+        return pd.DataFrame({
+            'Open': self.records['open'],
+            'High': self.records['high'],
+            'Low': self.records['low'],
+            'Close': self.records['close'],
+            'Volume': self.records['volume'],
+        }, index=index)
+
+
+def session_bar(session: date, intraday_bars: Iterable[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Daily bar (to_bars() format) for a session the store does not hold yet, from its intraday bars
+
+    The store only keeps sessions that are final (after OHLCV_STORE_FINAL_HOUR_ET), so callers
+    computing indicators for the current session append this bar to the stored history.
+    """
+    bars = [b for b in intraday_bars if b.get('close')]
+    if not bars:
+        return None
+    return {
+        'date': session.strftime("%Y-%m-%d"),
+        'open': float(bars[0].get('open') or bars[0]['close']),
+        'high': float(max(b.get('high') or b['close'] for b in bars)),
+        'low': float(min(b.get('low') or b['close'] for b in bars)),
+        'close': float(bars[-1]['close']),
+        'volume': int(sum(b.get('volume') or 0 for b in bars)),
+    }
+
+
+def yfinance_downloader(symbols: List[str], start: date, end: date) -> Dict[str, np.ndarray]:
+    """One batched yfinance daily download (auto-adjusted, like the history consumers)"""
+    import yfinance as yf
+    data = yf.download(
+        tickers=' '.join(symbols),
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        interval="1d",
+        auto_adjust=True,
+        group_by='ticker',
+        threads=True,
+        progress=False
+    )
+    results: Dict[str, np.ndarray] = {}
+    if data is None or data.empty:
+        return results
+    for symbol in symbols:
+        try:
+            if hasattr(data.columns, 'levels'):
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                frame = data[symbol]
+            else:
+                frame = data
+            frame = frame.dropna(subset=['Close'])
+            if frame.empty:
+                continue
+            records = np.empty(len(frame), dtype=RECORD_DTYPE)
+            records['date'] = frame.index.values.astype('datetime64[D]').astype(np.int64)
+            records['open'] = frame['Open'].to_numpy(dtype=np.float64)
+            records['high'] = frame['High'].to_numpy(dtype=np.float64)
+            records['low'] = frame['Low'].to_numpy(dtype=np.float64)
+            records['close'] = frame['Close'].to_numpy(dtype=np.float64)
+            records['volume'] = frame['Volume'].fillna(0).to_numpy(dtype=np.float64)
+            results[symbol] = records
+        except Exception as e:
+            log.debug(f"Could not parse OHLCV download for {symbol}: {e}")
+    return results
+
+
+class OHLCVStore:
+    """Memory-mapped per-symbol daily OHLCV files with incremental refresh"""
+
+    def __init__(self, root: str = OHLCV_STORE_DIR, downloader: Optional[Downloader] = None,
+                 offline: bool = OHLCV_STORE_OFFLINE):
+        self.root = Path(root)
+        self.downloader = downloader or yfinance_downloader
+        self.offline = offline
+        self._maps: Dict[str, Tuple[Tuple[int, int], np.ndarray]] = {}
+        self._lock = threading.RLock()
+        self.stats = {'reads': 0, 'remaps': 0, 'downloads': 0, 'appended_rows': 0, 'rewrites': 0, 'symbols_refreshed': 0,
+                      'missing': 0}
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def path(self, symbol: str) -> Path:
+        return self.root / f"{symbol.upper().replace('/', '_')}.ohlcv"
+
+    @contextmanager
+    def _file_lock(self):
+        """Cross-process writer lock (flock on data/ohlcv/.lock) plus the in-process lock"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.root / '.lock', 'a+') as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _read_header(self, path: Path) -> Optional[int]:
+        """covered_from day number, or None if the file is missing or not a store file"""
+        try:
+            with open(path, 'rb') as f:
+                magic, covered_from, record_size = _HEADER.unpack(f.read(HEADER_SIZE))
+        except (OSError, struct.error):
+            return None
+        if magic != _MAGIC or record_size != RECORD_DTYPE.itemsize:
+            return None
+        return covered_from
+
+    def _records(self, symbol: str) -> np.ndarray:
+        """Memory-mapped records for symbol (remapped when the file changed)"""
+        path = self.path(symbol)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        key = (st.st_ino, st.st_size)
+        with self._lock:
+            cached = self._maps.get(symbol)
+            if cached and cached[0] == key:
+                return cached[1]
+            count = (st.st_size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+            if count <= 0 or self._read_header(path) is None:
+                records = np.empty(0, dtype=RECORD_DTYPE)
+            else:
+                records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+            self._maps[symbol] = (key, records)
+            self.stats['remaps'] += 1
+            return records
+
+    def _write(self, symbol: str, records: np.ndarray, covered_from: int):
+        """Replace the symbol file atomically (rewrite/backfill/new symbol)"""
+        path = self.path(symbol)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, covered_from, RECORD_DTYPE.itemsize))
+            f.write(np.ascontiguousarray(records, dtype=RECORD_DTYPE).tobytes())
+        os.replace(tmp, path)
+
+    def _append(self, symbol: str, records: np.ndarray):
+        """Append rows after the last stored session (in place; mapped readers see them on their next read)"""
+        with open(self.path(symbol), 'ab') as f:
+            f.write(np.ascontiguousarray(records, dtype=RECORD_DTYPE).tobytes())
+
+    @staticmethod
+    def _touch(path: Path):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def read(self, symbol: str, days: Optional[int] = None, end: Optional[date] = None) -> OHLCVSeries:
+        """
+        Stored sessions for symbol without touching the network
+
+        Args:
+            days: Keep only the last `days` sessions
+            end: Only sessions strictly before this date (as-of reads for replays)
+        """
+        records = self._records(symbol)
+        if end is not None:
+            records = records[:int(np.searchsorted(records['date'], day_number(end), side='left'))]
+        if days is not None:
+            records = records[-days:] if days > 0 else records[:0]
+        self.stats['reads'] += 1
+        return OHLCVSeries(symbol, records)
+
+    def history(self, symbols: Iterable[str], days: int, end: Optional[date] = None) -> Dict[str, OHLCVSeries]:
+        """Refresh what is missing (one batched download per start date), then read the last `days` sessions before `end`"""
+        symbols = list(dict.fromkeys(s.upper() for s in symbols if s))
+        self.refresh(symbols, days, as_of=end)
+        return {symbol: self.read(symbol, days, end) for symbol in symbols}
+
+    def history_frame(self, symbol: str, days: int, end: Optional[date] = None):
+        """history() for one symbol as a yfinance-shaped DataFrame"""
+        return self.history([symbol], days, end)[symbol.upper()].to_frame()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def is_current(self, symbol: str, now: Optional[datetime] = None) -> bool:
+        """True if the symbol was checked after the latest session became final"""
+        try:
+            return os.stat(self.path(symbol)).st_mtime >= final_boundary(now)
+        except OSError:
+            return False
+
+    def refresh(self, symbols: Iterable[str], days: int, now: Optional[datetime] = None,
+                as_of: Optional[date] = None) -> Dict[str, int]:
+        """
+        Bring the files for symbols up to the latest final session with at least `days` sessions of coverage
+        (before `as_of` when given, so as-of reads for past dates are sized from that date, not from today)
+
+        Returns:
+            {symbol: rows appended or written} for symbols that were downloaded
+        """
+        if self.offline:
+            return {}
+        final = last_final_session(now)
+        end = final + timedelta(days=1)
+        # Calendar span comfortably covering `days` sessions (weekends + holidays)
+        anchor = min(final, as_of - timedelta(days=1)) if as_of is not None else final
+        wanted_from = day_number(anchor - timedelta(days=int(days * 7 / 5) + 15))
+
+        # Group by download start: appends start at the last stored session (overlap row), others at wanted_from
+        groups: Dict[int, List[str]] = {}
+        for symbol in dict.fromkeys(s.upper() for s in symbols if s):
+            covered_from = self._read_header(self.path(symbol))
+            if covered_from is not None and covered_from <= wanted_from and self.is_current(symbol, now):
+                continue
+            records = self._records(symbol)
+            if covered_from is None or covered_from > wanted_from or not len(records):
+                start = wanted_from
+            else:
+                start = int(records['date'][-1])
+            groups.setdefault(start, []).append(symbol)
+
+        changed: Dict[str, int] = {}
+        for start, group in sorted(groups.items()):
+            try:
+                downloaded = self.downloader(group, day_date(start), end)
+                self.stats['downloads'] += 1
+            except Exception as e:
+                log.warning(f"⚠️ OHLCV download failed for {len(group)} symbols from {day_date(start)}: {e}")
+                continue
+            rewrites = []
+            missing = [symbol for symbol in group if downloaded.get(symbol) is None or not len(downloaded[symbol])]
+            if missing:
+                # Throttled/empty responses leave the files untouched, so the symbols are retried next refresh
+                self.stats['missing'] += len(missing)
+                log.warning(f"⚠️ OHLCV download returned no rows for {len(missing)}/{len(group)} symbols from {day_date(start)}: "
+                            f"{', '.join(missing[:5])}")
+            with self._file_lock():
+                for symbol in group:
+                    if symbol in missing:
+                        continue
+                    rows = downloaded[symbol]
+                    rows = rows[rows['date'] <= day_number(final)]
+                    written = self._merge(symbol, start, rows, wanted_from)
+                    if written is None:
+                        rewrites.append(symbol)
+                    elif written:
+                        changed[symbol] = written
+            self.stats['symbols_refreshed'] += len(group) - len(missing) - len(rewrites)
+            if rewrites:
+                # Adjusted history moved (dividend/split) - fetch the full range again
+                log.info(f"📚 OHLCV store: adjustment change for {len(rewrites)} symbols - rewriting {', '.join(rewrites[:5])}")
+                for symbol in rewrites:
+                    self._drop(symbol)
+                changed.update(self.refresh(rewrites, days, now, as_of))
+
+        if changed:
+            log.info(f"📚 OHLCV store: {sum(changed.values())} sessions written for {len(changed)} symbols "
+                     f"({len(groups)} batched downloads)")
+        return changed
+
+    def _merge(self, symbol: str, start: int, rows: np.ndarray, wanted_from: int) -> Optional[int]:
+        """
+        Merge downloaded rows into the symbol file (caller holds the writer lock)
+
+        Only called for symbols the download returned; files of symbols it did not return
+        are neither written nor touched.
+
+        Returns rows written, or None if the overlap row shows an adjustment change (needs a full rewrite).
+        """
+        path = self.path(symbol)
+        covered_from = self._read_header(path)
+        records = self._records(symbol)
+
+        if start == wanted_from or covered_from is None or not len(records):
+            # New symbol or backfill: replace the file
+            self._write(symbol, rows, wanted_from)
+            self.stats['rewrites'] += 1
+            return len(rows)
+
+        last = int(records['date'][-1])
+        overlap = rows[rows['date'] == last]
+        if len(overlap):
+            stored, fresh = float(records['close'][-1]), float(overlap['close'][0])
+            if abs(fresh - stored) > OHLCV_STORE_ADJUSTMENT_TOLERANCE * max(abs(stored), 1.0):
+                return None
+        new_rows = rows[rows['date'] > last]
+        if len(new_rows):
+            self._append(symbol, new_rows)
+            self.stats['appended_rows'] += len(new_rows)
+        self._touch(path)
+        return len(new_rows)
+
+    def _drop(self, symbol: str):
+        with self._lock:
+            self._maps.pop(symbol, None)
+            try:
+                self.path(symbol).unlink()
+            except OSError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'mapped_symbols': len(self._maps), 'root': str(self.root), 'offline': self.offline}
+
+
+_ohlcv_store: Optional[OHLCVStore] = None
+
+
+def get_ohlcv_store() -> OHLCVStore:
+    """Process-wide OHLCV store"""
+    global _ohlcv_store
+    if _ohlcv_store is None:
+        _ohlcv_store = OHLCVStore()
+    return _ohlcv_store
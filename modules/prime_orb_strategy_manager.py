@@ -52,7 +52,7 @@ Revision: 00151
 import asyncio
 import logging
 from datetime import datetime, time, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 import pytz
@@ -158,10 +158,11 @@ class ORBStrategyResult:
 class DailyTradeCounter:
     """Track daily trade executions for SO/ORR limits"""
     
-    def __init__(self):
+    def __init__(self, now_fn: Optional[Callable[[], datetime]] = None):
         self.so_trades = set()  # Symbols traded with SO today
         self.orr_trades = set()  # Symbols traded with ORR today
-        self.current_date = datetime.now().date()
+        self._now = now_fn or datetime.now  # Rev 00242: strategy manager passes its (replayable) PT clock
+        self.current_date = self._now().date()
         log.info("Daily Trade Counter initialized")
     
     def has_traded_so_today(self, symbol: str) -> bool:
@@ -187,7 +188,7 @@ class DailyTradeCounter:
     
     def _check_new_day(self):
         """Reset counters if new day"""
-        today = datetime.now().date()
+        today = self._now().date()
         if today != self.current_date:
             self.reset_daily()
             self.current_date = today
@@ -219,9 +220,10 @@ class PrimeORBStrategyManager:
     inverse ETF selection, daily trade limits, and complete integration.
     """
     
-    def __init__(self, data_manager=None):
+    def __init__(self, data_manager=None, clock=None):
         """Initialize Prime ORB Strategy Manager"""
         self.data_manager = data_manager
+        self.clock = clock  # Rev 00242: Injectable clock (replay engine); None = wall clock
         
         # Core data structures
         self.orb_data = {}  # {symbol: ORBData}
@@ -229,7 +231,7 @@ class PrimeORBStrategyManager:
         self.post_orb_validation = {}  # {symbol: PostORBValidation}
         
         # Daily trade counter
-        self.trade_counter = DailyTradeCounter()
+        self.trade_counter = DailyTradeCounter(now_fn=self._now_pt)
         
         # Duplicate signal prevention (Rev 00163)
         # Rev 00046: FORCE clear on initialization to prevent stale data from persisting across container restarts
@@ -302,11 +304,14 @@ class PrimeORBStrategyManager:
     # TIME WINDOW MANAGEMENT
     # ========================================================================
     
+    def _now_pt(self) -> datetime:
+        """Current timezone-aware Pacific Time (Rev 00242: from the injected clock when replaying)"""
+        now_utc = self.clock.utcnow() if self.clock else datetime.utcnow()
+        return now_utc.replace(tzinfo=pytz.utc).astimezone(PT_TZ)
+    
     def _get_current_time_pt(self) -> time:
         """Get current time in Pacific Time"""
-        now_utc = datetime.utcnow().replace(tzinfo=pytz.utc)
-        now_pt = now_utc.astimezone(PT_TZ)
-        return now_pt.time()
+        return self._now_pt().time()
     
     def _is_within_so_window(self) -> bool:
         """Check if current time is within SO collection window (7:15-7:30 AM PT, 15-minute window)"""
@@ -395,7 +400,7 @@ class PrimeORBStrategyManager:
                 orb_volume=orb_volume,
                 orb_range=orb_range,
                 orb_is_green=orb_is_green,
-                capture_time=datetime.now(PT_TZ)
+                capture_time=self._now_pt()
             )
             
             # Initialize ORR reversal state with capture window violations
@@ -444,13 +449,13 @@ class PrimeORBStrategyManager:
                             timestamp = datetime.fromisoformat(timestamp)
                     except:
                         # If parsing fails, use current time as fallback
-                        timestamp = datetime.now(PT_TZ)
+                        timestamp = self._now_pt()
                 elif isinstance(timestamp, datetime):
                     # Already a datetime object
                     pass
                 else:
                     # Unknown format, use current time
-                    timestamp = datetime.now(PT_TZ)
+                    timestamp = self._now_pt()
                 
                 # Ensure timezone awareness
                 if timestamp.tzinfo is None:
@@ -496,13 +501,13 @@ class PrimeORBStrategyManager:
                             timestamp = datetime.fromisoformat(timestamp)
                     except:
                         # If parsing fails, use current time as fallback
-                        timestamp = datetime.now(PT_TZ)
+                        timestamp = self._now_pt()
                 elif isinstance(timestamp, datetime):
                     # Already a datetime object
                     pass
                 else:
                     # Unknown format, use current time
-                    timestamp = datetime.now(PT_TZ)
+                    timestamp = self._now_pt()
                 
                 # Ensure timezone awareness
                 if timestamp.tzinfo is None:
@@ -571,7 +576,7 @@ class PrimeORBStrategyManager:
                     
                     validation = PostORBValidation(
                         symbol=symbol,
-                        validation_time=datetime.now(PT_TZ),
+                        validation_time=self._now_pt(),
                         post_orb_high=post_orb_high,
                         post_orb_low=post_orb_low,
                         orb_high_breached=breached_high,
@@ -742,7 +747,7 @@ class PrimeORBStrategyManager:
                 # Still track if we go below ORB low for future ORR detection
                 if current_price < orb.orb_low and not state.was_below_orb_low:
                     state.was_below_orb_low = True
-                    state.first_below_timestamp = datetime.now(PT_TZ)
+                    state.first_below_timestamp = self._now_pt()
                     log.debug(f"📉 {symbol}: Price ${current_price:.2f} below ORB low ${orb.orb_low:.2f} (tracking for future ORR)")
                 return None  # Exit early - no signals below/at ORB high
             
@@ -760,7 +765,7 @@ class PrimeORBStrategyManager:
             if not state.was_above_orb_high:
                 # Price just crossed above ORB high for the FIRST TIME
                 state.was_above_orb_high = True
-                state.first_above_timestamp = datetime.now(PT_TZ)
+                state.first_above_timestamp = self._now_pt()
                 
                 # Trigger Bullish ORR (V-shaped reversal confirmed)
                 if not state.bullish_orr_triggered:
@@ -908,7 +913,7 @@ class PrimeORBStrategyManager:
             if not intraday_data:
                 # Create minimal bar from quote
                 intraday_data = [{
-                    'timestamp': datetime.now(),
+                    'timestamp': self._now_pt(),
                     'open': market_data.get('open_price', market_data.get('current_price', 0.0)),
                     'high': market_data.get('high_price', market_data.get('current_price', 0.0)),
                     'low': market_data.get('low_price', market_data.get('current_price', 0.0)),
@@ -981,9 +986,7 @@ class PrimeORBStrategyManager:
                         
                         # Rev 00055: Log signal timing for collection window analysis
                         # Rev 00064: Removed redundant datetime import (already imported at top line 54)
-                        from zoneinfo import ZoneInfo
-                        pt_tz = ZoneInfo('America/Los_Angeles')
-                        now_pt = datetime.now(pt_tz)
+                        now_pt = self._now_pt()
                         signal_time = now_pt.strftime('%H:%M:%S')
                         log.info(f"✅ {trading_symbol} SO: Signal generated at {signal_time} PT, will be executed at 7:30 AM PT")
                         
@@ -1103,7 +1106,7 @@ class PrimeORBStrategyManager:
             if not intraday_data:
                 # Create minimal bar from quote
                 intraday_data = [{
-                    'timestamp': datetime.now(),
+                    'timestamp': self._now_pt(),
                     'open': market_data.get('open_price', market_data.get('current_price', 0.0)),
                     'high': market_data.get('high_price', market_data.get('current_price', 0.0)),
                     'low': market_data.get('low_price', market_data.get('current_price', 0.0)),
@@ -1304,7 +1307,7 @@ class PrimeORBStrategyManager:
                     try:
                         capture_dt = datetime.fromisoformat(capture_time_str.replace("Z", "+00:00"))
                     except ValueError:
-                        capture_dt = datetime.now(PT_TZ)
+                        capture_dt = self._now_pt()
                 orb_data = ORBData(
                     symbol=symbol,
                     orb_high=float(data.get("orb_high", 0.0)),
@@ -1314,7 +1317,7 @@ class PrimeORBStrategyManager:
                     orb_volume=float(data.get("orb_volume", 0.0)),
                     orb_range=float(data.get("orb_range", 0.0)),
                     orb_is_green=bool(data.get("orb_is_green", False)),
-                    capture_time=capture_dt or datetime.now(PT_TZ),
+                    capture_time=capture_dt or self._now_pt(),
                 )
                 self.orb_data[symbol] = orb_data
                 self.reversal_states[symbol] = ORRReversalState(symbol=symbol)
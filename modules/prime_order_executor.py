@@ -0,0 +1,407 @@
+"""
+Prime Order Executor
+
+Async sliding-window order pipeline for E*TRADE batch execution.
+
+Rev 00244: Replaces the burst-and-sleep loop in PrimeETradeTrading.execute_batch_orders
+(a fresh ThreadPoolExecutor per burst of 3, wait for the slowest order, then a blocking
+1.2s sleep). Orders now flow through two stages on the event loop:
+
+    preview (PREVIEW slots) -> place (IN-FLIGHT window) -> ack
+
+- The place window slides: the next order is submitted as soon as any order acks,
+  instead of waiting for a whole burst to finish.
+- Previews run in their own slots, so order N+1 is previewed while order N is placing.
+- Every API call takes a token from an AsyncTokenBucket (calls/second + burst) shared by
+  every executor of the process for the same E*TRADE environment, so concurrent batches
+  (SO and ORR, prestage previews) stay under the order rate limit together.
+- Retries back off with full jitter via asyncio.sleep and never block the loop.
+- Each order keeps one clientOrderId across preview and all place retries, so a retried
+  place after a timeout is rejected as a duplicate rather than filled twice.
+- A place that timed out, failed with 5xx/transport errors or came back as a duplicate is
+  looked up by clientOrderId before it is retried or reported failed; only 429, 5xx and
+  transport errors are retried.
+- Each order reports queue, preview and submit-to-ack latency.
+
+The blocking preview_order/place_order calls run in worker threads (asyncio.to_thread).
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+from .prime_data_manager import AsyncTokenBucket
+from .prime_pipeline_trace import get_pipeline_tracer
+
+log = logging.getLogger(__name__)
+
+ORDER_MAX_IN_FLIGHT = int(os.getenv('ETRADE_ORDER_MAX_IN_FLIGHT', '3'))
+ORDER_PREVIEW_CONCURRENCY = int(os.getenv('ETRADE_ORDER_PREVIEW_CONCURRENCY', '3'))
+ORDER_PREVIEW_ENABLED = os.getenv('ETRADE_ORDER_PREVIEW_ENABLED', 'true').lower() == 'true'
+ORDER_RATE_PER_SECOND = float(os.getenv('ETRADE_ORDER_RATE_PER_SECOND', '5'))
+ORDER_RATE_BURST = int(os.getenv('ETRADE_ORDER_RATE_BURST', '5'))
+ORDER_MAX_RETRIES = int(os.getenv('ETRADE_ORDER_MAX_RETRIES', '3'))
+ORDER_RETRY_BASE_SECONDS = float(os.getenv('ETRADE_ORDER_RETRY_BASE_SECONDS', '0.5'))
+ORDER_RETRY_MAX_SECONDS = float(os.getenv('ETRADE_ORDER_RETRY_MAX_SECONDS', '4'))
+ORDER_TIMEOUT_SECONDS = float(os.getenv('ETRADE_ORDER_TIMEOUT_SECONDS', '30'))
+
+# Transport failures (requests exception text surfaced as {'error': str(e)})
+TRANSPORT_ERRORS = ('timed out', 'timeout', 'connection', 'network', 'max retries exceeded', 'remote end closed')
+DUPLICATE_ORDER_MARKERS = ('1036', 'duplicate')  # E*TRADE duplicate clientOrderId rejection
+
+def is_retriable_error(error_msg: str) -> bool:
+    """Only 429, 5xx and transport errors are retried; any other HTTP status is final"""
+    error_lower = str(error_msg).lower()
+    status = re.search(r'http (\d{3})', error_lower)
+    if status:
+        code = int(status.group(1))
+        return code == 429 or 500 <= code <= 599
+    return any(keyword in error_lower for keyword in TRANSPORT_ERRORS)
+
+def is_duplicate_order_error(response: Any) -> bool:
+    """Place rejected because the clientOrderId was already used (an earlier attempt may have filled)"""
+    if not isinstance(response, dict):
+        return False
+    text = f"{response.get('error', '')} {response.get('message', '')}".lower()
+    return any(marker in text for marker in DUPLICATE_ORDER_MARKERS)
+
+def response_error(response: Any) -> Optional[str]:
+    """Error message from an E*TRADE response dict (None when the call succeeded)"""
+    if isinstance(response, dict) and 'error' in response:
+        return str(response.get('error') or 'Unknown')
+    return None
+
+def extract_preview_id(response: Any) -> Optional[str]:
+    """previewId from a preview response ({'PreviewOrderResponse': {'PreviewIds': [{'previewId': ...}]}})"""
+    if isinstance(response, dict):
+        if 'previewId' in response:
+            return str(response['previewId'])
+        preview_ids = response.get('PreviewIds')
+        if isinstance(preview_ids, list) and preview_ids:
+            return extract_preview_id(preview_ids[0])
+        if isinstance(preview_ids, dict):
+            return extract_preview_id(preview_ids)
+        if 'PreviewOrderResponse' in response:
+            return extract_preview_id(response['PreviewOrderResponse'])
+    return None
+
+_CLIENT_ID_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_client_id_salt = ''.join(random.choice(_CLIENT_ID_ALPHABET) for _ in range(2))  # Tells processes apart
+_client_id_sequence = itertools.count()
+_client_id_lock = threading.Lock()
+
+def _base36(value: int, width: int) -> str:
+    digits = []
+    for _ in range(width):
+        value, remainder = divmod(value, 36)
+        digits.append(_CLIENT_ID_ALPHABET[remainder])
+    return ''.join(reversed(digits))
+
+def make_client_order_id(symbol: str, prefix: str = 'B') -> str:
+    """
+    Unique E*TRADE clientOrderId (alphanumeric, <= 20 chars)
+
+    prefix(1) + epoch seconds(6, base36) + process salt(2) + process sequence(3, base36)
+    + symbol(<= 8). The sequence never repeats within a second (46656 IDs), so two batches
+    placed in the same second cannot share an ID and reconciliation cannot match a retry to
+    an unrelated earlier order.
+    """
+    with _client_id_lock:
+        sequence = next(_client_id_sequence)
+    stamp = _base36(int(time.time()), 6) + _client_id_salt + _base36(sequence, 3)
+    return f"{prefix}{stamp}{''.join(c for c in symbol if c.isalnum())[:8]}"
+
+_order_token_buckets: Dict[tuple, AsyncTokenBucket] = {}
+_order_token_buckets_lock = threading.Lock()
+
+def get_order_token_bucket(environment: str = 'prod', rate_per_second: float = ORDER_RATE_PER_SECOND,
+                           rate_burst: int = ORDER_RATE_BURST) -> AsyncTokenBucket:
+    """Process-wide order rate limiter for one E*TRADE environment (burst refilled at rate_per_second)"""
+    burst = max(1, int(rate_burst))
+    key = (environment, burst, float(rate_per_second))
+    with _order_token_buckets_lock:
+        bucket = _order_token_buckets.get(key)
+        if bucket is None:
+            bucket = _order_token_buckets[key] = AsyncTokenBucket(f'E*TRADE orders ({environment})', {
+                'burst': (burst, burst / max(rate_per_second, 0.01))
+            })
+    return bucket
+
+@dataclass
+class OrderExecution:
+    """Outcome and timings of one order in a batch"""
+    symbol: str
+    quantity: int
+    side: str
+    signal_type: str = 'TRADE'
+    client_order_id: str = ''
+    success: bool = False
+    order_id: Optional[str] = None
+    preview_id: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    reconciled: bool = False       # Placement confirmed by clientOrderId lookup (timeout / duplicate)
+    queue_ms: float = 0.0          # Batch start -> first place submitted
+    preview_ms: float = 0.0        # Preview round trip(s) incl. retries
+    submit_to_ack_ms: float = 0.0  # First place submitted -> ack (incl. retries)
+    total_ms: float = 0.0          # Batch start -> ack
+    order: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def to_result(self) -> Dict[str, Any]:
+        """Legacy execute_batch_orders result dict plus timings"""
+        result = asdict(self)
+        result.pop('order')
+        return result
+
+class AsyncOrderExecutor:
+    """
+    Sliding-window preview/place pipeline over a PrimeETradeTrading instance.
+
+    Only preview_order(...) and place_order(...) are used, so any object with those
+    two methods (e.g. a replay or sandbox adapter) can be driven by this executor.
+    """
+
+    def __init__(self, trading, max_in_flight: int = ORDER_MAX_IN_FLIGHT,
+                 preview_concurrency: int = ORDER_PREVIEW_CONCURRENCY,
+                 preview_enabled: bool = ORDER_PREVIEW_ENABLED,
+                 rate_per_second: float = ORDER_RATE_PER_SECOND, rate_burst: int = ORDER_RATE_BURST,
+                 max_retries: int = ORDER_MAX_RETRIES,
+                 retry_base_seconds: float = ORDER_RETRY_BASE_SECONDS,
+                 retry_max_seconds: float = ORDER_RETRY_MAX_SECONDS,
+                 call_timeout: float = ORDER_TIMEOUT_SECONDS,
+                 token_bucket: Optional[AsyncTokenBucket] = None):
+        self.trading = trading
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.preview_concurrency = max(1, int(preview_concurrency))
+        self.preview_enabled = preview_enabled and hasattr(trading, 'preview_order')
+        self.max_retries = max(1, int(max_retries))
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.call_timeout = call_timeout
+        # Shared per environment: the rate limit holds across concurrent batches
+        self.token_bucket = token_bucket or get_order_token_bucket(
+            str(getattr(trading, 'environment', 'prod')), rate_per_second, rate_burst
+        )
+        # Semaphores wake waiters FIFO, so submission order follows the priority queue
+        self._preview_slots = asyncio.Semaphore(self.preview_concurrency)
+
+    async def _call(self, label: str, execution: OrderExecution, fn: Callable, **kwargs) -> Any:
+        """
+        One rate-limited API call with jittered exponential retries
+
+        Raises the last exception / returns the last error response when retries are exhausted.
+        """
+        for attempt in range(1, self.max_retries + 1):
+            await self.token_bucket.acquire()
+            if label == 'place':
+                execution.attempts += 1
+            try:
+                response = await asyncio.wait_for(asyncio.to_thread(fn, **kwargs), timeout=self.call_timeout)
+                error = response_error(response)
+                if error is not None and label == 'place' and (
+                        is_duplicate_order_error(response) or (is_retriable_error(error) and '429' not in error)):
+                    # A duplicate or a 5xx/transport error may hide a place that went through (429 = rejected)
+                    placed = await self._find_placed(execution)
+                    if placed is not None:
+                        return placed
+                if error is None or not is_retriable_error(error) or attempt >= self.max_retries:
+                    return response
+                reason = error
+            except Exception as e:
+                # asyncio.wait_for abandons the worker thread, whose place may still fill:
+                # look it up before retrying (the retry reuses the clientOrderId)
+                if label == 'place':
+                    placed = await self._find_placed(execution)
+                    if placed is not None:
+                        return placed
+                if attempt >= self.max_retries:
+                    raise
+                reason = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+
+            # Full jitter: uniform(0, min(cap, base * 2^(attempt-1)))
+            backoff = random.uniform(0, min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempt - 1)))
+            log.warning(f"   ⚠️ {label.title()} retry {attempt}/{self.max_retries} for {execution.symbol} in {backoff:.2f}s: {reason}")
+            await asyncio.sleep(backoff)
+
+    async def _find_placed(self, execution: OrderExecution) -> Optional[Dict[str, Any]]:
+        """
+        Look the order up by clientOrderId; a PlaceOrderResponse-shaped dict when E*TRADE has it
+
+        None when the order is not there (or the trading object cannot look orders up).
+        A failed lookup is logged and treated as not found, so the caller's normal retry /
+        failure path applies.
+        """
+        find = getattr(self.trading, 'find_order_by_client_id', None)
+        if find is None:
+            return None
+        await self.token_bucket.acquire()
+        try:
+            found = await asyncio.wait_for(asyncio.to_thread(find, execution.client_order_id), timeout=self.call_timeout)
+        except Exception as e:
+            log.error(f"   ❌ {execution.symbol}: Order lookup for {execution.client_order_id} failed ({e}) - placement unconfirmed, check the account")
+            return None
+        if not found or not found.get('order_id'):
+            return None
+        execution.reconciled = True
+        log.warning(f"   🔎 {execution.symbol}: Placed order found by clientOrderId {execution.client_order_id} "
+                    f"(orderId {found['order_id']}, {found.get('status') or 'status unknown'})")
+        return {'PlaceOrderResponse': {'OrderIds': [{'orderId': found['order_id']}],
+                                       'clientOrderId': execution.client_order_id}}
+
+    async def _preview(self, execution: OrderExecution):
+        """Preview stage; a failed preview falls back to placing without a previewId"""
+        start = time.perf_counter()
+        order = execution.order
+        async with self._preview_slots:
+            try:
+                response = await self._call(
+                    'preview', execution, self.trading.preview_order,
+                    symbol=execution.symbol, quantity=execution.quantity, side=execution.side,
+                    order_type=order.get('order_type', 'MARKET'), price=order.get('price') if order.get('order_type') == 'LIMIT' else None,
+                    client_order_id=execution.client_order_id
+                )
+                error = response_error(response)
+                if error:
+                    log.warning(f"   ⚠️ Preview failed for {execution.symbol}: {error} - placing without previewId")
+                else:
+                    execution.preview_id = extract_preview_id(response)
+            except Exception as e:
+                log.warning(f"   ⚠️ Preview failed for {execution.symbol}: {e} - placing without previewId")
+        execution.preview_ms = (time.perf_counter() - start) * 1000
+        # Rev 00256: Per-order spans under the caller's execution span (slot wait included)
+        get_pipeline_tracer().record('preview', execution.preview_ms, ok=execution.preview_id is not None,
+                                     symbol=execution.symbol)
+
+    async def preview(self, order: Dict[str, Any], client_order_id: str) -> OrderExecution:
+        """
+        Preview one order outside a batch (Rev 00245: SO pre-staging)
+
+        Returns the OrderExecution with preview_id set when E*TRADE accepted the preview.
+        """
+        execution = OrderExecution(
+            symbol=order['symbol'], quantity=order['quantity'], side=order.get('side', 'BUY'),
+            signal_type=order.get('signal_type', 'TRADE'), client_order_id=client_order_id, order=order
+        )
+        await self._preview(execution)
+        return execution
+
+    async def _run_order(self, execution: OrderExecution, batch_start: float, window: asyncio.Semaphore) -> OrderExecution:
+        # Rev 00245: Orders carrying a pre-staged previewId go straight to placement
+        if execution.order.get('preview_id'):
+            execution.preview_id = str(execution.order['preview_id'])
+        elif self.preview_enabled:
+            await self._preview(execution)
+
+        order = execution.order
+        async with window:
+            submitted = time.perf_counter()
+            execution.queue_ms = (submitted - batch_start) * 1000
+            kwargs = {
+                'symbol': execution.symbol, 'quantity': execution.quantity, 'side': execution.side,
+                'order_type': order.get('order_type', 'MARKET'), 'client_order_id': execution.client_order_id
+            }
+            if order.get('order_type') == 'LIMIT' and order.get('price'):
+                kwargs['price'] = order['price']
+            if execution.preview_id:
+                kwargs['preview_ids'] = [execution.preview_id]
+            try:
+                response = await self._call('place', execution, self.trading.place_order, **kwargs)
+                error = response_error(response)
+                if error:
+                    execution.error = error
+                else:
+                    execution.success = True
+                    extract = getattr(self.trading, '_extract_order_id_from_response', None)
+                    execution.order_id = extract(response) if extract else None
+            except Exception as e:
+                execution.error = str(e) or type(e).__name__
+            acked = time.perf_counter()
+            execution.submit_to_ack_ms = (acked - submitted) * 1000
+            execution.total_ms = (acked - batch_start) * 1000
+        get_pipeline_tracer().record('place', execution.submit_to_ack_ms, ok=execution.success,
+                                     symbol=execution.symbol, attempts=execution.attempts, queue_ms=round(execution.queue_ms, 1))
+
+        if execution.success:
+            log.info(f"   ✅ {execution.symbol}: Executed (ack {execution.submit_to_ack_ms:.0f}ms, total {execution.total_ms:.0f}ms)")
+        else:
+            log.warning(f"   ❌ {execution.symbol}: Failed - {execution.error}")
+        return execution
+
+    async def execute(self, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Execute orders highest-confidence first through the preview/place pipeline
+
+        Returns:
+            {success, success_count, failed_count, executed_orders, failed_orders, duration, latency}
+        """
+        sorted_orders = sorted(orders, key=lambda x: x.get('confidence', 0.85), reverse=True)
+
+        log.info("")
+        log.info(f"{'='*80}")
+        log.info(f"🎯 BATCH EXECUTION: {len(orders)} orders")
+        log.info(f"{'='*80}")
+        log.info(f"   In-Flight Window: {self.max_in_flight} | Preview: {'ON' if self.preview_enabled else 'OFF'} ({self.preview_concurrency} slots)")
+        log.info("")
+        log.info("📊 PRIORITIZED ORDER QUEUE:")
+        for i, order in enumerate(sorted_orders[:10], 1):
+            log.info(f"   {i}. {order['symbol']} {order.get('side', 'BUY')} {order.get('quantity', 0)} (conf={order.get('confidence', 0.85):.0%})")
+        if len(sorted_orders) > 10:
+            log.info(f"   ... and {len(sorted_orders) - 10} more")
+        log.info("")
+
+        executions = [
+            OrderExecution(
+                symbol=order['symbol'], quantity=order['quantity'], side=order.get('side', 'BUY'),
+                signal_type=order.get('signal_type', 'TRADE'),
+                client_order_id=order.get('client_order_id') or make_client_order_id(order['symbol']),
+                order=order
+            )
+            for order in sorted_orders
+        ]
+
+        window = asyncio.Semaphore(self.max_in_flight)
+        start = time.perf_counter()
+        await asyncio.gather(*(self._run_order(e, start, window) for e in executions))
+        duration = time.perf_counter() - start
+
+        executed_orders = [e.to_result() for e in executions if e.success]
+        failed_orders = [{'order': e.order, 'error': e.error or 'Unknown', 'attempts': e.attempts}
+                         for e in executions if not e.success]
+        acks = sorted(e.submit_to_ack_ms for e in executions)
+        totals = sorted(e.total_ms for e in executions)
+        latency = {
+            'ack_p50_ms': acks[len(acks) // 2] if acks else 0.0,
+            'ack_max_ms': acks[-1] if acks else 0.0,
+            'first_ack_ms': totals[0] if totals else 0.0,
+            'last_ack_ms': totals[-1] if totals else 0.0,
+        }
+
+        log.info("")
+        log.info(f"{'='*80}")
+        log.info("✅ BATCH EXECUTION COMPLETE")
+        log.info(f"{'='*80}")
+        log.info(f"   Duration: {duration:.1f}s")
+        log.info(f"   Success: {len(executed_orders)}/{len(orders)} ✅")
+        log.info(f"   Failed: {len(failed_orders)}/{len(orders)}")
+        if orders:
+            log.info(f"   Success Rate: {len(executed_orders)/len(orders)*100:.1f}%")
+        log.info(f"   Submit→Ack: p50 {latency['ack_p50_ms']:.0f}ms, max {latency['ack_max_ms']:.0f}ms | "
+                 f"first ack {latency['first_ack_ms']:.0f}ms, last ack {latency['last_ack_ms']:.0f}ms")
+        log.info("")
+
+        return {
+            'success': True,
+            'success_count': len(executed_orders),
+            'failed_count': len(failed_orders),
+            'executed_orders': executed_orders,
+            'failed_orders': failed_orders,
+            'duration': duration,
+            'latency': latency
+        }
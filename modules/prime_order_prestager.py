@@ -0,0 +1,179 @@
+"""
+Prime Order Pre-Stager
+
+Keeps E*TRADE order previews warm for the likely SO orders while signals are still
+being collected (7:15-7:30 AM PT), so batch execution at the SO cutoff only has to
+place orders.
+
+Rev 00245: Each SO scan hands the stager its estimated top-N orders (symbol, quantity,
+price). A symbol is re-previewed only when:
+- it is new to the top-N,
+- its estimated quantity drifts more than SO_PRESTAGE_QTY_TOLERANCE_PCT,
+- its price drifts more than SO_PRESTAGE_PRICE_TOLERANCE_PCT, or
+- its preview is older than SO_PRESTAGE_MAX_AGE_SECONDS.
+
+Symbols that drop out of the top-N are released.
+
+At execution, apply() attaches the staged clientOrderId and previewId to every sized
+signal whose final order still matches its preview. E*TRADE requires the placed
+quantity to equal the previewed quantity. When the final quantity is within the
+quantity tolerance and at least the staged quantity, the order is trimmed to the staged
+quantity, so it never deploys more than sizing allowed. Orders that no longer match
+fall back to an inline preview in AsyncOrderExecutor.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .prime_order_executor import AsyncOrderExecutor, make_client_order_id
+
+log = logging.getLogger(__name__)
+
+PRESTAGE_ENABLED = os.getenv('SO_PRESTAGE_ENABLED', 'true').lower() == 'true'
+PRESTAGE_TOP_N = int(os.getenv('SO_PRESTAGE_TOP_N', '15'))
+PRESTAGE_QTY_TOLERANCE_PCT = float(os.getenv('SO_PRESTAGE_QTY_TOLERANCE_PCT', '2.0'))
+PRESTAGE_PRICE_TOLERANCE_PCT = float(os.getenv('SO_PRESTAGE_PRICE_TOLERANCE_PCT', '0.5'))
+PRESTAGE_MAX_AGE_SECONDS = float(os.getenv('SO_PRESTAGE_MAX_AGE_SECONDS', '300'))
+PRESTAGE_REFRESH_SECONDS = float(os.getenv('SO_PRESTAGE_REFRESH_SECONDS', '60'))
+
+@dataclass
+class StagedPreview:
+    """A previewed order waiting for placement"""
+    symbol: str
+    side: str
+    quantity: int
+    price: float
+    client_order_id: str
+    preview_id: str
+    previewed_at: float  # time.monotonic()
+
+class OrderPreStager:
+    """Warm preview cache for the likely SO orders (keyed by symbol)"""
+
+    def __init__(self, trading, qty_tolerance_pct: float = PRESTAGE_QTY_TOLERANCE_PCT,
+                 price_tolerance_pct: float = PRESTAGE_PRICE_TOLERANCE_PCT,
+                 max_age_seconds: float = PRESTAGE_MAX_AGE_SECONDS,
+                 executor: Optional[AsyncOrderExecutor] = None):
+        self.trading = trading
+        self.qty_tolerance_pct = qty_tolerance_pct
+        self.price_tolerance_pct = price_tolerance_pct
+        self.max_age_seconds = max_age_seconds
+        self.executor = executor
+        self._staged: Dict[str, StagedPreview] = {}
+        self.stats = {'refreshes': 0, 'previews': 0, 're_previews': 0, 'preview_failures': 0,
+                      'hits': 0, 'trimmed': 0, 'misses': 0}
+
+    def __len__(self) -> int:
+        return len(self._staged)
+
+    @staticmethod
+    def _drift_pct(new: float, old: float) -> float:
+        return abs(new - old) / old * 100.0 if old else (0.0 if new == old else 100.0)
+
+    def _is_current(self, staged: Optional[StagedPreview], quantity: int, price: float, now: float) -> bool:
+        """True if the staged preview still covers this estimate"""
+        return (staged is not None
+                and now - staged.previewed_at <= self.max_age_seconds
+                and staged.quantity <= quantity  # Orders are only ever trimmed down to a preview
+                and self._drift_pct(quantity, staged.quantity) <= self.qty_tolerance_pct
+                and self._drift_pct(price, staged.price) <= self.price_tolerance_pct)
+
+    async def refresh(self, candidates: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Bring staged previews in line with the current top-N estimate
+
+        Args:
+            candidates: Estimated orders {symbol, quantity, price, side}, best first
+
+        Returns:
+            {'staged', 'previewed', 'kept', 'released'} counts for this refresh
+        """
+        if self.executor is None:
+            self.executor = AsyncOrderExecutor(self.trading)
+
+        self.stats['refreshes'] += 1
+        now = time.monotonic()
+        wanted = {c['symbol']: c for c in candidates if c.get('quantity', 0) > 0 and c.get('price', 0) > 0}
+
+        released = [symbol for symbol in self._staged if symbol not in wanted]
+        for symbol in released:
+            del self._staged[symbol]
+
+        to_preview = [c for symbol, c in wanted.items()
+                      if not self._is_current(self._staged.get(symbol), int(c['quantity']), float(c['price']), now)]
+        kept = len(wanted) - len(to_preview)
+
+        async def stage(candidate: Dict[str, Any]):
+            symbol = candidate['symbol']
+            client_order_id = make_client_order_id(symbol, prefix='P')
+            order = {'symbol': symbol, 'quantity': int(candidate['quantity']),
+                     'side': candidate.get('side', 'BUY'), 'order_type': 'MARKET'}
+            execution = await self.executor.preview(order, client_order_id)
+            if symbol in self._staged:
+                self.stats['re_previews'] += 1
+            self.stats['previews'] += 1
+            if execution.preview_id:
+                self._staged[symbol] = StagedPreview(
+                    symbol=symbol, side=order['side'], quantity=order['quantity'], price=float(candidate['price']),
+                    client_order_id=client_order_id, preview_id=execution.preview_id, previewed_at=time.monotonic()
+                )
+            else:
+                self.stats['preview_failures'] += 1
+                self._staged.pop(symbol, None)
+
+        if to_preview:
+            await asyncio.gather(*(stage(c) for c in to_preview))
+
+        log.info(f"🧊 SO pre-stage: {len(self._staged)} previews warm "
+                 f"({len(to_preview)} previewed, {kept} kept, {len(released)} released)")
+        return {'staged': len(self._staged), 'previewed': len(to_preview), 'kept': kept, 'released': len(released)}
+
+    def apply(self, orders: List[Dict[str, Any]]) -> int:
+        """
+        Attach staged previews to final sized orders (in place) and release them
+
+        Sets 'client_order_id' and 'preview_id' on each matching order; an order trimmed to
+        the staged quantity gets 'prestage_trimmed_from' with its sized quantity.
+
+        Returns:
+            Number of orders that will skip the inline preview
+        """
+        now = time.monotonic()
+        hits = 0
+        for order in orders:
+            staged = self._staged.pop(order.get('symbol'), None)
+            if staged is None:
+                continue
+            quantity = int(order.get('quantity', 0))
+            price = float(order.get('price', staged.price) or staged.price)
+            usable = (staged.side == order.get('side', 'BUY')
+                      and now - staged.previewed_at <= self.max_age_seconds
+                      and staged.quantity <= quantity
+                      and self._drift_pct(quantity, staged.quantity) <= self.qty_tolerance_pct
+                      and self._drift_pct(price, staged.price) <= self.price_tolerance_pct)
+            if not usable:
+                self.stats['misses'] += 1
+                continue
+            if staged.quantity != quantity:
+                order['prestage_trimmed_from'] = quantity
+                order['quantity'] = staged.quantity
+                if 'position_value' in order and price:
+                    order['position_value'] = staged.quantity * price
+                self.stats['trimmed'] += 1
+            order['client_order_id'] = staged.client_order_id
+            order['preview_id'] = staged.preview_id
+            hits += 1
+        self.stats['hits'] += hits
+        log.info(f"🧊 SO pre-stage: {hits}/{len(orders)} orders use staged previews (one round trip each)")
+        return hits
+
+    def clear(self):
+        """Drop all staged previews (end of SO window / new day)"""
+        self._staged.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'staged': len(self._staged)}
@@ -0,0 +1,364 @@
+"""
+Prime Pipeline Trace
+====================
+
+Span tracing of the signal pipeline with latency histograms for /metrics.
+
+Rev 00256:
+- Spans nest through a ContextVar, so asyncio tasks and asyncio.to_thread calls started
+  inside a span are attributed to it without passing it around:
+
+      scan                          (_scan_orb_batch_signals, one trace per scan)
+        quotes
+      process_signals               (_process_orb_signals, one trace per batch, always a root)
+        enrichment    + enrichment per signal
+        ranking
+        red_day
+        selection
+        sizing
+        execution
+          preview / place per order  (AsyncOrderExecutor)
+      prestage                      (_prestage_so_previews task, always a root)
+        preview per staged order
+
+- span() times a with-block; begin()/end() time stages that span more code than a
+  with-block comfortably covers; record() adds an already-measured duration
+- root=True starts a new trace even inside a span (e.g. a task created during a scan)
+- Every finished span feeds a histogram per (trace, stage, level): trace is the root's
+  name (so prestage previews stay apart from execution previews), level is "run" for a
+  trace root, "batch" for stages and "signal" for per-symbol spans
+- render_prometheus() is served on /metrics in Prometheus text format (no client library)
+- With PIPELINE_TRACE_DIR set, every finished trace is written there as JSON
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import logging
+import math
+import os
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+log = logging.getLogger("prime_pipeline_trace")
+
+PIPELINE_TRACE_ENABLED = os.getenv('PIPELINE_TRACE_ENABLED', 'true').lower() == 'true'
+PIPELINE_TRACE_DIR = os.getenv('PIPELINE_TRACE_DIR', '').strip()
+PIPELINE_TRACE_BUCKETS = tuple(
+    float(b) for b in os.getenv('PIPELINE_TRACE_BUCKETS', '0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10,30,60').split(',')
+    if b.strip()
+)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_current_span: ContextVar[Optional['Span']] = ContextVar('prime_pipeline_span', default=None)
+
+
+class Span:
+    """One timed stage of a trace"""
+
+    def __init__(self, trace: 'Trace', name: str, level: str, parent: Optional['Span'],
+                 attrs: Dict[str, Any], start: Optional[float] = None):
+        self.trace = trace
+        self.span_id = next(trace._ids)
+        self.name = name
+        self.level = level
+        self.parent = parent
+        self.attrs = attrs
+        self.start = time.perf_counter() if start is None else start
+        self.duration_ms: Optional[float] = None
+        self.ok = True
+
+    def set(self, **attrs):
+        """Attach attributes (counts, symbol, ...) to the span"""
+        self.attrs.update(attrs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'span_id': self.span_id,
+            'parent_id': self.parent.span_id if self.parent else None,
+            'name': self.name,
+            'level': self.level,
+            'start_ms': round((self.start - self.trace.root.start) * 1000, 2),
+            'duration_ms': round(self.duration_ms, 2) if self.duration_ms is not None else None,
+            'ok': self.ok,
+            'attrs': self.attrs,
+        }
+
+
+class Trace:
+    """Spans of one pipeline run (a trace root and everything started under it)"""
+
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.started_at = datetime.now(timezone.utc)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()  # Spans may finish in worker threads
+        self.spans: List[Span] = []
+        self.open: Dict[str, Span] = {}  # begin()/end() stages by name
+        self.root = Span(self, name, 'run', None, attrs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        return {
+            'trace_id': self.trace_id,
+            'name': self.root.name,
+            'started_at': self.started_at.isoformat(),
+            **self.root.to_dict(),
+            'spans': [s.to_dict() for s in spans if s is not self.root],
+        }
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (seconds)"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+def _label_value(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return str(int(value)) if value.is_integer() and abs(value) < 1e15 else repr(value)
+
+
+class PipelineTracer:
+    """Span recorder and histogram registry for the signal pipeline"""
+
+    def __init__(self, enabled: bool = PIPELINE_TRACE_ENABLED, trace_dir: str = PIPELINE_TRACE_DIR,
+                 buckets: Tuple[float, ...] = PIPELINE_TRACE_BUCKETS):
+        self.enabled = enabled
+        self.trace_dir = trace_dir
+        self.buckets = tuple(sorted(buckets))
+        self.histograms: Dict[Tuple[str, str, str], Histogram] = {}
+        self.errors: Dict[Tuple[str, str, str], int] = {}
+        self.traces: Dict[str, int] = {}
+        self.last_trace: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Spans
+    # ------------------------------------------------------------------
+
+    def _start(self, name: str, level: str, attrs: Dict[str, Any], start: Optional[float] = None,
+               root: bool = False) -> Span:
+        parent = None if root else _current_span.get()
+        if parent is None:
+            return Trace(name, attrs).root
+        return Span(parent.trace, name, level, parent, attrs, start)
+
+    def _finish(self, span: Span, ok: bool = True, skip_empty: bool = False):
+        if span.duration_ms is not None:
+            return
+        span.duration_ms = (time.perf_counter() - span.start) * 1000
+        span.ok = span.ok and ok
+        trace = span.trace
+        if span is trace.root:
+            for stage in list(trace.open.values()):  # Stages left open by an early return
+                stage.set(closed_by_parent=True)
+                self._finish(stage)
+            trace.open.clear()
+            with trace._lock:
+                empty = not trace.spans
+            if skip_empty and empty:
+                return  # e.g. a scan outside the ORB windows
+            self._observe(span)
+            self._complete(trace)
+            return
+        with trace._lock:
+            trace.spans.append(span)
+        self._observe(span)
+
+    def _observe(self, span: Span):
+        key = (span.trace.root.name, span.name, span.level)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(span.duration_ms / 1000)
+            if not span.ok:
+                self.errors[key] = self.errors.get(key, 0) + 1
+
+    @contextmanager
+    def span(self, name: str, level: str = 'batch', skip_empty: bool = False, root: bool = False,
+             **attrs) -> Iterator[Optional[Span]]:
+        """
+        Time a with-block as a span (a trace root when no span is current)
+
+        Args:
+            skip_empty: As a trace root, drop the trace when no spans were started under it
+            root: Start a new trace even if a span is current
+        """
+        if not self.enabled:
+            yield None
+            return
+        span = self._start(name, level, attrs, root=root)
+        token = _current_span.set(span)
+        ok = False
+        try:
+            yield span
+            ok = True
+        finally:
+            _current_span.reset(token)
+            self._finish(span, ok, skip_empty)
+
+    def begin(self, name: str, level: str = 'batch', **attrs) -> Optional[Span]:
+        """Start a stage span under the current span; closed by end(name) or with its trace"""
+        if not self.enabled or _current_span.get() is None:
+            return None
+        span = self._start(name, level, attrs)
+        span.trace.open[name] = span
+        _current_span.set(span)
+        return span
+
+    def end(self, name: str, ok: bool = True, **attrs):
+        """Finish the stage started by begin(name) and make its parent current again"""
+        current = _current_span.get()
+        if current is None:
+            return
+        span = current.trace.open.pop(name, None)
+        if span is None:
+            return
+        span.set(**attrs)
+        self._finish(span, ok)
+        if current is span:
+            _current_span.set(span.parent)
+
+    def record(self, name: str, duration_ms: float, level: str = 'signal', ok: bool = True, **attrs):
+        """Add a span measured elsewhere (ends now) under the current span"""
+        if not self.enabled or _current_span.get() is None:
+            return
+        span = self._start(name, level, attrs, start=time.perf_counter() - duration_ms / 1000)
+        span.duration_ms = duration_ms
+        span.ok = ok
+        with span.trace._lock:
+            span.trace.spans.append(span)
+        self._observe(span)
+
+    # ------------------------------------------------------------------
+    # Finished traces
+    # ------------------------------------------------------------------
+
+    def _complete(self, trace: Trace):
+        summary = trace.to_dict()
+        with self._lock:
+            self.traces[trace.root.name] = self.traces.get(trace.root.name, 0) + 1
+            self.last_trace[trace.root.name] = summary
+
+        stages = ", ".join(f"{s['name']} {s['duration_ms']:.0f}ms" for s in summary['spans'] if s['level'] == 'batch')
+        log.info(f"⏱️ {trace.root.name} trace {trace.root.duration_ms:.0f}ms: {stages or 'no stages'}")
+
+        if self.trace_dir:
+            path = os.path.join(self.trace_dir, f"{trace.started_at:%Y%m%d_%H%M%S}_{trace.root.name}_{trace.trace_id}.json")
+            try:
+                os.makedirs(self.trace_dir, exist_ok=True)
+                with open(path, 'w') as f:
+                    json.dump(summary, f, indent=2, default=str)
+            except OSError as e:
+                log.warning(f"⚠️ Could not write pipeline trace {path}: {e}")
+
+    # ------------------------------------------------------------------
+    # Prometheus exposition
+    # ------------------------------------------------------------------
+
+    def render_prometheus(self, gauges: Optional[Dict[str, float]] = None) -> str:
+        """
+        Histograms, error counters and trace counts in Prometheus text format
+
+        Args:
+            gauges: Extra gauges (metric name -> value) appended to the output
+        """
+        with self._lock:
+            histograms = {key: (list(h.counts), h.sum, h.count) for key, h in self.histograms.items()}
+            errors = dict(self.errors)
+            traces = dict(self.traces)
+
+        lines = [
+            "# HELP prime_pipeline_span_duration_seconds Signal pipeline span duration by trace, stage and level",
+            "# TYPE prime_pipeline_span_duration_seconds histogram",
+        ]
+        for (trace, stage, level), (counts, total, count) in sorted(histograms.items()):
+            labels = f'trace="{_label_value(trace)}",stage="{_label_value(stage)}",level="{_label_value(level)}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f'prime_pipeline_span_duration_seconds_bucket{{{labels},le="{_format_value(bound)}"}} {cumulative}')
+            lines.append(f'prime_pipeline_span_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'prime_pipeline_span_duration_seconds_sum{{{labels}}} {total!r}')
+            lines.append(f'prime_pipeline_span_duration_seconds_count{{{labels}}} {count}')
+
+        lines.append("# HELP prime_pipeline_span_errors_total Spans that raised or reported failure")
+        lines.append("# TYPE prime_pipeline_span_errors_total counter")
+        for (trace, stage, level), count in sorted(errors.items()):
+            lines.append(f'prime_pipeline_span_errors_total{{trace="{_label_value(trace)}",stage="{_label_value(stage)}",'
+                         f'level="{_label_value(level)}"}} {count}')
+
+        lines.append("# HELP prime_pipeline_traces_total Finished pipeline traces by root")
+        lines.append("# TYPE prime_pipeline_traces_total counter")
+        for name, count in sorted(traces.items()):
+            lines.append(f'prime_pipeline_traces_total{{name="{_label_value(name)}"}} {count}')
+
+        for name, value in sorted((gauges or {}).items()):
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def metrics_to_gauges(metrics: Dict[str, Any], prefix: str = 'prime') -> Dict[str, float]:
+    """Flatten numeric/bool leaves of a nested metrics dict into gauge names (prefix_section_key)"""
+    gauges = {}
+    for key, value in metrics.items():
+        name = f"{prefix}_{''.join(c if c.isalnum() else '_' for c in str(key)).lower()}"
+        if isinstance(value, dict):
+            gauges.update(metrics_to_gauges(value, name))
+        elif isinstance(value, bool):
+            gauges[name] = 1.0 if value else 0.0
+        elif isinstance(value, (int, float)):
+            gauges[name] = float(value)
+    return gauges
+
+
+def traced(name: str, skip_empty: bool = False, root: bool = False):
+    """Run an async method inside span(name) (a trace root when called outside a span, or with root=True)"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with get_pipeline_tracer().span(name, skip_empty=skip_empty, root=root):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_pipeline_tracer: Optional[PipelineTracer] = None
+
+
+def get_pipeline_tracer() -> PipelineTracer:
+    """Process-wide pipeline tracer"""
+    global _pipeline_tracer
+    if _pipeline_tracer is None:
+        _pipeline_tracer = PipelineTracer()
+    return _pipeline_tracer
@@ -0,0 +1,737 @@
+"""
+Prime Replay Engine
+
+Offline day replay of the ORB pipeline from recorded or synthetic 1-minute bars.
+
+Rev 00242: Drives the real PrimeORBStrategyManager and PrimeStealthTrailingTP
+with an injected ReplayClock instead of wall time, so a full session (ORB
+capture, SO scan, ranking, sizing, stealth trailing and EOD close) runs as fast
+as the CPU allows. Used to validate exit-setting changes (e.g. the Rev 00196
+breakeven/trailing numbers) across many days instead of a handful of live ones.
+
+Bar sources:
+- RecordedBarSource: {root}/{YYYY-MM-DD}/{SYMBOL}.csv|.json with
+  timestamp, open, high, low, close, volume (timestamp = bar start; ISO string
+  or epoch seconds; naive timestamps are UTC)
+- SyntheticBarSource: seeded random walk (deterministic per seed/date/symbol)
+
+Intrabar path: each 1-minute bar is fed to stealth trailing as two ticks - the
+adverse extreme first (low of a green bar, high of a red bar) at +30s, then
+the close at +60s - so stops are tested before the bar's close is credited.
+
+Usage:
+    python -m modules.prime_replay_engine --synthetic --days 5
+    python -m modules.prime_replay_engine --bars-dir data/replay_bars --start 2025-11-03 --end 2025-11-07
+"""
+
+import argparse
+import asyncio
+import bisect
+import csv
+import json
+import logging
+import os
+import random
+import time as perf_time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pytz
+
+try:
+    from .config_loader import get_config_value
+    from .prime_indicator_engine import rsi as rsi_series
+    from .prime_models import PrimePosition, SignalSide
+    from .prime_orb_strategy_manager import PrimeORBStrategyManager, SignalType
+    from .prime_so_ranking import calculate_so_priority_score
+    from .prime_stealth_trailing_tp import (
+        ExecutionAdapter, ExitReason, PositionState, PrimeStealthTrailingTP
+    )
+except ImportError:
+    from config_loader import get_config_value
+    from prime_indicator_engine import rsi as rsi_series
+    from prime_models import PrimePosition, SignalSide
+    from prime_orb_strategy_manager import PrimeORBStrategyManager, SignalType
+    from prime_so_ranking import calculate_so_priority_score
+    from prime_stealth_trailing_tp import (
+        ExecutionAdapter, ExitReason, PositionState, PrimeStealthTrailingTP
+    )
+
+log = logging.getLogger("prime_replay_engine")
+
+PT_TZ = pytz.timezone('America/Los_Angeles')
+
+SESSION_OPEN_PT = time(6, 30)
+SESSION_CLOSE_PT = time(13, 0)
+EOD_CLOSE_PT = time(12, 55)  # Matches the live EOD close (Rev 20251020)
+
+# Rev 00095 adaptive selection constants (see PrimeTradingSystem._process_orb_signals)
+PROGRESSIVE_TARGETS = [15, 12, 10, 8]
+EXPENSE_THRESHOLD_MULTIPLIER = 3.0
+EXPENSE_RATIO_LIMIT = 0.30
+TOP_PROTECTED_MAX_ACCOUNT_PCT = 0.60
+
+# ============================================================================
+# CLOCK
+# ============================================================================
+
+class ReplayClock:
+    """Injectable clock: utcnow() returns naive UTC like datetime.utcnow()"""
+
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = _to_naive_utc(start) if start else datetime(1970, 1, 1)
+
+    def utcnow(self) -> datetime:
+        return self._now
+
+    def set(self, when: datetime) -> None:
+        self._now = _to_naive_utc(when)
+
+    def advance(self, seconds: float) -> None:
+        self._now += timedelta(seconds=seconds)
+
+    def now_pt(self) -> datetime:
+        return pytz.utc.localize(self._now).astimezone(PT_TZ)
+
+def _to_naive_utc(when: datetime) -> datetime:
+    if when.tzinfo is not None:
+        return when.astimezone(pytz.utc).replace(tzinfo=None)
+    return when
+
+def pt_datetime(day: date, at: time) -> datetime:
+    """Timezone-aware UTC datetime for a Pacific wall-clock time on `day`"""
+    return PT_TZ.localize(datetime.combine(day, at)).astimezone(pytz.utc)
+
+# ============================================================================
+# BAR SOURCES
+# ============================================================================
+
+def _parse_timestamp(value: Any) -> datetime:
+    """ISO string or epoch seconds -> aware UTC datetime (naive = UTC)"""
+    if isinstance(value, datetime):
+        ts = value
+    elif isinstance(value, (int, float)) or (isinstance(value, str) and value.replace('.', '', 1).isdigit()):
+        return datetime.fromtimestamp(float(value), tz=pytz.utc)
+    else:
+        ts = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    if ts.tzinfo is None:
+        return pytz.utc.localize(ts)
+    return ts.astimezone(pytz.utc)
+
+def _normalize_bar(raw: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'timestamp': _parse_timestamp(raw.get('timestamp', raw.get('datetime'))),
+        'open': float(raw['open']),
+        'high': float(raw['high']),
+        'low': float(raw['low']),
+        'close': float(raw['close']),
+        'volume': float(raw.get('volume', 0) or 0),
+    }
+
+class RecordedBarSource:
+    """Recorded 1-minute bars laid out as {root}/{YYYY-MM-DD}/{SYMBOL}.csv|.json"""
+
+    def __init__(self, root_dir: str, symbols: Optional[List[str]] = None):
+        self.root_dir = root_dir
+        self.symbols = [s.upper() for s in symbols] if symbols else None
+
+    def dates(self, start: Optional[date] = None, end: Optional[date] = None) -> List[date]:
+        days = []
+        if not os.path.isdir(self.root_dir):
+            return days
+        for name in sorted(os.listdir(self.root_dir)):
+            try:
+                day = date.fromisoformat(name)
+            except ValueError:
+                continue
+            if (start and day < start) or (end and day > end):
+                continue
+            days.append(day)
+        return days
+
+    def load_day(self, day: date) -> Dict[str, List[Dict[str, Any]]]:
+        day_dir = os.path.join(self.root_dir, day.isoformat())
+        bars_by_symbol: Dict[str, List[Dict[str, Any]]] = {}
+        if not os.path.isdir(day_dir):
+            return bars_by_symbol
+        for filename in sorted(os.listdir(day_dir)):
+            symbol, ext = os.path.splitext(filename)
+            symbol = symbol.upper()
+            if self.symbols and symbol not in self.symbols:
+                continue
+            path = os.path.join(day_dir, filename)
+            try:
+                if ext == '.csv':
+                    with open(path, 'r', newline='') as f:
+                        rows = list(csv.DictReader(f))
+                elif ext == '.json':
+                    with open(path, 'r') as f:
+                        rows = json.load(f)
+                else:
+                    continue
+                bars = sorted((_normalize_bar(r) for r in rows), key=lambda b: b['timestamp'])
+                if bars:
+                    bars_by_symbol[symbol] = bars
+            except Exception as e:
+                log.warning(f"⚠️ Skipping recorded bars {path}: {e}")
+        return bars_by_symbol
+
+class SyntheticBarSource:
+    """Seeded random-walk 1-minute bars (06:30-13:00 PT) for smoke runs and benchmarks"""
+
+    def __init__(self, symbols: List[str], seed: int = 7, start_price: float = 40.0,
+                 volatility_pct: float = 0.25):
+        self.symbols = [s.upper() for s in symbols]
+        self.seed = seed
+        self.start_price = start_price
+        self.volatility_pct = volatility_pct
+
+    def dates(self, start: Optional[date] = None, end: Optional[date] = None, days: int = 5) -> List[date]:
+        """Weekdays from `start` (default: the last `days` weekdays before today)"""
+        if start is None:
+            start = date.today() - timedelta(days=int(days * 7 / 5) + 3)
+        result = []
+        day = start
+        while len(result) < days and (end is None or day <= end):
+            if day.weekday() < 5:
+                result.append(day)
+            day += timedelta(days=1)
+        return result
+
+    def load_day(self, day: date) -> Dict[str, List[Dict[str, Any]]]:
+        session_start = pt_datetime(day, SESSION_OPEN_PT)
+        minutes = int((datetime.combine(day, SESSION_CLOSE_PT) - datetime.combine(day, SESSION_OPEN_PT)).total_seconds() // 60)
+        bars_by_symbol = {}
+        for symbol in self.symbols:
+            rng = random.Random(f"{self.seed}:{day.isoformat()}:{symbol}")
+            price = self.start_price * rng.uniform(0.5, 2.0)
+            drift = rng.gauss(0.0, self.volatility_pct / 40.0) / 100.0
+            sigma = self.volatility_pct / 100.0
+            bars = []
+            for i in range(minutes):
+                open_price = price
+                path = [open_price]
+                for _ in range(4):
+                    path.append(path[-1] * (1.0 + drift / 4.0 + rng.gauss(0.0, sigma / 2.0)))
+                close_price = path[-1]
+                # Heavier volume at the open and into the close
+                u_shape = 1.0 + 2.0 * ((i - minutes / 2.0) / (minutes / 2.0)) ** 2
+                bars.append({
+                    'timestamp': session_start + timedelta(minutes=i),
+                    'open': round(open_price, 4),
+                    'high': round(max(path), 4),
+                    'low': round(min(path), 4),
+                    'close': round(close_price, 4),
+                    'volume': float(int(rng.uniform(2000, 8000) * u_shape)),
+                })
+                price = close_price
+            bars_by_symbol[symbol] = bars
+        return bars_by_symbol
+
+def aggregate_bars(bars: List[Dict[str, Any]], minutes: int = 15) -> List[Dict[str, Any]]:
+    """
+    Aggregate 1-minute bars into `minutes` candles aligned to the PT session open.
+
+    Each candle carries 'end' (aware UTC); callers use only candles whose end
+    has passed (the live ORB logic reads completed 15-minute candles).
+    """
+    candles: List[Dict[str, Any]] = []
+    current = None
+    current_key = None
+    for bar in bars:
+        pt = bar['timestamp'].astimezone(PT_TZ)
+        minute_of_day = pt.hour * 60 + pt.minute
+        bucket_start = minute_of_day - (minute_of_day - (SESSION_OPEN_PT.hour * 60 + SESSION_OPEN_PT.minute)) % minutes
+        key = (pt.date(), bucket_start)
+        if key != current_key:
+            if current:
+                candles.append(current)
+            start = bar['timestamp'] - timedelta(minutes=minute_of_day - bucket_start, seconds=pt.second)
+            current = {
+                'timestamp': start,
+                'end': start + timedelta(minutes=minutes),
+                'open': bar['open'],
+                'high': bar['high'],
+                'low': bar['low'],
+                'close': bar['close'],
+                'volume': bar['volume'],
+            }
+            current_key = key
+        else:
+            current['high'] = max(current['high'], bar['high'])
+            current['low'] = min(current['low'], bar['low'])
+            current['close'] = bar['close']
+            current['volume'] += bar['volume']
+    if current:
+        candles.append(current)
+    return candles
+
+# ============================================================================
+# EXECUTION
+# ============================================================================
+
+@dataclass
+class ReplayFill:
+    """One simulated exit fill (full close or scale-out)"""
+    symbol: str
+    quantity: int
+    entry_price: float
+    exit_price: float
+    pnl: float
+    pnl_pct: float
+    reason: str
+    entry_time: datetime
+    exit_time: datetime
+    partial: bool = False
+
+class ReplayExecutionAdapter(ExecutionAdapter):
+    """Fills exits at the stealth tick price and records them (no alerts, no broker)"""
+
+    def __init__(self, clock: ReplayClock):
+        self.clock = clock
+        self.fills: List[ReplayFill] = []
+
+    def _record(self, position: PositionState, qty: int, reason: str, partial: bool) -> None:
+        pnl = (position.current_price - position.entry_price) * qty
+        pnl_pct = (position.current_price - position.entry_price) / position.entry_price if position.entry_price else 0.0
+        self.fills.append(ReplayFill(
+            symbol=position.symbol,
+            quantity=qty,
+            entry_price=position.entry_price,
+            exit_price=position.current_price,
+            pnl=pnl,
+            pnl_pct=pnl_pct,
+            reason=reason,
+            entry_time=position.entry_time,
+            exit_time=self.clock.utcnow(),
+            partial=partial
+        ))
+
+    async def close_position(self, position: PositionState, reason: str) -> None:
+        self._record(position, position.quantity, reason, partial=False)
+
+    async def scale_out(self, position: PositionState, qty: int, reason: str) -> None:
+        self._record(position, qty, reason, partial=True)
+
+    async def close_positions_batch(self, positions: List[PositionState], reason: str) -> bool:
+        for position in positions:
+            self._record(position, position.quantity, reason, partial=False)
+        return True  # Nothing to alert in replay
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+@dataclass
+class ReplayDayResult:
+    """Outcome of one replayed session"""
+    day: date
+    symbols: int
+    so_signals: int
+    trades: List[Dict[str, Any]] = field(default_factory=list)
+    fills: List[ReplayFill] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def total_pnl(self) -> float:
+        return sum(f.pnl for f in self.fills)
+
+    def summary(self) -> Dict[str, Any]:
+        closes = [f for f in self.fills if not f.partial]
+        wins = sum(1 for f in closes if f.pnl > 0)
+        return {
+            'date': self.day.isoformat(),
+            'symbols': self.symbols,
+            'so_signals': self.so_signals,
+            'trades': len(self.trades),
+            'total_pnl': round(self.total_pnl, 2),
+            'win_rate': round(wins / len(closes), 3) if closes else 0.0,
+            'exit_reasons': dict(Counter(f.reason for f in closes)),
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+        }
+
+class ReplayEngine:
+    """
+    Replays trading days through the live ORB strategy and stealth trailing classes.
+
+    One PrimeORBStrategyManager and one PrimeStealthTrailingTP are shared across
+    days (reset_daily between sessions), both reading the ReplayClock.
+    """
+
+    def __init__(self, bar_source: Any, account_value: float = 1000.0,
+                 so_capital_pct: Optional[float] = None, orr_capital_pct: Optional[float] = None,
+                 benchmark_symbol: str = 'SPY', quiet: bool = True):
+        self.bar_source = bar_source
+        self.account_value = account_value
+        self.so_capital_pct = float(so_capital_pct if so_capital_pct is not None else get_config_value("SO_CAPITAL_PCT", 90.0))
+        self.orr_capital_pct = float(orr_capital_pct if orr_capital_pct is not None else get_config_value("ORR_CAPITAL_PCT", 0.0))
+        self.benchmark_symbol = benchmark_symbol
+
+        if quiet:
+            for name in ("prime_orb_strategy_manager", "prime_stealth_trailing", "modules.prime_rolling_window"):
+                logging.getLogger(name).setLevel(logging.ERROR)
+
+        self.clock = ReplayClock()
+        self.adapter = ReplayExecutionAdapter(self.clock)
+        self.orb = PrimeORBStrategyManager(clock=self.clock)
+        self.stealth = PrimeStealthTrailingTP(execution_adapter=self.adapter, mode="REPLAY", clock=self.clock)
+        self.stealth.exit_monitor = None  # No GCS writes from replay
+
+    # ------------------------------------------------------------------
+    # Market data helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _signal_features(bars: List[Dict[str, Any]], upto: int, candles: List[Dict[str, Any]],
+                         benchmark_change_pct: float) -> Dict[str, float]:
+        """VWAP distance, RS vs benchmark, ORB volume ratio and RSI from bars[:upto]"""
+        window = bars[:upto]
+        price = window[-1]['close']
+        volume = sum(b['volume'] for b in window)
+        vwap = sum((b['high'] + b['low'] + b['close']) / 3.0 * b['volume'] for b in window) / volume if volume else price
+        change_pct = (price - window[0]['open']) / window[0]['open'] * 100.0 if window[0]['open'] else 0.0
+        avg_candle_volume = sum(c['volume'] for c in candles) / len(candles) if candles else 0.0
+        closes = np.asarray([b['close'] for b in window[-15:]], dtype=np.float64)[None, :]
+        return {
+            'vwap': vwap,
+            'vwap_distance_pct': (price - vwap) / vwap * 100.0 if vwap else 0.0,
+            'rs_vs_spy': change_pct - benchmark_change_pct,
+            'volume_ratio': candles[0]['volume'] / avg_candle_volume if candles and avg_candle_volume else 1.0,
+            'rsi': float(rsi_series(closes, 14)[0]),
+        }
+
+    def _tick_market_data(self, symbols: List[str], day_bars: Dict[str, List[Dict[str, Any]]],
+                          end_index: Dict[str, int], price_key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Stealth market data per open symbol; RSI for all symbols in one vectorized call"""
+        live = [s for s in symbols if end_index.get(s)]
+        if not live:
+            return {}
+        depth = min(15, min(end_index[s] for s in live))
+        closes = np.asarray([[b['close'] for b in day_bars[s][end_index[s] - depth:end_index[s]]] for s in live],
+                            dtype=np.float64)
+        rsis = rsi_series(closes, 14)
+        market_data = {}
+        for i, symbol in enumerate(live):
+            upto = end_index[symbol]
+            bar = day_bars[symbol][upto - 1]
+            if price_key == 'extreme':
+                price = bar['low'] if bar['close'] >= bar['open'] else bar['high']
+            else:
+                price = bar['close']
+            recent = day_bars[symbol][max(0, upto - 20):upto]
+            avg_volume = sum(b['volume'] for b in recent) / len(recent)
+            market_data[symbol] = {
+                'price': price,
+                'rsi': float(rsis[i]),
+                'atr': price * 0.02,
+                'volume_ratio': bar['volume'] / avg_volume if avg_volume else 1.0,
+                'momentum': 0.0,
+                'volatility': 0.02,
+            }
+        return market_data
+
+    # ------------------------------------------------------------------
+    # Selection & sizing (compact Rev 00095 port)
+    # ------------------------------------------------------------------
+
+    def _select_so_signals(self, ranked: List[Dict[str, Any]], so_capital: float) -> Tuple[List[Dict[str, Any]], float]:
+        """Top-3 protection + progressive 15→12→10→8 targets with a 30% expense ratio"""
+        if not ranked:
+            return [], 0.0
+        max_single = self.account_value * TOP_PROTECTED_MAX_ACCOUNT_PCT
+        protected = [s for s in ranked[:3] if s['price'] <= max_single]
+
+        for target in PROGRESSIVE_TARGETS:
+            if target > len(ranked):
+                continue
+            fair_share = so_capital / target
+            threshold = fair_share * EXPENSE_THRESHOLD_MULTIPLIER
+            candidates = ranked[:target]
+            expensive = [s for s in candidates if s not in protected and s['price'] > threshold]
+            non_protected = target - len(protected)
+            expense_ratio = len(expensive) / non_protected if non_protected > 0 else 0.0
+            if expense_ratio <= EXPENSE_RATIO_LIMIT:
+                return candidates, fair_share
+
+        if len(ranked) < PROGRESSIVE_TARGETS[-1]:
+            # Fewer signals than the smallest target: take them all (live sizes these by fair share too)
+            return list(ranked), so_capital / len(ranked)
+
+        threshold_8 = so_capital / 8 * EXPENSE_THRESHOLD_MULTIPLIER
+        selected = list(protected)
+        start_rank = 3 if len(protected) == 3 else 0
+        for sig in ranked[start_rank:]:
+            if len(selected) >= 8:
+                break
+            if sig['price'] <= threshold_8 and sig not in selected:
+                selected.append(sig)
+        return selected, so_capital / max(1, len(selected))
+
+    async def _open_position(self, sig: Dict[str, Any], quantity: int) -> Optional[Dict[str, Any]]:
+        result = sig['result']
+        symbol = result.symbol
+        price = sig['price']
+        orb_data = self.orb.orb_data.get(sig['original_symbol'])
+        position = PrimePosition(
+            position_id=f"REPLAY_{self.clock.now_pt().date().isoformat()}_{symbol}",
+            symbol=symbol,
+            side=SignalSide.LONG,
+            quantity=quantity,
+            entry_price=price,
+            current_price=price,
+            stop_loss=result.stop_loss,
+            take_profit=result.take_profit,
+            position_value=price * quantity,
+            confidence=result.confidence,
+            quality_score=result.confidence,
+            reason=result.reasoning,
+            entry_time=self.clock.utcnow()
+        )
+        market_data = {
+            'price': price,
+            'rsi': sig.get('rsi', 50.0),
+            'atr': price * 0.02,
+            'volume_ratio': 1.0,
+            'momentum': 0.0,
+            'volatility': 0.02,
+            'entry_bar_high': orb_data.orb_high if orb_data else price * 1.02,
+            'entry_bar_low': orb_data.orb_low if orb_data else price * 0.98
+        }
+        if not await self.stealth.add_position(position, market_data):
+            return None
+        self.orb.executed_symbols_today.add(symbol)
+        self.orb.executed_symbols_today.add(sig['original_symbol'])
+        self.orb.record_trade(sig['original_symbol'], result.signal_type, trading_symbol=symbol)
+        return {
+            'symbol': symbol,
+            'signal_type': result.signal_type.value if result.signal_type else None,
+            'quantity': quantity,
+            'entry_price': price,
+            'entry_time': self.clock.utcnow(),
+            'priority_score': round(sig.get('priority_score', 0.0), 4),
+        }
+
+    # ------------------------------------------------------------------
+    # Day loop
+    # ------------------------------------------------------------------
+
+    async def run_day(self, day: date, bars_by_symbol: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> ReplayDayResult:
+        started = perf_time.perf_counter()
+        day_bars = bars_by_symbol if bars_by_symbol is not None else self.bar_source.load_day(day)
+
+        self.orb.reset_daily()
+        self.stealth.reset_daily_stats()
+        fills_before = len(self.adapter.fills)
+
+        session_start = pt_datetime(day, SESSION_OPEN_PT)
+        so_start = pt_datetime(day, self.orb.so_entry_time)
+        so_execute = pt_datetime(day, self.orb.so_execution_time)
+        orr_start = pt_datetime(day, self.orb.orr_start_time)
+        orr_end = pt_datetime(day, self.orb.orr_cutoff_time)
+        eod_close = pt_datetime(day, EOD_CLOSE_PT)
+        session_minutes = int((pt_datetime(day, SESSION_CLOSE_PT) - session_start).total_seconds() // 60)
+
+        # Per-symbol bar index by session minute (bars must be 1-minute, session-aligned)
+        end_index: Dict[str, List[int]] = {}
+        bar_ends: Dict[str, List[datetime]] = {}
+        candles_by_symbol: Dict[str, List[Dict[str, Any]]] = {}
+        candle_ends: Dict[str, List[datetime]] = {}
+        for symbol, bars in day_bars.items():
+            bar_ends[symbol] = [b['timestamp'] + timedelta(minutes=1) for b in bars]
+            candles_by_symbol[symbol] = aggregate_bars(bars, 15)
+            candle_ends[symbol] = [c['end'] for c in candles_by_symbol[symbol]]
+
+        trade_symbols = [s for s in day_bars if s != self.benchmark_symbol]
+        so_signals: Dict[str, Dict[str, Any]] = {}
+        trades: List[Dict[str, Any]] = []
+        so_executed = False
+        eod_done = False
+
+        for minute in range(1, session_minutes + 1):
+            now = session_start + timedelta(minutes=minute)
+            for symbol in day_bars:
+                end_index[symbol] = bisect.bisect_right(bar_ends[symbol], now)
+
+            # Stealth trailing: adverse extreme at +30s, then the close at +60s
+            open_symbols = list(self.stealth.active_positions.keys())
+            if open_symbols and not eod_done:
+                for offset, price_key in ((-30, 'extreme'), (0, None)):
+                    self.clock.set(now + timedelta(seconds=offset))
+                    market_data = self._tick_market_data(
+                        [s for s in open_symbols if s in self.stealth.active_positions], day_bars, end_index, price_key
+                    )
+                    if market_data:
+                        await self.stealth.update_positions_batch(market_data)
+            self.clock.set(now)
+
+            # SO collection window (7:15-7:30 PT): analyze every symbol on each completed minute
+            if so_start <= now < so_execute:
+                benchmark_change = 0.0
+                bench_bars = day_bars.get(self.benchmark_symbol)
+                if bench_bars and end_index.get(self.benchmark_symbol):
+                    bench_last = bench_bars[end_index[self.benchmark_symbol] - 1]['close']
+                    benchmark_change = (bench_last - bench_bars[0]['open']) / bench_bars[0]['open'] * 100.0
+                for symbol in trade_symbols:
+                    upto = end_index[symbol]
+                    if not upto or symbol in so_signals:
+                        continue
+                    completed = candles_by_symbol[symbol][:bisect.bisect_right(candle_ends[symbol], now)]
+                    result = await self.orb.analyze_symbol(symbol, {
+                        'current_price': day_bars[symbol][upto - 1]['close'],
+                        'intraday_data': completed,
+                    })
+                    if not result.should_trade or result.signal_type != SignalType.STANDARD_ORDER:
+                        continue
+                    trading_symbol = result.symbol
+                    if trading_symbol not in day_bars or not end_index.get(trading_symbol):
+                        continue
+                    orb = self.orb.orb_data.get(symbol)
+                    sig = {
+                        'symbol': trading_symbol,
+                        'original_symbol': symbol,
+                        'price': day_bars[trading_symbol][end_index[trading_symbol] - 1]['close'],
+                        'confidence': result.confidence,
+                        'orb_high': orb.orb_high if orb else 0.0,
+                        'orb_low': orb.orb_low if orb else 0.0,
+                        'result': result,
+                    }
+                    sig.update(self._signal_features(day_bars[symbol], upto, completed, benchmark_change))
+                    so_signals[symbol] = sig
+
+            # SO batch execution at 7:30 PT
+            if not so_executed and now >= so_execute:
+                so_executed = True
+                so_capital = self.account_value * self.so_capital_pct / 100.0
+                for sig in so_signals.values():
+                    # Entry at the execution-time price, not the collection-time price
+                    sig['price'] = day_bars[sig['symbol']][end_index[sig['symbol']] - 1]['close']
+                    sig['priority_score'] = calculate_so_priority_score(sig)
+                ranked = sorted(so_signals.values(), key=lambda s: s['priority_score'], reverse=True)
+                selected, fair_share = self._select_so_signals(ranked, so_capital)
+                deployed = 0.0
+                for sig in selected:
+                    quantity = int(fair_share // sig['price'])
+                    if quantity < 1 and sig['price'] <= so_capital - deployed:
+                        quantity = 1  # Top-priority symbol priced above fair share (Rev 00095 protection)
+                    if quantity < 1 or deployed + quantity * sig['price'] > so_capital:
+                        continue
+                    trade = await self._open_position(sig, quantity)
+                    if trade:
+                        deployed += quantity * sig['price']
+                        trades.append(trade)
+
+            # ORR (only when ORR capital is allocated): execute immediately
+            if self.orr_capital_pct > 0 and orr_start <= now < orr_end:
+                orr_capital = self.account_value * self.orr_capital_pct / 100.0
+                for symbol in trade_symbols:
+                    upto = end_index[symbol]
+                    if not upto or symbol not in self.orb.orb_data:
+                        continue
+                    completed = candles_by_symbol[symbol][:bisect.bisect_right(candle_ends[symbol], now)]
+                    result = await self.orb.analyze_symbol(symbol, {
+                        'current_price': day_bars[symbol][upto - 1]['close'],
+                        'intraday_data': completed,
+                    })
+                    if not result.should_trade or result.signal_type != SignalType.OPENING_RANGE_REVERSAL:
+                        continue
+                    trading_symbol = result.symbol
+                    if trading_symbol not in day_bars or not end_index.get(trading_symbol):
+                        continue
+                    price = day_bars[trading_symbol][end_index[trading_symbol] - 1]['close']
+                    quantity = int(orr_capital // price)
+                    if quantity < 1:
+                        continue
+                    trade = await self._open_position({
+                        'symbol': trading_symbol, 'original_symbol': symbol,
+                        'price': price, 'result': result,
+                    }, quantity)
+                    if trade:
+                        trades.append(trade)
+
+            # EOD close (12:55 PT)
+            if not eod_done and now >= eod_close:
+                eod_done = True
+                positions = list(self.stealth.active_positions.values())
+                if positions:
+                    await self.adapter.close_positions_batch(positions, ExitReason.END_OF_DAY_CLOSE.value)
+                    for position in positions:
+                        await self.stealth._remove_position(position.symbol, ExitReason.END_OF_DAY_CLOSE, send_alert=False)
+                break
+
+        result = ReplayDayResult(
+            day=day,
+            symbols=len(trade_symbols),
+            so_signals=len(so_signals),
+            trades=trades,
+            fills=self.adapter.fills[fills_before:],
+            elapsed_seconds=perf_time.perf_counter() - started
+        )
+        log.info(f"🎬 Replay {day.isoformat()}: {len(trades)} trades, P&L ${result.total_pnl:+.2f} "
+                 f"({result.elapsed_seconds:.2f}s)")
+        return result
+
+    async def run_days(self, days: Iterable[date]) -> List[ReplayDayResult]:
+        results = []
+        for day in days:
+            results.append(await self.run_day(day))
+        return results
+
+def summarize(results: List[ReplayDayResult]) -> Dict[str, Any]:
+    """Aggregate summary across replayed days"""
+    closes = [f for r in results for f in r.fills if not f.partial]
+    wins = sum(1 for f in closes if f.pnl > 0)
+    return {
+        'days': len(results),
+        'trades': sum(len(r.trades) for r in results),
+        'total_pnl': round(sum(r.total_pnl for r in results), 2),
+        'win_rate': round(wins / len(closes), 3) if closes else 0.0,
+        'exit_reasons': dict(Counter(f.reason for f in closes)),
+        'elapsed_seconds': round(sum(r.elapsed_seconds for r in results), 3),
+    }
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+DEFAULT_SYNTHETIC_SYMBOLS = ("SPY", "TQQQ", "SOXL", "TNA", "LABU", "NUGT", "FAS", "UPRO", "TECL", "GUSH")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay ORB trading days offline")
+    parser.add_argument("--bars-dir", help="Recorded bars root ({root}/{YYYY-MM-DD}/{SYMBOL}.csv|.json)")
+    parser.add_argument("--synthetic", action="store_true", help="Use seeded synthetic bars")
+    parser.add_argument("--symbols", default=None,
+                        help=f"Comma-separated symbols (synthetic default {','.join(DEFAULT_SYNTHETIC_SYMBOLS)}; "
+                             f"recorded bars are filtered only when given)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--start", help="First date (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last date (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, default=5, help="Synthetic day count")
+    parser.add_argument("--account", type=float, default=1000.0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    log.setLevel(logging.INFO)
+
+    symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()] if args.symbols else None
+    start = date.fromisoformat(args.start) if args.start else None
+    end = date.fromisoformat(args.end) if args.end else None
+    if args.synthetic or not args.bars_dir:
+        source = SyntheticBarSource(symbols or list(DEFAULT_SYNTHETIC_SYMBOLS), seed=args.seed)
+        days = source.dates(start, end, days=args.days)
+    else:
+        source = RecordedBarSource(args.bars_dir, symbols)
+        days = source.dates(start, end)
+
+    engine = ReplayEngine(source, account_value=args.account, quiet=not args.verbose)
+    results = asyncio.run(engine.run_days(days))
+    for r in results:
+        print(json.dumps(r.summary()))
+    print(json.dumps({'total': summarize(results)}))
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,6 @@ for the Easy ORB Strategy. This module handles all risk management
 decisions for opening new positions.
 
 Last Updated: January 6, 2026 (Rev 00231)
-"""
 
 Key Features:
 - Multi-layer risk framework with 10 core principles
@@ -233,13 +232,13 @@ class PrimeRiskManager:
     def _initialize_etrade_trading(self):
         """Initialize E*TRADE trading integration for real account data"""
         try:
-            from .prime_etrade_trading import PrimeETradeTrading
+            from .prime_etrade_trading import get_etrade_client_hub
             
             # Determine environment based on configuration
             etrade_mode = get_config_value('ETRADE_MODE', 'sandbox')
             
-            # Initialize E*TRADE trading with environment
-            self.etrade_trading = PrimeETradeTrading(environment=etrade_mode)
+            # Rev 00251: Handle on the shared E*TRADE client (tokens/accounts/pool loaded once per process)
+            self.etrade_trading = get_etrade_client_hub().handle(etrade_mode)
             
             # Initialize the trading system
             if self.etrade_trading.initialize():
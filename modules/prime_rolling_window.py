@@ -0,0 +1,134 @@
+"""
+Prime Rolling Window
+
+Time-windowed price history with O(1) amortized rolling max/min.
+
+Rev 00239: Replaces the per-tick list of {'price', 'timestamp'} dicts on
+PositionState. Samples live in parallel float deques (timestamp, price) and two
+monotonic deques track the running peak and trough, so appending a tick and
+reading the time-weighted peak/trough no longer rescan or rebuild the history.
+The window follows STEALTH_GAP_RISK_TIME_WEIGHTED_PEAK (minutes).
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+_EPOCH = datetime(1970, 1, 1)
+
+def _to_seconds(timestamp: Union[datetime, float, int, None]) -> float:
+    """Naive-UTC datetime (datetime.utcnow() convention) or epoch seconds -> epoch seconds"""
+    if timestamp is None:
+        timestamp = datetime.utcnow()
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is not None:
+            return timestamp.timestamp()
+        return (timestamp - _EPOCH).total_seconds()
+    return float(timestamp)
+
+class RollingPeakWindow:
+    """
+    Rolling window of (timestamp, price) samples with monotonic max/min deques.
+
+    Samples older than `window_seconds` (relative to the newest sample or the
+    query time) are evicted from the front. Timestamps must be non-decreasing.
+    """
+
+    __slots__ = ('window_seconds', '_times', '_prices', '_max_times', '_max_prices', '_min_times', '_min_prices')
+
+    def __init__(self, window_seconds: float = 45 * 60.0):
+        self.window_seconds = float(window_seconds)
+        self._times: deque = deque()
+        self._prices: deque = deque()
+        # Monotonic deques: _max_prices is non-increasing, _min_prices is non-decreasing
+        self._max_times: deque = deque()
+        self._max_prices: deque = deque()
+        self._min_times: deque = deque()
+        self._min_prices: deque = deque()
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def __bool__(self) -> bool:
+        return bool(self._prices)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Legacy view: {'price', 'timestamp'} dicts, oldest first"""
+        for t, price in zip(self._times, self._prices):
+            yield {'price': price, 'timestamp': datetime.utcfromtimestamp(t)}
+
+    def append(self, price: float, timestamp: Union[datetime, float, None] = None) -> None:
+        """Add a sample and evict samples that fell out of the window"""
+        t = _to_seconds(timestamp)
+        price = float(price)
+        self._times.append(t)
+        self._prices.append(price)
+
+        while self._max_prices and self._max_prices[-1] <= price:
+            self._max_prices.pop()
+            self._max_times.pop()
+        self._max_times.append(t)
+        self._max_prices.append(price)
+
+        while self._min_prices and self._min_prices[-1] >= price:
+            self._min_prices.pop()
+            self._min_times.pop()
+        self._min_times.append(t)
+        self._min_prices.append(price)
+
+        self.prune(t)
+
+    def prune(self, now: Union[datetime, float, None] = None) -> None:
+        """Drop samples older than now - window_seconds"""
+        cutoff = _to_seconds(now) - self.window_seconds
+        times = self._times
+        while times and times[0] < cutoff:
+            times.popleft()
+            self._prices.popleft()
+        while self._max_times and self._max_times[0] < cutoff:
+            self._max_times.popleft()
+            self._max_prices.popleft()
+        while self._min_times and self._min_times[0] < cutoff:
+            self._min_times.popleft()
+            self._min_prices.popleft()
+
+    def peak(self, now: Union[datetime, float, None] = None) -> Optional[float]:
+        """Highest price within the window ending at `now` (None if no samples)"""
+        self.prune(now)
+        return self._max_prices[0] if self._max_prices else None
+
+    def trough(self, now: Union[datetime, float, None] = None) -> Optional[float]:
+        """Lowest price within the window ending at `now` (None if no samples)"""
+        self.prune(now)
+        return self._min_prices[0] if self._min_prices else None
+
+    def set_window(self, window_seconds: float) -> None:
+        """Change the window length (shrinking takes effect on the next prune)"""
+        self.window_seconds = float(window_seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot form (JSON-serializable)"""
+        return {
+            'window_seconds': self.window_seconds,
+            'times': list(self._times),
+            'prices': list(self._prices),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Union[Dict[str, Any], List[Dict[str, Any]], None],
+                  window_seconds: Optional[float] = None) -> 'RollingPeakWindow':
+        """Rebuild from to_dict() output or a legacy list of {'price', 'timestamp'} dicts"""
+        if isinstance(data, dict):
+            window = cls(window_seconds if window_seconds is not None else data.get('window_seconds', 45 * 60.0))
+            for t, price in zip(data.get('times', []), data.get('prices', [])):
+                window.append(price, t)
+            return window
+
+        window = cls(window_seconds if window_seconds is not None else 45 * 60.0)
+        for entry in data or []:
+            if isinstance(entry, dict) and 'price' in entry:
+                timestamp = entry.get('timestamp')
+                if isinstance(timestamp, str):
+                    timestamp = datetime.fromisoformat(timestamp)
+                window.append(entry['price'], timestamp)
+        return window
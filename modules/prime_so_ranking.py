@@ -0,0 +1,179 @@
+"""
+Prime SO Ranking
+
+Multi-factor priority score used to rank Standard Order (SO) signals before
+capital allocation.
+
+Rev 00242: Moved out of PrimeTradingSystem._process_orb_signals so the live
+pipeline and the replay engine rank signals with the same formula.
+"""
+
+from typing import Any, Dict
+
+
+def calculate_so_priority_score(signal: Dict[str, Any]) -> float:
+    """
+    Calculate multi-factor priority score for SO signals
+    
+    Rev 00106: Formula v2.1 - DATA-DRIVEN REFINEMENT (Nov 6, 2025)
+    Based on comprehensive correlation analysis (Nov 6):
+    
+    CORRELATION EVIDENCE (Nov 6 - 15 signals):
+    - VWAP Distance: +0.772 correlation ⭐⭐⭐ STRONGEST PREDICTOR!
+    - RS vs SPY: +0.609 correlation ⭐⭐⭐ 2ND STRONGEST!
+    - ORB Volume: +0.342 correlation ✅ MODERATE
+    - Confidence: +0.333 correlation ⚠️ WEAK (inconsistent)
+    - RSI: -0.096 correlation ⚠️ NEGATIVE (context-dependent)
+    
+    TOP PERFORMER VALIDATION (Nov 6):
+    - TSDD (+3.24% P&L): Had HIGHEST VWAP Distance (+3.35%) ✅
+    - TSDD: Strong RS vs SPY (+8.16%) ✅
+    - AMDD (95% conf): Only +1.03% P&L (#14/15) - confidence not predictive!
+    
+    Formula v2.1 Weights (Conservative +2% Adjustments):
+    - VWAP Distance: 27% (↑ +2% - exceptional +0.772 correlation) ⭐
+    - RS vs SPY: 25% (same - strong +0.609 correlation) ⭐
+    - ORB Volume: 22% (↑ +2% - moderate +0.342 correlation)
+    - Confidence: 13% (↓ -2% - weak +0.333 correlation)
+    - RSI: 10% (same - context-aware for bull/bear markets)
+    - ORB Range: 3% (↓ -2% - minimal contribution)
+    
+    Changes from v2.0 → v2.1:
+    - More weight to proven predictors (VWAP, Volume)
+    - Less weight to weak predictors (Confidence, ORB Range)
+    - Evidence-based, conservative adjustments
+    
+    Expected: +10-15% better capital allocation vs v2.0
+    """
+    symbol = signal.get('symbol', '')
+    
+    # Factor 1: RS vs SPY (25%) - Rev 00104: NEW ⭐⭐⭐
+    # Top performers on Nov 5: +27-28% vs SPY (market leaders)
+    rs_vs_spy = signal.get('rs_vs_spy', 0)
+    
+    if rs_vs_spy >= 20.0:
+        rs_score = 1.0           # Massive outperformance (>+20%)
+    elif rs_vs_spy >= 10.0:
+        rs_score = 0.85          # Strong outperformance (+10-20%)
+    elif rs_vs_spy >= 5.0:
+        rs_score = 0.70          # Good outperformance (+5-10%)
+    elif rs_vs_spy >= 0.0:
+        rs_score = 0.50          # Inline with market (0-5%)
+    elif rs_vs_spy >= -10.0:
+        rs_score = 0.35          # Slight underperformance (0 to -10%)
+    else:
+        rs_score = 0.20          # Underperforming (<-10%)
+    
+    # Factor 2: VWAP Distance (25%) - Rev 00104: NEW ⭐⭐⭐
+    # Top performers on Nov 5: +18-20% above VWAP (institutional support)
+    vwap_distance = signal.get('vwap_distance_pct', 0)
+    
+    if vwap_distance >= 15.0:
+        vwap_score = 1.0         # Far above VWAP (>+15%)
+    elif vwap_distance >= 10.0:
+        vwap_score = 0.90        # Well above VWAP (+10-15%)
+    elif vwap_distance >= 5.0:
+        vwap_score = 0.75        # Above VWAP (+5-10%)
+    elif vwap_distance >= 0.0:
+        vwap_score = 0.60        # At/slightly above VWAP (0-5%)
+    elif vwap_distance >= -3.0:
+        vwap_score = 0.40        # Slightly below VWAP (0 to -3%)
+    else:
+        vwap_score = 0.20        # Below VWAP (<-3%)
+    
+    # Factor 3: ORB Volume Ratio (20%) - Rev 00104: Reduced from 40%
+    # Still important but less than VWAP/RS discoveries
+    orb_volume_ratio = signal.get('volume_ratio', 1.0)
+    
+    if orb_volume_ratio >= 3.0:
+        orb_vol_score = 1.0      # Exceptional
+    elif orb_volume_ratio >= 2.0:
+        orb_vol_score = 0.85     # Strong
+    elif orb_volume_ratio >= 1.5:
+        orb_vol_score = 0.70     # Good
+    elif orb_volume_ratio >= 1.2:
+        orb_vol_score = 0.50     # Moderate
+    else:
+        orb_vol_score = 0.25     # Weak
+    
+    # Factor 4: Confidence (15%) - Rev 00104: RE-ADDED ⭐⭐
+    # Nov 5 discovery: 95% confidence = top 2 performers
+    # Was removed (Rev 00091) due to -0.298 correlation on holiday days
+    # Re-added based on positive correlation on normal trading days
+    confidence = signal.get('confidence', 0.5)
+    
+    # Scale 0.5-1.0 → 0-1.0
+    if confidence >= 0.5:
+        conf_score = (confidence - 0.5) / 0.5
+        conf_score = min(1.0, conf_score)
+    else:
+        conf_score = 0.0
+    
+    # Factor 5: RSI Context-Aware (10%) - Rev 00104: REVISED ⭐⭐
+    # Nov 5 discovery: High RSI (70-75) = top performers in BULL markets
+    # Nov 1 data: High RSI (>65) = losers in weak markets
+    # Solution: Context-aware scoring based on market regime
+    rsi = signal.get('rsi', 55.0)
+    market_regime = signal.get('market_regime', 'MIXED')  # Will be added to signals
+    
+    if market_regime == 'BULL':
+        # Bull market: High RSI = momentum (not overbought)
+        if 65 <= rsi <= 75:
+            rsi_score = 0.85     # Strong momentum ⭐ REVISED
+        elif 55 <= rsi < 65:
+            rsi_score = 1.0      # Sweet spot
+        elif 50 <= rsi < 55:
+            rsi_score = 0.90     # Good
+        elif 45 <= rsi < 50:
+            rsi_score = 0.75     # Acceptable
+        elif rsi > 75:
+            rsi_score = 0.60     # Getting too high even for bull
+        else:  # rsi < 45
+            rsi_score = 0.40     # Weak even in bull market
+    else:
+        # Non-bull market: High RSI = overbought (penalty)
+        if 50 <= rsi <= 60:
+            rsi_score = 1.0      # Sweet spot
+        elif 45 <= rsi < 50:
+            rsi_score = 0.85     # Good
+        elif 60 < rsi <= 65:
+            rsi_score = 0.70     # Getting high
+        elif rsi > 65:
+            rsi_score = 0.30     # PENALTY (overbought)
+        elif 40 <= rsi < 45:
+            rsi_score = 0.75     # Acceptable
+        else:  # rsi < 40
+            rsi_score = 0.60     # Weak
+    
+    # Factor 6: ORB Range % - Volatility (5%) - Rev 00104: Reduced from 30%
+    # Less predictive than VWAP/RS discoveries
+    orb_high = signal.get('orb_high', 0)
+    orb_low = signal.get('orb_low', 0)
+    if orb_low > 0:
+        orb_range_pct = (orb_high - orb_low) / orb_low
+    else:
+        orb_range_pct = 0.01
+    orb_range_score = min(orb_range_pct / 0.05, 1.0)  # 1.0 at 5%+
+    
+    # Rev 00106: Formula v2.1 - DATA-DRIVEN REFINEMENT (Nov 6, 2025)
+    # Conservative +2% adjustments based on correlation analysis
+    # Evidence: VWAP +0.772, RS +0.609, Volume +0.342, Confidence +0.333
+    priority_score = (
+        vwap_score * 0.27 +           # 27% - VWAP Distance ⭐ (↑ +2%, correlation +0.772)
+        rs_score * 0.25 +             # 25% - RS vs SPY ⭐ (same, correlation +0.609)
+        orb_vol_score * 0.22 +        # 22% - ORB volume (↑ +2%, correlation +0.342)
+        conf_score * 0.13 +           # 13% - Confidence (↓ -2%, correlation +0.333 weak)
+        rsi_score * 0.10 +            # 10% - RSI (same, context-aware)
+        orb_range_score * 0.03        # 3% - ORB range (↓ -2%, minimal contribution)
+    )
+    
+    # Rev 00141: Store calculated values in signal for data collection
+    signal['priority_score'] = priority_score
+    signal['rs_vs_spy'] = rs_vs_spy
+    signal['vwap_distance_pct'] = vwap_distance
+    signal['volume_ratio'] = orb_volume_ratio
+    signal['orb_volume_ratio'] = orb_volume_ratio
+    signal['rsi'] = rsi
+    signal['orb_range_pct'] = orb_range_pct
+    
+    return priority_score
@@ -41,7 +41,7 @@ import math
 import json
 from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 import numpy as np
 from collections import defaultdict, deque
@@ -53,6 +53,7 @@ try:
         determine_confidence_tier
     )
     from .config_loader import get_config_value
+    from .prime_rolling_window import RollingPeakWindow
 except ImportError:
     from prime_models import (
         StrategyMode, SignalType, SignalSide, TradeStatus, StopType, TrailingMode,
@@ -60,6 +61,7 @@ except ImportError:
         determine_confidence_tier
     )
     from config_loader import get_config_value
+    from prime_rolling_window import RollingPeakWindow
 
 log = logging.getLogger("prime_stealth_trailing")
 
@@ -85,6 +87,18 @@ class ExecutionAdapter:
     async def amend_tp(self, position: 'PositionState', new_tp: float) -> None:
         """Update take profit (internal tracking only for stealth)"""
         pass  # Stealth TPs are internal-only
+    
+    async def close_positions_batch(self, positions: List['PositionState'], reason: str) -> bool:
+        """
+        Close several positions sharing one exit reason (Rev 00240: monitoring tick)
+        
+        Returns True if the adapter sent one aggregated exit alert (callers then skip per-position alerts).
+        """
+        results = await asyncio.gather(*[self.close_position(p, reason) for p in positions], return_exceptions=True)
+        for position, result in zip(positions, results):
+            if isinstance(result, Exception):
+                log.warning(f"⚠️ Failed to close {position.symbol} via execution adapter: {result}")
+        return False
 
 class MockExecutionAdapter(ExecutionAdapter):
     """Mock execution adapter for Demo Mode"""
@@ -112,6 +126,14 @@ class MockExecutionAdapter(ExecutionAdapter):
         if hasattr(self.exec, 'scale_out'):
             await self.exec.scale_out(position.symbol, qty, reason)
         log.info(f"📉 DEMO: Scaled out {qty} shares of {position.symbol} - {reason}")
+    
+    async def close_positions_batch(self, positions: List['PositionState'], reason: str) -> bool:
+        """Close via mock executor batch (one aggregated alert) when more than one position exits"""
+        if len(positions) > 1 and hasattr(self.exec, 'close_positions_batch'):
+            await self.exec.close_positions_batch(positions, reason)
+            log.info(f"📉 DEMO: Batch closed {len(positions)} positions - {reason}")
+            return True
+        return await super().close_positions_batch(positions, reason)
 
 class LiveETradeAdapter(ExecutionAdapter):
     """Live ETrade execution adapter - Uses order executor for batch efficiency"""
@@ -149,6 +171,39 @@ class LiveETradeAdapter(ExecutionAdapter):
         except Exception as e:
             log.error(f"❌ Failed to scale out {position.symbol}: {e}")
 
+    async def close_positions_batch(self, positions: List['PositionState'], reason: str) -> bool:
+        """
+        Close several positions as one batch of MARKET orders (Rev 00240)
+
+        Goes through the order executor's sliding-window pipeline (order_executor if given,
+        else the client's execute_batch_orders_async) instead of one place_order per symbol.
+        Per-position exit alerts are still sent by stealth trailing (returns False).
+        """
+        if len(positions) < 2 or not (self.order_executor or hasattr(self.etrade, 'execute_batch_orders_async')):
+            return await super().close_positions_batch(positions, reason)
+
+        orders = [{
+            'symbol': p.symbol,
+            'quantity': p.quantity,
+            'side': 'SELL' if p.side == SignalSide.LONG else 'BUY',
+            'order_type': 'MARKET',
+            'signal_type': 'EXIT',
+            'confidence': 1.0,
+        } for p in positions]
+        try:
+            if self.order_executor:
+                result = await self.order_executor.execute(orders)
+            else:
+                result = await self.etrade.execute_batch_orders_async(orders)
+        except Exception as e:
+            log.error(f"❌ Batch close failed for {[p.symbol for p in positions]}: {e}")
+            return False
+
+        for failed in result.get('failed_orders', []):
+            log.error(f"❌ Failed to close {failed['order']['symbol']}: {failed.get('error')}")
+        log.info(f"📉 LIVE: Batch closed {result.get('success_count', 0)}/{len(positions)} positions via ETrade - {reason}")
+        return False
+
 # ============================================================================
 # ENUMS
 # ============================================================================
@@ -437,7 +492,8 @@ class PositionState:
     profit_timeout_start: Optional[datetime] = None  # When position first became profitable
     
     # NEW: Price history for time-weighted peak (Rev 00130)
-    price_history: List[Dict[str, Any]] = field(default_factory=list)  # List of {price, timestamp} for time-weighted peak
+    # Rev 00239: Rolling window with O(1) peak/trough (window = gap_risk_time_weighted_peak_minutes)
+    price_history: RollingPeakWindow = field(default_factory=RollingPeakWindow)
 
 @dataclass
 class StealthDecision:
@@ -500,9 +556,11 @@ class PrimeStealthTrailingTP:
     def __init__(self, strategy_mode: StrategyMode = StrategyMode.STANDARD,
                  execution_adapter: Optional[ExecutionAdapter] = None,
                  mode: str = "DEMO",
-                 alert_manager: Optional[Any] = None):
+                 alert_manager: Optional[Any] = None,
+                 clock: Optional[Any] = None):
         self.strategy_mode = strategy_mode
         self.mode = mode
+        self.clock = clock  # Rev 00242: Injectable clock (replay engine); None = wall clock
         self.exec = execution_adapter  # Required for automatic execution
         self.alert_manager = alert_manager  # Rev 00117: For exit alerts
         self.config = self._load_stealth_config()
@@ -534,7 +592,7 @@ class PrimeStealthTrailingTP:
         # Rev 00133: Exit monitoring collector (TEMPORARY - for exit optimization)
         try:
             from .prime_exit_monitoring_collector import get_exit_monitoring_collector
-            self.exit_monitor = get_exit_monitoring_collector()
+            self.exit_monitor = get_exit_monitoring_collector(clock=self.clock)
             log.info("✅ Exit monitoring collector initialized (TEMPORARY - for exit optimization)")
         except Exception as e:
             log.warning(f"⚠️ Exit monitoring collector not available: {e}")
@@ -554,6 +612,10 @@ class PrimeStealthTrailingTP:
         log.info(f"   - Max Holding Hours: {self.config.max_holding_hours}")
         log.info(f"   - Profit Timeout Hours: {self.config.profit_timeout_hours}")
     
+    def _utcnow(self) -> datetime:
+        """Current naive-UTC time (Rev 00242: from the injected clock when replaying)"""
+        return self.clock.utcnow() if self.clock else datetime.utcnow()
+    
     def _load_stealth_config(self) -> StealthConfig:
         """Load stealth configuration from settings (ALIGNED WITH OPTIMIZED DEFAULTS)"""
         return StealthConfig(
@@ -783,6 +845,10 @@ class PrimeStealthTrailingTP:
         """Get scale-out targets"""
         return (self.config.scale_out_t1_pct, self.config.scale_out_t2_pct)
     
+    def _price_window_seconds(self) -> float:
+        """Rev 00239: Rolling price history window (time-weighted peak minutes)"""
+        return float(self.config.gap_risk_time_weighted_peak_minutes) * 60.0
+    
     # ========================================================================
     # SNAPSHOT & RESTORE (Persistence on restart)
     # ========================================================================
@@ -812,7 +878,8 @@ class PrimeStealthTrailingTP:
                     'scaled1': pos.scaled1,
                     'scaled2': pos.scaled2,
                     'peak_volume_ratio': pos.peak_volume_ratio,
-                    'confidence': pos.confidence
+                    'confidence': pos.confidence,
+                    'price_history': pos.price_history.to_dict()  # Rev 00239
                 }
             return snapshot_data
         except Exception as e:
@@ -828,6 +895,10 @@ class PrimeStealthTrailingTP:
                 pos_data['last_update'] = datetime.fromisoformat(pos_data['last_update'])
                 pos_data['side'] = SignalSide(pos_data['side'])
                 pos_data['stealth_mode'] = StealthMode(pos_data['stealth_mode'])
+                # Rev 00239: Rebuild rolling price window (older snapshots have none)
+                pos_data['price_history'] = RollingPeakWindow.from_dict(
+                    pos_data.get('price_history'), window_seconds=self._price_window_seconds()
+                )
                 
                 # Create PositionState (fill in missing fields with defaults)
                 position = PositionState(**pos_data)
@@ -980,7 +1051,7 @@ class PrimeStealthTrailingTP:
                 current_price=current_price,
                 quantity=position.quantity,
                 entry_time=position.entry_time,
-                last_update=datetime.utcnow(),
+                last_update=self._utcnow(),
                 highest_price=current_price,
                 lowest_price=current_price,
                 initial_stop_loss=initial_stop,
@@ -1000,8 +1071,9 @@ class PrimeStealthTrailingTP:
                 peak_volume_ratio=volume_ratio,  # For hysteresis
                 last_tighten_ts=None,  # For cooldown
                 # Rev 00130: Initialize price history with entry price
-                price_history=[{'price': current_price, 'timestamp': datetime.utcnow()}]
+                price_history=RollingPeakWindow(self._price_window_seconds())
             )
+            position_state.price_history.append(current_price, self._utcnow())
             
             # Store position
             self.active_positions[symbol] = position_state
@@ -1032,7 +1104,64 @@ class PrimeStealthTrailingTP:
             
             return False
     
-    async def update_position(self, symbol: str, market_data: Dict[str, Any]) -> Optional[StealthDecision]:
+    async def update_positions_batch(self, market_data_by_symbol: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Monitoring tick (Rev 00240): evaluate all positions concurrently, then close every EXIT together
+        
+        Stage 1 runs update_position() for every symbol at once (each under its own per-symbol lock),
+        with exits deferred. Stage 2 closes the exits through the adapter's close_positions_batch()
+        (one call per exit reason) and removes them from tracking.
+        
+        Returns:
+            Dict with 'decisions' {symbol: StealthDecision}, 'exits' [symbols] and 'timings' (ms)
+        """
+        tick_started = time.perf_counter()
+        symbols = [s for s in market_data_by_symbol if s in self.active_positions]
+        results = await asyncio.gather(
+            *[self.update_position(s, market_data_by_symbol[s], defer_exit=True) for s in symbols],
+            return_exceptions=True
+        )
+        decisions: Dict[str, StealthDecision] = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                log.error(f"❌ Error updating position {symbol} in stealth trailing: {result}")
+            elif result is not None:
+                decisions[symbol] = result
+        decide_ms = (time.perf_counter() - tick_started) * 1000
+        
+        exits_started = time.perf_counter()
+        exits_by_reason: Dict[ExitReason, List[PositionState]] = defaultdict(list)
+        for symbol, decision in decisions.items():
+            if decision.action == "EXIT" and symbol in self.active_positions:
+                exits_by_reason[decision.exit_reason].append(self.active_positions[symbol])
+        
+        exited: List[str] = []
+        for exit_reason, positions in exits_by_reason.items():
+            aggregated_alert = False
+            if self.exec:
+                try:
+                    aggregated_alert = await self.exec.close_positions_batch(
+                        positions, exit_reason.value if exit_reason else "unknown"
+                    )
+                except Exception as e:
+                    # Rev 00181: Remove from stealth trailing even if close fails (prevents close loops)
+                    log.warning(f"⚠️ Batch close failed for {[p.symbol for p in positions]}: {e} - removing from stealth trailing anyway")
+            for position in positions:
+                await self._remove_position(position.symbol, exit_reason, send_alert=not aggregated_alert)
+                exited.append(position.symbol)
+        exit_ms = (time.perf_counter() - exits_started) * 1000
+        
+        return {
+            'decisions': decisions,
+            'exits': exited,
+            'timings': {
+                'decide_ms': round(decide_ms, 1),
+                'exit_ms': round(exit_ms, 1),
+                'positions': len(symbols),
+            }
+        }
+    
+    async def update_position(self, symbol: str, market_data: Dict[str, Any], defer_exit: bool = False) -> Optional[StealthDecision]:
         """
         Update position with new market data and EXECUTE stealth decision
         
@@ -1041,6 +1170,7 @@ class PrimeStealthTrailingTP:
         Args:
             symbol: Symbol to update
             market_data: Current market data
+            defer_exit: Return EXIT decisions without closing (Rev 00240: update_positions_batch closes them together)
             
         Returns:
             StealthDecision: Decision that was applied
@@ -1068,7 +1198,7 @@ class PrimeStealthTrailingTP:
                 position_state.volume_ratio = volume_ratio
                 position_state.momentum = momentum
                 position_state.volatility = volatility
-                position_state.last_update = datetime.utcnow()
+                position_state.last_update = self._utcnow()
                 
                 # Update RSI for decision making
                 position_state.current_rsi = rsi
@@ -1096,7 +1226,7 @@ class PrimeStealthTrailingTP:
                     # This captures the final state before exit
                     if self.exit_monitor:
                         try:
-                            trade_id = getattr(position_state, 'trade_id', getattr(position_state, 'position_id', f"{self.mode}_{symbol}_{datetime.utcnow().strftime('%Y%m%d')}"))
+                            trade_id = getattr(position_state, 'trade_id', getattr(position_state, 'position_id', f"{self.mode}_{symbol}_{self._utcnow().strftime('%Y%m%d')}"))
                             self.exit_monitor.collect_monitoring_data(
                                 symbol=symbol,
                                 trade_id=trade_id,
@@ -1114,6 +1244,9 @@ class PrimeStealthTrailingTP:
                         except Exception as e:
                             log.debug(f"Exit monitoring data collection skipped for {symbol}: {e}")
                     
+                    if defer_exit:
+                        return decision
+                    
                     # Execute close via adapter
                     if self.exec:
                         try:
@@ -1234,19 +1367,15 @@ class PrimeStealthTrailingTP:
                 if current_price < position_state.lowest_price:
                     position_state.lowest_price = current_price
                 
-                # Rev 00130: Track price history for time-weighted peak (last 30 minutes)
-                # Add current price to history with timestamp
-                now = datetime.utcnow()
-                position_state.price_history.append({
-                    'price': current_price,
-                    'timestamp': now
-                })
+                # Rev 00130: Track price history for time-weighted peak
+                # Rev 00239: Rolling window evicts samples older than the time-weighted peak window on append
+                position_state.price_history.append(current_price, self._utcnow())
                 
                 # Rev 00148: Collect exit monitoring data AFTER decision is applied and flags are set
                 # This ensures breakeven_achieved and trailing_activated flags are correctly captured
                 if self.exit_monitor:
                     try:
-                        trade_id = getattr(position_state, 'trade_id', getattr(position_state, 'position_id', f"{self.mode}_{symbol}_{datetime.utcnow().strftime('%Y%m%d')}"))
+                        trade_id = getattr(position_state, 'trade_id', getattr(position_state, 'position_id', f"{self.mode}_{symbol}_{self._utcnow().strftime('%Y%m%d')}"))
                         self.exit_monitor.collect_monitoring_data(
                             symbol=symbol,
                             trade_id=trade_id,
@@ -1264,13 +1393,6 @@ class PrimeStealthTrailingTP:
                     except Exception as e:
                         log.debug(f"Exit monitoring data collection skipped for {symbol}: {e}")
                 
-                # Keep only last 30 minutes of price history (cleanup old entries)
-                cutoff_time = now - timedelta(minutes=30)
-                position_state.price_history = [
-                    entry for entry in position_state.price_history
-                    if entry.get('timestamp', now) >= cutoff_time
-                ]
-                
                 return decision
                 
             except Exception as e:
@@ -1288,7 +1410,7 @@ class PrimeStealthTrailingTP:
             current_price = position.current_price
             entry_price = position.entry_price
             pnl_pct = position.unrealized_pnl_pct
-            holding_minutes = (datetime.utcnow() - position.entry_time).total_seconds() / 60
+            holding_minutes = (self._utcnow() - position.entry_time).total_seconds() / 60
             
             # Rev 00154: Log decision flow start for debugging
             log.info(f"🔄 STEALTH DECISION: {position.symbol} | P&L: {pnl_pct:.4f} ({pnl_pct*100:.2f}%) | Held: {holding_minutes:.1f}min | Breakeven: {position.breakeven_achieved} | Trailing: {position.trailing_activated}")
@@ -1315,7 +1437,7 @@ class PrimeStealthTrailingTP:
             # Breakeven should only activate to SAVE gains when trailing is NOT active
             # Rev 00119: Prevent breakeven from activating too early (first 3.5 minutes)
             # Rev 00154: Added comprehensive INFO-level logging for activation checks
-            holding_minutes = (datetime.utcnow() - position.entry_time).total_seconds() / 60
+            holding_minutes = (self._utcnow() - position.entry_time).total_seconds() / 60
             min_breakeven_activation_minutes = getattr(self.config, "min_breakeven_activation_minutes", 6.4)  # Rev 00196: Optimized from 3.5 to 6.4 minutes
             
             # Rev 00194: DO NOT activate breakeven if trailing is already active
@@ -1330,11 +1452,12 @@ class PrimeStealthTrailingTP:
                 if (pnl_pct >= self.config.breakeven_threshold_pct and
                     holding_minutes >= min_breakeven_activation_minutes):
                     # Check if profit has been sustained for minimum time (2 minutes)
-                    if not hasattr(position, 'breakeven_sustained_start'):
-                        position.breakeven_sustained_start = datetime.utcnow()
+                    # Rev 00243: The timer is reset to None below, so test the value (not hasattr)
+                    if getattr(position, 'breakeven_sustained_start', None) is None:
+                        position.breakeven_sustained_start = self._utcnow()
                         log.info(f"⏳ Breakeven threshold reached for {position.symbol}: Starting sustained profit timer (need 2 min)")
                     
-                    sustained_minutes = (datetime.utcnow() - position.breakeven_sustained_start).total_seconds() / 60
+                    sustained_minutes = (self._utcnow() - position.breakeven_sustained_start).total_seconds() / 60
                     min_sustained_minutes = getattr(self.config, "min_breakeven_sustained_minutes", 2.0)  # 2 minutes minimum
                     
                     if sustained_minutes >= min_sustained_minutes:
@@ -1407,7 +1530,7 @@ class PrimeStealthTrailingTP:
         # PRIORITY 1: GAP-RISK DETECTION (Chat recommendation)
         # Rev 00128: Make gap risk adaptive based on entry bar volatility to avoid closing profitable volatile trades
         # Gap risk should only trigger for truly significant gaps, not normal volatility swings
-        holding_minutes = (datetime.utcnow() - position.entry_time).total_seconds() / 60
+        holding_minutes = (self._utcnow() - position.entry_time).total_seconds() / 60
         min_gap_risk_activation_minutes = getattr(self.config, "min_gap_risk_activation_minutes", 10.0)  # 10 minutes minimum
         
         # Only check gap risk if position has been held for minimum time
@@ -1453,21 +1576,14 @@ class PrimeStealthTrailingTP:
             # Rev 00131: TIME-WEIGHTED PEAK - Extended to configurable minutes (default 45)
             # Rev 00170: Now configurable (was hardcoded 45 minutes)
             # This prevents exits based on old peaks and gives more room for profitable trades
-            now = datetime.utcnow()
-            recent_cutoff = now - timedelta(minutes=self.config.gap_risk_time_weighted_peak_minutes)
-            
-            # Get recent price history (last 30 minutes)
-            recent_prices = []
-            if hasattr(position, 'price_history') and position.price_history:
-                for price_entry in position.price_history:
-                    if isinstance(price_entry, dict) and 'timestamp' in price_entry:
-                        if price_entry['timestamp'] >= recent_cutoff:
-                            recent_prices.append(price_entry.get('price', 0))
+            # Rev 00239: O(1) rolling peak/trough over the configured window
+            now = self._utcnow()
+            price_window = position.price_history
             
             # Determine last peak: Use recent peak if available, otherwise use all-time peak
             if position.side == SignalSide.LONG:
-                if recent_prices:
-                    recent_peak = max(recent_prices)
+                recent_peak = price_window.peak(now) if price_window else None
+                if recent_peak is not None:
                     all_time_peak = position.highest_price
                     last_peak = max(recent_peak, all_time_peak)  # Use higher of recent or all-time
                     peak_source = "recent" if recent_peak >= all_time_peak else "all-time"
@@ -1475,8 +1591,8 @@ class PrimeStealthTrailingTP:
                     last_peak = position.highest_price
                     peak_source = "all-time"
             else:  # SHORT
-                if recent_prices:
-                    recent_trough = min(recent_prices)
+                recent_trough = price_window.trough(now) if price_window else None
+                if recent_trough is not None:
                     all_time_trough = position.lowest_price
                     last_peak = min(recent_trough, all_time_trough)  # Use lower of recent or all-time
                     peak_source = "recent" if recent_trough <= all_time_trough else "all-time"
@@ -1511,7 +1627,7 @@ class PrimeStealthTrailingTP:
         # PRIORITY 1: STEALTH STOP LOSS HIT - Side-aware (Chat recommendation)
         # Rev 00213: CRITICAL FIX - Add minimum holding time for profitable positions to prevent premature exits
         # Rev 00214: CRITICAL FIX - Add minimum profit threshold before allowing stop loss exit on profitable positions
-        holding_minutes = (datetime.utcnow() - position.entry_time).total_seconds() / 60
+        holding_minutes = (self._utcnow() - position.entry_time).total_seconds() / 60
         
         # Rev 00213: If position is profitable, require minimum holding time before allowing stop loss exit
         # This prevents positions from exiting too early when they're profitable but haven't had time to develop
@@ -1622,14 +1738,14 @@ class PrimeStealthTrailingTP:
         # PRIORITY 5: Time-based exit (maximum holding period)
         # Rev 00149: CRITICAL FIX - Defer maximum holding time if breakeven or trailing is active
         # Positions with protection should be allowed to run longer to maximize profit capture
-        holding_seconds = (datetime.utcnow() - position.entry_time).total_seconds()
+        holding_seconds = (self._utcnow() - position.entry_time).total_seconds()
         holding_hours = holding_seconds / 3600
         
         # Rev 00072: Debug logging for time-based exit (helps diagnose timezone issues)
         # Rev 00150: Enhanced logging for activation criteria check
         # Rev 00154: Changed to INFO level for visibility
         if holding_hours >= (self.config.max_holding_hours - 0.1):  # Log when close to threshold
-            log.info(f"⏰ MAX HOLD TIME CHECK: {position.symbol} - Entry: {position.entry_time}, Now: {datetime.utcnow()}, Held: {holding_hours:.2f}h / {self.config.max_holding_hours:.2f}h")
+            log.info(f"⏰ MAX HOLD TIME CHECK: {position.symbol} - Entry: {position.entry_time}, Now: {self._utcnow()}, Held: {holding_hours:.2f}h / {self.config.max_holding_hours:.2f}h")
             log.info(f"   Breakeven achieved: {position.breakeven_achieved}")
             log.info(f"   Trailing activated: {position.trailing_activated}")
         
@@ -1733,7 +1849,7 @@ class PrimeStealthTrailingTP:
 
             # Require a reasonable sample size or runtime before declaring a bad day
             earliest_entry = min(p.entry_time for p in positions)
-            runtime_minutes = (datetime.utcnow() - earliest_entry).total_seconds() / 60
+            runtime_minutes = (self._utcnow() - earliest_entry).total_seconds() / 60
             min_positions = getattr(self.config, "bad_day_min_positions", 3)
             min_runtime = getattr(self.config, "bad_day_min_runtime_minutes", 20.0)
 
@@ -1904,7 +2020,7 @@ class PrimeStealthTrailingTP:
         Returns:
             StealthDecision to exit, or None to continue
         """
-        holding_minutes = (datetime.utcnow() - position.entry_time).total_seconds() / 60
+        holding_minutes = (self._utcnow() - position.entry_time).total_seconds() / 60
         
         # Rev 00201: Use configurable rapid exit time limit
         rapid_exit_time_limit_minutes = getattr(self.config, "rapid_exit_time_limit_minutes", 30.0)
@@ -2019,7 +2135,7 @@ class PrimeStealthTrailingTP:
         
         Rev 00069: Enhanced logging to diagnose timeout failures
         """
-        current_time = datetime.utcnow()
+        current_time = self._utcnow()
         pnl_pct = position.unrealized_pnl_pct
         
         # Calculate time since ENTRY (not since first profitable)
@@ -2230,7 +2346,7 @@ class PrimeStealthTrailingTP:
     
     def _apply_volume_protection(self, position: PositionState, market_data: Dict[str, Any]) -> Optional[StealthDecision]:
         """Apply volume-based protection with hysteresis & cooldown (Chat A+)"""
-        now = datetime.utcnow()
+        now = self._utcnow()
         
         # Update peak volume ratio for hysteresis
         position.peak_volume_ratio = max(position.peak_volume_ratio, position.volume_ratio)
@@ -2343,7 +2459,7 @@ class PrimeStealthTrailingTP:
         
         # Rev 00131: Trailing activation (OPTIMIZED FOR PROFIT CAPTURE)
         # Lowered threshold to 0.5% and time to 4 minutes to capture profits earlier
-        holding_minutes = (datetime.utcnow() - position.entry_time).total_seconds() / 60
+        holding_minutes = (self._utcnow() - position.entry_time).total_seconds() / 60
         min_trailing_activation_minutes = getattr(self.config, "min_trailing_activation_minutes", 6.4)  # Rev 00196: Optimized from 3.5 to 6.4 minutes (median activation time)
         
         # Rev 00154: Enhanced logging - all messages at INFO level for visibility
@@ -2376,7 +2492,7 @@ class PrimeStealthTrailingTP:
         # ========== TIERED ENTRY BAR PROTECTION (Rev 00043) ==========
         # Rev 00156: All entry bar protection values are now configurable
         # CRITICAL: Use wider stops for first N minutes, scaled to entry bar volatility
-        holding_minutes = (datetime.utcnow() - position.entry_time).total_seconds() / 60
+        holding_minutes = (self._utcnow() - position.entry_time).total_seconds() / 60
         
         if holding_minutes < self.config.entry_bar_protection_minutes:
             # Rev 00131: TIERED Entry Bar Protection (OPTIMIZED - WIDENED for volatile stocks)
@@ -2528,7 +2644,7 @@ class PrimeStealthTrailingTP:
         # Entry bars with low volatility only need minimal protection
         # This prevents entry bar noise from killing trades while minimizing downside
         
-        holding_minutes = (datetime.utcnow() - position.entry_time).total_seconds() / 60
+        holding_minutes = (self._utcnow() - position.entry_time).total_seconds() / 60
         
         if holding_minutes < self.config.entry_bar_protection_minutes:
             # TIERED Entry Bar Protection based on entry bar volatility - Rev 00156: Configurable
@@ -2837,7 +2953,7 @@ class PrimeStealthTrailingTP:
                     # Calculate holding time
                     holding_time_minutes = 0
                     if hasattr(position, 'entry_time') and position.entry_time:
-                        time_diff = datetime.utcnow() - position.entry_time
+                        time_diff = self._utcnow() - position.entry_time
                         holding_time_minutes = int(time_diff.total_seconds() / 60)
                     
                     # Calculate P&L
@@ -2868,7 +2984,7 @@ class PrimeStealthTrailingTP:
                 except Exception as e:
                     log.error(f"❌ Failed to send exit alert for {symbol}: {e}", exc_info=True)
                     log.error(f"   Alert manager: {self.alert_manager}, Mode: {self.mode}, Exit reason: {exit_reason.value}")
-            else:
+            elif send_alert:  # Rev 00242: batch/replay removals (send_alert=False) are not an error
                 log.error(f"❌ Cannot send exit alert for {symbol}: alert_manager is None!")
                 log.error(f"   This should not happen - alert_manager should be set during initialization")
             
@@ -3120,7 +3236,7 @@ class PrimeStealthTrailingTP:
             Minimum score required to boot a position (0.1-0.5)
         """
         try:
-            current_time = datetime.utcnow()
+            current_time = self._utcnow()
             
             # Estimate market open time (7:15 AM PT = 14:15 UTC / 10:15 AM ET)
             # For simplicity, use first SO position entry time if available
@@ -3181,7 +3297,7 @@ class PrimeStealthTrailingTP:
         
         Returns: (score, is_bootable, reason)
         """
-        current_time = datetime.utcnow()
+        current_time = self._utcnow()
         age_minutes = (current_time - pos.entry_time).total_seconds() / 60.0
         
         # Calculate P&L percentage
@@ -3271,7 +3387,7 @@ class PrimeStealthTrailingTP:
                         'score': score,
                         'value': pos.entry_price * pos.quantity,
                         'reason': reason,
-                        'age_minutes': (datetime.utcnow() - pos.entry_time).total_seconds() / 60.0,
+                        'age_minutes': (self._utcnow() - pos.entry_time).total_seconds() / 60.0,
                         'pnl_pct': pos.unrealized_pnl_pct
                     }
             
@@ -3309,7 +3425,7 @@ class PrimeStealthTrailingTP:
             pos = self.active_positions[symbol]
             
             log.info(f"🔄 Closing {symbol} for rebalance: {reason}")
-            log.info(f"   Age: {(datetime.utcnow() - pos.entry_time).total_seconds() / 60:.0f} min, "
+            log.info(f"   Age: {(self._utcnow() - pos.entry_time).total_seconds() / 60:.0f} min, "
                     f"P&L: {pos.unrealized_pnl_pct:.2%}")
             
             # Close via execution adapter
@@ -3413,6 +3529,7 @@ class PrimeStealthTrailingTP:
             'breakeven_activations': 0,
             'trailing_activations': 0,
             'exits_triggered': 0,
+            'scale_outs_triggered': 0,  # Rev 00242: Keep in sync with __init__ (scale-out ladder increments it)
             'total_pnl': 0.0
         }
         log.info("Daily stealth statistics reset")
@@ -0,0 +1,428 @@
+"""
+Prime Streaming Indicators
+
+Incremental indicator state for open positions (Rev 00252).
+
+Each position's state is seeded once from its daily history when it first
+shows up in the monitoring tick. The seed commits every completed daily bar in
+O(1) per bar. After that, each batch quote is applied as today's live bar
+without re-reading history:
+- EMA 12/26 and MACD (9-period signal) extend the committed EMAs by one step
+- RSI 14 and ATR 14 use Wilder smoothing (avg = (avg * 13 + x) / 14)
+- Bollinger 20 and daily-return volatility use a sliding Welford window
+  (running mean/M2; the live value is folded in without mutating it)
+- SMA 20/50, volume SMA and momentum use running sums over fixed deques
+- OBV extends the committed total by the live bar's signed day volume
+- VWAP accumulates price x volume delta between successive quotes
+
+Daily values follow the standard definitions: RSI and ATR are Wilder-smoothed.
+They therefore differ slightly from the simple-average values of the
+PrimeETradeTrading batch path. When a quote arrives for a new session date,
+the last live bar is committed and the intraday VWAP restarts.
+"""
+
+import logging
+import math
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+log = logging.getLogger(__name__)
+
+STREAMING_INDICATORS_ENABLED = os.getenv('STREAMING_INDICATORS_ENABLED', 'true').lower() == 'true'
+STREAMING_INDICATORS_MIN_BARS = int(os.getenv('STREAMING_INDICATORS_MIN_BARS', '35'))
+STREAMING_INDICATORS_SEED_RETRY_SECONDS = float(os.getenv('STREAMING_INDICATORS_SEED_RETRY_SECONDS', '300'))
+
+# symbols -> {symbol: daily bars ({'date', 'open', 'high', 'low', 'close', 'volume'}, oldest first)}
+HistoryLoader = Callable[[List[str]], Dict[str, List[Dict[str, Any]]]]
+
+
+class SlidingWelford:
+    """Mean/variance of the last `size` values, updated in O(1) per value (Welford add/remove)"""
+
+    __slots__ = ('size', 'values', 'mean', 'm2')
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: deque = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, x: float):
+        """Add x, evicting the oldest value once the window is full"""
+        if len(self.values) == self.size:
+            old = self.values.popleft()
+            n = len(self.values)
+            if n == 0:
+                self.mean = self.m2 = 0.0
+            else:
+                old_mean = self.mean
+                self.mean = (old_mean * (n + 1) - old) / n
+                self.m2 -= (old - old_mean) * (old - self.mean)
+        self.values.append(x)
+        n = len(self.values)
+        delta = x - self.mean
+        self.mean += delta / n
+        self.m2 = max(self.m2 + delta * (x - self.mean), 0.0)
+
+    def peek(self, x: float):
+        """(mean, population variance) of the window after pushing x, without pushing it"""
+        values = self.values
+        mean, m2, n = self.mean, self.m2, len(values)
+        if n == self.size:
+            old = values[0]
+            n -= 1
+            if n == 0:
+                mean = m2 = 0.0
+            else:
+                old_mean = mean
+                mean = (old_mean * (n + 1) - old) / n
+                m2 -= (old - old_mean) * (old - mean)
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 = max(m2 + delta * (x - mean), 0.0)
+        return mean, m2 / n
+
+
+class RunningWindow:
+    """Running sum of the last `size` values"""
+
+    __slots__ = ('size', 'values', 'total')
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: deque = deque()
+        self.total = 0.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, x: float):
+        if len(self.values) == self.size:
+            self.total -= self.values.popleft()
+        self.values.append(x)
+        self.total += x
+
+    def peek_mean(self, x: float) -> float:
+        """Mean of the window after pushing x, without pushing it"""
+        if len(self.values) == self.size:
+            return (self.total - self.values[0] + x) / self.size
+        return (self.total + x) / (len(self.values) + 1)
+
+
+class StreamingIndicatorState:
+    """
+    Daily indicator state for one symbol: committed through the last completed
+    bar, plus an intraday live bar rebuilt from each quote
+    """
+
+    RSI_PERIOD = 14
+    ATR_PERIOD = 14
+    BOLLINGER_PERIOD = 20
+    MOMENTUM_PERIOD = 10
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bars = 0
+        self.last_close: Optional[float] = None
+        self.session_date: Optional[str] = None
+
+        self.ema_12: Optional[float] = None
+        self.ema_26: Optional[float] = None
+        self.macd_signal: Optional[float] = None
+        self._rsi_warmup: List[float] = []
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+        self._tr_warmup: List[float] = []
+        self.atr: Optional[float] = None
+        self.obv = 0.0
+
+        # Full-period windows of committed values; peeks evict the oldest to make room for the live bar
+        self.closes = SlidingWelford(self.BOLLINGER_PERIOD)
+        self.returns = SlidingWelford(self.BOLLINGER_PERIOD)
+        self.sma_50 = RunningWindow(50)
+        self.volumes = RunningWindow(self.BOLLINGER_PERIOD)
+        self.momentum_closes: deque = deque(maxlen=self.MOMENTUM_PERIOD)
+
+        # Live (intraday) bar
+        self.live: Optional[Dict[str, float]] = None
+        self._vwap_pv = 0.0
+        self._vwap_volume = 0.0
+        self._last_day_volume = 0.0
+        self.updates = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.bars >= STREAMING_INDICATORS_MIN_BARS and self.atr is not None and self.avg_gain is not None
+
+    # ------------------------------------------------------------------
+    # Committed (daily) state
+    # ------------------------------------------------------------------
+
+    def seed(self, bars: Sequence[Dict[str, Any]], today: Optional[str] = None) -> int:
+        """
+        Commit completed daily bars (oldest first)
+
+        A trailing bar dated `today` is skipped: it is a partial bar, and the live quote replaces it.
+        Returns the number of committed bars.
+        """
+        today = today or datetime.now().strftime("%Y-%m-%d")
+        for bar in bars:
+            if bar.get('date') == today:
+                continue
+            try:
+                close = float(bar['close'])
+                self.commit(close, float(bar.get('high', close)), float(bar.get('low', close)), float(bar.get('volume', 0) or 0))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return self.bars
+
+    def commit(self, close: float, high: float, low: float, volume: float):
+        """Fold one completed daily bar into the state (O(1))"""
+        prev = self.last_close
+        if prev is None:
+            self.ema_12 = self.ema_26 = close
+        else:
+            self.ema_12 = close * (2 / 13) + self.ema_12 * (1 - 2 / 13)
+            self.ema_26 = close * (2 / 27) + self.ema_26 * (1 - 2 / 27)
+            if self.bars + 1 >= 26:
+                macd = self.ema_12 - self.ema_26
+                self.macd_signal = macd if self.macd_signal is None else macd * 0.2 + self.macd_signal * 0.8
+
+            change = close - prev
+            gain, loss = max(change, 0.0), max(-change, 0.0)
+            if self.avg_gain is None:
+                self._rsi_warmup.append(change)
+                if len(self._rsi_warmup) == self.RSI_PERIOD:
+                    self.avg_gain = sum(max(c, 0.0) for c in self._rsi_warmup) / self.RSI_PERIOD
+                    self.avg_loss = sum(max(-c, 0.0) for c in self._rsi_warmup) / self.RSI_PERIOD
+                    self._rsi_warmup = []
+            else:
+                self.avg_gain = (self.avg_gain * (self.RSI_PERIOD - 1) + gain) / self.RSI_PERIOD
+                self.avg_loss = (self.avg_loss * (self.RSI_PERIOD - 1) + loss) / self.RSI_PERIOD
+
+            tr = max(high - low, abs(high - prev), abs(low - prev))
+            if self.atr is None:
+                self._tr_warmup.append(tr)
+                if len(self._tr_warmup) == self.ATR_PERIOD:
+                    self.atr = sum(self._tr_warmup) / self.ATR_PERIOD
+                    self._tr_warmup = []
+            else:
+                self.atr = (self.atr * (self.ATR_PERIOD - 1) + tr) / self.ATR_PERIOD
+
+            if close > prev:
+                self.obv += volume
+            elif close < prev:
+                self.obv -= volume
+            if prev > 0:
+                self.returns.push(change / prev)
+
+        self.closes.push(close)
+        self.sma_50.push(close)
+        self.volumes.push(volume)
+        self.momentum_closes.append(close)
+        self.last_close = close
+        self.bars += 1
+
+    # ------------------------------------------------------------------
+    # Live (intraday) bar
+    # ------------------------------------------------------------------
+
+    def _roll_session(self, session_date: str):
+        """New trading day: commit the previous session's last live bar, restart VWAP"""
+        if self.live is not None and self.session_date is not None:
+            live = self.live
+            self.commit(live['price'], live['high'], live['low'], live['volume'])
+        self.session_date = session_date
+        self.live = None
+        self._vwap_pv = self._vwap_volume = self._last_day_volume = 0.0
+
+    def update(self, price: float, high: Optional[float] = None, low: Optional[float] = None,
+               day_volume: Optional[float] = None, session_date: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Apply one quote as today's live bar and return the indicator snapshot (O(1))
+
+        Args:
+            price: Last trade price
+            high/low: Session high/low (defaults to the running extremes of the quotes seen)
+            day_volume: Cumulative session volume
+            session_date: Trading date of the quote (YYYY-MM-DD, defaults to today)
+        """
+        session_date = session_date or datetime.now().strftime("%Y-%m-%d")
+        if session_date != self.session_date:
+            self._roll_session(session_date)
+
+        price = float(price)
+        live = self.live or {'high': price, 'low': price, 'volume': 0.0}
+        high = max(float(high or price), live['high'], price)
+        low = min(float(low or price), live['low'], price)
+        day_volume = float(day_volume if day_volume is not None else live['volume'])
+
+        # VWAP from volume traded between quotes; volume before the first quote is priced at the typical price
+        traded = day_volume - self._last_day_volume
+        if traded > 0:
+            vwap_price = (high + low + price) / 3 if self._vwap_volume == 0 else price
+            self._vwap_pv += vwap_price * traded
+            self._vwap_volume += traded
+        self._last_day_volume = max(self._last_day_volume, day_volume)
+
+        self.live = {'price': price, 'high': high, 'low': low, 'volume': day_volume}
+        self.updates += 1
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Indicator values for the live bar (committed state + live bar, nothing mutated)"""
+        if self.live is None or self.last_close is None:
+            return {}
+        price, high, low, volume = self.live['price'], self.live['high'], self.live['low'], self.live['volume']
+        prev = self.last_close
+
+        ema_12 = price * (2 / 13) + self.ema_12 * (1 - 2 / 13)
+        ema_26 = price * (2 / 27) + self.ema_26 * (1 - 2 / 27)
+        macd = ema_12 - ema_26
+        macd_signal = macd * 0.2 + self.macd_signal * 0.8 if self.macd_signal is not None else macd
+
+        change = price - prev
+        if self.avg_gain is not None:
+            avg_gain = (self.avg_gain * (self.RSI_PERIOD - 1) + max(change, 0.0)) / self.RSI_PERIOD
+            avg_loss = (self.avg_loss * (self.RSI_PERIOD - 1) + max(-change, 0.0)) / self.RSI_PERIOD
+            rsi = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+        else:
+            rsi = 50.0
+
+        tr = max(high - low, abs(high - prev), abs(low - prev))
+        atr = (self.atr * (self.ATR_PERIOD - 1) + tr) / self.ATR_PERIOD if self.atr is not None else tr
+
+        middle, variance = self.closes.peek(price)
+        std = math.sqrt(variance)
+        upper, lower = middle + 2 * std, middle - 2 * std
+        band = upper - lower
+
+        _, return_variance = self.returns.peek(change / prev if prev > 0 else 0.0)
+        volume_sma = self.volumes.peek_mean(volume)
+        momentum_base = self.momentum_closes[0] if len(self.momentum_closes) == self.MOMENTUM_PERIOD else None
+        momentum = (price - momentum_base) / momentum_base * 100 if momentum_base else 0.0
+        vwap = self._vwap_pv / self._vwap_volume if self._vwap_volume > 0 else None
+        obv = self.obv + (volume if change > 0 else -volume if change < 0 else 0.0)
+
+        return {
+            'rsi': rsi,
+            'rsi_14': rsi,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_histogram': macd - macd_signal,
+            'sma_20': middle,
+            'sma_50': self.sma_50.peek_mean(price),
+            'ema_12': ema_12,
+            'ema_26': ema_26,
+            'atr': atr,
+            'bollinger_upper': upper,
+            'bollinger_middle': middle,
+            'bollinger_lower': lower,
+            'bollinger_width': band / middle if middle else 0.0,
+            'bollinger_position': (price - lower) / band if band > 0 else 0.5,
+            'volatility': math.sqrt(return_variance),
+            'volume_ratio': volume / volume_sma if volume_sma > 0 else 1.0,
+            'volume_sma': volume_sma,
+            'obv': obv,
+            'vwap': vwap,
+            'vwap_distance_pct': (price - vwap) / vwap * 100 if vwap else None,
+            'momentum': momentum,
+            'change_pct': change / prev * 100 if prev > 0 else 0.0,
+            'previous_close': prev,
+            'history_bars': self.bars,
+        }
+
+
+class StreamingIndicatorTracker:
+    """Per-position StreamingIndicatorState, seeded on first sight and dropped when the position closes"""
+
+    def __init__(self, history_loader: Optional[HistoryLoader] = None):
+        self.history_loader = history_loader
+        self.states: Dict[str, StreamingIndicatorState] = {}
+        self._seed_failed_at: Dict[str, float] = {}
+        self.stats = {'seeded': 0, 'seed_failures': 0, 'released': 0, 'updates': 0, 'last_update_us': 0.0}
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.states
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def seed(self, symbol: str, bars: Sequence[Dict[str, Any]]) -> bool:
+        """Build the state for symbol from daily bars; False if there is not enough history"""
+        state = StreamingIndicatorState(symbol)
+        state.seed(bars)
+        if not state.ready:
+            self._seed_failed_at[symbol] = time.monotonic()
+            self.stats['seed_failures'] += 1
+            log.debug(f"Streaming indicators: {symbol} has {state.bars} daily bars (need {STREAMING_INDICATORS_MIN_BARS})")
+            return False
+        self.states[symbol] = state
+        self._seed_failed_at.pop(symbol, None)
+        self.stats['seeded'] += 1
+        return True
+
+    def sync(self, symbols: Iterable[str]) -> List[str]:
+        """
+        Match the tracked states to the open positions
+
+        Releases states of closed positions and returns the symbols that still need seeding.
+        Symbols that could not be seeded recently are not retried until
+        STREAMING_INDICATORS_SEED_RETRY_SECONDS has passed.
+        """
+        wanted = set(symbols)
+        for symbol in [s for s in self.states if s not in wanted]:
+            del self.states[symbol]
+            self.stats['released'] += 1
+        now = time.monotonic()
+        return [s for s in wanted
+                if s not in self.states and now - self._seed_failed_at.get(s, -math.inf) >= STREAMING_INDICATORS_SEED_RETRY_SECONDS]
+
+    def seed_missing(self, symbols: Iterable[str]) -> int:
+        """Load history for untracked symbols with the history loader and seed them (blocking)"""
+        missing = self.sync(symbols)
+        if not missing or self.history_loader is None:
+            return 0
+        try:
+            history = self.history_loader(missing) or {}
+        except Exception as e:
+            log.warning(f"⚠️ Streaming indicators: history load failed for {len(missing)} symbols: {e}")
+            history = {}
+        seeded = sum(1 for symbol in missing if self.seed(symbol, history.get(symbol) or []))
+        if seeded:
+            log.info(f"📈 Streaming indicators seeded for {seeded}/{len(missing)} new positions ({len(self.states)} tracked)")
+        return seeded
+
+    def update_from_quotes(self, quotes: Dict[str, Dict[str, Any]],
+                           symbols: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Apply one batch of quotes ({symbol: {'last', 'high', 'low', 'volume', ...}})
+
+        Returns:
+            {symbol: indicator snapshot} for every tracked symbol with a usable quote
+        """
+        started = time.perf_counter()
+        snapshots: Dict[str, Dict[str, Any]] = {}
+        for symbol in (self.states if symbols is None else symbols):
+            state = self.states.get(symbol)
+            quote = quotes.get(symbol)
+            if state is None or not quote:
+                continue
+            price = quote.get('last', quote.get('price', 0.0))
+            if not price or price <= 0:
+                continue
+            snapshots[symbol] = state.update(price, quote.get('high'), quote.get('low'), quote.get('volume'))
+        self.stats['updates'] += len(snapshots)
+        if snapshots:
+            self.stats['last_update_us'] = round((time.perf_counter() - started) * 1e6 / len(snapshots), 1)
+        return snapshots
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'tracked': len(self.states)}
@@ -30,6 +30,11 @@ from .prime_models import StrategyMode, SignalType, SignalSide, TradeStatus, Sto
 from .config_loader import get_config_value
 from .mock_trading_executor import MockTradingExecutor
 from .daily_run_tracker import get_daily_run_tracker
+from .prime_benchmark_context import BenchmarkContext, BENCHMARK_SYMBOLS, build_benchmark_context
+from .prime_so_ranking import calculate_so_priority_score
+from .prime_streaming_indicators import StreamingIndicatorTracker, STREAMING_INDICATORS_ENABLED
+from .startup_timeline import get_startup_timeline
+from .prime_pipeline_trace import get_pipeline_tracer, traced
 
 # ============================================================================
 # TRADING CONFIGURATION
@@ -400,30 +405,51 @@ class PrimeTradingSystem:
         # Daily markers / persistence
         self.daily_run_tracker = get_daily_run_tracker()
         self._daily_markers_applied = False
+        
+        # Rev 00235: Per-scan SPY/QQQ/SPX benchmark snapshot (shared by RS vs SPY, Red Day filter, 0DTE)
+        self._benchmark_context: Optional[BenchmarkContext] = None
+        
+        # Rev 00252: Streaming indicator state per open position (seeded once, O(1) per monitoring quote)
+        self.indicator_tracker: Optional[StreamingIndicatorTracker] = (
+            StreamingIndicatorTracker(self._load_position_history) if STREAMING_INDICATORS_ENABLED else None
+        )
+    
+    def _load_position_history(self, symbols: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Daily history for newly opened positions (blocking - one batched download via the session cache)"""
+        etrade_trading = getattr(self.trade_manager, 'etrade_trading', None) if self.trade_manager else None
+        if etrade_trading is None:
+            return {}
+        etrade_trading.prefetch_historical_data(symbols)
+        return {symbol: etrade_trading._get_historical_data_for_symbol(symbol) for symbol in symbols}
     
     async def initialize(self, components: Dict[str, Any]):
         """Initialize the optimized trading system with components"""
+        # Rev 00250: Per-component init times for the startup timeline (/debug/startup)
+        timeline = get_startup_timeline()
         try:
             # Initialize components if not provided
-            if not components.get('data_manager'):
-                from .prime_data_manager import get_prime_data_manager
-                # CRITICAL: Pass ETrade OAuth for real-time data (Rev 00180AE)
-                etrade_oauth = components.get('etrade_oauth', None)
-                self.data_manager = await get_prime_data_manager(etrade_oauth)
+            with timeline.component('data_manager'):
+                if not components.get('data_manager'):
+                    from .prime_data_manager import get_prime_data_manager
+                    # CRITICAL: Pass ETrade OAuth for real-time data (Rev 00180AE)
+                    etrade_oauth = components.get('etrade_oauth', None)
+                    self.data_manager = await get_prime_data_manager(etrade_oauth)
             
             # DELETED (Oct 20, 2025): Production signal generator removed - ORB manager generates signals directly
             #     self.signal_generator = get_enhanced_production_signal_generator()
             
             # Initialize Market Manager (CRITICAL for timezone-aware market hours)
-            if not components.get('market_manager'):
-                from .prime_market_manager import get_prime_market_manager
-                self.market_manager = get_prime_market_manager()
-                log.info("🕐 Market Manager initialized (timezone-aware market hours)")
+            with timeline.component('market_manager'):
+                if not components.get('market_manager'):
+                    from .prime_market_manager import get_prime_market_manager
+                    self.market_manager = get_prime_market_manager()
+                    log.info("🕐 Market Manager initialized (timezone-aware market hours)")
             
             # Initialize ORB Strategy Manager (PRIMARY & ONLY STRATEGY)
             # Multi-strategy manager kept in module but not used in production
-            from .prime_orb_strategy_manager import get_prime_orb_strategy_manager
-            self.orb_strategy_manager = get_prime_orb_strategy_manager(self.data_manager)
+            with timeline.component('orb_strategy_manager'):
+                from .prime_orb_strategy_manager import get_prime_orb_strategy_manager
+                self.orb_strategy_manager = get_prime_orb_strategy_manager(self.data_manager)
             from .config_loader import get_config_value
             so_cutoff_str = get_config_value('SO_CUTOFF_TIME', '07:30')
             
@@ -435,41 +461,45 @@ class PrimeTradingSystem:
             log.info(f"   - Target Gain: 3% average (1-10% range)")
             
             # Initialize risk management based on mode
-            if self.config.mode == SystemMode.DEMO_MODE:
-                # Demo Mode: Use Demo Risk Manager
-                if not components.get('risk_manager'):
-                    from .prime_demo_risk_manager import get_prime_demo_risk_manager
-                    self.risk_manager = get_prime_demo_risk_manager()
-                    log.info("🎮 Demo Mode: Initialized Demo Risk Manager")
-            else:
-                # Live Mode: Use real Risk Manager with E*TRADE
-                if not components.get('risk_manager'):
-                    from .prime_risk_manager import get_prime_risk_manager
-                    self.risk_manager = get_prime_risk_manager()
-                    log.info("💰 Live Mode: Initialized Prime Risk Manager")
+            with timeline.component('risk_manager'):
+                if self.config.mode == SystemMode.DEMO_MODE:
+                    # Demo Mode: Use Demo Risk Manager
+                    if not components.get('risk_manager'):
+                        from .prime_demo_risk_manager import get_prime_demo_risk_manager
+                        self.risk_manager = get_prime_demo_risk_manager()
+                        log.info("🎮 Demo Mode: Initialized Demo Risk Manager")
+                else:
+                    # Live Mode: Use real Risk Manager with E*TRADE
+                    if not components.get('risk_manager'):
+                        from .prime_risk_manager import get_prime_risk_manager
+                        self.risk_manager = get_prime_risk_manager()
+                        log.info("💰 Live Mode: Initialized Prime Risk Manager")
             
             # Initialize unified trade manager for BOTH modes
-            if not components.get('trade_manager'):
-                from .prime_unified_trade_manager import get_prime_unified_trade_manager
-                self.trade_manager = get_prime_unified_trade_manager()
-                mode_text = "Live" if self.config.mode == SystemMode.LIVE_MODE else "Demo"
-                log.info(f"🎯 {mode_text} Mode: Initialized Unified Trade Manager")
+            with timeline.component('trade_manager'):
+                if not components.get('trade_manager'):
+                    from .prime_unified_trade_manager import get_prime_unified_trade_manager
+                    self.trade_manager = get_prime_unified_trade_manager()
+                    mode_text = "Live" if self.config.mode == SystemMode.LIVE_MODE else "Demo"
+                    log.info(f"🎯 {mode_text} Mode: Initialized Unified Trade Manager")
             
             # Rev 00127: Initialize alert_manager BEFORE stealth_trailing so it can be passed correctly
-            if not components.get('alert_manager'):
-                from .prime_alert_manager import get_prime_alert_manager
-                self.alert_manager = get_prime_alert_manager()
+            with timeline.component('alert_manager'):
+                if not components.get('alert_manager'):
+                    from .prime_alert_manager import get_prime_alert_manager
+                    self.alert_manager = get_prime_alert_manager()
             
             # Initialize stealth trailing - MUST happen AFTER mock_executor AND alert_manager initialization
             # Will be re-initialized later with execution adapter
-            if not components.get('stealth_trailing'):
-                from .prime_stealth_trailing_tp import get_prime_stealth_trailing
-                # Rev 00117: Pass alert_manager and mode for exit alerts
-                # Rev 00127: alert_manager is now initialized before this point
-                mode_str = "LIVE" if self.config.mode == SystemMode.LIVE_MODE else "DEMO"
-                self.stealth_trailing = get_prime_stealth_trailing(alert_manager=self.alert_manager)
-                self.stealth_trailing.mode = mode_str  # Set mode for alert display
-                log.info(f"🛡️ Stealth Trailing System initialized ({mode_str} mode, execution adapter will be set later)")
+            with timeline.component('stealth_trailing'):
+                if not components.get('stealth_trailing'):
+                    from .prime_stealth_trailing_tp import get_prime_stealth_trailing
+                    # Rev 00117: Pass alert_manager and mode for exit alerts
+                    # Rev 00127: alert_manager is now initialized before this point
+                    mode_str = "LIVE" if self.config.mode == SystemMode.LIVE_MODE else "DEMO"
+                    self.stealth_trailing = get_prime_stealth_trailing(alert_manager=self.alert_manager)
+                    self.stealth_trailing.mode = mode_str  # Set mode for alert display
+                    log.info(f"🛡️ Stealth Trailing System initialized ({mode_str} mode, execution adapter will be set later)")
             
             # ARCHIVED (Rev 00173): Symbol selector no longer used - ORB strategy uses static prioritized list
             # DELETED (Oct 20, 2025): Prime symbol selector removed - All symbols used in ORB strategy
@@ -495,21 +525,22 @@ class PrimeTradingSystem:
             # self.symbol_selector = components.get('symbol_selector', self.symbol_selector)
             
             # Initialize mock trading executor for Demo Mode (after alert manager and risk manager)
-            if not components.get('mock_executor') and self.alert_manager:
-                # Rev 00107: Pass risk manager's compound engine to mock executor (single engine!)
-                compound_engine_to_pass = None
-                if hasattr(self, 'risk_manager') and hasattr(self.risk_manager, 'compound_engine'):
-                    compound_engine_to_pass = self.risk_manager.compound_engine
-                    log.info(f"✅ Passing compound engine from risk manager to mock executor (SINGLE ENGINE)")
-                
-                self.mock_executor = MockTradingExecutor(
-                    alert_manager=self.alert_manager,
-                    compound_engine=compound_engine_to_pass
-                )
-                log.info(f"✅ Mock Executor initialized (alert_manager: {self.alert_manager is not None}, compound_engine: {compound_engine_to_pass is not None})")
-            elif components.get('mock_executor'):
-                self.mock_executor = components.get('mock_executor')
-                log.info(f"✅ Mock Executor received from components")
+            with timeline.component('mock_executor'):
+                if not components.get('mock_executor') and self.alert_manager:
+                    # Rev 00107: Pass risk manager's compound engine to mock executor (single engine!)
+                    compound_engine_to_pass = None
+                    if hasattr(self, 'risk_manager') and hasattr(self.risk_manager, 'compound_engine'):
+                        compound_engine_to_pass = self.risk_manager.compound_engine
+                        log.info(f"✅ Passing compound engine from risk manager to mock executor (SINGLE ENGINE)")
+                
+                    self.mock_executor = MockTradingExecutor(
+                        alert_manager=self.alert_manager,
+                        compound_engine=compound_engine_to_pass
+                    )
+                    log.info(f"✅ Mock Executor initialized (alert_manager: {self.alert_manager is not None}, compound_engine: {compound_engine_to_pass is not None})")
+                elif components.get('mock_executor'):
+                    self.mock_executor = components.get('mock_executor')
+                    log.info(f"✅ Mock Executor received from components")
             
             # CRITICAL FIX (Rev 00180AE): Configure stealth trailing IMMEDIATELY after mock executor
             # This ensures exec adapter is available BEFORE any trading begins
@@ -543,23 +574,24 @@ class PrimeTradingSystem:
             log.info(f"🎯 ORR Trading: {orr_status} (ORR_CAPITAL_PCT={orr_reserve_pct}%)")
             
             # Initialize alert manager and start EOD scheduler
-            if self.alert_manager:
-                await self.alert_manager.initialize()
-                # Set mock executor reference for Demo Mode EOD reports
-                if hasattr(self, 'mock_executor') and self.mock_executor:
-                    self.alert_manager._mock_executor = self.mock_executor
-                    log.info(f"✅ Alert Manager: Mock Executor reference set (instance: {id(self.mock_executor)})")
-                # Rev 00180AE: Set unified trade manager reference for Live Mode EOD reports
-                if hasattr(self, 'trade_manager') and self.trade_manager:
-                    self.alert_manager._unified_trade_manager = self.trade_manager
-                    log.info(f"✅ Alert Manager: Unified Trade Manager reference set for Live EOD")
-                    log.info(f"   Instance ID: {id(self.trade_manager)}")
-                
-                # Rev 00047: DISABLE internal EOD scheduler - use Cloud Scheduler ONLY
-                # This prevents 3 duplicate reports (internal scheduler + Cloud Scheduler + multiple instances)
-                # Cloud Scheduler job "end-of-day-report" triggers /api/end-of-day-report at 4:05 PM ET
-                # self.alert_manager.start_end_of_day_scheduler()  # DISABLED
-                log.info("✅ EOD reporting configured - handled by Cloud Scheduler ONLY (internal scheduler disabled)")
+            with timeline.component('alert_manager_initialize'):
+                if self.alert_manager:
+                    await self.alert_manager.initialize()
+                    # Set mock executor reference for Demo Mode EOD reports
+                    if hasattr(self, 'mock_executor') and self.mock_executor:
+                        self.alert_manager._mock_executor = self.mock_executor
+                        log.info(f"✅ Alert Manager: Mock Executor reference set (instance: {id(self.mock_executor)})")
+                    # Rev 00180AE: Set unified trade manager reference for Live Mode EOD reports
+                    if hasattr(self, 'trade_manager') and self.trade_manager:
+                        self.alert_manager._unified_trade_manager = self.trade_manager
+                        log.info(f"✅ Alert Manager: Unified Trade Manager reference set for Live EOD")
+                        log.info(f"   Instance ID: {id(self.trade_manager)}")
+                
+                    # Rev 00047: DISABLE internal EOD scheduler - use Cloud Scheduler ONLY
+                    # This prevents 3 duplicate reports (internal scheduler + Cloud Scheduler + multiple instances)
+                    # Cloud Scheduler job "end-of-day-report" triggers /api/end-of-day-report at 4:05 PM ET
+                    # self.alert_manager.start_end_of_day_scheduler()  # DISABLED
+                    log.info("✅ EOD reporting configured - handled by Cloud Scheduler ONLY (internal scheduler disabled)")
             
             # Parallel processing is ready to use
             
@@ -1169,6 +1201,17 @@ class PrimeTradingSystem:
                     log.error(f"Failed to load symbols from core_list.csv: {e}")
                     return
             
+            # Rev 00254: 0DTE underlyings share the (batched, incremental) refresh
+            try:
+                import pandas as pd
+                dte_list_path = "data/watchlist/0dte_list.csv"
+                if os.path.exists(dte_list_path):
+                    df = pd.read_csv(dte_list_path, comment='#')
+                    dte_symbols = df['symbol'].tolist() if 'symbol' in df.columns else df.iloc[:, 0].tolist()
+                    symbols = list(dict.fromkeys(list(symbols) + dte_symbols))
+            except Exception as e:
+                log.debug(f"Could not add 0DTE symbols to ADV refresh: {e}")
+            
             # Refresh ADV data (run in executor to avoid blocking event loop)
             await asyncio.get_event_loop().run_in_executor(
                 None,
@@ -1359,7 +1402,7 @@ class PrimeTradingSystem:
                                 # Rev 00170: Flush exit monitoring data after EOD close
                                 if hasattr(self, 'stealth_trailing') and self.stealth_trailing and hasattr(self.stealth_trailing, 'exit_monitor') and self.stealth_trailing.exit_monitor:
                                     try:
-                                        self.stealth_trailing.exit_monitor.flush_all()
+                                        await asyncio.to_thread(self.stealth_trailing.exit_monitor.flush_all)  # Rev 00238: waits for segment uploads
                                         log.info("✅ Exit monitoring data flushed after EOD close")
                                     except Exception as flush_error:
                                         log.warning(f"⚠️ Failed to flush exit monitoring data after EOD close: {flush_error}")
@@ -1371,7 +1414,7 @@ class PrimeTradingSystem:
                                 # Rev 00170: Still flush exit monitoring data even if no positions to close
                                 if hasattr(self, 'stealth_trailing') and self.stealth_trailing and hasattr(self.stealth_trailing, 'exit_monitor') and self.stealth_trailing.exit_monitor:
                                     try:
-                                        self.stealth_trailing.exit_monitor.flush_all()
+                                        await asyncio.to_thread(self.stealth_trailing.exit_monitor.flush_all)  # Rev 00238: waits for segment uploads
                                         log.info("✅ Exit monitoring data flushed at EOD (no positions to close)")
                                     except Exception as flush_error:
                                         log.warning(f"⚠️ Failed to flush exit monitoring data at EOD: {flush_error}")
@@ -1436,8 +1479,10 @@ class PrimeTradingSystem:
                                 # Rev 00133: Flush exit monitoring data before EOD report (TEMPORARY - for exit optimization)
                                 if hasattr(self, 'stealth_trailing') and self.stealth_trailing and hasattr(self.stealth_trailing, 'exit_monitor') and self.stealth_trailing.exit_monitor:
                                     try:
-                                        self.stealth_trailing.exit_monitor.flush_all()
+                                        await asyncio.to_thread(self.stealth_trailing.exit_monitor.flush_all)  # Rev 00238: waits for segment uploads
                                         log.info("✅ Exit monitoring data flushed to GCS")
+                                        # Rev 00238: Daily compaction - merge today's append-only segments
+                                        await asyncio.to_thread(self.stealth_trailing.exit_monitor.compact_date)
                                     except Exception as flush_error:
                                         log.warning(f"⚠️ Failed to flush exit monitoring data: {flush_error}")
                                 
@@ -1605,6 +1650,12 @@ class PrimeTradingSystem:
                     self._prev_candle_prefetched_today = False  # Rev 20251023: Reset prefetch flag for SO window
                     self._holiday_checked_date = None  # Rev 00139: Reset holiday check for new day
                     self._holiday_skip_today = False  # Rev 00139: Reset holiday skip flag
+                    self._prestage_account_value = None  # Rev 00245: Re-read balance for SO pre-staging
+                    options_chain_manager = getattr(getattr(self, 'dte0_manager', None), 'options_chain_manager', None)
+                    if options_chain_manager and hasattr(options_chain_manager, 'stop_prefetch'):
+                        await options_chain_manager.stop_prefetch()  # Rev 00246
+                    if getattr(self, 'order_prestager', None):
+                        self.order_prestager.clear()
                     self._last_orb_date = current_date
                     log.info(f"🔄 Daily reset complete for {current_date} - all flags cleared")
                     
@@ -1695,6 +1746,14 @@ class PrimeTradingSystem:
                         await self._prefetch_previous_candle_data()
                         self._prev_candle_prefetched_today = True
                         log.info(f"✅ Previous candle data ready - SO validation can now execute instantly!")
+                        
+                        # Rev 00246: Warm 0DTE options chains in the background until 0DTE execution
+                        options_chain_manager = getattr(getattr(self, 'dte0_manager', None), 'options_chain_manager', None)
+                        if options_chain_manager and hasattr(options_chain_manager, 'start_prefetch'):
+                            try:
+                                options_chain_manager.start_prefetch()
+                            except Exception as e:
+                                log.warning(f"⚠️ Failed to start 0DTE chain prefetch: {e}")
                 
                 # ========== AUTO ORB BACKFILL (Rev 00180L) ==========
                 # If ORB data is missing (system started mid-day), auto-capture using today's market data
@@ -1841,16 +1900,14 @@ class PrimeTradingSystem:
                                         spx_qqq_spy_orb = self.dte0_manager.get_spx_qqq_spy_orb_data(self.orb_strategy_manager)
                                         
                                         # Try to get current prices for context
+                                        # Rev 00235: Current prices from the shared benchmark snapshot
                                         current_prices = {}
-                                        if hasattr(self, 'trade_manager') and self.trade_manager and hasattr(self.trade_manager, 'etrade_trading'):
-                                            try:
-                                                quotes = self.trade_manager.etrade_trading.get_quotes(['SPX', 'QQQ', 'SPY'])
-                                                for quote in quotes:
-                                                    symbol = getattr(quote, 'symbol', None) or getattr(quote, 'Symbol', None)
-                                                    if symbol:
-                                                        current_prices[symbol] = getattr(quote, 'last_price', None) or getattr(quote, 'LastPrice', None) or getattr(quote, 'last', None)
-                                            except Exception as price_error:
-                                                log.debug(f"Could not get current prices for Signal Collection alert: {price_error}")
+                                        try:
+                                            benchmark = await self._get_benchmark_context()
+                                            benchmark.record_use()
+                                            current_prices = benchmark.current_prices()
+                                        except Exception as price_error:
+                                            log.debug(f"Could not get current prices for Signal Collection alert: {price_error}")
                                         
                                         if spx_qqq_spy_orb['SPX']:
                                             orb = spx_qqq_spy_orb['SPX']
@@ -2096,6 +2153,11 @@ class PrimeTradingSystem:
                                 # Clear pending signals on error to prevent retry
                                 if hasattr(self, '_pending_dte0_signals'):
                                     self._pending_dte0_signals = []
+                            
+                            # Rev 00246: Chains are no longer needed once 0DTE execution has run
+                            options_chain_manager = getattr(self.dte0_manager, 'options_chain_manager', None)
+                            if options_chain_manager and hasattr(options_chain_manager, 'stop_prefetch'):
+                                await options_chain_manager.stop_prefetch()
                 
                 # NOTE: EOD report moved BEFORE market hours check (lines 1067-1103) to ensure it runs at 1:05 PM
                 
@@ -2306,6 +2368,15 @@ class PrimeTradingSystem:
                                         log.warning(f"Error getting ORB data for {symbol}: {e}")
                                     return None
                                 
+                                # Rev 00248: Demo mode - mark open options positions with the synthetic pricer (one batch pass)
+                                options_executor = self.dte0_manager.options_executor
+                                synthetic_chains = getattr(getattr(self.dte0_manager, 'options_chain_manager', None), 'synthetic_chains', None)
+                                open_symbols = list({p.symbol for p in options_executor.get_open_positions()})
+                                if options_executor.demo_mode and synthetic_chains and open_symbols:
+                                    quotes = await asyncio.gather(*(self.data_manager.get_quote(s) for s in open_symbols), return_exceptions=True)
+                                    underlying_prices = {s: q.get('last', q.get('price', 0.0)) for s, q in zip(open_symbols, quotes) if isinstance(q, dict)}
+                                    await options_executor.revalue_positions(underlying_prices, synthetic_chains)
+                                
                                 # Monitor options positions
                                 exit_signals = await self.dte0_manager.options_executor.monitor_positions(
                                     market_data_provider=get_market_data,
@@ -2507,11 +2578,56 @@ class PrimeTradingSystem:
                                 all_symbols = list(stealth_positions.keys()) + list(orphaned_positions_to_monitor.keys())
                                 
                                 if all_symbols and self.data_manager:
+                                    # Rev 00240: Monitoring tick - one batch quote, one batch technicals fetch,
+                                    # concurrent stealth decisions, one batched close for exits
+                                    tick_started = time.perf_counter()
                                     # Batch fetch current prices and market data
-                                    batch_quotes = await self.data_manager.get_batch_quotes(all_symbols)
+                                    # Rev 00252: SPY rides along for RS vs SPY (streaming and batch technicals reuse these quotes)
+                                    quote_symbols = all_symbols + ([] if 'SPY' in all_symbols else ['SPY'])
+                                    batch_quotes = await self.data_manager.get_batch_quotes(quote_symbols)
+                                    quotes_ms = (time.perf_counter() - tick_started) * 1000
                                     
                                     if batch_quotes:
-                                        # Update each position in stealth trailing
+                                        # Rev 00141/00240: Comprehensive technicals for all stealth symbols in one off-loop batch
+                                        enrich_started = time.perf_counter()
+                                        comprehensive_by_symbol = {}
+                                        stealth_symbols_with_quotes = [s for s in stealth_positions if s in batch_quotes]
+                                        
+                                        # Rev 00252: Streaming indicators - new positions are seeded once from daily history,
+                                        # every tracked position is then updated in O(1) from this tick's quote
+                                        if self.indicator_tracker is not None:
+                                            try:
+                                                if self.indicator_tracker.sync(stealth_positions):
+                                                    await asyncio.to_thread(self.indicator_tracker.seed_missing, list(stealth_positions))
+                                                spy_quote = batch_quotes.get('SPY') or {}
+                                                spy_change_pct = spy_quote.get('change_pct') or 0.0
+                                                for symbol, snapshot in self.indicator_tracker.update_from_quotes(batch_quotes, stealth_symbols_with_quotes).items():
+                                                    symbol_change_pct = batch_quotes[symbol].get('change_pct') or snapshot['change_pct']
+                                                    snapshot.update({
+                                                        'rs_vs_spy': symbol_change_pct - spy_change_pct,
+                                                        'spy_price': spy_quote.get('last'),
+                                                        'spy_change_pct': spy_change_pct,
+                                                        'data_quality': snapshot['history_bars'],
+                                                    })
+                                                    comprehensive_by_symbol[symbol] = snapshot
+                                            except Exception as stream_error:
+                                                log.warning(f"⚠️ Streaming indicator update failed: {stream_error}")
+                                        
+                                        # Positions without streaming state (not enough history) use the batch path
+                                        batch_symbols = [s for s in stealth_symbols_with_quotes if s not in comprehensive_by_symbol]
+                                        if batch_symbols and hasattr(self, 'trade_manager') and self.trade_manager and hasattr(self.trade_manager, 'etrade_trading') and self.trade_manager.etrade_trading:
+                                            try:
+                                                comprehensive_by_symbol.update(await asyncio.to_thread(
+                                                    self.trade_manager.etrade_trading.get_market_data_for_strategy_batch,
+                                                    batch_symbols,
+                                                    quotes={s: batch_quotes[s] for s in batch_symbols + ['SPY'] if s in batch_quotes}
+                                                ))
+                                            except Exception as tech_error:
+                                                log.debug(f"⚠️ Could not fetch comprehensive technicals: {tech_error}, using defaults")
+                                        enrich_ms = (time.perf_counter() - enrich_started) * 1000
+                                        
+                                        # Build market data for each position in stealth trailing
+                                        market_data_by_symbol = {}
                                         for symbol in list(stealth_positions.keys()):
                                             if symbol in batch_quotes:
                                                 quote = batch_quotes[symbol]
@@ -2532,43 +2648,40 @@ class PrimeTradingSystem:
                                                 }
                                                 
                                                 # Rev 00141: Try to get comprehensive technical indicators if available
-                                                try:
-                                                    if hasattr(self, 'trade_manager') and self.trade_manager and hasattr(self.trade_manager, 'etrade_trading') and self.trade_manager.etrade_trading:
-                                                        # Use E*TRADE trading system's comprehensive market data
-                                                        comprehensive_data = self.trade_manager.etrade_trading.get_market_data_for_strategy(symbol)
-                                                        if comprehensive_data and comprehensive_data.get('data_quality', 0) > 0:
-                                                            # Extract technical indicators (only use if data quality is good)
-                                                            market_data.update({
-                                                                'rsi': comprehensive_data.get('rsi'),
-                                                                'rsi_14': comprehensive_data.get('rsi_14', comprehensive_data.get('rsi')),
-                                                                'macd': comprehensive_data.get('macd'),
-                                                                'macd_signal': comprehensive_data.get('macd_signal'),
-                                                                'macd_histogram': comprehensive_data.get('macd_histogram'),
-                                                                'sma_20': comprehensive_data.get('sma_20'),
-                                                                'sma_50': comprehensive_data.get('sma_50'),
-                                                                'ema_12': comprehensive_data.get('ema_12'),
-                                                                'ema_26': comprehensive_data.get('ema_26'),
-                                                                'atr': comprehensive_data.get('atr'),
-                                                                'bollinger_upper': comprehensive_data.get('bollinger_upper'),
-                                                                'bollinger_middle': comprehensive_data.get('bollinger_middle'),
-                                                                'bollinger_lower': comprehensive_data.get('bollinger_lower'),
-                                                                'bollinger_width': comprehensive_data.get('bollinger_width'),
-                                                                'bollinger_position': comprehensive_data.get('bollinger_position'),
-                                                                'volatility': comprehensive_data.get('volatility'),
-                                                                'volume_ratio': comprehensive_data.get('volume_ratio'),
-                                                                'vwap': comprehensive_data.get('vwap'),
-                                                                'vwap_distance_pct': comprehensive_data.get('vwap_distance_pct'),
-                                                                'rs_vs_spy': comprehensive_data.get('rs_vs_spy'),
-                                                                'spy_price': comprehensive_data.get('spy_price'),
-                                                                'spy_change_pct': comprehensive_data.get('spy_change_pct'),
-                                                                'momentum_10': comprehensive_data.get('momentum'),
-                                                                'momentum': comprehensive_data.get('momentum')
-                                                            })
-                                                            log.debug(f"✅ Fetched comprehensive technicals for {symbol} (quality: {comprehensive_data.get('data_quality', 0)})")
-                                                        else:
-                                                            log.debug(f"⚠️ Comprehensive data for {symbol} has low quality or missing, using fallbacks")
-                                                except Exception as tech_error:
-                                                    log.debug(f"⚠️ Could not fetch comprehensive technicals for {symbol}: {tech_error}, using defaults")
+                                                # Use E*TRADE trading system's comprehensive market data (batched above)
+                                                comprehensive_data = comprehensive_by_symbol.get(symbol)
+                                                # Batch path reports quality as a label ('minimal'..'excellent'), streaming as a bar count
+                                                if comprehensive_data and comprehensive_data.get('data_quality') not in (None, 0, 'minimal'):
+                                                    # Extract technical indicators (only use if data quality is good)
+                                                    market_data.update({
+                                                        'rsi': comprehensive_data.get('rsi'),
+                                                        'rsi_14': comprehensive_data.get('rsi_14', comprehensive_data.get('rsi')),
+                                                        'macd': comprehensive_data.get('macd'),
+                                                        'macd_signal': comprehensive_data.get('macd_signal'),
+                                                        'macd_histogram': comprehensive_data.get('macd_histogram'),
+                                                        'sma_20': comprehensive_data.get('sma_20'),
+                                                        'sma_50': comprehensive_data.get('sma_50'),
+                                                        'ema_12': comprehensive_data.get('ema_12'),
+                                                        'ema_26': comprehensive_data.get('ema_26'),
+                                                        'atr': comprehensive_data.get('atr'),
+                                                        'bollinger_upper': comprehensive_data.get('bollinger_upper'),
+                                                        'bollinger_middle': comprehensive_data.get('bollinger_middle'),
+                                                        'bollinger_lower': comprehensive_data.get('bollinger_lower'),
+                                                        'bollinger_width': comprehensive_data.get('bollinger_width'),
+                                                        'bollinger_position': comprehensive_data.get('bollinger_position'),
+                                                        'volatility': comprehensive_data.get('volatility'),
+                                                        'volume_ratio': comprehensive_data.get('volume_ratio'),
+                                                        'vwap': comprehensive_data.get('vwap'),
+                                                        'vwap_distance_pct': comprehensive_data.get('vwap_distance_pct'),
+                                                        'rs_vs_spy': comprehensive_data.get('rs_vs_spy'),
+                                                        'spy_price': comprehensive_data.get('spy_price'),
+                                                        'spy_change_pct': comprehensive_data.get('spy_change_pct'),
+                                                        'momentum_10': comprehensive_data.get('momentum'),
+                                                        'momentum': comprehensive_data.get('momentum')
+                                                    })
+                                                    log.debug(f"✅ Fetched comprehensive technicals for {symbol} (quality: {comprehensive_data.get('data_quality', 0)})")
+                                                else:
+                                                    log.debug(f"⚠️ Comprehensive data for {symbol} has low quality or missing, using fallbacks")
                                                 
                                                 # Fallback to basic indicators if comprehensive data not available
                                                 if 'rsi' not in market_data or market_data.get('rsi') is None:
@@ -2587,13 +2700,28 @@ class PrimeTradingSystem:
                                                     log.warning(f"⚠️ Invalid market data for {symbol}, skipping update (data: {market_data})")
                                                     continue
                                                 
-                                                # Update stealth trailing (will check ALL exit conditions)
-                                                # Rev 00143: Enhanced error handling to prevent monitoring failures
-                                                try:
-                                                    await self.stealth_trailing.update_position(symbol, market_data)
-                                                except Exception as update_error:
-                                                    log.error(f"❌ Error updating position {symbol} in stealth trailing: {update_error}", exc_info=True)
-                                                    # Continue monitoring other positions even if one fails
+                                                market_data_by_symbol[symbol] = market_data
+                                        
+                                        # Update stealth trailing (will check ALL exit conditions)
+                                        # Rev 00143: Enhanced error handling to prevent monitoring failures
+                                        # Rev 00240: All positions decided concurrently (per-symbol locks), exits closed in one batch
+                                        tick_result = {'exits': [], 'timings': {}}
+                                        try:
+                                            tick_result = await self.stealth_trailing.update_positions_batch(market_data_by_symbol)
+                                        except Exception as update_error:
+                                            log.error(f"❌ Error updating positions in stealth trailing: {update_error}", exc_info=True)
+                                        
+                                        tick_timings = {
+                                            'quotes_ms': round(quotes_ms, 1),
+                                            'enrich_ms': round(enrich_ms, 1),
+                                            **tick_result.get('timings', {}),
+                                            'exits': len(tick_result.get('exits', [])),
+                                            'total_ms': round((time.perf_counter() - tick_started) * 1000, 1),
+                                        }
+                                        self.performance_metrics['monitoring_tick'] = tick_timings
+                                        log.info(f"⏱️ Monitoring tick: {len(market_data_by_symbol)} positions in {tick_timings['total_ms']:.0f}ms "
+                                                f"(quotes {tick_timings['quotes_ms']:.0f}ms, technicals {tick_timings['enrich_ms']:.0f}ms, "
+                                                f"decisions {tick_timings.get('decide_ms', 0.0):.0f}ms, exits {tick_timings.get('exit_ms', 0.0):.0f}ms / {tick_timings['exits']} closed)")
                                         
                                         # Rev 00122: Monitor orphaned positions separately (check exit conditions manually)
                                         # Handle both Demo (MockTrade) and Live (ETradePosition) orphaned positions
@@ -3173,6 +3301,35 @@ class PrimeTradingSystem:
             log.error(f"Error scanning watchlist for signals: {e}")
             return {'signals': [], 'count': 0}
     
+    async def _refresh_benchmark_context(self, batch_quotes: Optional[Dict[str, Dict[str, Any]]] = None) -> BenchmarkContext:
+        """
+        Rev 00235: Build the per-scan benchmark snapshot and share it with the 0DTE manager
+        
+        Uses the scan's batch quotes when supplied, otherwise fetches SPY/QQQ/SPX in one batch.
+        """
+        try:
+            if batch_quotes is None or not any(s in batch_quotes for s in BENCHMARK_SYMBOLS):
+                batch_quotes = await self.data_manager.get_batch_quotes(list(BENCHMARK_SYMBOLS)) if self.data_manager else {}
+            context = await asyncio.to_thread(build_benchmark_context, batch_quotes or {})
+        except Exception as e:
+            log.warning(f"⚠️ Could not build benchmark snapshot: {e}")
+            context = BenchmarkContext(source="unavailable")
+        
+        self._benchmark_context = context
+        if hasattr(self, 'dte0_manager') and self.dte0_manager and hasattr(self.dte0_manager, 'set_benchmark_context'):
+            self.dte0_manager.set_benchmark_context(context)
+        return context
+    
+    async def _get_benchmark_context(self) -> BenchmarkContext:
+        """Rev 00235: Current benchmark snapshot, refreshed when missing or older than BENCHMARK_MAX_AGE_SECONDS"""
+        context = self._benchmark_context
+        if context is None or context.is_stale():
+            if context is not None:
+                log.info(f"🔄 Benchmark snapshot stale ({context.age_seconds():.0f}s > {context.max_age_seconds:.0f}s) - refreshing")
+            context = await self._refresh_benchmark_context()
+        return context
+    
+    @traced('scan', skip_empty=True)  # Rev 00256: Scans outside the ORB windows leave no trace
     async def _scan_orb_batch_signals(self) -> Dict[str, Any]:
         """
         Scan 100 symbols for ORB signals (SO/ORR) - OPTIMIZED for instant decisions
@@ -3256,13 +3413,19 @@ class PrimeTradingSystem:
                         volume_colors[symbol] = "GREEN" if prev_close > prev_open else ("RED" if prev_close < prev_open else "NEUTRAL")
             
             # Get current prices (always fetch fresh)
+            # Rev 00235: Benchmarks (SPY/QQQ/SPX) ride along in the same batch quote request
             log.info(f"📊 Fetching current prices (4 batches of 25)...")
-            batch_quotes = await self.data_manager.get_batch_quotes(symbols_to_scan)
+            benchmark_extra = [s for s in BENCHMARK_SYMBOLS if s not in symbols_to_scan]
+            with get_pipeline_tracer().span('quotes', symbols=len(symbols_to_scan) + len(benchmark_extra)):
+                batch_quotes = await self.data_manager.get_batch_quotes(symbols_to_scan + benchmark_extra)
             
             if not batch_quotes:
                 log.warning(f"⚠️ No quotes available")
                 return {'signals': [], 'count': 0}
             
+            # Rev 00235: One benchmark snapshot per scan (replaces per-signal blocking get_quotes(['SPY']))
+            benchmark = await self._refresh_benchmark_context(batch_quotes)
+            
             # Process all symbols (ORB + 0DTE) - Rev 00211: Monitor 0DTE symbols independently
             for symbol in symbols_to_scan:
                 try:
@@ -3302,60 +3465,40 @@ class PrimeTradingSystem:
                         log.info(f"✅ {signal_type}: {orb_result.symbol} @ ${orb_result.entry_price:.2f} ({orb_result.confidence:.1%})")
                         
                         # Rev 00181: Calculate RS vs SPY early if possible (for Red Day Filter) - Enhanced with fallback
+                        # Rev 00235: SPY comes from the per-scan benchmark snapshot
                         rs_vs_spy = 0.0
-                        spy_price = None
-                        spy_change_pct = 0.0
+                        spy_price = benchmark.price('SPY')
+                        spy_change_pct = benchmark.change_pct('SPY')
+                        benchmark_age = benchmark.record_use()
                         try:
-                            if hasattr(self, 'trade_manager') and self.trade_manager and hasattr(self.trade_manager, 'etrade_trading'):
-                                spy_quotes = self.trade_manager.etrade_trading.get_quotes(['SPY'])
-                                if spy_quotes and len(spy_quotes) > 0:
-                                    spy_quote = spy_quotes[0]
-                                    spy_change_pct = getattr(spy_quote, 'change_pct', None)
-                                    if spy_change_pct is None:
-                                        spy_change_pct = 0.0
-                                    spy_price = spy_quote.last_price
-                                    
-                                    # Get symbol change % from quote (quote is a dict from batch_quotes)
-                                    symbol_change_pct = quote.get('change_pct', 0.0) if isinstance(quote, dict) else 0.0
-                                    
-                                    # Rev 00181: Enhanced fallback - use open vs previous close if change_pct is 0.0
-                                    if symbol_change_pct == 0.0 and isinstance(quote, dict):
-                                        # Try to calculate from open price if available
-                                        symbol_open = quote.get('open', None)
-                                        symbol_price = quote.get('last_price', quote.get('price', None))
-                                        if symbol_open and symbol_price:
-                                            # Use market data manager to get historical data for fallback
-                                            try:
-                                                if hasattr(self, 'data_manager') and self.data_manager:
-                                                    # Get historical data for the symbol
-                                                    hist_data = await self.data_manager.get_historical_data(orb_result.symbol, days=2)
-                                                    if hist_data and len(hist_data) >= 2:
-                                                        prev_close = hist_data[-2].get('close', None) if isinstance(hist_data[-2], dict) else (getattr(hist_data[-2], 'close', None) if hasattr(hist_data[-2], 'close') else None)
-                                                        if prev_close and prev_close > 0:
-                                                            # Use open price for more accurate intraday calculation
-                                                            symbol_change_pct = ((symbol_open - prev_close) / prev_close) * 100
-                                                            log.debug(f"📊 Calculated symbol change % from open vs prev close for {orb_result.symbol}: {symbol_change_pct:.2f}%")
-                                            except Exception as hist_error:
-                                                log.debug(f"⚠️ Could not calculate symbol change % from historical data for {orb_result.symbol}: {hist_error}")
-                                    
-                                    # Rev 00181: Enhanced SPY fallback
-                                    if spy_change_pct == 0.0:
+                            if spy_price:
+                                # Get symbol change % from quote (quote is a dict from batch_quotes)
+                                symbol_change_pct = quote.get('change_pct', 0.0) if isinstance(quote, dict) else 0.0
+                                symbol_change_pct = symbol_change_pct or 0.0
+                                
+                                # Rev 00181: Enhanced fallback - use open vs previous close if change_pct is 0.0
+                                if symbol_change_pct == 0.0 and isinstance(quote, dict):
+                                    # Try to calculate from open price if available
+                                    symbol_open = quote.get('open', None)
+                                    symbol_price = quote.get('last_price', quote.get('price', None))
+                                    if symbol_open and symbol_price:
+                                        # Use market data manager to get historical data for fallback
                                         try:
-                                            import yfinance as yf
-                                            spy_ticker = yf.Ticker("SPY")
-                                            spy_hist = spy_ticker.history(period="2d", interval="1d")
-                                            if not spy_hist.empty and len(spy_hist) >= 2:
-                                                spy_prev_close = spy_hist['Close'].iloc[-2]
-                                                spy_base_price = spy_quote.open if spy_quote.open > 0 else spy_quote.last_price
-                                                if spy_prev_close > 0 and spy_base_price:
-                                                    spy_change_pct = ((spy_base_price - spy_prev_close) / spy_prev_close) * 100
-                                                    log.debug(f"📊 Calculated SPY change % from open vs prev close: {spy_change_pct:.2f}%")
-                                        except Exception as spy_hist_error:
-                                            log.debug(f"⚠️ Could not calculate SPY change % from historical data: {spy_hist_error}")
-                                    
-                                    # Calculate RS vs SPY
-                                    rs_vs_spy = symbol_change_pct - spy_change_pct
-                                    log.debug(f"✅ Calculated RS vs SPY for {orb_result.symbol}: {rs_vs_spy:.2f}% (symbol: {symbol_change_pct:.2f}%, SPY: {spy_change_pct:.2f}%)")
+                                            if hasattr(self, 'data_manager') and self.data_manager:
+                                                # Get historical data for the symbol
+                                                hist_data = await self.data_manager.get_historical_data(orb_result.symbol, days=2)
+                                                if hist_data and len(hist_data) >= 2:
+                                                    prev_close = hist_data[-2].get('close', None) if isinstance(hist_data[-2], dict) else (getattr(hist_data[-2], 'close', None) if hasattr(hist_data[-2], 'close') else None)
+                                                    if prev_close and prev_close > 0:
+                                                        # Use open price for more accurate intraday calculation
+                                                        symbol_change_pct = ((symbol_open - prev_close) / prev_close) * 100
+                                                        log.debug(f"📊 Calculated symbol change % from open vs prev close for {orb_result.symbol}: {symbol_change_pct:.2f}%")
+                                        except Exception as hist_error:
+                                            log.debug(f"⚠️ Could not calculate symbol change % from historical data for {orb_result.symbol}: {hist_error}")
+                                
+                                # Calculate RS vs SPY
+                                rs_vs_spy = benchmark.relative_strength(symbol_change_pct, 'SPY')
+                                log.debug(f"✅ Calculated RS vs SPY for {orb_result.symbol}: {rs_vs_spy:.2f}% (symbol: {symbol_change_pct:.2f}%, SPY: {spy_change_pct:.2f}%, benchmark age {benchmark_age:.1f}s)")
                         except Exception as rs_error:
                             log.debug(f"⚠️ Could not calculate RS vs SPY for {orb_result.symbol} during signal creation: {rs_error}")
                         
@@ -3364,6 +3507,7 @@ class PrimeTradingSystem:
                         signal_metadata['rs_vs_spy'] = rs_vs_spy
                         signal_metadata['spy_price'] = spy_price
                         signal_metadata['spy_change_pct'] = spy_change_pct
+                        signal_metadata['benchmark_age_seconds'] = round(benchmark_age, 3)
                         
                         signal_dict = {
                             'symbol': orb_result.symbol,  # May be inverse ETF
@@ -3394,18 +3538,15 @@ class PrimeTradingSystem:
                         log.info(f"✅ {signal_type} BEARISH: {bearish_result.symbol} @ ${bearish_result.entry_price:.2f} ({bearish_result.confidence:.1%}) - PUT signal")
                         
                         # Calculate RS vs SPY for bearish signal (same logic)
+                        # Rev 00235: SPY comes from the per-scan benchmark snapshot
                         rs_vs_spy = 0.0
-                        spy_price = None
-                        spy_change_pct = 0.0
+                        spy_price = benchmark.price('SPY')
+                        spy_change_pct = benchmark.change_pct('SPY')
+                        benchmark_age = benchmark.record_use()
                         try:
-                            if hasattr(self, 'trade_manager') and self.trade_manager and hasattr(self.trade_manager, 'etrade_trading'):
-                                spy_quotes = self.trade_manager.etrade_trading.get_quotes(['SPY'])
-                                if spy_quotes and len(spy_quotes) > 0:
-                                    spy_quote = spy_quotes[0]
-                                    spy_change_pct = getattr(spy_quote, 'change_pct', None) or 0.0
-                                    spy_price = spy_quote.last_price
-                                    symbol_change_pct = quote.get('change_pct', 0.0) if isinstance(quote, dict) else 0.0
-                                    rs_vs_spy = symbol_change_pct - spy_change_pct
+                            if spy_price:
+                                symbol_change_pct = (quote.get('change_pct', 0.0) if isinstance(quote, dict) else 0.0) or 0.0
+                                rs_vs_spy = benchmark.relative_strength(symbol_change_pct, 'SPY')
                         except Exception as rs_error:
                             log.debug(f"⚠️ Could not calculate RS vs SPY for bearish {symbol}: {rs_error}")
                         
@@ -3413,6 +3554,7 @@ class PrimeTradingSystem:
                         signal_metadata['rs_vs_spy'] = rs_vs_spy
                         signal_metadata['spy_price'] = spy_price
                         signal_metadata['spy_change_pct'] = spy_change_pct
+                        signal_metadata['benchmark_age_seconds'] = round(benchmark_age, 3)
                         
                         # Add bearish signal to dte_signals (for PUT options)
                         dte_signals.append({
@@ -3437,6 +3579,11 @@ class PrimeTradingSystem:
                     continue
             
             log.info(f"✅ {window_type} Scan Complete: {len(all_signals)} ORB signals, {len(dte_signals)} 0DTE signals from {len(symbols_to_scan)} symbols")
+            if benchmark.uses:
+                benchmark_stats = benchmark.get_stats()
+                log.info(f"📈 Benchmark snapshot used by {benchmark_stats['uses']} signals "
+                        f"(avg age {benchmark_stats['avg_age_at_use_seconds']:.2f}s, max {benchmark_stats['max_age_at_use_seconds']:.2f}s, "
+                        f"stale uses {benchmark_stats['stale_uses']})")
             
             # Rev 00048: SO Signal Collection alert sent at 7:30 AM (not during scanning)
             # Rev 00056: This alert is now sent BEFORE execution in the batch execution trigger
@@ -3458,6 +3605,9 @@ class PrimeTradingSystem:
                 self._so_signals_ready_time = time.time()
                 log.info(f"✅ SO signals stored - batch execution scheduled for 7:30 AM PT")
                 
+                # Rev 00245: Keep E*TRADE previews warm for the likely top-N (Live only, runs in background)
+                self._schedule_so_prestage(all_signals)
+                
                 # Rev 00055: Log timing summary for collection window analysis
                 # Rev 00064: Removed redundant datetime import (already imported at top)
                 from zoneinfo import ZoneInfo
@@ -3662,6 +3812,12 @@ class PrimeTradingSystem:
         # Create a mapping of signal to position sizing info
         signal_sizing_map = {p['signal'].symbol: p for p in sized_positions}
         
+        # Rev 00246: Load every needed chain up front, concurrently (warm from the prefetcher when running)
+        if hasattr(options_chain_manager, 'prefetch_chains') and sized_positions:
+            chain_start = time.perf_counter()
+            await options_chain_manager.prefetch_chains([p['signal'].symbol for p in sized_positions])
+            log.info(f"🔗 Options chains ready for {len(sized_positions)} signals in {(time.perf_counter() - chain_start) * 1000:.0f}ms")
+        
         executed_count = 0
         failed_count = 0
         executed_positions = []  # Collect executed positions for alert
@@ -3727,15 +3883,6 @@ class PrimeTradingSystem:
                     failed_count += 1
                     continue
                 
-                # Fetch options chain
-                log.info(f"📡 Fetching options chain for {symbol}...")
-                chain = await options_chain_manager.fetch_options_chain(symbol, expiry=None)
-                
-                if not chain or not chain.get(option_type + 's'):
-                    log.warning(f"⚠️ No {option_type} contracts found for {symbol}")
-                    failed_count += 1
-                    continue
-                
                 # Get current price from ORB signal
                 current_price = signal.orb_signal.get('current_price', 0.0)
                 if current_price <= 0:
@@ -3743,6 +3890,15 @@ class PrimeTradingSystem:
                     failed_count += 1
                     continue
                 
+                # Fetch options chain (Rev 00248: Demo mode prices a synthetic chain around current_price)
+                log.info(f"📡 Fetching options chain for {symbol}...")
+                chain = await options_chain_manager.fetch_options_chain(symbol, expiry=None, underlying_price=current_price)
+                
+                if not chain or not chain.get(option_type + 's'):
+                    log.warning(f"⚠️ No {option_type} contracts found for {symbol}")
+                    failed_count += 1
+                    continue
+                
                 # Rev 00227: Get strategy type from signal (Level 2 Options Strategies)
                 strategy_type = getattr(signal, 'strategy_type', 'debit_spread')  # Default to debit spread
                 spread_type = getattr(signal, 'spread_type', 'debit')  # Default to debit
@@ -4127,11 +4283,90 @@ class PrimeTradingSystem:
             log.error(f"Error calculating adaptive sleep interval: {e}")
             return 30.0  # Default fallback
     
+    def _schedule_so_prestage(self, signals: List[Dict[str, Any]]):
+        """
+        Start a background SO pre-staging refresh (Rev 00245)
+        
+        Skipped in Demo mode, when disabled, while a refresh is still running, or within
+        SO_PRESTAGE_REFRESH_SECONDS of the last refresh.
+        """
+        try:
+            from .prime_order_prestager import PRESTAGE_ENABLED, PRESTAGE_REFRESH_SECONDS
+            
+            if not PRESTAGE_ENABLED or self.config.mode == SystemMode.DEMO_MODE:
+                return
+            etrade_trading = self.trade_manager.etrade_trading if self.trade_manager and hasattr(self.trade_manager, 'etrade_trading') else None
+            if not etrade_trading or not self.risk_manager:
+                return
+            task = getattr(self, '_so_prestage_task', None)
+            if task and not task.done():
+                return
+            if time.time() - getattr(self, '_so_prestage_last_run', 0.0) < PRESTAGE_REFRESH_SECONDS:
+                return
+            self._so_prestage_last_run = time.time()
+            self._so_prestage_task = asyncio.create_task(self._prestage_so_previews(etrade_trading, list(signals)))
+        except Exception as e:
+            log.warning(f"⚠️ SO pre-stage not scheduled: {e}")
+    
+    @traced('prestage', root=True)  # Rev 00256: Own trace - the task would otherwise inherit the scan span
+    async def _prestage_so_previews(self, etrade_trading, signals: List[Dict[str, Any]]):
+        """
+        Estimate the likely SO orders and refresh their staged previews (Rev 00245)
+        
+        Ranks the collected signals with calculate_so_priority_score and sizes the top
+        SO_PRESTAGE_TOP_N with the risk manager's batch sizing, on copies so the pending
+        signals are untouched. The estimate skips enrichment and adaptive filtering, so it
+        can differ from the final orders; the stager only reuses previews that still match.
+        """
+        try:
+            from .prime_order_prestager import OrderPreStager, PRESTAGE_TOP_N
+            
+            if not getattr(self, 'order_prestager', None):
+                self.order_prestager = OrderPreStager(etrade_trading)
+            
+            executed_today = getattr(self, '_so_executed_symbols_today', set())
+            ranked = sorted(
+                (dict(s) for s in signals if s.get('signal_type') == 'SO' and s.get('symbol') not in executed_today),
+                key=calculate_so_priority_score, reverse=True
+            )[:PRESTAGE_TOP_N]
+            if not ranked:
+                return
+            for rank, sig in enumerate(ranked, 1):
+                sig['priority_rank'] = rank
+            
+            # Balance is read once per day for the estimate (same fields as _process_orb_signals)
+            account_value = getattr(self, '_prestage_account_value', None)
+            if not account_value:
+                account_value = 1000.0
+                account_summary = await asyncio.to_thread(etrade_trading.get_account_summary)
+                balance = (account_summary or {}).get('balance', {})
+                if 'cash_available_for_investment' in balance:
+                    account_value = float(balance['cash_available_for_investment'])
+                elif 'cash_buying_power' in balance:
+                    account_value = float(balance['cash_buying_power'])
+                self._prestage_account_value = account_value
+            so_capital = account_value * (self.config.so_capital_pct / 100.0)
+            
+            sized = await self.risk_manager.calculate_batch_position_sizes(
+                signals=ranked,
+                so_capital=so_capital,
+                account_value=account_value,
+                max_position_pct=self.config.max_position_pct
+            )
+            candidates = [
+                {'symbol': s['symbol'], 'quantity': int(s.get('quantity', 0)), 'price': float(s.get('price', 0) or 0), 'side': 'BUY'}
+                for s in sized if s.get('quantity', 0) > 0
+            ]
+            await self.order_prestager.refresh(candidates)
+        except Exception as e:
+            log.warning(f"⚠️ SO pre-stage refresh failed: {e}")
+    
     async def _batch_execute_live_signals(self, signals_to_execute: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Batch execute Live signals via E*TRADE (Rev 00180T - Simplified)
         
-        Uses prime_etrade_trading.execute_batch_orders() for efficient batch execution
+        Uses prime_etrade_trading.execute_batch_orders_async() (Rev 00244 sliding-window
+        preview/place pipeline) directly on the event loop
         
         Args:
             signals_to_execute: List of validated signal dictionaries with quantity
@@ -4150,11 +4385,19 @@ class PrimeTradingSystem:
             # Execute batch via E*TRADE (uses built-in batch execution)
             log.info(f"🚀 Executing {len(signals_to_execute)} Live orders via E*TRADE batch...")
             
-            batch_result = await asyncio.to_thread(
-                etrade_trading.execute_batch_orders,
-                signals_to_execute,
-                max_concurrent=3
-            )
+            # Rev 00245: Orders still matching a pre-staged preview skip the inline preview
+            prestager = getattr(self, 'order_prestager', None)
+            if prestager:
+                task = getattr(self, '_so_prestage_task', None)
+                if task and not task.done():
+                    task.cancel()  # Previews already staged stay usable
+                prestager.apply(signals_to_execute)
+                prestager.clear()
+            
+            with get_pipeline_tracer().span('execution', orders=len(signals_to_execute)) as span:  # Rev 00256
+                batch_result = await etrade_trading.execute_batch_orders_async(signals_to_execute)
+                if span:
+                    span.set(executed=batch_result.get('success_count', 0), failed=batch_result.get('failed_count', 0))
             
             # Process results
             executed = []
@@ -4219,6 +4462,7 @@ class PrimeTradingSystem:
             log.error(f"Batch execution failed: {e}", exc_info=True)
             return {'executed': [], 'rejected': signals_to_execute}
     
+    @traced('process_signals', root=True)  # Rev 00256: Own trace, also when called from an ORR-window scan
     async def _process_orb_signals(self, orb_signals: List[Dict[str, Any]]):
         """
         Process ORB signals through the trading system (Demo or Live Mode)
@@ -4350,7 +4594,12 @@ class PrimeTradingSystem:
                     if hasattr(self, 'trade_manager') and self.trade_manager and hasattr(self.trade_manager, 'etrade_trading') and self.trade_manager.etrade_trading:
                         try:
                             # Get comprehensive market data with technical indicators (on-demand from yfinance)
-                            comprehensive_data = self.trade_manager.etrade_trading.get_market_data_for_strategy(symbol)
+                            # Rev 00236: Pre-computed by the batch enrichment stage; per-symbol call only as fallback
+                            comprehensive_data = enrichment_data.get(symbol)
+                            if comprehensive_data is None:
+                                comprehensive_data = await asyncio.to_thread(self.trade_manager.etrade_trading.get_market_data_for_strategy, symbol)
+                            if comprehensive_data:
+                                signal['enrichment_ms'] = comprehensive_data.get('enrichment_ms', 0.0)
                             if comprehensive_data:
                                 # Extract technical indicators for Priority Optimizer (all 18 indicators)
                                 indicators_collected = 0
@@ -4491,182 +4740,41 @@ class PrimeTradingSystem:
                     
                     return signal
                 
+                # Rev 00236: Batch enrichment stage - one quote batch + one history download for all
+                # candidates (session-cached), indicators computed in worker threads off the event loop
+                enrichment_started = time.perf_counter()
+                tracer = get_pipeline_tracer()  # Rev 00256: Stage spans for the SO batch
+                tracer.begin('enrichment', signals=len(so_signals))
+                enrichment_data = {}
+                if hasattr(self, 'trade_manager') and self.trade_manager and hasattr(self.trade_manager, 'etrade_trading') and self.trade_manager.etrade_trading:
+                    try:
+                        enrichment_data = await asyncio.to_thread(
+                            self.trade_manager.etrade_trading.get_market_data_for_strategy_batch,
+                            [sig.get('symbol', '') for sig in so_signals]
+                        )
+                    except Exception as e:
+                        log.warning(f"⚠️ Batch enrichment failed, falling back to per-symbol enrichment: {e}")
+                        enrichment_data = {}
+                
                 # Enrich all signals with technical data before ranking
-                enriched_signals = []
+                enriched_signals = await asyncio.gather(*[enrich_signal_with_technical_data(sig.copy()) for sig in so_signals])
+                so_signals = list(enriched_signals)
+                
+                enrichment_total_ms = (time.perf_counter() - enrichment_started) * 1000
+                per_signal_ms = [sig.get('enrichment_ms', 0.0) for sig in so_signals]
+                fetch_ms = next(iter(enrichment_data.values()), {}).get('enrichment_fetch_ms', 0.0) if enrichment_data else 0.0
+                log.info(f"⚡ Enriched {len(so_signals)} SO signals in {enrichment_total_ms:.0f}ms "
+                        f"(shared fetch {fetch_ms:.0f}ms, indicators avg {sum(per_signal_ms) / max(len(per_signal_ms), 1):.1f}ms / max {max(per_signal_ms, default=0.0):.1f}ms per signal)")
+                self.performance_metrics['last_enrichment_ms'] = round(enrichment_total_ms, 1)
                 for sig in so_signals:
-                    enriched = await enrich_signal_with_technical_data(sig.copy())
-                    enriched_signals.append(enriched)
-                so_signals = enriched_signals
+                    tracer.record('enrichment', sig.get('enrichment_ms', 0.0), symbol=sig.get('symbol'))
+                tracer.end('enrichment', batch_fetch_ms=round(fetch_ms, 1))
                 
                 # Enhanced ranking function with volatility and volume filters
-                def calculate_so_priority_score(signal):
-                    """
-                    Calculate multi-factor priority score for SO signals
-                    
-                    Rev 00106: Formula v2.1 - DATA-DRIVEN REFINEMENT (Nov 6, 2025)
-                    Based on comprehensive correlation analysis (Nov 6):
-                    
-                    CORRELATION EVIDENCE (Nov 6 - 15 signals):
-                    - VWAP Distance: +0.772 correlation ⭐⭐⭐ STRONGEST PREDICTOR!
-                    - RS vs SPY: +0.609 correlation ⭐⭐⭐ 2ND STRONGEST!
-                    - ORB Volume: +0.342 correlation ✅ MODERATE
-                    - Confidence: +0.333 correlation ⚠️ WEAK (inconsistent)
-                    - RSI: -0.096 correlation ⚠️ NEGATIVE (context-dependent)
-                    
-                    TOP PERFORMER VALIDATION (Nov 6):
-                    - TSDD (+3.24% P&L): Had HIGHEST VWAP Distance (+3.35%) ✅
-                    - TSDD: Strong RS vs SPY (+8.16%) ✅
-                    - AMDD (95% conf): Only +1.03% P&L (#14/15) - confidence not predictive!
-                    
-                    Formula v2.1 Weights (Conservative +2% Adjustments):
-                    - VWAP Distance: 27% (↑ +2% - exceptional +0.772 correlation) ⭐
-                    - RS vs SPY: 25% (same - strong +0.609 correlation) ⭐
-                    - ORB Volume: 22% (↑ +2% - moderate +0.342 correlation)
-                    - Confidence: 13% (↓ -2% - weak +0.333 correlation)
-                    - RSI: 10% (same - context-aware for bull/bear markets)
-                    - ORB Range: 3% (↓ -2% - minimal contribution)
-                    
-                    Changes from v2.0 → v2.1:
-                    - More weight to proven predictors (VWAP, Volume)
-                    - Less weight to weak predictors (Confidence, ORB Range)
-                    - Evidence-based, conservative adjustments
-                    
-                    Expected: +10-15% better capital allocation vs v2.0
-                    """
-                    symbol = signal.get('symbol', '')
-                    
-                    # Factor 1: RS vs SPY (25%) - Rev 00104: NEW ⭐⭐⭐
-                    # Top performers on Nov 5: +27-28% vs SPY (market leaders)
-                    rs_vs_spy = signal.get('rs_vs_spy', 0)
-                    
-                    if rs_vs_spy >= 20.0:
-                        rs_score = 1.0           # Massive outperformance (>+20%)
-                    elif rs_vs_spy >= 10.0:
-                        rs_score = 0.85          # Strong outperformance (+10-20%)
-                    elif rs_vs_spy >= 5.0:
-                        rs_score = 0.70          # Good outperformance (+5-10%)
-                    elif rs_vs_spy >= 0.0:
-                        rs_score = 0.50          # Inline with market (0-5%)
-                    elif rs_vs_spy >= -10.0:
-                        rs_score = 0.35          # Slight underperformance (0 to -10%)
-                    else:
-                        rs_score = 0.20          # Underperforming (<-10%)
-                    
-                    # Factor 2: VWAP Distance (25%) - Rev 00104: NEW ⭐⭐⭐
-                    # Top performers on Nov 5: +18-20% above VWAP (institutional support)
-                    vwap_distance = signal.get('vwap_distance_pct', 0)
-                    
-                    if vwap_distance >= 15.0:
-                        vwap_score = 1.0         # Far above VWAP (>+15%)
-                    elif vwap_distance >= 10.0:
-                        vwap_score = 0.90        # Well above VWAP (+10-15%)
-                    elif vwap_distance >= 5.0:
-                        vwap_score = 0.75        # Above VWAP (+5-10%)
-                    elif vwap_distance >= 0.0:
-                        vwap_score = 0.60        # At/slightly above VWAP (0-5%)
-                    elif vwap_distance >= -3.0:
-                        vwap_score = 0.40        # Slightly below VWAP (0 to -3%)
-                    else:
-                        vwap_score = 0.20        # Below VWAP (<-3%)
-                    
-                    # Factor 3: ORB Volume Ratio (20%) - Rev 00104: Reduced from 40%
-                    # Still important but less than VWAP/RS discoveries
-                    orb_volume_ratio = signal.get('volume_ratio', 1.0)
-                    
-                    if orb_volume_ratio >= 3.0:
-                        orb_vol_score = 1.0      # Exceptional
-                    elif orb_volume_ratio >= 2.0:
-                        orb_vol_score = 0.85     # Strong
-                    elif orb_volume_ratio >= 1.5:
-                        orb_vol_score = 0.70     # Good
-                    elif orb_volume_ratio >= 1.2:
-                        orb_vol_score = 0.50     # Moderate
-                    else:
-                        orb_vol_score = 0.25     # Weak
-                    
-                    # Factor 4: Confidence (15%) - Rev 00104: RE-ADDED ⭐⭐
-                    # Nov 5 discovery: 95% confidence = top 2 performers
-                    # Was removed (Rev 00091) due to -0.298 correlation on holiday days
-                    # Re-added based on positive correlation on normal trading days
-                    confidence = signal.get('confidence', 0.5)
-                    
-                    # Scale 0.5-1.0 → 0-1.0
-                    if confidence >= 0.5:
-                        conf_score = (confidence - 0.5) / 0.5
-                        conf_score = min(1.0, conf_score)
-                    else:
-                        conf_score = 0.0
-                    
-                    # Factor 5: RSI Context-Aware (10%) - Rev 00104: REVISED ⭐⭐
-                    # Nov 5 discovery: High RSI (70-75) = top performers in BULL markets
-                    # Nov 1 data: High RSI (>65) = losers in weak markets
-                    # Solution: Context-aware scoring based on market regime
-                    rsi = signal.get('rsi', 55.0)
-                    market_regime = signal.get('market_regime', 'MIXED')  # Will be added to signals
-                    
-                    if market_regime == 'BULL':
-                        # Bull market: High RSI = momentum (not overbought)
-                        if 65 <= rsi <= 75:
-                            rsi_score = 0.85     # Strong momentum ⭐ REVISED
-                        elif 55 <= rsi < 65:
-                            rsi_score = 1.0      # Sweet spot
-                        elif 50 <= rsi < 55:
-                            rsi_score = 0.90     # Good
-                        elif 45 <= rsi < 50:
-                            rsi_score = 0.75     # Acceptable
-                        elif rsi > 75:
-                            rsi_score = 0.60     # Getting too high even for bull
-                        else:  # rsi < 45
-                            rsi_score = 0.40     # Weak even in bull market
-                    else:
-                        # Non-bull market: High RSI = overbought (penalty)
-                        if 50 <= rsi <= 60:
-                            rsi_score = 1.0      # Sweet spot
-                        elif 45 <= rsi < 50:
-                            rsi_score = 0.85     # Good
-                        elif 60 < rsi <= 65:
-                            rsi_score = 0.70     # Getting high
-                        elif rsi > 65:
-                            rsi_score = 0.30     # PENALTY (overbought)
-                        elif 40 <= rsi < 45:
-                            rsi_score = 0.75     # Acceptable
-                        else:  # rsi < 40
-                            rsi_score = 0.60     # Weak
-                    
-                    # Factor 6: ORB Range % - Volatility (5%) - Rev 00104: Reduced from 30%
-                    # Less predictive than VWAP/RS discoveries
-                    orb_high = signal.get('orb_high', 0)
-                    orb_low = signal.get('orb_low', 0)
-                    if orb_low > 0:
-                        orb_range_pct = (orb_high - orb_low) / orb_low
-                    else:
-                        orb_range_pct = 0.01
-                    orb_range_score = min(orb_range_pct / 0.05, 1.0)  # 1.0 at 5%+
-                    
-                    # Rev 00106: Formula v2.1 - DATA-DRIVEN REFINEMENT (Nov 6, 2025)
-                    # Conservative +2% adjustments based on correlation analysis
-                    # Evidence: VWAP +0.772, RS +0.609, Volume +0.342, Confidence +0.333
-                    priority_score = (
-                        vwap_score * 0.27 +           # 27% - VWAP Distance ⭐ (↑ +2%, correlation +0.772)
-                        rs_score * 0.25 +             # 25% - RS vs SPY ⭐ (same, correlation +0.609)
-                        orb_vol_score * 0.22 +        # 22% - ORB volume (↑ +2%, correlation +0.342)
-                        conf_score * 0.13 +           # 13% - Confidence (↓ -2%, correlation +0.333 weak)
-                        rsi_score * 0.10 +            # 10% - RSI (same, context-aware)
-                        orb_range_score * 0.03        # 3% - ORB range (↓ -2%, minimal contribution)
-                    )
-                    
-                    # Rev 00141: Store calculated values in signal for data collection
-                    signal['priority_score'] = priority_score
-                    signal['rs_vs_spy'] = rs_vs_spy
-                    signal['vwap_distance_pct'] = vwap_distance
-                    signal['volume_ratio'] = orb_volume_ratio
-                    signal['orb_volume_ratio'] = orb_volume_ratio
-                    signal['rsi'] = rsi
-                    signal['orb_range_pct'] = orb_range_pct
-                    
-                    return priority_score
+                # Rev 00242: calculate_so_priority_score lives in prime_so_ranking (shared with the replay engine)
                 
                 # Rank by multi-factor score (highest first)
+                tracer.begin('ranking')
                 so_signals_ranked = sorted(so_signals, 
                                           key=calculate_so_priority_score, 
                                           reverse=True)
@@ -4720,6 +4828,9 @@ class PrimeTradingSystem:
                 # Red Day Rule: IF >70% signals RSI <40 AND >80% signals volume <1.0x → SKIP
                 # Expected savings: $11-27 per red day = $400-1,600/year
                 
+                tracer.end('ranking', ranked=len(so_signals_ranked))
+                tracer.begin('red_day', signals=len(so_signals_ranked))
+                
                 log.info(f"")
                 log.info(f"=" * 80)
                 log.info(f"🚨 ENHANCED RED DAY FILTER CHECK (Rev 00136 - Multi-Factor)")
@@ -5197,11 +5308,14 @@ class PrimeTradingSystem:
                     # Import and run enhanced detector
                     from .prime_enhanced_red_day_detector import PrimeEnhancedRedDayDetector
                     enhanced_detector = PrimeEnhancedRedDayDetector()
+                    red_day_benchmark = await self._get_benchmark_context()
+                    red_day_benchmark_age = red_day_benchmark.record_use()
+                    log.info(f"   • SPY momentum: {red_day_benchmark.change_pct('SPY'):+.2f}% (benchmark age {red_day_benchmark_age:.1f}s)")
                     
                     # Run enhanced analysis (with fallback market data)
                     risk_assessment = await enhanced_detector.analyze_red_day_risk(
                         signals=so_signals_ranked,
-                        spy_momentum=0.0,  # TODO: Get real SPY momentum
+                        spy_momentum=red_day_benchmark.change_pct('SPY'),  # Rev 00235: From benchmark snapshot
                         vix_level=15.0     # TODO: Get real VIX level
                     )
                     
@@ -5322,6 +5436,8 @@ class PrimeTradingSystem:
                         log.info(f"   ✅ All signals passed signal-level Red Day filter")
                     log.info(f"=" * 80)
                     log.info(f"")
+                tracer.end('red_day', is_red_day=is_red_day, passed=len(so_signals_ranked))
+                tracer.begin('selection')
                 
                 # STEP 1: ADAPTIVE SIGNAL FILTERING (Rev 00095 - Nov 3, 2025)
                 # Progressive reduction: 15 → 12 → 10 → 8 based on expense ratios
@@ -5500,6 +5616,7 @@ class PrimeTradingSystem:
                     if filtered_count > 5:
                         log.info(f"   • ... and {filtered_count - 5} more")
                 log.info(f"")
+                tracer.end('selection', selected=len(selected_signals))
             
             # PRIORITY OPTIMIZER: Save complete signal list + Auto-cleanup (Rev 00096)
             # Minimal integration for after-EOD data collection with 50-day retention
@@ -5639,12 +5756,13 @@ class PrimeTradingSystem:
             # Bug: Was checking self.demo_risk_manager which doesn't exist (it's stored as self.risk_manager)
             # This prevented position sizing from working in both Demo and Live modes
             if self.risk_manager:
-                sized_signals = await self.risk_manager.calculate_batch_position_sizes(
-                    signals=signals_to_execute,
-                    so_capital=so_capital,
-                    account_value=account_value,
-                    max_position_pct=self.config.max_position_pct
-                )
+                with get_pipeline_tracer().span('sizing', signals=len(signals_to_execute)):  # Rev 00256
+                    sized_signals = await self.risk_manager.calculate_batch_position_sizes(
+                        signals=signals_to_execute,
+                        so_capital=so_capital,
+                        account_value=account_value,
+                        max_position_pct=self.config.max_position_pct
+                    )
                 
                 # Replace signals_to_execute with sized signals
                 signals_to_execute = sized_signals
@@ -6023,12 +6141,13 @@ class PrimeTradingSystem:
                     so_capital_for_batch = sum(s.get('so_capital_allocation', 0) for s in so_signals_only)
                     
                     # Call batch sizing
-                    so_signals_sized = await live_rm.calculate_batch_position_sizes(
-                        signals=so_signals_only,
-                        so_capital=so_capital_for_batch,
-                        account_value=account_value,
-                        max_position_pct=self.config.max_position_pct
-                    )
+                    with get_pipeline_tracer().span('sizing', signals=len(so_signals_only), live_batch=True):  # Rev 00256
+                        so_signals_sized = await live_rm.calculate_batch_position_sizes(
+                            signals=so_signals_only,
+                            so_capital=so_capital_for_batch,
+                            account_value=account_value,
+                            max_position_pct=self.config.max_position_pct
+                        )
                     
                     # Rev 00105 (Nov 6, 2025): CRITICAL - Filter out 0-quantity signals before execution
                     # Same fix as Demo mode - only keep executable signals
@@ -7376,6 +7495,7 @@ class PrimeTradingSystem:
         """Get comprehensive performance metrics"""
         return {
             'trading_system': self.performance_metrics,
+            'benchmark_context': self._benchmark_context.get_stats() if self._benchmark_context else None,
             'parallel_processing': self.parallel_manager.get_metrics(),
             'memory': self.memory_manager.get_memory_stats(),
             'config': {
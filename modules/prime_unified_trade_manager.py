@@ -46,7 +46,7 @@ try:
     )
     from .config_loader import get_config_value
     from .prime_stealth_trailing_tp import PrimeStealthTrailingTP, StealthDecision, ExitReason
-    from .prime_etrade_trading import PrimeETradeTrading
+    from .prime_etrade_trading import get_etrade_client_hub
     from .prime_alert_manager import PrimeAlertManager, TradeAlert
     from .prime_market_manager import get_prime_market_manager, PrimeMarketManager
     # Compound engine removed from Live mode (Rev 00108) - E*TRADE provides all data
@@ -58,7 +58,7 @@ except ImportError:
     )
     from config_loader import get_config_value
     from prime_stealth_trailing_tp import PrimeStealthTrailingTP, StealthDecision, ExitReason
-    from prime_etrade_trading import PrimeETradeTrading
+    from prime_etrade_trading import get_etrade_client_hub
     from prime_alert_manager import PrimeAlertManager, TradeAlert
     from prime_market_manager import get_prime_market_manager, PrimeMarketManager
     # Compound engine removed from Live mode (Rev 00108) - E*TRADE provides all data
@@ -342,8 +342,8 @@ class PrimeUnifiedTradeManager:
             # Determine environment based on configuration
             etrade_mode = get_config_value('ETRADE_MODE', 'sandbox')
             
-            # Initialize E*TRADE trading with environment
-            self.etrade_trading = PrimeETradeTrading(environment=etrade_mode)
+            # Rev 00251: Handle on the shared E*TRADE client (tokens/accounts/pool loaded once per process)
+            self.etrade_trading = get_etrade_client_hub().handle(etrade_mode)
             
             # Initialize the trading system
             if self.etrade_trading.initialize():
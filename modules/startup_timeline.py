@@ -0,0 +1,218 @@
+"""
+Startup Timeline
+================
+
+Cold-start profile for Cloud Run: how long each module import, startup phase and
+PrimeTradingSystem component took, measured from the moment this module is imported
+(main.py imports it first).
+
+Rev 00250:
+- ImportTimer (a sys.meta_path finder) times every module executed after it is
+  installed: inclusive time (with nested imports) and self time (without). It is
+  uninstalled at the trading_started milestone, so runtime imports skip the proxy
+- phase()/component() time startup phases in main.py and component inits in
+  PrimeTradingSystem.initialize; mark() records milestones (e.g. http_server_ready)
+- snapshot() is served as JSON at /debug/startup
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from typing import Any, Dict, List, Optional
+
+log = logging.getLogger("startup_timeline")
+
+STARTUP_PROFILE_IMPORTS = os.getenv('STARTUP_PROFILE_IMPORTS', 'true').lower() == 'true'
+STARTUP_TOP_IMPORTS = int(os.getenv('STARTUP_TOP_IMPORTS', '25'))
+
+_T0 = time.perf_counter()
+
+# Milestone that ends import profiling (startup is over; later imports are not cold-start cost)
+IMPORT_PROFILE_END_MILESTONE = 'trading_started'
+
+
+def _elapsed_ms(since: float = _T0) -> float:
+    return (time.perf_counter() - since) * 1000
+
+
+class _TimedLoader:
+    """Loader proxy that times exec_module and then restores the original loader"""
+
+    def __init__(self, loader: Any, timer: 'ImportTimer'):
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create = getattr(self._loader, 'create_module', None)
+        return create(spec) if create else None
+
+    def exec_module(self, module):
+        # Module code sees the original loader (isinstance checks, resource readers)
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        stack = self._timer._stack()
+        stack.append(0.0)  # Inclusive time of nested imports
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            inclusive = (time.perf_counter() - start) * 1000
+            nested = stack.pop()
+            if stack:
+                stack[-1] += inclusive
+            self._timer._record(module.__name__, start, inclusive, inclusive - nested)
+
+
+class ImportTimer(MetaPathFinder):
+    """Times module execution for every import resolved after install()"""
+
+    def __init__(self):
+        self.imports: Dict[str, Dict[str, float]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> List[float]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, name: str, start: float, inclusive_ms: float, self_ms: float):
+        with self._lock:
+            self.imports[name] = {
+                'at_ms': round((start - _T0) * 1000, 1),
+                'inclusive_ms': round(inclusive_ms, 2),
+                'self_ms': round(self_ms, 2),
+            }
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+
+class StartupTimeline:
+    """Milestones, phases and component init times since process start"""
+
+    def __init__(self, import_timer: Optional[ImportTimer] = None):
+        self.import_timer = import_timer
+        self.milestones: Dict[str, float] = {}
+        self.phases: List[Dict[str, Any]] = []
+        self.components: List[Dict[str, Any]] = []
+        self._open: Dict[str, float] = {}
+
+    def mark(self, name: str):
+        """Record a milestone (first occurrence wins)"""
+        self.milestones.setdefault(name, round(_elapsed_ms(), 1))
+        if name == IMPORT_PROFILE_END_MILESTONE and self.import_timer:
+            self.import_timer.uninstall()
+
+    def begin(self, name: str):
+        """Start a phase that spans more code than a with-block comfortably covers"""
+        self._open[name] = time.perf_counter()
+
+    def end(self, name: str, ok: bool = True):
+        start = self._open.pop(name, None)
+        if start is not None:
+            self._add(self.phases, name, start, ok)
+
+    @staticmethod
+    def _add(entries: List[Dict[str, Any]], name: str, start: float, ok: bool):
+        entries.append({
+            'name': name,
+            'start_ms': round((start - _T0) * 1000, 1),
+            'duration_ms': round(_elapsed_ms(start), 2),
+            'ok': ok,
+        })
+
+    @contextmanager
+    def _timed(self, entries: List[Dict[str, Any]], name: str):
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self._add(entries, name, start, ok)
+
+    def phase(self, name: str):
+        """Time a startup phase (with-block)"""
+        return self._timed(self.phases, name)
+
+    def component(self, name: str):
+        """Time one component init (with-block)"""
+        return self._timed(self.components, name)
+
+    def snapshot(self, top: int = STARTUP_TOP_IMPORTS) -> Dict[str, Any]:
+        """
+        JSON-ready timeline
+
+        Args:
+            top: Number of slowest imports (by inclusive time) to include; 0 = all
+        """
+        imports = dict(self.import_timer.imports) if self.import_timer else {}
+        slowest = sorted(imports.items(), key=lambda item: item[1]['inclusive_ms'], reverse=True)
+        if top > 0:
+            slowest = slowest[:top]
+        return {
+            'uptime_ms': round(_elapsed_ms(), 1),
+            'milestones': dict(self.milestones),
+            'phases': list(self.phases),
+            'components': list(self.components),
+            'imports': {
+                'profiled': self.import_timer is not None,
+                'active': self.import_timer is not None and self.import_timer in sys.meta_path,
+                'count': len(imports),
+                'total_self_ms': round(sum(i['self_ms'] for i in imports.values()), 1),
+                'slowest': [{'module': name, **timing} for name, timing in slowest],
+            },
+        }
+
+    def log_summary(self):
+        """One-line phase summary plus the slowest component inits"""
+        phases = ", ".join(f"{p['name']} {p['duration_ms']:.0f}ms" for p in self.phases)
+        log.info(f"⏱️ Startup timeline ({_elapsed_ms():.0f}ms): {phases or 'no phases recorded'}")
+        for c in sorted(self.components, key=lambda c: c['duration_ms'], reverse=True)[:5]:
+            log.info(f"   - {c['name']}: {c['duration_ms']:.0f}ms")
+        if self.import_timer:
+            imports = self.import_timer.imports
+            log.info(f"   - {len(imports)} modules imported ({sum(i['self_ms'] for i in imports.values()):.0f}ms self time)")
+
+
+_startup_timeline: Optional[StartupTimeline] = None
+
+
+def get_startup_timeline() -> StartupTimeline:
+    """Process-wide startup timeline (installs the import timer on first use)"""
+    global _startup_timeline
+    if _startup_timeline is None:
+        import_timer = None
+        if STARTUP_PROFILE_IMPORTS:
+            import_timer = ImportTimer()
+            import_timer.install()
+        _startup_timeline = StartupTimeline(import_timer)
+    return _startup_timeline
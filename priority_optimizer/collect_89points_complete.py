@@ -37,10 +37,17 @@ try:
     from modules.gcs_persistence import get_gcs_persistence
     from modules.comprehensive_data_collector import ComprehensiveDataCollector
     from modules.prime_etrade_trading import PrimeETradeTrading
+    from modules.prime_indicator_engine import obv_series_total
 except ImportError as e:
     log.error(f"Failed to import required modules: {e}")
     sys.exit(1)
 
+# Rev 00253: Daily history from the shared OHLCV store (yfinance download when unavailable)
+try:
+    from modules.prime_ohlcv_store import get_ohlcv_store, session_bar
+except ImportError:
+    get_ohlcv_store = session_bar = None
+
 
 class Complete89PointCollector:
     """Complete collector that fetches all technical indicators"""
@@ -77,9 +84,32 @@ class Complete89PointCollector:
             import pandas as pd
             import numpy as np
             
-            # Get historical data
+            # Get historical data (Rev 00253: shared OHLCV store first, yfinance if it fails or is short)
             ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="1mo", interval="1d")
+            hist = None
+            from_store = False
+            if get_ohlcv_store is not None:
+                try:
+                    # ~1 month of completed sessions before the collection date
+                    session = datetime.strptime(self.date, '%Y-%m-%d').date()
+                    hist = get_ohlcv_store().history_frame(symbol, 22, end=session)
+                    from_store = len(hist) >= 20
+                    if from_store:
+                        # The store holds final sessions only - append the collection date's bar from 5m bars
+                        intraday = ticker.history(start=session, end=session + timedelta(days=1), interval="5m")
+                        target_bar = session_bar(session, [{
+                            'open': row['Open'], 'high': row['High'], 'low': row['Low'],
+                            'close': row['Close'], 'volume': row['Volume'],
+                        } for _, row in intraday.iterrows()])
+                        if target_bar is not None:
+                            hist = pd.concat([hist, pd.DataFrame({
+                                'Open': [target_bar['open']], 'High': [target_bar['high']], 'Low': [target_bar['low']],
+                                'Close': [target_bar['close']], 'Volume': [target_bar['volume']],
+                            }, index=pd.to_datetime([target_bar['date']]))])
+                except Exception as e:
+                    log.debug(f"OHLCV store history failed for {symbol}: {e}")
+            if not from_store:
+                hist = ticker.history(period="1mo", interval="1d")
             
             if hist.empty or len(hist) < 20:
                 log.warning(f"Insufficient data for {symbol} from yfinance")
@@ -140,13 +170,8 @@ class Complete89PointCollector:
             volume_sma = pd.Series(volumes).rolling(window=20).mean().iloc[-1] if len(volumes) >= 20 else volumes[-1]
             volume_ratio = volumes[-1] / volume_sma if volume_sma > 0 else 1.0
             
-            # OBV
-            obv = 0
-            for i in range(1, len(closes)):
-                if closes[i] > closes[i-1]:
-                    obv += volumes[i]
-                elif closes[i] < closes[i-1]:
-                    obv -= volumes[i]
+            # OBV (Rev 00237: vectorized indicator engine)
+            obv = obv_series_total(closes, volumes)
             
             # VWAP (simplified - using recent data)
             vwap = (hist['Close'] * hist['Volume']).sum() / hist['Volume'].sum() if hist['Volume'].sum() > 0 else closes[-1]
@@ -36,11 +36,18 @@ try:
     from modules.gcs_persistence import get_gcs_persistence
     from modules.comprehensive_data_collector import ComprehensiveDataCollector
     from modules.prime_etrade_trading import PrimeETradeTrading
+    from modules.prime_indicator_engine import obv_series_total
     from modules.prime_data_manager import get_prime_data_manager
 except ImportError as e:
     log.error(f"Failed to import required modules: {e}")
     sys.exit(1)
 
+# Rev 00253: Daily history from the shared OHLCV store (yfinance download when unavailable)
+try:
+    from modules.prime_ohlcv_store import get_ohlcv_store, session_bar
+except ImportError:
+    get_ohlcv_store = session_bar = None
+
 
 class ETrade89PointCollector:
     """E*TRADE-based collector with signal collection time technicals"""
@@ -121,7 +128,16 @@ class ETrade89PointCollector:
             # Get historical data up to target time using data manager or yfinance
             historical_data = []
             
-            if self.data_manager:
+            # Rev 00253: Shared OHLCV store first (sessions before the target date)
+            from_store = False
+            if get_ohlcv_store is not None:
+                try:
+                    historical_data = get_ohlcv_store().history([symbol], 42, end=target_time.date())[symbol.upper()].to_bars()
+                    from_store = bool(historical_data)
+                except Exception as e:
+                    log.debug(f"OHLCV store history failed for {symbol}: {e}")
+            
+            if not historical_data and self.data_manager:
                 try:
                     # Get historical data from data manager (uses yfinance internally)
                     end_date = target_time
@@ -138,7 +154,6 @@ class ETrade89PointCollector:
                 except Exception as e:
                     log.debug(f"Data manager historical data failed for {symbol}: {e}")
             
-            # Fallback to yfinance if no historical data
             if not historical_data:
                 try:
                     import yfinance as yf
@@ -184,6 +199,17 @@ class ETrade89PointCollector:
             except Exception as e:
                 log.debug(f"Intraday data not available for {symbol} at {target_time}: {e}")
             
+            # Rev 00253: The store holds final sessions only - append the target session's bar so far
+            if from_store:
+                target_bar = session_bar(target_time.date(), intraday_data)
+                if target_bar is None and current_quote is not None and target_time.date() == datetime.now().date():
+                    target_bar = session_bar(target_time.date(), [{
+                        'open': current_quote.open, 'high': current_quote.high, 'low': current_quote.low,
+                        'close': current_quote.last_price, 'volume': current_quote.volume,
+                    }])
+                if target_bar is not None:
+                    historical_data.append(target_bar)
+            
             # Calculate technical indicators from historical data
             market_data = self._calculate_technical_indicators(
                 symbol=symbol,
@@ -292,13 +318,8 @@ class ETrade89PointCollector:
             volume_sma = float(pd.Series(volumes).rolling(window=20).mean().iloc[-1]) if len(volumes) >= 20 else float(volumes[-1])
             volume_ratio = float(current_volume / volume_sma) if volume_sma > 0 else 1.0
             
-            # OBV
-            obv = 0.0
-            for i in range(1, len(closes)):
-                if closes[i] > closes[i-1]:
-                    obv += volumes[i]
-                elif closes[i] < closes[i-1]:
-                    obv -= volumes[i]
+            # OBV (Rev 00237: vectorized indicator engine)
+            obv = obv_series_total(closes, volumes)
             
             # VWAP (using intraday data if available, else daily)
             if intraday_data:
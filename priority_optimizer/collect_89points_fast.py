@@ -40,6 +40,12 @@ except ImportError as e:
     log.error(f"Failed to import required modules: {e}")
     sys.exit(1)
 
+# Rev 00253: Daily history from the shared OHLCV store (yfinance download when unavailable)
+try:
+    from modules.prime_ohlcv_store import get_ohlcv_store, session_bar
+except ImportError:
+    get_ohlcv_store = session_bar = None
+
 
 class Fast89PointCollector:
     """Fast REST-based collector using yfinance with signal collection time technicals"""
@@ -98,8 +104,19 @@ class Fast89PointCollector:
                 target_time = self.signal_collection_time
             
             # Get historical data (2 months for SMA200)
+            # Rev 00253: Shared OHLCV store first, yfinance if it fails or is short
             ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="2mo", interval="1d")
+            hist = None
+            from_store = False
+            if get_ohlcv_store is not None:
+                try:
+                    # ~2 months of completed sessions before the target date
+                    hist = get_ohlcv_store().history_frame(symbol, 42, end=target_time.date())
+                    from_store = len(hist) >= 20
+                except Exception as e:
+                    log.debug(f"OHLCV store history failed for {symbol}: {e}")
+            if not from_store:
+                hist = ticker.history(period="2mo", interval="1d")
             
             if hist.empty or len(hist) < 20:
                 return {}
@@ -123,6 +140,14 @@ class Fast89PointCollector:
                             'volume': int(row['Volume'])
                         })
             
+            # Rev 00253: The store holds final sessions only - append the target session's bar so far
+            target_bar = session_bar(target_time.date(), intraday_bars) if from_store else None
+            if target_bar is not None:
+                hist = pd.concat([hist, pd.DataFrame({
+                    'Open': [target_bar['open']], 'High': [target_bar['high']], 'Low': [target_bar['low']],
+                    'Close': [target_bar['close']], 'Volume': [target_bar['volume']],
+                }, index=pd.to_datetime([target_bar['date']]))])
+            
             closes = hist['Close'].values
             highs = hist['High'].values
             lows = hist['Low'].values
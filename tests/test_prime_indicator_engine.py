@@ -0,0 +1,127 @@
+"""
+Golden tests for the vectorized indicator engine (Rev 00237)
+
+The engine must be bit-identical to the PrimeETradeTrading list-based calculators
+it replaces, for every indicator key and for series both shorter and longer than
+each indicator period.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+from modules.prime_etrade_trading import PrimeETradeTrading
+from modules.prime_indicator_engine import (
+    INDICATOR_KEYS,
+    compute_indicators,
+    compute_indicators_single,
+    obv_series_total,
+)
+
+Series = Tuple[List[float], List[float], List[float], List[float]]
+
+
+def _fixture(n: int, start: float, step: float, wave: float) -> Series:
+    """Deterministic trend + saw-tooth series with high/low/volume around it"""
+    closes = [round(start + step * i + wave * ((i * 7) % 11 - 5), 2) for i in range(n)]
+    highs = [round(c + 0.5 + (i % 3) * 0.25, 2) for i, c in enumerate(closes)]
+    lows = [round(c - 0.5 - (i % 4) * 0.2, 2) for i, c in enumerate(closes)]
+    volumes = [float(1_000_000 + (i * 37_000) % 400_000) for i in range(n)]
+    return closes, highs, lows, volumes
+
+
+FIXTURES: Dict[str, Series] = {
+    'TREND': _fixture(60, 100.0, 0.35, 0.4),   # longer than every period but SMA 200
+    'CHOP': _fixture(30, 50.0, 0.0, 0.8),      # between the MACD fast and slow periods
+    'SHORT': _fixture(10, 20.0, -0.1, 0.3),    # shorter than every period
+}
+
+
+def _reference_indicators(closes: List[float], highs: List[float], lows: List[float], volumes: List[float]) -> Dict[str, float]:
+    """Original PrimeETradeTrading list-based calculators (no credentials needed - __init__ is skipped)"""
+    ref = object.__new__(PrimeETradeTrading)
+    return {
+        'rsi_14': ref._calculate_rsi(closes, 14),
+        'rsi_21': ref._calculate_rsi(closes, 21),
+        'macd': ref._calculate_macd(closes),
+        'macd_signal': ref._calculate_macd_signal(closes),
+        'macd_histogram': ref._calculate_macd_histogram(closes),
+        'sma_20': ref._calculate_sma(closes, 20),
+        'sma_50': ref._calculate_sma(closes, 50),
+        'sma_200': ref._calculate_sma(closes, 200),
+        'ema_12': ref._calculate_ema(closes, 12),
+        'ema_26': ref._calculate_ema(closes, 26),
+        'atr': ref._calculate_atr(highs, lows, closes),
+        'bollinger_upper': ref._calculate_bollinger_upper(closes),
+        'bollinger_middle': ref._calculate_bollinger_middle(closes),
+        'bollinger_lower': ref._calculate_bollinger_lower(closes),
+        'bollinger_width': ref._calculate_bollinger_width(closes),
+        'volume_ratio': ref._calculate_volume_ratio(volumes),
+        'volume_sma': ref._calculate_sma(volumes, 20),
+        'obv': ref._calculate_obv(closes, volumes),
+        'ad_line': ref._calculate_ad_line(highs, lows, closes, volumes),
+    }
+
+
+def _random_walk_series(samples: int, seed: int) -> Dict[str, Series]:
+    rng = np.random.default_rng(seed)
+    series: Dict[str, Series] = {}
+    for i in range(samples):
+        n = int(rng.choice([1, 2, 14, 15, 20, 25, 26, 34, 35, 50, 120, 201]))
+        closes = [float(c) for c in np.round(100 * np.cumprod(1 + rng.normal(0, 0.02, n)), 2)]
+        highs = [c + float(rng.uniform(0, 2)) for c in closes]
+        lows = [c - float(rng.uniform(0, 2)) for c in closes]
+        volumes = [int(v) for v in rng.integers(1e5, 5e7, n)]
+        series[f"S{i}"] = (closes, highs, lows, volumes)
+    return series
+
+
+@pytest.mark.parametrize('symbol', sorted(FIXTURES))
+def test_fixture_matches_reference_exactly(symbol):
+    closes, highs, lows, volumes = FIXTURES[symbol]
+    expected = _reference_indicators(closes, highs, lows, volumes)
+    actual = compute_indicators(FIXTURES)[symbol]
+
+    assert set(actual) == set(INDICATOR_KEYS)
+    for key in INDICATOR_KEYS:
+        assert actual[key] == float(expected[key]), key
+
+
+def test_fixture_known_values():
+    trend = compute_indicators(FIXTURES)['TREND']
+    assert trend['rsi_14'] == 58.33333333333333
+    assert trend['macd_signal'] == 2.4139112334596757
+    assert trend['sma_20'] == 117.30499999999999
+    assert trend['atr'] == 2.8035714285714275
+    assert trend['obv'] == -18464000.0
+
+    short = compute_indicators(FIXTURES)['SHORT']
+    assert short['rsi_14'] == 50.0
+    assert short['macd_signal'] == 0.0
+    assert short['atr'] == 0.0
+    assert short['bollinger_width'] == 0.0
+
+
+def test_random_walks_match_reference_exactly():
+    series = _random_walk_series(samples=200, seed=7)
+    vectorized = compute_indicators(series)
+
+    mismatches: Dict[str, int] = {}
+    for symbol, (closes, highs, lows, volumes) in series.items():
+        for key, expected in _reference_indicators(closes, highs, lows, volumes).items():
+            if float(expected) != vectorized[symbol][key]:
+                mismatches[key] = mismatches.get(key, 0) + 1
+    assert mismatches == {}
+
+
+def test_batch_equals_single_symbol():
+    batch = compute_indicators(FIXTURES)
+    for symbol, (closes, highs, lows, volumes) in FIXTURES.items():
+        assert compute_indicators_single(closes, highs, lows, volumes) == batch[symbol]
+
+
+def test_obv_series_total_matches_reference():
+    closes, _highs, _lows, volumes = FIXTURES['TREND']
+    ref = object.__new__(PrimeETradeTrading)
+    assert obv_series_total(closes, volumes) == float(ref._calculate_obv(closes, volumes))